@@ -0,0 +1,117 @@
+"""Benchmark of the graph building and sorting procedures.
+
+Builds a random directed acyclic pipeline and measures the time spent to 
+build and sort its graph in the compact and in the dictionary formats.
+
+Usage: python benchmarks/graph_benchmark.py [--nodes N] [--links-per-node K]
+"""
+
+import random
+import sys
+from argparse import ArgumentParser
+from pathlib import Path
+from time import perf_counter
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from ipipeline.control.building import (  # noqa: E402
+    build_compact_graph, build_graph
+)
+from ipipeline.control.sorting import (  # noqa: E402
+    sort_compact_topology, sort_topology
+)
+from ipipeline.structure.link import Link  # noqa: E402
+from ipipeline.structure.node import Node  # noqa: E402
+from ipipeline.structure.pipeline import Pipeline  # noqa: E402
+
+
+def create_pipeline(
+    nodes_qty: int, links_qty: int, span: int, seed: int
+) -> Pipeline:
+    """Creates a random directed acyclic pipeline.
+
+    Each node is linked to the nodes placed up to the span after it, so 
+    the links never form a cycle.
+
+    Parameters
+    ----------
+    nodes_qty : int
+        Quantity of nodes.
+    links_qty : int
+        Quantity of links of each node.
+    span : int
+        Maximum distance between the source and the destination nodes.
+    seed : int
+        Seed of the random generator.
+
+    Returns
+    -------
+    pipeline : Pipeline
+        Pipeline that stores a flow of tasks.
+    """
+
+    rand = random.Random(seed)
+    nodes = {f'n{i}': Node(f'n{i}', None) for i in range(nodes_qty)}
+    links = {}
+
+    for src_index in range(nodes_qty):
+        for step in rand.sample(range(1, span + 1), links_qty):
+            dst_index = src_index + step
+
+            if dst_index < nodes_qty:
+                id = f'l{len(links)}'
+                links[id] = Link(id, f'n{src_index}', f'n{dst_index}')
+
+    pipeline = Pipeline('p1')
+    pipeline.nodes = nodes
+    pipeline.links = links
+
+    return pipeline
+
+
+def main() -> None:
+    """Runs the benchmark and prints the elapsed times."""
+
+    parser = ArgumentParser(description='graph building and sorting')
+    parser.add_argument('--nodes', type=int, default=1_000_000)
+    parser.add_argument('--links-per-node', type=int, default=5)
+    parser.add_argument('--span', type=int, default=1_000)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--skip-dict', action='store_true')
+    args = parser.parse_args()
+
+    start = perf_counter()
+    pipeline = create_pipeline(
+        args.nodes, args.links_per_node, args.span, args.seed
+    )
+    print(
+        f'pipeline: {len(pipeline.nodes)} nodes, {len(pipeline.links)} '
+        f'links created in {perf_counter() - start:.2f}s'
+    )
+
+    start = perf_counter()
+    ids, offsets, targets = build_compact_graph(pipeline)
+    build_time = perf_counter() - start
+    start = perf_counter()
+    ordering = sort_compact_topology(ids, offsets, targets)
+    sort_time = perf_counter() - start
+    print(
+        f'compact: built in {build_time:.2f}s, sorted in {sort_time:.2f}s '
+        f'({len(ordering)} groups)'
+    )
+
+    if not args.skip_dict:
+        start = perf_counter()
+        graph = build_graph(pipeline)
+        build_time = perf_counter() - start
+        start = perf_counter()
+        ordering = sort_topology(graph)
+        sort_time = perf_counter() - start
+        print(
+            f'dict: built in {build_time:.2f}s, sorted in {sort_time:.2f}s '
+            f'({len(ordering)} groups)'
+        )
+
+
+if __name__ == '__main__':
+    main()
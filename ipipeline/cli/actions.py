@@ -1,5 +1,10 @@
 """Functions related to the action procedures."""
 
+import os
+
+from ipipeline.control.clustering import serve_worker
+from ipipeline.control.loading import load_spec
+from ipipeline.exceptions import ClusterError
 from ipipeline.utils.instance import get_inst
 from ipipeline.utils.system import build_directory, build_file
 
@@ -70,3 +75,58 @@ def execute_pipeline(
 
     ordering = executor.get_ordering(pipeline)
     _ = executor.execute_pipeline(pipeline, catalog, ordering)
+
+
+def execute_spec(executor_class_name: str, spec_path: str) -> None:
+    """Executes a pipeline from a spec file.
+
+    The pipeline, catalog and ordering are loaded through the compiled 
+    cache of the spec file, so only the first execution after a change 
+    builds and sorts them.
+
+    Parameters
+    ----------
+    executor_class_name : str
+        Name of the executor class.
+    spec_path : str
+        Path of the spec file (.json or .toml) of a pipeline.
+    """
+
+    executor_mod_name = 'ipipeline.control.executors'
+    executor = get_inst(executor_mod_name, executor_class_name)()
+    pipeline, catalog, ordering = load_spec(spec_path)
+    _ = executor.execute_pipeline(pipeline, catalog, ordering)
+
+
+def start_worker(host: str, port: int) -> None:
+    """Starts a worker of a cluster.
+
+    The worker serves the nodes of a coordinator until it is stopped. The 
+    key that authenticates the connection is read from the 
+    IPIPELINE_AUTHKEY environment variable, since the command line 
+    arguments are visible to the other users of the host.
+
+    Parameters
+    ----------
+    host : str
+        Host listened by the coordinator.
+    port : int
+        Port listened by the coordinator.
+
+    Raises
+    ------
+    ClusterError
+        Informs that the authkey was not found in the environment.
+    ClusterError
+        Informs that the coordinator was not found in the address.
+    """
+
+    authkey = os.environ.get('IPIPELINE_AUTHKEY', '')
+
+    if not authkey:
+        raise ClusterError(
+            'authkey was not found in the environment', 
+            ['name == IPIPELINE_AUTHKEY']
+        )
+
+    serve_worker((host, port), authkey.encode())
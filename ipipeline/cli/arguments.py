@@ -160,6 +160,24 @@ args = {
         'store', 
         str
     ), 
+    'spec_path': Argument(
+        'spec_path', 
+        'path of the spec file (.json or .toml) of a pipeline.', 
+        'store', 
+        str
+    ), 
+    'host': Argument(
+        'host', 
+        'host listened by the coordinator.', 
+        'store', 
+        str
+    ), 
+    'port': Argument(
+        'port', 
+        'port listened by the coordinator.', 
+        'store', 
+        int
+    ), 
     'help': Argument(
         'help', 
         'shows the available arguments.', 
@@ -2,7 +2,9 @@
 
 from typing import Callable, List
 
-from ipipeline.cli.actions import build_project, execute_pipeline
+from ipipeline.cli.actions import (
+    build_project, execute_pipeline, execute_spec, start_worker
+)
 from ipipeline.cli.arguments import Argument, args
 
 
@@ -162,5 +164,19 @@ cmds = {
             args['catalog_func_name']
         ], 
         [args['help']]
+    ), 
+    'spec': Command(
+        'spec', 
+        'executes a pipeline from a spec file.', 
+        execute_spec, 
+        [args['executor_class_name'], args['spec_path']], 
+        [args['help']]
+    ), 
+    'worker': Command(
+        'worker', 
+        'starts a worker of a cluster.', 
+        start_worker, 
+        [args['host'], args['port']], 
+        [args['help']]
     )
 }
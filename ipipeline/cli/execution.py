@@ -30,7 +30,8 @@ def execute_cli(args: List[str]) -> None:
             args.append('--help')
 
         parser = create_parser(
-            cmds['root'], [cmds['project'], cmds['execution']]
+            cmds['root'], 
+            [cmds['project'], cmds['execution'], cmds['spec'], cmds['worker']]
         )
         parsed_args = vars(parser.parse_args(args=args))
         parsed_args.pop('execute_action')(**parsed_args)
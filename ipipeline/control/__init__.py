@@ -3,4 +3,27 @@
 The control package provides components to manipulate the data.
 """
 
-from ipipeline.control.executors import BaseExecutor, SequentialExecutor
+from ipipeline.control.caching import BaseCache, DiskCache, MemoryCache
+from ipipeline.control.checkpointing import Checkpoint
+from ipipeline.control.clustering import (
+    ClusterPool, Reference, build_reference, load_reference, serve_worker
+)
+from ipipeline.control.compiling import Plan, compile_pipeline
+from ipipeline.control.executors import (
+    AsyncExecutor, 
+    BaseExecutor, 
+    ClusterExecutor, 
+    CompiledExecutor, 
+    DistributedExecutor, 
+    GeneratedExecutor, 
+    HybridExecutor, 
+    PoolExecutor, 
+    ProcessExecutor, 
+    SequentialExecutor, 
+    ThreadExecutor
+)
+from ipipeline.control.generating import generate_function, generate_source
+from ipipeline.control.loading import build_spec, load_spec, parse_spec
+from ipipeline.control.optimizing import optimize_pipeline
+from ipipeline.control.recording import Record, load_record
+from ipipeline.control.transporting import SharedTransport
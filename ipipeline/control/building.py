@@ -1,10 +1,15 @@
 """Functions related to the building procedures."""
 
-from typing import Any, Dict, List
+from array import array
+from collections import Counter
+from itertools import accumulate, islice
+from operator import attrgetter, le
+from typing import Any, Dict, List, Tuple
 
 from ipipeline.exceptions import BuildingError
 from ipipeline.structure.catalog import Catalog
 from ipipeline.structure.pipeline import Pipeline
+from ipipeline.utils.checking import check_none
 
 
 def build_graph(pipeline: Pipeline) -> Dict[str, list]:
@@ -32,6 +37,7 @@ def build_graph(pipeline: Pipeline) -> Dict[str, list]:
     """
 
     graph = {}
+    pairs = set()
 
     for node in pipeline.nodes.values():
         graph[node.id] = []
@@ -49,17 +55,381 @@ def build_graph(pipeline: Pipeline) -> Dict[str, list]:
                 [f'dst_id == {link.dst_id}']
             )
 
-        if link.dst_id in graph[link.src_id]:
+        if (link.src_id, link.dst_id) in pairs:
             raise BuildingError(
                 'dst_id was found in the graph[link.src_id]', 
                 [f'dst_id == {link.dst_id}']
             )
 
+        pairs.add((link.src_id, link.dst_id))
         graph[link.src_id].append(link.dst_id)
 
     return graph
 
 
+def build_compact_graph(
+    pipeline: Pipeline
+) -> Tuple[List[str], array, array]:
+    """Builds a compact graph.
+
+    The node IDs are interned to integer indexes and the adjacency is 
+    stored in the compressed sparse row format, where the destination 
+    indexes of the source index i are targets[offsets[i]:offsets[i + 1]] 
+    in the order of the links. The graph is built and validated in linear 
+    time and memory.
+
+    Parameters
+    ----------
+    pipeline : Pipeline
+        Pipeline that stores a flow of tasks.
+
+    Returns
+    -------
+    ids : List[str]
+        IDs of the nodes. The positions are the indexes of the nodes.
+    offsets : array
+        Offsets of the destination indexes of each source index in the 
+        targets. Its length is the quantity of nodes plus one.
+    targets : array
+        Destination indexes grouped by the source indexes.
+
+    Raises
+    ------
+    BuildingError
+        Informs that the src_id was not found in the pipeline._nodes.
+    BuildingError
+        Informs that the dst_id was not found in the pipeline._nodes.
+    BuildingError
+        Informs that the dst_id was found in the graph[link.src_id].
+    """
+
+    ids = list(pipeline.nodes)
+    indexes = {id: index for index, id in enumerate(ids)}
+    links = pipeline.links.values()
+
+    try:
+        src_indexes = array(
+            'l', map(indexes.__getitem__, map(attrgetter('src_id'), links))
+        )
+        dst_indexes = array(
+            'l', map(indexes.__getitem__, map(attrgetter('dst_id'), links))
+        )
+    except KeyError:
+        for link in links:
+            if link.src_id not in indexes:
+                raise BuildingError(
+                    'src_id was not found in the pipeline._nodes', 
+                    [f'src_id == {link.src_id}']
+                )
+
+            if link.dst_id not in indexes:
+                raise BuildingError(
+                    'dst_id was not found in the pipeline._nodes', 
+                    [f'dst_id == {link.dst_id}']
+                )
+
+    counts = Counter(src_indexes)
+    offsets = array('l', [0])
+    offsets.extend(accumulate(map(counts.__getitem__, range(len(ids)))))
+
+    if all(map(le, src_indexes, islice(src_indexes, 1, None))):
+        targets = dst_indexes
+    else:
+        targets = array('l', [0]) * len(dst_indexes)
+        positions = offsets[:-1]
+
+        for src_index, dst_index in zip(src_indexes, dst_indexes):
+            targets[positions[src_index]] = dst_index
+            positions[src_index] += 1
+
+    markers = array('l', [-1]) * len(ids)
+
+    for src_index in range(len(ids)):
+        for dst_index in targets[offsets[src_index]:offsets[src_index + 1]]:
+            if markers[dst_index] == src_index:
+                raise BuildingError(
+                    'dst_id was found in the graph[link.src_id]', 
+                    [f'dst_id == {ids[dst_index]}']
+                )
+
+            markers[dst_index] = src_index
+
+    return ids, offsets, targets
+
+
+def build_subgraph(
+    graph: Dict[str, list], ordering: List[list]
+) -> Dict[str, list]:
+    """Builds the subgraph formed by the nodes of an ordering.
+
+    Parameters
+    ----------
+    graph : Dict[str, list]
+        Graph of the pipeline. The keys are the source node IDs and the 
+        values are the lists of destination node IDs.
+    ordering : List[list]
+        Ordering of the graph. The inner lists represent groups of nodes 
+        that must be executed sequentially and the nodes within these 
+        groups can be executed simultaneously.
+
+    Returns
+    -------
+    subgraph : Dict[str, list]
+        Subgraph of the pipeline. The keys are the source node IDs and the 
+        values are the lists of destination node IDs, both restricted to 
+        the nodes of the ordering.
+    """
+
+    ids = {id for group in ordering for id in group}
+    subgraph = {}
+
+    for group in ordering:
+        for id in group:
+            subgraph[id] = [dst_id for dst_id in graph[id] if dst_id in ids]
+
+    return subgraph
+
+
+def build_target_ordering(
+    pipeline: Pipeline, 
+    catalog: Catalog, 
+    ordering: List[list], 
+    targets: List[str]
+) -> List[list]:
+    """Builds the ordering of the nodes required to produce the targets.
+
+    The nodes are found by walking backwards from the targets through the 
+    producer nodes of the inputs and the source nodes of the links. The 
+    items already in the catalog are not produced again, therefore a node 
+    whose outputs are all in the catalog is skipped along with the nodes 
+    required only by it.
+
+    Parameters
+    ----------
+    pipeline : Pipeline
+        Pipeline that stores a flow of tasks.
+    catalog : Catalog
+        Catalog that stores the items of an execution.
+    ordering : List[list]
+        Ordering of the graph. The inner lists represent groups of nodes 
+        that must be executed sequentially and the nodes within these 
+        groups can be executed simultaneously.
+    targets : List[str]
+        IDs of the items to produce.
+
+    Returns
+    -------
+    target_ordering : List[list]
+        Ordering of the nodes required to produce the targets. The inner 
+        lists keep the nodes of the ordering groups in the same sequence.
+
+    Raises
+    ------
+    BuildingError
+        Informs that the target was not found in the node outputs.
+    PipelineError
+        Informs that the output was found in the _producers.
+    PipelineError
+        Informs that the id was not found in the _nodes.
+    """
+
+    producers = pipeline.producers
+    src_ids = _get_src_ids(pipeline)
+    required_ids = set()
+    pending_ids = []
+
+    for target in targets:
+        if not catalog.check_item(target):
+            if target not in producers:
+                raise BuildingError(
+                    'target was not found in the node outputs', 
+                    [f'target == {target}']
+                )
+
+            pending_ids.append(producers[target])
+
+    while pending_ids:
+        id = pending_ids.pop()
+
+        if id in required_ids:
+            continue
+
+        required_ids.add(id)
+        node = pipeline.get_node(id)
+
+        for item_id in build_inputs(node.pos_inputs, node.key_inputs):
+            if item_id in producers and not catalog.check_item(item_id):
+                pending_ids.append(producers[item_id])
+
+        for src_id in src_ids.get(id, []):
+            src_node = pipeline.get_node(src_id)
+
+            if not src_node.outputs or not all(
+                catalog.check_item(item_id) for item_id in src_node.outputs
+            ):
+                pending_ids.append(src_id)
+
+    target_ordering = []
+
+    for group in ordering:
+        target_group = [id for id in group if id in required_ids]
+
+        if target_group:
+            target_ordering.append(target_group)
+
+    return target_ordering
+
+
+def build_tag_ordering(
+    pipeline: Pipeline, 
+    ordering: List[list], 
+    include: List[str] = None, 
+    exclude: List[str] = None
+) -> List[list]:
+    """Builds the ordering of the nodes selected by their tags.
+
+    The nodes with any of the included tags are selected along with their 
+    upstream nodes, which are found by walking backwards through the 
+    producer nodes of the inputs and the source nodes of the links. The 
+    nodes with any of the excluded tags are never selected and the walk 
+    does not pass through them, therefore their outputs must be in the 
+    catalog before the execution.
+
+    Parameters
+    ----------
+    pipeline : Pipeline
+        Pipeline that stores a flow of tasks.
+    ordering : List[list]
+        Ordering of the graph. The inner lists represent groups of nodes 
+        that must be executed sequentially and the nodes within these 
+        groups can be executed simultaneously.
+    include : List[str], optional
+        Tags of the nodes selected along with their upstream nodes. If 
+        None, all the nodes are selected.
+    exclude : List[str], optional
+        Tags of the nodes never selected.
+
+    Returns
+    -------
+    tag_ordering : List[list]
+        Ordering of the selected nodes. The inner lists keep the nodes of 
+        the ordering groups in the same sequence.
+
+    Raises
+    ------
+    PipelineError
+        Informs that the output was found in the _producers.
+    PipelineError
+        Informs that the id was not found in the _nodes.
+    """
+
+    tag_index = pipeline.tag_index
+    excluded_ids = set()
+
+    for tag in check_none(exclude, []):
+        excluded_ids.update(tag_index.get(tag, []))
+
+    if include is None:
+        selected_ids = set(pipeline.nodes.keys()) - excluded_ids
+    else:
+        producers = pipeline.producers
+        src_ids = _get_src_ids(pipeline)
+        selected_ids = set()
+        pending_ids = [id for tag in include for id in tag_index.get(tag, [])]
+
+        while pending_ids:
+            id = pending_ids.pop()
+
+            if id in selected_ids or id in excluded_ids:
+                continue
+
+            selected_ids.add(id)
+            node = pipeline.get_node(id)
+
+            for item_id in build_inputs(node.pos_inputs, node.key_inputs):
+                if item_id in producers:
+                    pending_ids.append(producers[item_id])
+
+            pending_ids.extend(src_ids.get(id, []))
+
+    tag_ordering = []
+
+    for group in ordering:
+        tag_group = [id for id in group if id in selected_ids]
+
+        if tag_group:
+            tag_ordering.append(tag_group)
+
+    return tag_ordering
+
+
+def build_consumers_qty(
+    pipeline: Pipeline, ordering: List[list]
+) -> Dict[str, int]:
+    """Builds the quantity of consumer nodes for each item.
+
+    A node that refers to an item more than once is counted only once.
+
+    Parameters
+    ----------
+    pipeline : Pipeline
+        Pipeline that stores a flow of tasks.
+    ordering : List[list]
+        Ordering of the graph. The inner lists represent groups of nodes 
+        that must be executed sequentially and the nodes within these 
+        groups can be executed simultaneously.
+
+    Returns
+    -------
+    consumers_qty : Dict[str, int]
+        Quantity of consumer nodes for each item. The keys are the item IDs 
+        and the values are the quantity of nodes that take the item as an 
+        input.
+
+    Raises
+    ------
+    PipelineError
+        Informs that the id was not found in the _nodes.
+    """
+
+    consumers_qty = {}
+
+    for group in ordering:
+        for id in group:
+            node = pipeline.get_node(id)
+
+            for item_id in build_inputs(node.pos_inputs, node.key_inputs):
+                consumers_qty[item_id] = consumers_qty.get(item_id, 0) + 1
+
+    return consumers_qty
+
+
+def build_inputs(
+    pos_inputs: List[str], key_inputs: Dict[str, str]
+) -> List[str]:
+    """Builds the distinct inputs of a task.
+
+    Parameters
+    ----------
+    pos_inputs : List[str]
+        Positional inputs of the task. The elements are the IDs of the 
+        catalog items.
+    key_inputs : Dict[str, str]
+        Keyword inputs of the task. The keys are the task parameters and 
+        the values are the IDs of the catalog items.
+
+    Returns
+    -------
+    inputs : List[str]
+        Distinct inputs of the task in order of appearance. The elements 
+        are the IDs of the catalog items.
+    """
+
+    inputs = list(dict.fromkeys([*pos_inputs, *key_inputs.values()]))
+
+    return inputs
+
+
 def build_pos_args(pos_inputs: List[str], catalog: Catalog) -> List[Any]:
     """Builds the positional arguments of a task.
 
@@ -158,3 +528,26 @@ def build_items(outputs: List[str], returns: Any) -> Dict[str, Any]:
         items = dict(zip(outputs, returns))
 
     return items
+
+
+def _get_src_ids(pipeline: Pipeline) -> Dict[str, list]:
+    """Gets the source nodes of each node.
+
+    Parameters
+    ----------
+    pipeline : Pipeline
+        Pipeline that stores a flow of tasks.
+
+    Returns
+    -------
+    src_ids : Dict[str, list]
+        Source nodes of the nodes. The keys are the destination node IDs 
+        and the values are the lists of source node IDs.
+    """
+
+    src_ids = {}
+
+    for link in pipeline.links.values():
+        src_ids.setdefault(link.dst_id, []).append(link.src_id)
+
+    return src_ids
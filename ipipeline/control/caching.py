@@ -0,0 +1,646 @@
+"""Classes and functions related to the caching procedures."""
+
+import hashlib
+import os
+import pickle
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from functools import partial
+from pathlib import Path
+from threading import RLock
+from types import CodeType, ModuleType
+from typing import Any, Callable, Dict, List, Set
+
+from ipipeline.exceptions import CacheError
+from ipipeline.utils.pickling import protocol
+
+
+class BaseCache(ABC):
+    """Provides an interface to the cache classes.
+
+    A cache stores the items of an execution under a key that fingerprints 
+    the task and its arguments, so a node whose task and arguments were 
+    not changed reuses the items instead of executing the task again.
+
+    Attributes
+    ----------
+    _hits : int
+        Quantity of keys found in the cache.
+    _misses : int
+        Quantity of keys not found in the cache.
+    _lock : RLock
+        Lock that serializes the access to the entries between threads.
+    """
+
+    def __init__(self) -> None:
+        """Initializes the attributes."""
+
+        self._hits = 0
+        self._misses = 0
+        self._lock = RLock()
+
+    @property
+    def hits(self) -> int:
+        """Gets the _hits attribute.
+
+        Returns
+        -------
+        hits : int
+            Quantity of keys found in the cache.
+        """
+
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Gets the _misses attribute.
+
+        Returns
+        -------
+        misses : int
+            Quantity of keys not found in the cache.
+        """
+
+        return self._misses
+
+    def get_items(self, key: str) -> Dict[str, Any]:
+        """Gets the items stored under a key.
+
+        Parameters
+        ----------
+        key : str
+            Key of the items.
+
+        Returns
+        -------
+        items : Dict[str, Any]
+            Items of an execution. The keys are the item IDs and the values 
+            are the arguments required by the tasks. If the key was not 
+            found, None is returned.
+        """
+
+        with self._lock:
+            items = self._load_items(key)
+
+            if items is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+
+            return items
+
+    def set_items(self, key: str, items: Dict[str, Any]) -> None:
+        """Sets the items under a key.
+
+        Parameters
+        ----------
+        key : str
+            Key of the items.
+        items : Dict[str, Any]
+            Items of an execution. The keys are the item IDs and the values 
+            are the arguments required by the tasks.
+        """
+
+        with self._lock:
+            self._dump_items(key, items)
+
+    @abstractmethod
+    def _load_items(self, key: str) -> Dict[str, Any]:
+        """Provides an interface to load the items stored under a key.
+
+        Parameters
+        ----------
+        key : str
+            Key of the items.
+
+        Returns
+        -------
+        items : Dict[str, Any]
+            Items of an execution. The keys are the item IDs and the values 
+            are the arguments required by the tasks. If the key was not 
+            found, None is returned.
+        """
+
+        pass
+
+    @abstractmethod
+    def _dump_items(self, key: str, items: Dict[str, Any]) -> None:
+        """Provides an interface to dump the items under a key.
+
+        Parameters
+        ----------
+        key : str
+            Key of the items.
+        items : Dict[str, Any]
+            Items of an execution. The keys are the item IDs and the values 
+            are the arguments required by the tasks.
+        """
+
+        pass
+
+
+class MemoryCache(BaseCache):
+    """Stores the items of an execution in memory.
+
+    The least recently used entries are discarded beyond the maximum 
+    quantity of entries.
+
+    Attributes
+    ----------
+    _hits : int
+        Quantity of keys found in the cache.
+    _misses : int
+        Quantity of keys not found in the cache.
+    _lock : RLock
+        Lock that serializes the access to the entries between threads.
+    _max_entries : int
+        Maximum quantity of entries kept in the cache.
+    _entries : OrderedDict
+        Entries of the cache ordered from the least to the most recently 
+        used. The keys are the cache keys and the values are the items.
+    """
+
+    def __init__(self, max_entries: int = 128) -> None:
+        """Initializes the attributes.
+
+        Parameters
+        ----------
+        max_entries : int, optional
+            Maximum quantity of entries kept in the cache.
+        """
+
+        super().__init__()
+
+        self._max_entries = max_entries
+        self._entries = OrderedDict()
+
+    @property
+    def max_entries(self) -> int:
+        """Gets the _max_entries attribute.
+
+        Returns
+        -------
+        max_entries : int
+            Maximum quantity of entries kept in the cache.
+        """
+
+        return self._max_entries
+
+    def _load_items(self, key: str) -> Dict[str, Any]:
+        """Loads the items stored under a key.
+
+        Parameters
+        ----------
+        key : str
+            Key of the items.
+
+        Returns
+        -------
+        items : Dict[str, Any]
+            Items of an execution. The keys are the item IDs and the values 
+            are the arguments required by the tasks. If the key was not 
+            found, None is returned.
+        """
+
+        items = self._entries.get(key)
+
+        if items is not None:
+            self._entries.move_to_end(key)
+            items = dict(items)
+
+        return items
+
+    def _dump_items(self, key: str, items: Dict[str, Any]) -> None:
+        """Dumps the items under a key.
+
+        Parameters
+        ----------
+        key : str
+            Key of the items.
+        items : Dict[str, Any]
+            Items of an execution. The keys are the item IDs and the values 
+            are the arguments required by the tasks.
+        """
+
+        self._entries[key] = dict(items)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+
+class DiskCache(BaseCache):
+    """Stores the items of an execution in files of a directory.
+
+    The entries persist between the executions and the processes. The 
+    least recently used entries are deleted beyond the maximum size.
+
+    Attributes
+    ----------
+    _hits : int
+        Quantity of keys found in the cache.
+    _misses : int
+        Quantity of keys not found in the cache.
+    _lock : RLock
+        Lock that serializes the access to the entries between threads.
+    _path : str
+        Path of the directory where the entries are stored.
+    _max_size : int
+        Maximum size of the entries in bytes.
+    _sizes : OrderedDict
+        Sizes of the entries ordered from the least to the most recently 
+        used. The keys are the cache keys and the values are the sizes in 
+        bytes.
+    _size : int
+        Total size of the entries in bytes.
+    """
+
+    def __init__(self, path: str, max_size: int = None) -> None:
+        """Initializes the attributes.
+
+        Parameters
+        ----------
+        path : str
+            Path of the directory where the entries are stored.
+        max_size : int, optional
+            Maximum size of the entries in bytes. If None, there is no 
+            limit.
+        """
+
+        super().__init__()
+
+        self._path = path
+        self._max_size = max_size
+        self._sizes = OrderedDict()
+        self._size = 0
+
+        Path(path).mkdir(parents=True, exist_ok=True)
+
+        for file in sorted(
+            Path(path).glob('*.pkl'), key=lambda file: file.stat().st_mtime
+        ):
+            self._sizes[file.stem] = file.stat().st_size
+            self._size += self._sizes[file.stem]
+
+    @property
+    def path(self) -> str:
+        """Gets the _path attribute.
+
+        Returns
+        -------
+        path : str
+            Path of the directory where the entries are stored.
+        """
+
+        return self._path
+
+    @property
+    def max_size(self) -> int:
+        """Gets the _max_size attribute.
+
+        Returns
+        -------
+        max_size : int
+            Maximum size of the entries in bytes.
+        """
+
+        return self._max_size
+
+    def _load_items(self, key: str) -> Dict[str, Any]:
+        """Loads the items stored under a key.
+
+        Parameters
+        ----------
+        key : str
+            Key of the items.
+
+        Returns
+        -------
+        items : Dict[str, Any]
+            Items of an execution. The keys are the item IDs and the values 
+            are the arguments required by the tasks. If the key was not 
+            found, None is returned.
+        """
+
+        items = None
+        path = Path(self._path) / f'{key}.pkl'
+
+        if key not in self._sizes:
+            try:
+                self._sizes[key] = path.stat().st_size
+                self._size += self._sizes[key]
+            except FileNotFoundError:
+                pass
+
+        if key in self._sizes:
+            try:
+                with open(path, 'rb') as file:
+                    items = pickle.load(file)
+
+                os.utime(path)
+                self._sizes.move_to_end(key)
+            except FileNotFoundError:
+                self._delete_entry(key)
+            except Exception:
+                items = None
+                self._delete_entry(key)
+
+        return items
+
+    def _dump_items(self, key: str, items: Dict[str, Any]) -> None:
+        """Dumps the items under a key.
+
+        Parameters
+        ----------
+        key : str
+            Key of the items.
+        items : Dict[str, Any]
+            Items of an execution. The keys are the item IDs and the values 
+            are the arguments required by the tasks.
+
+        Raises
+        ------
+        CacheError
+            Informs that the items were not pickled by the cache.
+        """
+
+        path = Path(self._path) / f'{key}.pkl'
+
+        try:
+            data = pickle.dumps(items, protocol=protocol)
+        except Exception as error:
+            raise CacheError(
+                'items were not pickled by the cache', [f'key == {key}']
+            ) from error
+
+        temp_path = Path(self._path) / f'{key}.tmp'
+        temp_path.write_bytes(data)
+        os.replace(temp_path, path)
+        self._size += len(data) - self._sizes.get(key, 0)
+        self._sizes[key] = len(data)
+        self._sizes.move_to_end(key)
+
+        if self._max_size is not None:
+            while self._size > self._max_size and len(self._sizes) > 1:
+                self._delete_entry(next(iter(self._sizes)))
+
+    def _delete_entry(self, key: str) -> None:
+        """Deletes the entry of a key along with its file.
+
+        Parameters
+        ----------
+        key : str
+            Key of the items.
+        """
+
+        self._size -= self._sizes.pop(key)
+
+        try:
+            (Path(self._path) / f'{key}.pkl').unlink()
+        except FileNotFoundError:
+            pass
+
+
+def build_key(
+    task: Callable, pos_args: List[Any], key_args: Dict[str, Any]
+) -> str:
+    """Builds the cache key of a task and its arguments.
+
+    Parameters
+    ----------
+    task : Callable
+        Task of the node.
+    pos_args : List[Any]
+        Positional arguments of the task.
+    key_args : Dict[str, Any]
+        Keyword arguments of the task.
+
+    Returns
+    -------
+    key : str
+        Key that combines the fingerprints of the task and its arguments.
+
+    Raises
+    ------
+    CacheError
+        Informs that the task was not pickled by the cache.
+    CacheError
+        Informs that the arguments were not pickled by the cache.
+    """
+
+    digest = hashlib.sha256()
+    digest.update(fingerprint_task(task).encode())
+    digest.update(fingerprint_args(pos_args, key_args).encode())
+    key = digest.hexdigest()
+
+    return key
+
+
+def fingerprint_task(task: Callable) -> str:
+    """Fingerprints a task by its qualified name, code and bound values.
+
+    The bound values are the arguments of the partial objects, the 
+    defaults and keyword defaults of the function and the values captured 
+    by its closure, where the captured functions are fingerprinted in 
+    turn. The global variables read by the task are not part of the 
+    fingerprint.
+
+    Parameters
+    ----------
+    task : Callable
+        Task of the node.
+
+    Returns
+    -------
+    fingerprint : str
+        Fingerprint of the task.
+
+    Raises
+    ------
+    CacheError
+        Informs that the task was not pickled by the cache.
+    """
+
+    digest = hashlib.sha256()
+    _update_task(digest, task, set())
+    fingerprint = digest.hexdigest()
+
+    return fingerprint
+
+
+def fingerprint_args(pos_args: List[Any], key_args: Dict[str, Any]) -> str:
+    """Fingerprints the arguments of a task by their pickled bytes.
+
+    Parameters
+    ----------
+    pos_args : List[Any]
+        Positional arguments of the task.
+    key_args : Dict[str, Any]
+        Keyword arguments of the task.
+
+    Returns
+    -------
+    fingerprint : str
+        Fingerprint of the arguments.
+
+    Raises
+    ------
+    CacheError
+        Informs that the arguments were not pickled by the cache.
+    """
+
+    try:
+        data = pickle.dumps(
+            (list(pos_args), sorted(key_args.items())), protocol=protocol
+        )
+    except Exception as error:
+        raise CacheError(
+            'arguments were not pickled by the cache', 
+            [f'error == {type(error).__name__}']
+        ) from error
+
+    fingerprint = hashlib.sha256(data).hexdigest()
+
+    return fingerprint
+
+
+def fingerprint_item(item: Any) -> str:
+    """Fingerprints an item by its pickled bytes.
+
+    Parameters
+    ----------
+    item : Any
+        Item of an execution.
+
+    Returns
+    -------
+    fingerprint : str
+        Fingerprint of the item.
+
+    Raises
+    ------
+    CacheError
+        Informs that the item was not pickled by the cache.
+    """
+
+    try:
+        data = pickle.dumps(item, protocol=protocol)
+    except Exception as error:
+        raise CacheError(
+            'item was not pickled by the cache', 
+            [f'error == {type(error).__name__}']
+        ) from error
+
+    fingerprint = hashlib.sha256(data).hexdigest()
+
+    return fingerprint
+
+
+def _update_code(digest: Any, code: CodeType) -> None:
+    """Updates a digest with the bytes of a code object.
+
+    The nested code objects (e.g. inner functions and lambdas) are 
+    traversed recursively.
+
+    Parameters
+    ----------
+    digest : Any
+        Digest of the hashlib package.
+    code : CodeType
+        Code object of a function.
+    """
+
+    digest.update(code.co_code)
+    digest.update(repr(code.co_names).encode())
+
+    for const in code.co_consts:
+        if isinstance(const, CodeType):
+            _update_code(digest, const)
+        else:
+            digest.update(repr(const).encode())
+
+
+def _update_task(digest: Any, task: Callable, seen_ids: Set[int]) -> None:
+    """Updates a digest with the name, code and bound values of a task.
+
+    Parameters
+    ----------
+    digest : Any
+        Digest of the hashlib package.
+    task : Callable
+        Task of the node.
+    seen_ids : Set[int]
+        IDs of the functions already traversed, which stops the recursion 
+        of the functions that capture themselves.
+
+    Raises
+    ------
+    CacheError
+        Informs that the task was not pickled by the cache.
+    """
+
+    while isinstance(task, partial):
+        _update_value(digest, (task.args, task.keywords))
+        task = task.func
+
+    if not hasattr(task, '__qualname__'):
+        _update_value(digest, task)
+        task = type(task).__call__
+
+    owner = getattr(task, '__self__', None)
+
+    if owner is not None and not isinstance(owner, ModuleType):
+        _update_value(digest, owner)
+
+    func = getattr(task, '__func__', task)
+    digest.update(
+        f'{getattr(func, "__module__", None)}:'
+        f'{getattr(func, "__qualname__", repr(func))}'.encode()
+    )
+    code = getattr(func, '__code__', None)
+
+    if code is None or id(func) in seen_ids:
+        return
+
+    seen_ids.add(id(func))
+    _update_code(digest, code)
+    _update_value(digest, (func.__defaults__, func.__kwdefaults__))
+
+    for cell in func.__closure__ or ():
+        try:
+            value = cell.cell_contents
+        except ValueError:
+            digest.update(b'<empty>')
+
+            continue
+
+        if isinstance(value, partial) or \
+                hasattr(getattr(value, '__func__', value), '__code__'):
+            _update_task(digest, value, seen_ids)
+        else:
+            _update_value(digest, value)
+
+
+def _update_value(digest: Any, value: Any) -> None:
+    """Updates a digest with the pickled bytes of a value bound to a task.
+
+    Parameters
+    ----------
+    digest : Any
+        Digest of the hashlib package.
+    value : Any
+        Value bound to a task.
+
+    Raises
+    ------
+    CacheError
+        Informs that the task was not pickled by the cache.
+    """
+
+    try:
+        digest.update(pickle.dumps(value, protocol=protocol))
+    except Exception as error:
+        raise CacheError(
+            'task was not pickled by the cache', 
+            [f'error == {type(error).__name__}']
+        ) from error
@@ -0,0 +1,114 @@
+"""Classes and functions related to the checkpointing procedures."""
+
+import os
+import pickle
+from pathlib import Path
+from typing import Any, Dict, List
+
+from ipipeline.exceptions import CheckpointError
+from ipipeline.utils.pickling import protocol
+
+
+class Checkpoint:
+    """Stores the items of the executed nodes in a directory.
+
+    Each executed node is written to its own file, which is renamed to its 
+    final name only after being completely written, therefore the nodes 
+    with a file are the finished ones even if the execution was killed 
+    in the middle of a write.
+
+    Attributes
+    ----------
+    _path : str
+        Path of the directory where the nodes are stored.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Initializes the attributes.
+
+        Parameters
+        ----------
+        path : str
+            Path of the directory where the nodes are stored.
+        """
+
+        self._path = path
+
+        Path(path).mkdir(parents=True, exist_ok=True)
+
+    @property
+    def path(self) -> str:
+        """Gets the _path attribute.
+
+        Returns
+        -------
+        path : str
+            Path of the directory where the nodes are stored.
+        """
+
+        return self._path
+
+    def dump_items(self, id: str, items: Dict[str, Any]) -> None:
+        """Dumps the items of an executed node.
+
+        Parameters
+        ----------
+        id : str
+            ID of the node.
+        items : Dict[str, Any]
+            Items of an execution. The keys are the item IDs and the values 
+            are the arguments required by the tasks.
+
+        Raises
+        ------
+        CheckpointError
+            Informs that the items were not pickled by the checkpoint.
+        """
+
+        try:
+            data = pickle.dumps(items, protocol=protocol)
+        except Exception as error:
+            raise CheckpointError(
+                'items were not pickled by the checkpoint', [f'id == {id}']
+            ) from error
+
+        path = Path(self._path) / f'{id}.pkl'
+        temp_path = Path(self._path) / f'{id}.tmp'
+        temp_path.write_bytes(data)
+        os.replace(temp_path, path)
+
+    def load_items(self) -> Dict[str, Any]:
+        """Loads the items of the finished nodes.
+
+        Returns
+        -------
+        items : Dict[str, Any]
+            Items of an execution. The keys are the item IDs and the values 
+            are the arguments required by the tasks.
+        """
+
+        items = {}
+
+        for file in sorted(Path(self._path).glob('*.pkl')):
+            items.update(pickle.loads(file.read_bytes()))
+
+        return items
+
+    def load_ids(self) -> List[str]:
+        """Loads the IDs of the finished nodes.
+
+        Returns
+        -------
+        ids : List[str]
+            IDs of the finished nodes.
+        """
+
+        ids = [file.stem for file in sorted(Path(self._path).glob('*.pkl'))]
+
+        return ids
+
+    def clear(self) -> None:
+        """Deletes the files of the finished nodes."""
+
+        for file in Path(self._path).glob('*.pkl'):
+            file.unlink()
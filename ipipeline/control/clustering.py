@@ -0,0 +1,631 @@
+"""Classes and functions related to the clustering procedures."""
+
+import logging
+import socket
+import time
+from collections import deque
+from concurrent.futures import Executor, Future
+from inspect import isclass, isfunction
+from itertools import count
+from multiprocessing.connection import Client, Connection, Listener
+from threading import Event, Lock, Thread
+from typing import Any, Callable, NamedTuple, Set, Tuple
+
+from ipipeline.exceptions import ClusterError, ExecutorError
+from ipipeline.utils.instance import get_inst
+
+
+logger = logging.getLogger(name=__name__)
+
+
+class Reference(NamedTuple):
+    """Stores the reference of a function declared at the module level.
+
+    Only the reference is sent to the workers, which import the function 
+    by the module name, so the worker hosts must have the module in their 
+    paths.
+
+    Attributes
+    ----------
+    mod_name : str
+        Name of the module in absolute terms.
+    inst_name : str
+        Name of the function located in the module.
+    """
+
+    mod_name: str
+    inst_name: str
+
+
+class ClusterPool(Executor):
+    """Stores the workers connected to a coordinator over TCP.
+
+    The coordinator listens to an address until the quantity of workers is 
+    connected. Each worker pulls a job when it is idle, executes it and 
+    pushes back its result, so the jobs are queued until a worker pulls 
+    them. A job is a function called with its arguments, whose functions 
+    are sent as references. The connections are always authenticated, 
+    since the messages are pickled, and the queued jobs fail once every 
+    worker is disconnected.
+
+    Attributes
+    ----------
+    _address : Tuple[str, int]
+        Address of the coordinator as a (host, port) pair.
+    _workers_qty : int
+        Quantity of workers awaited by the coordinator.
+    _authkey : bytes
+        Key that authenticates the connections.
+    _timeout : float
+        Seconds to wait for the workers to connect.
+    _listener : Listener
+        Listener that accepts the connections of the workers.
+    _connections : List[Connection]
+        Connections to the workers.
+    _threads : List[Thread]
+        Threads that receive the messages of the workers.
+    _jobs : deque
+        Jobs waiting for a worker. The elements are tuples of the job ID, 
+        the future and the message of the job.
+    _idle_ids : deque
+        Indexes of the workers waiting for a job.
+    _active_ids : Set[int]
+        Indexes of the workers still connected to the coordinator.
+    _running : Dict[int, tuple]
+        Jobs executed by the workers. The keys are the worker indexes and 
+        the values are tuples of the job ID and the future.
+    _job_ids : count
+        Counter that generates the job IDs.
+    _lock : Lock
+        Lock that serializes the access to the jobs between threads.
+    """
+
+    def __init__(
+        self, 
+        address: Tuple[str, int], 
+        workers_qty: int, 
+        authkey: bytes, 
+        timeout: float = 60.0
+    ) -> None:
+        """Initializes the attributes and waits for the workers.
+
+        Parameters
+        ----------
+        address : Tuple[str, int]
+            Address of the coordinator as a (host, port) pair.
+        workers_qty : int
+            Quantity of workers awaited by the coordinator.
+        authkey : bytes
+            Key that authenticates the connections.
+        timeout : float, optional
+            Seconds to wait for the workers to connect.
+
+        Raises
+        ------
+        ClusterError
+            Informs that the authkey was not found in the arguments.
+        ClusterError
+            Informs that the workers were not connected to the coordinator.
+        """
+
+        _check_authkey(authkey)
+
+        self._address = address
+        self._workers_qty = workers_qty
+        self._authkey = authkey
+        self._timeout = timeout
+        self._listener = Listener(address, authkey=authkey)
+        self._connections = []
+        self._threads = []
+        self._jobs = deque()
+        self._idle_ids = deque()
+        self._active_ids = set()
+        self._running = {}
+        self._job_ids = count()
+        self._lock = Lock()
+
+        connected = Event()
+        stopped = Event()
+        accept_thread = Thread(
+            target=self._accept_workers, args=(connected, stopped), daemon=True
+        )
+        accept_thread.start()
+
+        if not connected.wait(timeout):
+            stopped.set()
+            self._wake_listener()
+            accept_thread.join()
+            self.shutdown(wait=False)
+
+            raise ClusterError(
+                'workers were not connected to the coordinator', 
+                [
+                    f'workers_qty == {workers_qty}', 
+                    f'connected_qty == {len(self._connections)}'
+                ]
+            )
+
+        accept_thread.join()
+
+    def submit(self, fn: Callable, *args: Any, **kwargs: Any) -> Future:
+        """Submits a job to the first worker that pulls it.
+
+        Parameters
+        ----------
+        fn : Callable
+            Function of the job declared at the module level.
+        args : Any
+            Positional arguments of the function.
+        kwargs : Any
+            Keyword arguments of the function.
+
+        Returns
+        -------
+        future : Future
+            Future that resolves to the result of the job.
+        """
+
+        future = Future()
+
+        try:
+            message = (
+                build_reference(fn), 
+                tuple(_refer_arg(arg) for arg in args), 
+                {param: _refer_arg(arg) for param, arg in kwargs.items()}
+            )
+        except ClusterError as error:
+            future.set_exception(error)
+
+            return future
+
+        with self._lock:
+            self._jobs.append((next(self._job_ids), future, message))
+
+            if self._active_ids:
+                self._dispatch_jobs()
+            else:
+                self._fail_jobs()
+
+        return future
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stops the workers and closes the listener.
+
+        Parameters
+        ----------
+        wait : bool, optional
+            Flag that indicates if the running jobs must be waited.
+        """
+
+        with self._lock:
+            for connection in self._connections:
+                try:
+                    connection.send(('stop',))
+                except (OSError, ValueError):
+                    pass
+
+        if wait:
+            for thread in self._threads:
+                thread.join()
+
+        for connection in self._connections:
+            connection.close()
+
+        self._listener.close()
+
+    def _accept_workers(self, connected: Event, stopped: Event) -> None:
+        """Accepts the connections of the workers.
+
+        Parameters
+        ----------
+        connected : Event
+            Event set when the quantity of workers is connected.
+        stopped : Event
+            Event set when the coordinator stops waiting for the workers.
+        """
+
+        while len(self._connections) < self._workers_qty:
+            try:
+                connection = self._listener.accept()
+            except Exception as error:
+                if stopped.is_set():
+                    return
+
+                logger.warning(f'address: {self._address}, {error}')
+
+                continue
+
+            if stopped.is_set():
+                connection.close()
+
+                return
+
+            index = len(self._connections)
+
+            with self._lock:
+                self._connections.append(connection)
+                self._active_ids.add(index)
+
+            thread = Thread(
+                target=self._receive_messages, args=(index,), daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+            logger.info(f'worker: {index}, connected')
+
+        connected.set()
+
+    def _receive_messages(self, index: int) -> None:
+        """Receives the messages of a worker until it is disconnected.
+
+        Parameters
+        ----------
+        index : int
+            Index of the worker.
+        """
+
+        connection = self._connections[index]
+
+        while True:
+            try:
+                kind, *args = connection.recv()
+            except (EOFError, OSError):
+                break
+
+            with self._lock:
+                if kind == 'pull':
+                    self._idle_ids.append(index)
+                    self._dispatch_jobs()
+
+                    continue
+
+                job_id, future = self._running.pop(index)
+
+            if kind == 'push':
+                future.set_result(args[1])
+            else:
+                future.set_exception(args[1])
+
+        with self._lock:
+            if index in self._idle_ids:
+                self._idle_ids.remove(index)
+
+            self._active_ids.discard(index)
+            running = self._running.pop(index, None)
+
+            if running is not None:
+                running[1].set_exception(
+                    ClusterError(
+                        'worker was disconnected from the coordinator', 
+                        [f'index == {index}']
+                    )
+                )
+
+            if not self._active_ids:
+                self._fail_jobs()
+
+    def _dispatch_jobs(self) -> None:
+        """Dispatches the queued jobs to the idle workers.
+
+        A worker whose connection fails on the send is dropped, so the next 
+        jobs are not sent to the same broken connection. Must be called 
+        while the lock is acquired.
+        """
+
+        while self._jobs and self._idle_ids:
+            job_id, future, message = self._jobs.popleft()
+
+            if not future.set_running_or_notify_cancel():
+                continue
+
+            index = self._idle_ids.popleft()
+
+            try:
+                self._connections[index].send(('job', job_id) + message)
+            except (EOFError, OSError) as error:
+                logger.warning(f'worker: {index}, dropped, {error}')
+                self._active_ids.discard(index)
+                future.set_exception(
+                    ClusterError(
+                        'job was not sent to the worker', 
+                        [f'index == {index}', f'error == {error}']
+                    )
+                )
+            except Exception as error:
+                self._idle_ids.appendleft(index)
+                future.set_exception(
+                    ClusterError(
+                        'job was not sent to the worker', 
+                        [f'index == {index}', f'error == {error}']
+                    )
+                )
+            else:
+                self._running[index] = (job_id, future)
+
+        if not self._active_ids:
+            self._fail_jobs()
+
+    def _fail_jobs(self) -> None:
+        """Fails the queued jobs when no worker is connected.
+
+        Must be called while the lock is acquired.
+        """
+
+        while self._jobs:
+            job_id, future, _ = self._jobs.popleft()
+
+            if future.set_running_or_notify_cancel():
+                future.set_exception(
+                    ExecutorError(
+                        'workers were not connected to the coordinator', 
+                        [f'job_id == {job_id}', 'connected_qty == 0']
+                    )
+                )
+
+    def _wake_listener(self) -> None:
+        """Wakes the listener blocked in the accept call by connecting to it.
+
+        The connection is closed before the authentication, so it is never 
+        accepted as a worker.
+        """
+
+        try:
+            with socket.create_connection(
+                self._listener.address, timeout=self._timeout
+            ):
+                pass
+        except OSError:
+            pass
+
+
+def build_reference(fn: Callable) -> Reference:
+    """Builds the reference of a function declared at the module level.
+
+    Parameters
+    ----------
+    fn : Callable
+        Function declared at the module level.
+
+    Returns
+    -------
+    reference : Reference
+        Reference of the function.
+
+    Raises
+    ------
+    ClusterError
+        Informs that the fn was not declared at the module level.
+    """
+
+    qualname = getattr(fn, '__qualname__', '')
+
+    if not qualname or '.' in qualname or '<' in qualname or \
+            getattr(fn, '__module__', None) in [None, '__main__']:
+        raise ClusterError(
+            'fn was not declared at the module level', [f'fn == {fn!r}']
+        )
+
+    reference = Reference(fn.__module__, qualname)
+
+    return reference
+
+
+def load_reference(reference: Reference) -> Callable:
+    """Loads the function of a reference.
+
+    Parameters
+    ----------
+    reference : Reference
+        Reference of the function.
+
+    Returns
+    -------
+    fn : Callable
+        Function declared at the module level.
+
+    Raises
+    ------
+    InstanceError
+        Informs that the mod_name was not found in the package.
+    InstanceError
+        Informs that the inst_name was not found in the module.
+    """
+
+    fn = get_inst(reference.mod_name, reference.inst_name)
+
+    return fn
+
+
+def serve_worker(
+    address: Tuple[str, int], authkey: bytes, timeout: float = 60.0
+) -> None:
+    """Serves the jobs of a coordinator until it stops the worker.
+
+    The connection is retried until the coordinator listens or the timeout 
+    is reached, so the workers can be started before the coordinator.
+
+    Parameters
+    ----------
+    address : Tuple[str, int]
+        Address of the coordinator as a (host, port) pair.
+    authkey : bytes
+        Key that authenticates the connection.
+    timeout : float, optional
+        Seconds to wait for the coordinator to listen.
+
+    Raises
+    ------
+    ClusterError
+        Informs that the authkey was not found in the arguments.
+    ClusterError
+        Informs that the coordinator was not found in the address.
+    """
+
+    _check_authkey(authkey)
+    connection = _connect_worker(address, authkey, timeout)
+
+    with connection:
+        while True:
+            try:
+                connection.send(('pull',))
+                kind, *args = connection.recv()
+            except (EOFError, OSError):
+                break
+
+            if kind != 'job':
+                break
+
+            job_id, reference, pos_args, key_args = args
+
+            try:
+                fn = load_reference(reference)
+                result = fn(
+                    *[_load_arg(arg) for arg in pos_args], 
+                    **{
+                        param: _load_arg(arg)
+                        for param, arg in key_args.items()
+                    }
+                )
+            except Exception as error:
+                _push_error(connection, job_id, error)
+            else:
+                try:
+                    connection.send(('push', job_id, result))
+                except (EOFError, OSError):
+                    break
+                except Exception as error:
+                    _push_error(connection, job_id, error)
+
+
+def _check_authkey(authkey: bytes) -> None:
+    """Checks if an authkey was informed, since the messages are pickled.
+
+    Parameters
+    ----------
+    authkey : bytes
+        Key that authenticates the connections.
+
+    Raises
+    ------
+    ClusterError
+        Informs that the authkey was not found in the arguments.
+    """
+
+    if not isinstance(authkey, bytes) or not authkey:
+        raise ClusterError(
+            'authkey was not found in the arguments', 
+            [f'type == {type(authkey).__name__}']
+        )
+
+
+def _connect_worker(
+    address: Tuple[str, int], authkey: bytes, timeout: float
+) -> Connection:
+    """Connects a worker to a coordinator.
+
+    Parameters
+    ----------
+    address : Tuple[str, int]
+        Address of the coordinator as a (host, port) pair.
+    authkey : bytes
+        Key that authenticates the connection.
+    timeout : float
+        Seconds to wait for the coordinator to listen.
+
+    Returns
+    -------
+    connection : Connection
+        Connection to the coordinator.
+
+    Raises
+    ------
+    ClusterError
+        Informs that the coordinator was not found in the address.
+    """
+
+    deadline = time.monotonic() + timeout
+
+    while True:
+        try:
+            connection = Client(address, authkey=authkey)
+
+            return connection
+        except OSError as error:
+            if time.monotonic() >= deadline:
+                raise ClusterError(
+                    'coordinator was not found in the address', 
+                    [f'address == {address}']
+                ) from error
+
+            time.sleep(0.1)
+
+
+def _load_arg(arg: Any) -> Any:
+    """Loads an argument, resolving it when it is a reference.
+
+    Parameters
+    ----------
+    arg : Any
+        Argument of a job.
+
+    Returns
+    -------
+    arg : Any
+        Argument of a job.
+    """
+
+    if isinstance(arg, Reference):
+        arg = load_reference(arg)
+
+    return arg
+
+
+def _push_error(connection: Connection, job_id: int, error: Exception) -> None:
+    """Pushes the error of a job to the coordinator.
+
+    Parameters
+    ----------
+    connection : Connection
+        Connection to the coordinator.
+    job_id : int
+        ID of the job.
+    error : Exception
+        Error raised by the job.
+    """
+
+    try:
+        connection.send(('error', job_id, error))
+    except (EOFError, OSError):
+        pass
+    except Exception:
+        connection.send((
+            'error', 
+            job_id, 
+            ClusterError('error was not pickled by the worker', [repr(error)])
+        ))
+
+
+def _refer_arg(arg: Any) -> Any:
+    """Refers an argument when it is a function or class.
+
+    Parameters
+    ----------
+    arg : Any
+        Argument of a job.
+
+    Returns
+    -------
+    arg : Any
+        Reference of the argument when it is a function or class, otherwise 
+        the argument itself.
+
+    Raises
+    ------
+    ClusterError
+        Informs that the fn was not declared at the module level.
+    """
+
+    if isfunction(arg) or isclass(arg):
+        arg = build_reference(arg)
+
+    return arg
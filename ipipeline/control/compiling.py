@@ -0,0 +1,213 @@
+"""Classes and functions related to the compiling procedures."""
+
+from typing import Dict, List
+
+from ipipeline.structure.pipeline import Pipeline
+from ipipeline.utils.instance import build_repr
+
+
+class Plan:
+    """Stores a pipeline compiled to a sequence of slot-indexed steps.
+
+    Each item ID is assigned to an integer slot of a flat list, so the 
+    steps read and write the items by position instead of looking them up 
+    in the catalog. A step is a tuple of the node ID, the task, the 
+    positional input slots, the keyword input slots as (parameter, slot) 
+    pairs, the output slots and the slots consumed for the last time by 
+    the step.
+
+    Attributes
+    ----------
+    _ids : List[str]
+        IDs of the items. The positions are the slots of the items.
+    _steps : List[tuple]
+        Steps of the plan in the ordering sequence.
+    _inputs : List[int]
+        Slots of the items read from the catalog because they were not 
+        produced by a previous step.
+    _outputs : List[int]
+        Slots of the items produced by the steps.
+    """
+
+    def __init__(
+        self, 
+        ids: List[str], 
+        steps: List[tuple], 
+        inputs: List[int], 
+        outputs: List[int]
+    ) -> None:
+        """Initializes the attributes.
+
+        Parameters
+        ----------
+        ids : List[str]
+            IDs of the items. The positions are the slots of the items.
+        steps : List[tuple]
+            Steps of the plan in the ordering sequence.
+        inputs : List[int]
+            Slots of the items read from the catalog because they were not 
+            produced by a previous step.
+        outputs : List[int]
+            Slots of the items produced by the steps.
+        """
+
+        self._ids = ids
+        self._steps = steps
+        self._inputs = inputs
+        self._outputs = outputs
+
+    @property
+    def ids(self) -> List[str]:
+        """Gets the _ids attribute.
+
+        Returns
+        -------
+        ids : List[str]
+            IDs of the items. The positions are the slots of the items.
+        """
+
+        return self._ids
+
+    @property
+    def steps(self) -> List[tuple]:
+        """Gets the _steps attribute.
+
+        Returns
+        -------
+        steps : List[tuple]
+            Steps of the plan in the ordering sequence.
+        """
+
+        return self._steps
+
+    @property
+    def inputs(self) -> List[int]:
+        """Gets the _inputs attribute.
+
+        Returns
+        -------
+        inputs : List[int]
+            Slots of the items read from the catalog because they were not 
+            produced by a previous step.
+        """
+
+        return self._inputs
+
+    @property
+    def outputs(self) -> List[int]:
+        """Gets the _outputs attribute.
+
+        Returns
+        -------
+        outputs : List[int]
+            Slots of the items produced by the steps.
+        """
+
+        return self._outputs
+
+    def __repr__(self) -> str:
+        """Builds the representation of an instance.
+
+        Returns
+        -------
+        repr : str
+            Representation of an instance.
+        """
+
+        repr = build_repr(self)
+
+        return repr
+
+
+def compile_pipeline(pipeline: Pipeline, ordering: List[list]) -> Plan:
+    """Compiles a pipeline to a plan.
+
+    Parameters
+    ----------
+    pipeline : Pipeline
+        Pipeline that stores a flow of tasks.
+    ordering : List[list]
+        Ordering of the graph. The inner lists represent groups of nodes 
+        that must be executed sequentially and the nodes within these 
+        groups can be executed simultaneously.
+
+    Returns
+    -------
+    plan : Plan
+        Plan that stores the slot-indexed steps of the pipeline.
+
+    Raises
+    ------
+    PipelineError
+        Informs that the id was not found in the _nodes.
+    """
+
+    slots = {}
+    nodes = []
+    inputs = []
+    outputs = []
+    read_slots = set()
+    produced_slots = set()
+    last_steps = {}
+
+    for group in ordering:
+        for id in group:
+            node = pipeline.get_node(id)
+            pos_slots = tuple(
+                _get_slot(slots, item_id) for item_id in node.pos_inputs
+            )
+            key_slots = tuple(
+                (param, _get_slot(slots, item_id))
+                for param, item_id in node.key_inputs.items()
+            )
+
+            for slot in pos_slots + tuple(slot for _, slot in key_slots):
+                if slot not in produced_slots and slot not in read_slots:
+                    read_slots.add(slot)
+                    inputs.append(slot)
+
+                last_steps[slot] = len(nodes)
+
+            out_slots = tuple(
+                _get_slot(slots, item_id) for item_id in node.outputs
+            )
+
+            for slot in out_slots:
+                if slot not in produced_slots:
+                    produced_slots.add(slot)
+                    outputs.append(slot)
+
+            nodes.append((id, node.task, pos_slots, key_slots, out_slots))
+
+    releases = [[] for _ in nodes]
+
+    for slot, step in last_steps.items():
+        releases[step].append(slot)
+
+    steps = [node + (tuple(releases[i]),) for i, node in enumerate(nodes)]
+    plan = Plan(list(slots), steps, inputs, outputs)
+
+    return plan
+
+
+def _get_slot(slots: Dict[str, int], item_id: str) -> int:
+    """Gets the slot of an item, assigning the next slot in the first call.
+
+    Parameters
+    ----------
+    slots : Dict[str, int]
+        Slots of the items. The keys are the item IDs and the values are 
+        the slots.
+    item_id : str
+        ID of the item.
+
+    Returns
+    -------
+    slot : int
+        Slot of the item.
+    """
+
+    if item_id not in slots:
+        slots[item_id] = len(slots)
+
+    return slots[item_id]
@@ -1,27 +1,340 @@
-"""Classes related to the execution procedures."""
+"""Classes and functions related to the execution procedures."""
 
+import asyncio
 import logging
+import os
+import secrets
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List
+from collections import OrderedDict, deque
+from concurrent.futures import (
+    FIRST_COMPLETED, 
+    Executor, 
+    Future, 
+    ProcessPoolExecutor, 
+    ThreadPoolExecutor, 
+    wait
+)
+from functools import partial
+from inspect import isawaitable, iscoroutinefunction
+from multiprocessing import Pipe, Process
+from multiprocessing.connection import Connection
+from threading import Lock, Thread
+from typing import Any, Callable, Dict, List, Set, Tuple
+from weakref import WeakKeyDictionary
 
 from ipipeline.control.building import (
-    build_graph, build_items, build_key_args, build_pos_args
+    build_compact_graph, 
+    build_consumers_qty, 
+    build_graph, 
+    build_inputs, 
+    build_items, 
+    build_key_args, 
+    build_pos_args, 
+    build_subgraph, 
+    build_tag_ordering, 
+    build_target_ordering
+)
+from ipipeline.control.caching import BaseCache, build_key
+from ipipeline.control.checkpointing import Checkpoint
+from ipipeline.control.clustering import ClusterPool
+from ipipeline.control.compiling import Plan, compile_pipeline
+from ipipeline.control.generating import generate_function
+from ipipeline.control.recording import Record
+from ipipeline.control.scheduling import (
+    BaseScheduler, LevelScheduler, ReadyScheduler, compute_critical_paths
 )
-from ipipeline.control.sorting import sort_topology
-from ipipeline.exceptions import ExecutorError
-from ipipeline.structure.catalog import Catalog
+from ipipeline.control.sorting import sort_compact_topology
+from ipipeline.control.transporting import (
+    SharedTransport, close_blocks, dump_item, load_item
+)
+from ipipeline.exceptions import BaseError, CacheError, ExecutorError
+from ipipeline.structure.catalog import Catalog, measure_item
+from ipipeline.structure.node import Node
 from ipipeline.structure.pipeline import Pipeline
+from ipipeline.utils.checking import check_none
 
 
 logger = logging.getLogger(name=__name__)
+_orderings = OrderedDict()
+_orderings_lock = Lock()
+_max_orderings = 128
+_lanes = ['inline', 'thread', 'process']
+_priorities = ['fifo', 'critical_path']
+_schedulings = ['level', 'ready']
 
 
 class BaseExecutor(ABC):
-    """Provides an interface to the executor classes."""
+    """Provides an interface to the executor classes.
+
+    When the eviction is enabled, the quantity of nodes that consume each 
+    item is counted before the execution and an item is deleted from the 
+    catalog as soon as its last consumer node is executed, which bounds 
+    the memory to the items still required. The items without consumers 
+    and the kept items are never deleted.
+
+    When the cache is set, the items of a node are stored under a key that 
+    fingerprints its task and arguments, so the task is skipped in the 
+    next executions while both are unchanged. The nodes whose arguments 
+    are not picklable are always executed.
+
+    When the record is set, a node is skipped while its task and the 
+    fingerprints of its inputs match the ones recorded by the previous 
+    runs, and a node whose outputs match the recorded ones does not cause 
+    its destination nodes to be executed again (early cutoff).
+
+    When the checkpoint is set, the items of each executed node are 
+    written to its directory, so an interrupted execution is continued by 
+    the resume method from the nodes that were not finished.
+
+    When the include or exclude tags are set, the get_ordering method 
+    returns only the nodes with the included tags and their upstream 
+    nodes, leaving out the nodes with the excluded tags, so a stage of the 
+    pipeline is executed without the rest of it.
+
+    Attributes
+    ----------
+    _eviction : bool
+        Flag that indicates if the consumed items are deleted.
+    _kept_ids : List[str]
+        IDs of the items that are never deleted by the eviction.
+    _cache : BaseCache
+        Cache that stores the items of the executed nodes.
+    _record : Record
+        Record that stores the fingerprints of the executed nodes.
+    _checkpoint : Checkpoint
+        Checkpoint that stores the items of the executed nodes.
+    _include : List[str]
+        Tags of the nodes selected by the get_ordering method along with 
+        their upstream nodes. If None, all the nodes are selected.
+    _exclude : List[str]
+        Tags of the nodes never selected by the get_ordering method.
+    """
+
+    def __init__(
+        self, 
+        eviction: bool = False, 
+        kept_ids: List[str] = None, 
+        cache: BaseCache = None, 
+        record: Record = None, 
+        checkpoint: Checkpoint = None, 
+        include: List[str] = None, 
+        exclude: List[str] = None
+    ) -> None:
+        """Initializes the attributes.
+
+        Parameters
+        ----------
+        eviction : bool, optional
+            Flag that indicates if the consumed items are deleted.
+        kept_ids : List[str], optional
+            IDs of the items that are never deleted by the eviction.
+        cache : BaseCache, optional
+            Cache that stores the items of the executed nodes. If None, 
+            the nodes are always executed.
+        record : Record, optional
+            Record that stores the fingerprints of the executed nodes. If 
+            None, the nodes are always executed.
+        checkpoint : Checkpoint, optional
+            Checkpoint that stores the items of the executed nodes. If 
+            None, the items are not written.
+        include : List[str], optional
+            Tags of the nodes selected by the get_ordering method along 
+            with their upstream nodes. If None, all the nodes are selected.
+        exclude : List[str], optional
+            Tags of the nodes never selected by the get_ordering method.
+        """
+
+        self._eviction = eviction
+        self._kept_ids = check_none(kept_ids, [])
+        self._cache = cache
+        self._record = record
+        self._checkpoint = checkpoint
+        self._include = include
+        self._exclude = check_none(exclude, [])
+
+    @property
+    def eviction(self) -> bool:
+        """Gets the _eviction attribute.
+
+        Returns
+        -------
+        eviction : bool
+            Flag that indicates if the consumed items are deleted.
+        """
+
+        return self._eviction
+
+    @eviction.setter
+    def eviction(self, eviction: bool) -> None:
+        """Sets the _eviction attribute.
+
+        Parameters
+        ----------
+        eviction : bool
+            Flag that indicates if the consumed items are deleted.
+        """
+
+        self._eviction = eviction
+
+    @property
+    def kept_ids(self) -> List[str]:
+        """Gets the _kept_ids attribute.
+
+        Returns
+        -------
+        kept_ids : List[str]
+            IDs of the items that are never deleted by the eviction.
+        """
+
+        return self._kept_ids
+
+    @kept_ids.setter
+    def kept_ids(self, kept_ids: List[str]) -> None:
+        """Sets the _kept_ids attribute.
+
+        Parameters
+        ----------
+        kept_ids : List[str]
+            IDs of the items that are never deleted by the eviction.
+        """
+
+        self._kept_ids = kept_ids
+
+    @property
+    def cache(self) -> BaseCache:
+        """Gets the _cache attribute.
+
+        Returns
+        -------
+        cache : BaseCache
+            Cache that stores the items of the executed nodes.
+        """
+
+        return self._cache
+
+    @cache.setter
+    def cache(self, cache: BaseCache) -> None:
+        """Sets the _cache attribute.
+
+        Parameters
+        ----------
+        cache : BaseCache
+            Cache that stores the items of the executed nodes.
+        """
+
+        self._cache = cache
+
+    @property
+    def record(self) -> Record:
+        """Gets the _record attribute.
+
+        Returns
+        -------
+        record : Record
+            Record that stores the fingerprints of the executed nodes.
+        """
+
+        return self._record
+
+    @record.setter
+    def record(self, record: Record) -> None:
+        """Sets the _record attribute.
+
+        Parameters
+        ----------
+        record : Record
+            Record that stores the fingerprints of the executed nodes.
+        """
+
+        self._record = record
+
+    @property
+    def checkpoint(self) -> Checkpoint:
+        """Gets the _checkpoint attribute.
+
+        Returns
+        -------
+        checkpoint : Checkpoint
+            Checkpoint that stores the items of the executed nodes.
+        """
+
+        return self._checkpoint
+
+    @checkpoint.setter
+    def checkpoint(self, checkpoint: Checkpoint) -> None:
+        """Sets the _checkpoint attribute.
+
+        Parameters
+        ----------
+        checkpoint : Checkpoint
+            Checkpoint that stores the items of the executed nodes.
+        """
+
+        self._checkpoint = checkpoint
+
+    @property
+    def include(self) -> List[str]:
+        """Gets the _include attribute.
+
+        Returns
+        -------
+        include : List[str]
+            Tags of the nodes selected by the get_ordering method along 
+            with their upstream nodes. If None, all the nodes are selected.
+        """
+
+        return self._include
+
+    @include.setter
+    def include(self, include: List[str]) -> None:
+        """Sets the _include attribute.
+
+        Parameters
+        ----------
+        include : List[str]
+            Tags of the nodes selected by the get_ordering method along 
+            with their upstream nodes. If None, all the nodes are selected.
+        """
+
+        self._include = include
+
+    @property
+    def exclude(self) -> List[str]:
+        """Gets the _exclude attribute.
+
+        Returns
+        -------
+        exclude : List[str]
+            Tags of the nodes never selected by the get_ordering method.
+        """
+
+        return self._exclude
+
+    @exclude.setter
+    def exclude(self, exclude: List[str]) -> None:
+        """Sets the _exclude attribute.
+
+        Parameters
+        ----------
+        exclude : List[str]
+            Tags of the nodes never selected by the get_ordering method.
+        """
+
+        self._exclude = exclude
 
     def get_ordering(self, pipeline: Pipeline) -> List[list]:
         """Gets the ordering of a graph.
 
+        The orderings are cached by the process under the structural 
+        fingerprint of the pipelines and the include and exclude tags, so 
+        the graph is built, sorted and sliced only in the first call for 
+        each structure and selection, even when an identical pipeline is 
+        built again, and the fingerprint is computed once per change of 
+        the pipeline. The graph is built in the compact format to keep the 
+        call linear for large pipelines, except for the ordered pipelines, 
+        whose maintained topological order is reused instead of sorting the 
+        graph.
+
         Parameters
         ----------
         pipeline : Pipeline
@@ -33,11 +346,60 @@ class BaseExecutor(ABC):
             Ordering of the graph. The inner lists represent groups of nodes 
             that must be executed sequentially and the nodes within these 
             groups can be executed simultaneously.
+
+        Raises
+        ------
+        BuildingError
+            Informs that the src_id was not found in the pipeline._nodes.
+        BuildingError
+            Informs that the dst_id was not found in the pipeline._nodes.
+        BuildingError
+            Informs that the dst_id was found in the graph[link.src_id].
+        SortingError
+            Informs that a circular dependency was found in the graph.
+        OrderError
+            Informs that the dst_id was found in the _successors[src_id].
+        OrderError
+            Informs that a circular dependency was found in the order.
         """
 
-        graph = build_graph(pipeline)
-        ordering = sort_topology(graph)
-        logger.info(f'ordering: {ordering}')
+        include = self._include
+        exclude = self._exclude
+        key = (
+            pipeline.fingerprint, 
+            None if include is None else tuple(include), 
+            tuple(exclude)
+        )
+
+        with _orderings_lock:
+            ordering = _orderings.get(key)
+
+            if ordering is not None:
+                _orderings.move_to_end(key)
+
+        if ordering is None:
+            if pipeline.ordered:
+                ordering = pipeline.order.get_ordering()
+            else:
+                ids, offsets, targets = build_compact_graph(pipeline)
+                ordering = sort_compact_topology(ids, offsets, targets)
+
+            if include is not None or exclude:
+                ordering = build_tag_ordering(
+                    pipeline, ordering, include=include, exclude=exclude
+                )
+
+            logger.info(f'ordering: {ordering}')
+
+            with _orderings_lock:
+                _orderings[key] = ordering
+
+                while len(_orderings) > _max_orderings:
+                    _orderings.popitem(last=False)
+        else:
+            logger.debug(f'pipeline.id: {pipeline.id}, ordering was cached')
+
+        ordering = [list(group) for group in ordering]
 
         return ordering
 
@@ -70,23 +432,33 @@ class BaseExecutor(ABC):
         node = pipeline.get_node(id)
         logger.info(f'node.id: {node.id}, node.tags: {node.tags}')
 
-        pos_args = build_pos_args(node.pos_inputs, catalog)
-        key_args = build_key_args(node.key_inputs, catalog)
+        task = _get_task(node)
+        fingerprints, items = self._load_record(node, task, catalog)
 
-        try:
-            returns = node.task(*pos_args, **key_args)
-        except Exception as error:
-            raise ExecutorError(
-                'node was not executed by the executor', [f'id == {node.id}']
-            ) from error
+        if items is None:
+            pos_args = build_pos_args(node.pos_inputs, catalog)
+            key_args = build_key_args(node.key_inputs, catalog)
+            key, items = self._load_cache(
+                node.id, task, pos_args, key_args
+            )
 
-        items = build_items(node.outputs, returns)
+            if items is None:
+                items = _execute_task(
+                    node.id, task, pos_args, key_args, node.outputs
+                )
+                self._dump_cache(key, items)
+
+            self._dump_record(node.id, task, fingerprints, items)
 
         return items
 
     @abstractmethod
     def execute_pipeline(
-        self, pipeline: Pipeline, catalog: Catalog, ordering: List[list]
+        self, 
+        pipeline: Pipeline, 
+        catalog: Catalog, 
+        ordering: List[list], 
+        targets: List[str] = None
     ) -> Catalog:
         """Provides an interface to execute a pipeline.
 
@@ -100,6 +472,10 @@ class BaseExecutor(ABC):
             Ordering of the graph. The inner lists represent groups of nodes 
             that must be executed sequentially and the nodes within these 
             groups can be executed simultaneously.
+        targets : List[str], optional
+            IDs of the items to produce. Only the nodes required by them 
+            are executed. If None, all the nodes of the ordering are 
+            executed.
 
         Returns
         -------
@@ -108,20 +484,21 @@ class BaseExecutor(ABC):
 
         Raises
         ------
+        BuildingError
+            Informs that the target was not found in the node outputs.
         ExecutorError
             Informs that the node was not executed by the executor.
         """
 
         pass
 
-
-class SequentialExecutor(BaseExecutor):
-    """Executes a pipeline sequentially."""
-
-    def execute_pipeline(
+    def resume(
         self, pipeline: Pipeline, catalog: Catalog, ordering: List[list]
     ) -> Catalog:
-        """Executes a pipeline.
+        """Resumes the execution of a pipeline from the checkpoint.
+
+        The items of the finished nodes are set in the catalog and the 
+        finished nodes are removed from the ordering before executing it.
 
         Parameters
         ----------
@@ -141,22 +518,3657 @@ class SequentialExecutor(BaseExecutor):
 
         Raises
         ------
+        ExecutorError
+            Informs that the checkpoint was not set in the executor.
         ExecutorError
             Informs that the node was not executed by the executor.
         """
 
-        logger.info(
-            f'pipeline.id: {pipeline.id}, pipeline.tags: {pipeline.tags}'
-        )
-        logger.info(
-            f'catalog.id: {catalog.id}, catalog.tags: {catalog.tags}'
-        )
+        if self._checkpoint is None:
+            raise ExecutorError(
+                'checkpoint was not set in the executor', 
+                [f'checkpoint == {self._checkpoint}']
+            )
 
-        for group in ordering:
-            for node_id in group:
-                items = self.execute_node(pipeline, catalog, node_id)
+        finished_ids = set(self._checkpoint.load_ids())
+        logger.info(f'finished_ids: {sorted(finished_ids)}')
+
+        for item_id, item in self._checkpoint.load_items().items():
+            catalog.set_item(item_id, item)
 
-                for item_id, item in items.items():
-                    catalog.set_item(item_id, item)
+        ordering = [
+            [id for id in group if id not in finished_ids] 
+            for group in ordering
+        ]
+        catalog = self.execute_pipeline(
+            pipeline, catalog, [group for group in ordering if group]
+        )
 
         return catalog
+
+    def _load_record(
+        self, node: Node, task: Callable, catalog: Catalog
+    ) -> Tuple[Dict[str, str], Dict[str, Any]]:
+        """Loads the items of a node from the record when the record is set.
+
+        Parameters
+        ----------
+        node : Node
+            Node that stores a task.
+        task : Callable
+            Task of the node.
+        catalog : Catalog
+            Catalog that stores the items of an execution.
+
+        Returns
+        -------
+        fingerprints : Dict[str, str]
+            Fingerprints of the inputs of the node. The keys are the item 
+            IDs and the values are the fingerprints. If the record is not 
+            set, the inputs are not picklable or the items were found, 
+            None is returned.
+        items : Dict[str, Any]
+            Items of an execution. The keys are the item IDs and the values 
+            are the arguments required by the tasks. If the node was not 
+            recorded or was changed, None is returned.
+        """
+
+        fingerprints = None
+        items = None
+
+        if self._record is not None:
+            try:
+                fingerprints = {
+                    item_id: self._record.fingerprint_item(
+                        item_id, catalog.get_item(item_id)
+                    )
+                    for item_id in build_inputs(
+                        node.pos_inputs, node.key_inputs
+                    )
+                }
+                items = self._record.get_items(
+                    node.id, 
+                    task, 
+                    fingerprints, 
+                    node.outputs, 
+                    {
+                        item_id: catalog.get_item(item_id) 
+                        for item_id in node.outputs 
+                        if catalog.check_item(item_id)
+                    }
+                )
+            except CacheError as error:
+                logger.warning(f'node.id: {node.id}, {error}')
+
+            if items is not None:
+                fingerprints = None
+                logger.info(f'node.id: {node.id}, record hit')
+
+        return fingerprints, items
+
+    def _dump_record(
+        self, 
+        id: str, 
+        task: Callable, 
+        fingerprints: Dict[str, str], 
+        items: Dict[str, Any]
+    ) -> None:
+        """Dumps the items of a node to the record when it was executed.
+
+        Parameters
+        ----------
+        id : str
+            ID of the node.
+        task : Callable
+            Task of the node.
+        fingerprints : Dict[str, str]
+            Fingerprints of the inputs of the node. The keys are the item 
+            IDs and the values are the fingerprints.
+        items : Dict[str, Any]
+            Items of an execution. The keys are the item IDs and the values 
+            are the arguments required by the tasks.
+        """
+
+        if fingerprints is not None:
+            try:
+                if not self._record.set_items(id, task, fingerprints, items):
+                    logger.info(f'node.id: {id}, outputs were unchanged')
+            except CacheError as error:
+                self._record.delete_node(id)
+                logger.warning(f'node.id: {id}, {error}')
+
+    def _load_cache(
+        self, 
+        id: str, 
+        task: Callable, 
+        pos_args: List[Any], 
+        key_args: Dict[str, Any]
+    ) -> Tuple[str, Dict[str, Any]]:
+        """Loads the items of a node from the cache when the cache is set.
+
+        Parameters
+        ----------
+        id : str
+            ID of the node.
+        task : Callable
+            Task of the node.
+        pos_args : List[Any]
+            Positional arguments of the task.
+        key_args : Dict[str, Any]
+            Keyword arguments of the task.
+
+        Returns
+        -------
+        key : str
+            Key of the items in the cache. If the cache is not set or the 
+            arguments are not picklable, None is returned.
+        items : Dict[str, Any]
+            Items of an execution. The keys are the item IDs and the values 
+            are the arguments required by the tasks. If the key was not 
+            found, None is returned.
+        """
+
+        key = None
+        items = None
+
+        if self._cache is not None:
+            try:
+                key = build_key(task, pos_args, key_args)
+                items = self._cache.get_items(key)
+            except CacheError as error:
+                logger.warning(f'node.id: {id}, {error}')
+
+            if items is not None:
+                logger.info(f'node.id: {id}, cache hit')
+
+        return key, items
+
+    def _dump_cache(self, key: str, items: Dict[str, Any]) -> None:
+        """Dumps the items of a node to the cache when the key is set.
+
+        Parameters
+        ----------
+        key : str
+            Key of the items in the cache.
+        items : Dict[str, Any]
+            Items of an execution. The keys are the item IDs and the values 
+            are the arguments required by the tasks.
+        """
+
+        if key is not None:
+            try:
+                self._cache.set_items(key, items)
+            except CacheError as error:
+                logger.warning(f'key: {key}, {error}')
+
+    def _select_targets(
+        self, 
+        pipeline: Pipeline, 
+        catalog: Catalog, 
+        ordering: List[list], 
+        targets: List[str]
+    ) -> List[list]:
+        """Selects the nodes of an ordering required to produce the targets.
+
+        Parameters
+        ----------
+        pipeline : Pipeline
+            Pipeline that stores a flow of tasks.
+        catalog : Catalog
+            Catalog that stores the items of an execution.
+        ordering : List[list]
+            Ordering of the graph. The inner lists represent groups of nodes 
+            that must be executed sequentially and the nodes within these 
+            groups can be executed simultaneously.
+        targets : List[str]
+            IDs of the items to produce. If None, the ordering is returned 
+            unchanged.
+
+        Returns
+        -------
+        ordering : List[list]
+            Ordering of the nodes required to produce the targets.
+
+        Raises
+        ------
+        BuildingError
+            Informs that the target was not found in the node outputs.
+        """
+
+        if targets is not None:
+            ordering = build_target_ordering(
+                pipeline, catalog, ordering, targets
+            )
+            logger.info(f'targets: {targets}, ordering: {ordering}')
+
+        return ordering
+
+    def _count_consumers(
+        self, 
+        pipeline: Pipeline, 
+        ordering: List[list], 
+        targets: List[str] = None
+    ) -> Dict[str, int]:
+        """Counts the consumer nodes of each item when the eviction is set.
+
+        Parameters
+        ----------
+        pipeline : Pipeline
+            Pipeline that stores a flow of tasks.
+        ordering : List[list]
+            Ordering of the graph. The inner lists represent groups of nodes 
+            that must be executed sequentially and the nodes within these 
+            groups can be executed simultaneously.
+        targets : List[str], optional
+            IDs of the items to produce, which are never deleted by the 
+            eviction.
+
+        Returns
+        -------
+        consumers_qty : Dict[str, int]
+            Quantity of consumer nodes for each item. The keys are the item 
+            IDs and the values are the quantity of nodes that take the item 
+            as an input. If the eviction is not set, None is returned.
+        """
+
+        consumers_qty = None
+
+        if self._eviction:
+            consumers_qty = build_consumers_qty(pipeline, ordering)
+
+            for item_id in self._kept_ids + check_none(targets, []):
+                consumers_qty.pop(item_id, None)
+
+        return consumers_qty
+
+    def _store_items(
+        self, 
+        pipeline: Pipeline, 
+        catalog: Catalog, 
+        id: str, 
+        items: Dict[str, Any], 
+        consumers_qty: Dict[str, int]
+    ) -> List[str]:
+        """Stores the items of an executed node in the catalog.
+
+        The items are also written to the checkpoint when it is set and 
+        the items consumed for the last time by the node are deleted from 
+        the catalog when the eviction is set.
+
+        Parameters
+        ----------
+        pipeline : Pipeline
+            Pipeline that stores a flow of tasks.
+        catalog : Catalog
+            Catalog that stores the items of an execution.
+        id : str
+            ID of the node.
+        items : Dict[str, Any]
+            Items of an execution. The keys are the item IDs and the values 
+            are the arguments required by the tasks.
+        consumers_qty : Dict[str, int]
+            Quantity of consumer nodes for each item. The keys are the item 
+            IDs and the values are the quantity of nodes that take the item 
+            as an input. If None, no item is deleted.
+
+        Returns
+        -------
+        evicted_ids : List[str]
+            IDs of the items consumed for the last time by the node.
+
+        Raises
+        ------
+        CheckpointError
+            Informs that the items were not pickled by the checkpoint.
+        """
+
+        evicted_ids = []
+
+        for item_id, item in items.items():
+            catalog.set_item(item_id, item)
+
+        if self._checkpoint is not None:
+            self._checkpoint.dump_items(id, items)
+
+        if consumers_qty is not None:
+            node = pipeline.get_node(id)
+
+            for item_id in build_inputs(node.pos_inputs, node.key_inputs):
+                if item_id in consumers_qty:
+                    consumers_qty[item_id] -= 1
+
+                    if consumers_qty[item_id] == 0:
+                        del consumers_qty[item_id]
+                        evicted_ids.append(item_id)
+
+                        if catalog.check_item(item_id):
+                            catalog.delete_item(item_id)
+                            logger.debug(f'item_id: {item_id}, evicted')
+
+        return evicted_ids
+
+
+class SequentialExecutor(BaseExecutor):
+    """Executes a pipeline sequentially.
+
+    Attributes
+    ----------
+    _eviction : bool
+        Flag that indicates if the consumed items are deleted.
+    _kept_ids : List[str]
+        IDs of the items that are never deleted by the eviction.
+    _cache : BaseCache
+        Cache that stores the items of the executed nodes.
+    _record : Record
+        Record that stores the fingerprints of the executed nodes.
+    _checkpoint : Checkpoint
+        Checkpoint that stores the items of the executed nodes.
+    _include : List[str]
+        Tags of the nodes selected by the get_ordering method along with 
+        their upstream nodes. If None, all the nodes are selected.
+    _exclude : List[str]
+        Tags of the nodes never selected by the get_ordering method.
+    """
+
+    def execute_pipeline(
+        self, 
+        pipeline: Pipeline, 
+        catalog: Catalog, 
+        ordering: List[list], 
+        targets: List[str] = None
+    ) -> Catalog:
+        """Executes a pipeline.
+
+        Parameters
+        ----------
+        pipeline : Pipeline
+            Pipeline that stores a flow of tasks.
+        catalog : Catalog
+            Catalog that stores the items of an execution.
+        ordering : List[list]
+            Ordering of the graph. The inner lists represent groups of nodes 
+            that must be executed sequentially and the nodes within these 
+            groups can be executed simultaneously.
+        targets : List[str], optional
+            IDs of the items to produce. Only the nodes required by them 
+            are executed. If None, all the nodes of the ordering are 
+            executed.
+
+        Returns
+        -------
+        catalog : Catalog
+            Catalog that stores the items of an execution.
+
+        Raises
+        ------
+        BuildingError
+            Informs that the target was not found in the node outputs.
+        ExecutorError
+            Informs that the node was not executed by the executor.
+        """
+
+        logger.info(
+            f'pipeline.id: {pipeline.id}, pipeline.tags: {pipeline.tags}'
+        )
+        logger.info(
+            f'catalog.id: {catalog.id}, catalog.tags: {catalog.tags}'
+        )
+
+        ordering = self._select_targets(pipeline, catalog, ordering, targets)
+        consumers_qty = self._count_consumers(pipeline, ordering, targets)
+
+        for group in ordering:
+            for node_id in group:
+                items = self.execute_node(pipeline, catalog, node_id)
+                self._store_items(
+                    pipeline, catalog, node_id, items, consumers_qty
+                )
+
+        return catalog
+
+
+class PoolExecutor(BaseExecutor):
+    """Provides an interface to the executor classes based on a pool.
+
+    The nodes released by a scheduler are submitted to the pool while 
+    there are idle workers and their items are set in the catalog by the 
+    calling thread as soon as they are returned. The scheduling modes are 
+    the following:
+
+        level: releases the nodes group by group, so each group of the 
+        ordering acts as a barrier.
+        ready: releases each node as soon as its last source node was 
+        executed, regardless of the groups of the ordering.
+
+    The priority modes decide which released node is submitted first when 
+    there are more released nodes than idle workers:
+
+        fifo: submits the nodes in the released order.
+        critical_path: submits first the nodes with the longest path of 
+        costs to the end of the graph.
+
+    Attributes
+    ----------
+    _eviction : bool
+        Flag that indicates if the consumed items are deleted.
+    _kept_ids : List[str]
+        IDs of the items that are never deleted by the eviction.
+    _cache : BaseCache
+        Cache that stores the items of the executed nodes.
+    _record : Record
+        Record that stores the fingerprints of the executed nodes.
+    _checkpoint : Checkpoint
+        Checkpoint that stores the items of the executed nodes.
+    _include : List[str]
+        Tags of the nodes selected by the get_ordering method along with 
+        their upstream nodes. If None, all the nodes are selected.
+    _exclude : List[str]
+        Tags of the nodes never selected by the get_ordering method.
+    _max_workers : int
+        Maximum quantity of workers used to execute the nodes.
+    _scheduling : str
+        Scheduling mode used to release the nodes.
+    _priority : str
+        Priority mode used to submit the released nodes.
+    _costs : Dict[str, float]
+        Costs of the nodes used by the critical_path mode. The keys are 
+        the node IDs and the values are the costs.
+    _transport : SharedTransport
+        Transport that sends the large items to the pools of processes 
+        through shared memory.
+    """
+
+    def __init__(
+        self, 
+        max_workers: int = None, 
+        scheduling: str = 'level', 
+        priority: str = 'fifo', 
+        costs: Dict[str, float] = None, 
+        transport: SharedTransport = None, 
+        **key_args: dict
+    ) -> None:
+        """Initializes the attributes.
+
+        Parameters
+        ----------
+        max_workers : int, optional
+            Maximum quantity of workers used to execute the nodes. If None, 
+            the default of the underlying pool is used.
+        scheduling : str, optional
+            Scheduling mode used to release the nodes.
+        priority : str, optional
+            Priority mode used to submit the released nodes.
+        costs : Dict[str, float], optional
+            Costs of the nodes used by the critical_path mode. The keys are 
+            the node IDs and the values are the costs. The nodes without a 
+            cost are weighted as 1.
+        transport : SharedTransport, optional
+            Transport that sends the large items to the pools of processes 
+            through shared memory. If None, the items are pickled.
+        key_args : dict
+            Keyword arguments of the BaseExecutor class.
+
+        Raises
+        ------
+        ExecutorError
+            Informs that the scheduling was not found in the modes.
+        ExecutorError
+            Informs that the priority was not found in the modes.
+        """
+
+        super().__init__(**key_args)
+
+        self._max_workers = max_workers
+        self._scheduling = _check_mode('scheduling', scheduling, _schedulings)
+        self._priority = _check_mode('priority', priority, _priorities)
+        self._costs = check_none(costs, {})
+        self._transport = transport
+
+    @property
+    def max_workers(self) -> int:
+        """Gets the _max_workers attribute.
+
+        Returns
+        -------
+        max_workers : int
+            Maximum quantity of workers used to execute the nodes.
+        """
+
+        return self._max_workers
+
+    @max_workers.setter
+    def max_workers(self, max_workers: int) -> None:
+        """Sets the _max_workers attribute.
+
+        Parameters
+        ----------
+        max_workers : int
+            Maximum quantity of workers used to execute the nodes.
+        """
+
+        self._max_workers = max_workers
+
+    @property
+    def scheduling(self) -> str:
+        """Gets the _scheduling attribute.
+
+        Returns
+        -------
+        scheduling : str
+            Scheduling mode used to release the nodes.
+        """
+
+        return self._scheduling
+
+    @scheduling.setter
+    def scheduling(self, scheduling: str) -> None:
+        """Sets the _scheduling attribute.
+
+        Parameters
+        ----------
+        scheduling : str
+            Scheduling mode used to release the nodes.
+        """
+
+        self._scheduling = scheduling
+
+    @property
+    def priority(self) -> str:
+        """Gets the _priority attribute.
+
+        Returns
+        -------
+        priority : str
+            Priority mode used to submit the released nodes.
+        """
+
+        return self._priority
+
+    @priority.setter
+    def priority(self, priority: str) -> None:
+        """Sets the _priority attribute.
+
+        Parameters
+        ----------
+        priority : str
+            Priority mode used to submit the released nodes.
+        """
+
+        self._priority = priority
+
+    @property
+    def costs(self) -> Dict[str, float]:
+        """Gets the _costs attribute.
+
+        Returns
+        -------
+        costs : Dict[str, float]
+            Costs of the nodes used by the critical_path mode. The keys are 
+            the node IDs and the values are the costs.
+        """
+
+        return self._costs
+
+    @costs.setter
+    def costs(self, costs: Dict[str, float]) -> None:
+        """Sets the _costs attribute.
+
+        Parameters
+        ----------
+        costs : Dict[str, float]
+            Costs of the nodes used by the critical_path mode. The keys are 
+            the node IDs and the values are the costs.
+        """
+
+        self._costs = costs
+
+    @property
+    def transport(self) -> SharedTransport:
+        """Gets the _transport attribute.
+
+        Returns
+        -------
+        transport : SharedTransport
+            Transport that sends the large items to the pools of processes 
+            through shared memory.
+        """
+
+        return self._transport
+
+    @transport.setter
+    def transport(self, transport: SharedTransport) -> None:
+        """Sets the _transport attribute.
+
+        Parameters
+        ----------
+        transport : SharedTransport
+            Transport that sends the large items to the pools of processes 
+            through shared memory.
+        """
+
+        self._transport = transport
+
+    def create_scheduler(
+        self, pipeline: Pipeline, ordering: List[list]
+    ) -> BaseScheduler:
+        """Creates a scheduler according to the scheduling mode.
+
+        Parameters
+        ----------
+        pipeline : Pipeline
+            Pipeline that stores a flow of tasks.
+        ordering : List[list]
+            Ordering of the graph. The inner lists represent groups of nodes 
+            that must be executed sequentially and the nodes within these 
+            groups can be executed simultaneously.
+
+        Returns
+        -------
+        scheduler : BaseScheduler
+            Scheduler that releases the nodes ready to be executed.
+        """
+
+        scheduler = _create_scheduler(
+            pipeline, ordering, self._scheduling, self._priority, self._costs
+        )
+
+        return scheduler
+
+    @abstractmethod
+    def count_workers(self) -> int:
+        """Provides an interface to count the workers of a pool.
+
+        Returns
+        -------
+        workers_qty : int
+            Quantity of workers that execute the nodes simultaneously.
+        """
+
+        pass
+
+    @abstractmethod
+    def create_pool(self) -> Executor:
+        """Provides an interface to create a pool.
+
+        Returns
+        -------
+        pool : Executor
+            Pool that executes the nodes.
+        """
+
+        pass
+
+    @abstractmethod
+    def submit_node(
+        self, pool: Executor, pipeline: Pipeline, catalog: Catalog, id: str
+    ) -> Future:
+        """Provides an interface to submit a node to a pool.
+
+        Parameters
+        ----------
+        pool : Executor
+            Pool that executes the nodes.
+        pipeline : Pipeline
+            Pipeline that stores a flow of tasks.
+        catalog : Catalog
+            Catalog that stores the items of an execution.
+        id : str
+            ID of the node.
+
+        Returns
+        -------
+        future : Future
+            Future that resolves to the items of an execution.
+        """
+
+        pass
+
+    def evict_items(self, pool: Executor, item_ids: List[str]) -> None:
+        """Evicts the items consumed for the last time from a pool.
+
+        The items are already deleted from the catalog, so only their 
+        transport blocks are released here. The subclasses override this 
+        method to release what the pool keeps for them.
+
+        Parameters
+        ----------
+        pool : Executor
+            Pool that executes the nodes.
+        item_ids : List[str]
+            IDs of the items.
+        """
+
+        if self._transport is not None:
+            self._transport.release_items(item_ids)
+
+    def collect_items(self, pool: Executor, catalog: Catalog) -> None:
+        """Collects the items kept by a pool to the catalog.
+
+        The subclasses override this method when the pool keeps items that 
+        are not in the catalog at the end of the execution.
+
+        Parameters
+        ----------
+        pool : Executor
+            Pool that executes the nodes.
+        catalog : Catalog
+            Catalog that stores the items of an execution.
+        """
+
+        pass
+
+    def submit_task(
+        self, pool: Executor, pipeline: Pipeline, catalog: Catalog, id: str
+    ) -> Future:
+        """Submits the task of a node to a pool of processes.
+
+        The arguments of the node are built and looked up in the cache by 
+        the calling process and only them are sent to the pool. The items 
+        returned by the pool are dumped to the cache when it is set. When 
+        the transport is set, the large arguments and returns are passed 
+        through shared memory instead of being pickled.
+
+        Parameters
+        ----------
+        pool : Executor
+            Pool that executes the nodes.
+        pipeline : Pipeline
+            Pipeline that stores a flow of tasks.
+        catalog : Catalog
+            Catalog that stores the items of an execution.
+        id : str
+            ID of the node.
+
+        Returns
+        -------
+        future : Future
+            Future that resolves to the items of an execution.
+        """
+
+        node = pipeline.get_node(id)
+        logger.info(f'node.id: {node.id}, node.tags: {node.tags}')
+
+        task = _get_task(node)
+        fingerprints, items = self._load_record(node, task, catalog)
+        key = None
+
+        if items is None:
+            pos_args = build_pos_args(node.pos_inputs, catalog)
+            key_args = build_key_args(node.key_inputs, catalog)
+            key, items = self._load_cache(
+                node.id, task, pos_args, key_args
+            )
+
+        if items is None and self._transport is not None:
+            pos_args, key_args = self._transport.export_args(
+                node.pos_inputs, node.key_inputs, pos_args, key_args
+            )
+            pool_future = pool.submit(
+                _execute_shared_task, 
+                node.id, 
+                task, 
+                pos_args, 
+                key_args, 
+                node.outputs, 
+                self._transport.min_size
+            )
+            future = Future()
+            pool_future.add_done_callback(
+                partial(_import_future, self._transport, future)
+            )
+            future.add_done_callback(partial(_cancel_future, pool_future))
+            future.add_done_callback(
+                partial(self._dump_future, node, key, fingerprints)
+            )
+        elif items is None:
+            future = pool.submit(
+                _execute_task, 
+                node.id, 
+                task, 
+                pos_args, 
+                key_args, 
+                node.outputs
+            )
+            future.add_done_callback(
+                partial(self._dump_future, node, key, fingerprints)
+            )
+        else:
+            self._dump_record(node.id, task, fingerprints, items)
+            future = Future()
+            future.set_result(items)
+
+        return future
+
+    def _dump_future(
+        self, 
+        node: Node, 
+        key: str, 
+        fingerprints: Dict[str, str], 
+        future: Future
+    ) -> None:
+        """Dumps the items of a resolved future to the cache and record.
+
+        Parameters
+        ----------
+        node : Node
+            Node that stores a task.
+        key : str
+            Key of the items in the cache.
+        fingerprints : Dict[str, str]
+            Fingerprints of the inputs of the node. The keys are the item 
+            IDs and the values are the fingerprints.
+        future : Future
+            Future that resolves to the items of an execution.
+        """
+
+        if not future.cancelled() and future.exception() is None:
+            items = future.result()
+            self._dump_cache(key, items)
+            self._dump_record(node.id, node.task, fingerprints, items)
+
+    def execute_pipeline(
+        self, 
+        pipeline: Pipeline, 
+        catalog: Catalog, 
+        ordering: List[list], 
+        targets: List[str] = None
+    ) -> Catalog:
+        """Executes a pipeline.
+
+        Parameters
+        ----------
+        pipeline : Pipeline
+            Pipeline that stores a flow of tasks.
+        catalog : Catalog
+            Catalog that stores the items of an execution.
+        ordering : List[list]
+            Ordering of the graph. The inner lists represent groups of nodes 
+            that must be executed sequentially and the nodes within these 
+            groups can be executed simultaneously.
+        targets : List[str], optional
+            IDs of the items to produce. Only the nodes required by them 
+            are executed. If None, all the nodes of the ordering are 
+            executed.
+
+        Returns
+        -------
+        catalog : Catalog
+            Catalog that stores the items of an execution.
+
+        Raises
+        ------
+        BuildingError
+            Informs that the target was not found in the node outputs.
+        ExecutorError
+            Informs that the node was not executed by the executor.
+        ExecutorError
+            Informs that the nodes were not released by the scheduler.
+        """
+
+        logger.info(
+            f'pipeline.id: {pipeline.id}, pipeline.tags: {pipeline.tags}'
+        )
+        logger.info(
+            f'catalog.id: {catalog.id}, catalog.tags: {catalog.tags}'
+        )
+
+        ordering = self._select_targets(pipeline, catalog, ordering, targets)
+        scheduler = self.create_scheduler(pipeline, ordering)
+        consumers_qty = self._count_consumers(pipeline, ordering, targets)
+        workers_qty = self.count_workers()
+        futures = {}
+
+        try:
+            with self.create_pool() as pool:
+                try:
+                    while scheduler.check_pending():
+                        while (
+                            scheduler.check_ready() and 
+                            len(futures) < workers_qty
+                        ):
+                            node_id = scheduler.pop_ready()
+                            future = self.submit_node(
+                                pool, pipeline, catalog, node_id
+                            )
+                            futures[future] = node_id
+
+                        if not futures:
+                            raise ExecutorError(
+                                'nodes were not released by the scheduler', 
+                                [f'scheduling == {self._scheduling}']
+                            )
+
+                        done, _ = wait(futures, return_when=FIRST_COMPLETED)
+
+                        for future in done:
+                            node_id = futures.pop(future)
+                            items = _get_items(future, node_id)
+                            evicted_ids = self._store_items(
+                                pipeline, 
+                                catalog, 
+                                node_id, 
+                                items, 
+                                consumers_qty
+                            )
+                            self.evict_items(pool, evicted_ids)
+                            scheduler.release(node_id)
+
+                    self.collect_items(pool, catalog)
+                except Exception:
+                    for future in futures:
+                        future.cancel()
+
+                    raise
+        finally:
+            if self._transport is not None:
+                self._transport.release()
+
+        return catalog
+
+
+class ThreadExecutor(PoolExecutor):
+    """Executes a pipeline concurrently through a pool of threads.
+
+    Suits the tasks bound to I/O operations that release the GIL.
+
+    Attributes
+    ----------
+    _eviction : bool
+        Flag that indicates if the consumed items are deleted.
+    _kept_ids : List[str]
+        IDs of the items that are never deleted by the eviction.
+    _cache : BaseCache
+        Cache that stores the items of the executed nodes.
+    _record : Record
+        Record that stores the fingerprints of the executed nodes.
+    _checkpoint : Checkpoint
+        Checkpoint that stores the items of the executed nodes.
+    _include : List[str]
+        Tags of the nodes selected by the get_ordering method along with 
+        their upstream nodes. If None, all the nodes are selected.
+    _exclude : List[str]
+        Tags of the nodes never selected by the get_ordering method.
+    _max_workers : int
+        Maximum quantity of threads used to execute the nodes.
+    _scheduling : str
+        Scheduling mode used to release the nodes.
+    _priority : str
+        Priority mode used to submit the released nodes.
+    _costs : Dict[str, float]
+        Costs of the nodes used by the critical_path mode. The keys are 
+        the node IDs and the values are the costs.
+    _transport : SharedTransport
+        Transport that sends the large items to the pools of processes 
+        through shared memory.
+    """
+
+    def count_workers(self) -> int:
+        """Counts the workers of a pool of threads.
+
+        Returns
+        -------
+        workers_qty : int
+            Quantity of workers that execute the nodes simultaneously.
+        """
+
+        workers_qty = check_none(
+            self._max_workers, min(32, (os.cpu_count() or 1) + 4)
+        )
+
+        return workers_qty
+
+    def create_pool(self) -> Executor:
+        """Creates a pool of threads.
+
+        Returns
+        -------
+        pool : Executor
+            Pool that executes the nodes.
+        """
+
+        pool = ThreadPoolExecutor(max_workers=self._max_workers)
+
+        return pool
+
+    def submit_node(
+        self, pool: Executor, pipeline: Pipeline, catalog: Catalog, id: str
+    ) -> Future:
+        """Submits a node to a pool of threads.
+
+        Parameters
+        ----------
+        pool : Executor
+            Pool that executes the nodes.
+        pipeline : Pipeline
+            Pipeline that stores a flow of tasks.
+        catalog : Catalog
+            Catalog that stores the items of an execution.
+        id : str
+            ID of the node.
+
+        Returns
+        -------
+        future : Future
+            Future that resolves to the items of an execution.
+        """
+
+        future = pool.submit(self.execute_node, pipeline, catalog, id)
+
+        return future
+
+
+class ProcessExecutor(PoolExecutor):
+    """Executes a pipeline in parallel through a pool of processes.
+
+    Suits the tasks bound to CPU operations. The arguments of a node are 
+    built in the calling process and only them are sent to the workers, 
+    therefore the tasks, arguments and returns must be picklable.
+
+    Attributes
+    ----------
+    _eviction : bool
+        Flag that indicates if the consumed items are deleted.
+    _kept_ids : List[str]
+        IDs of the items that are never deleted by the eviction.
+    _cache : BaseCache
+        Cache that stores the items of the executed nodes.
+    _record : Record
+        Record that stores the fingerprints of the executed nodes.
+    _checkpoint : Checkpoint
+        Checkpoint that stores the items of the executed nodes.
+    _include : List[str]
+        Tags of the nodes selected by the get_ordering method along with 
+        their upstream nodes. If None, all the nodes are selected.
+    _exclude : List[str]
+        Tags of the nodes never selected by the get_ordering method.
+    _max_workers : int
+        Maximum quantity of processes used to execute the nodes.
+    _scheduling : str
+        Scheduling mode used to release the nodes.
+    _priority : str
+        Priority mode used to submit the released nodes.
+    _costs : Dict[str, float]
+        Costs of the nodes used by the critical_path mode. The keys are 
+        the node IDs and the values are the costs.
+    _transport : SharedTransport
+        Transport that sends the large items to the pools of processes 
+        through shared memory.
+    """
+
+    def count_workers(self) -> int:
+        """Counts the workers of a pool of processes.
+
+        Returns
+        -------
+        workers_qty : int
+            Quantity of workers that execute the nodes simultaneously.
+        """
+
+        workers_qty = check_none(self._max_workers, os.cpu_count() or 1)
+
+        return workers_qty
+
+    def create_pool(self) -> Executor:
+        """Creates a pool of processes.
+
+        Returns
+        -------
+        pool : Executor
+            Pool that executes the nodes.
+        """
+
+        pool = ProcessPoolExecutor(max_workers=self._max_workers)
+
+        return pool
+
+    def submit_node(
+        self, pool: Executor, pipeline: Pipeline, catalog: Catalog, id: str
+    ) -> Future:
+        """Submits a node to a pool of processes.
+
+        Parameters
+        ----------
+        pool : Executor
+            Pool that executes the nodes.
+        pipeline : Pipeline
+            Pipeline that stores a flow of tasks.
+        catalog : Catalog
+            Catalog that stores the items of an execution.
+        id : str
+            ID of the node.
+
+        Returns
+        -------
+        future : Future
+            Future that resolves to the items of an execution.
+        """
+
+        future = self.submit_task(pool, pipeline, catalog, id)
+
+        return future
+
+
+class HybridExecutor(PoolExecutor):
+    """Executes a pipeline through lanes selected by the tags of the nodes.
+
+    The lanes share the same scheduler, so the nodes of different lanes 
+    are executed simultaneously. The lane of a node is given by the first 
+    of its tags that matches a lane, otherwise the default lane is used. 
+    The lanes are the following:
+
+        inline: executes the node in the calling thread, which suits the 
+        tasks so small that a pool would cost more than the task itself.
+        thread: executes the node in a pool of threads, which suits the 
+        tasks bound to I/O operations.
+        process: executes the node in a pool of processes, which suits the 
+        tasks bound to CPU operations.
+
+    Attributes
+    ----------
+    _eviction : bool
+        Flag that indicates if the consumed items are deleted.
+    _kept_ids : List[str]
+        IDs of the items that are never deleted by the eviction.
+    _cache : BaseCache
+        Cache that stores the items of the executed nodes.
+    _record : Record
+        Record that stores the fingerprints of the executed nodes.
+    _checkpoint : Checkpoint
+        Checkpoint that stores the items of the executed nodes.
+    _include : List[str]
+        Tags of the nodes selected by the get_ordering method along with 
+        their upstream nodes. If None, all the nodes are selected.
+    _exclude : List[str]
+        Tags of the nodes never selected by the get_ordering method.
+    _max_workers : int
+        Maximum quantity of threads used to execute the nodes.
+    _scheduling : str
+        Scheduling mode used to release the nodes.
+    _priority : str
+        Priority mode used to submit the released nodes.
+    _costs : Dict[str, float]
+        Costs of the nodes used by the critical_path mode. The keys are 
+        the node IDs and the values are the costs.
+    _transport : SharedTransport
+        Transport that sends the large items to the pools of processes 
+        through shared memory.
+    _max_processes : int
+        Maximum quantity of processes used to execute the nodes.
+    _lane : str
+        Default lane of the nodes whose tags do not match a lane.
+    """
+
+    def __init__(
+        self, 
+        max_workers: int = None, 
+        scheduling: str = 'level', 
+        priority: str = 'fifo', 
+        costs: Dict[str, float] = None, 
+        max_processes: int = None, 
+        lane: str = 'thread', 
+        **key_args: dict
+    ) -> None:
+        """Initializes the attributes.
+
+        Parameters
+        ----------
+        max_workers : int, optional
+            Maximum quantity of threads used to execute the nodes. If None, 
+            the default of the ThreadPoolExecutor class is used.
+        scheduling : str, optional
+            Scheduling mode used to release the nodes.
+        priority : str, optional
+            Priority mode used to submit the released nodes.
+        costs : Dict[str, float], optional
+            Costs of the nodes used by the critical_path mode. The keys are 
+            the node IDs and the values are the costs. The nodes without a 
+            cost are weighted as 1.
+        max_processes : int, optional
+            Maximum quantity of processes used to execute the nodes. If 
+            None, the default of the ProcessPoolExecutor class is used.
+        lane : str, optional
+            Default lane of the nodes whose tags do not match a lane.
+        key_args : dict
+            Keyword arguments of the BaseExecutor class.
+
+        Raises
+        ------
+        ExecutorError
+            Informs that the scheduling was not found in the modes.
+        ExecutorError
+            Informs that the priority was not found in the modes.
+        ExecutorError
+            Informs that the lane was not found in the lanes.
+        """
+
+        super().__init__(
+            max_workers=max_workers, 
+            scheduling=scheduling, 
+            priority=priority, 
+            costs=costs, 
+            **key_args
+        )
+
+        self._max_processes = max_processes
+        self._lane = self._check_lane(lane)
+
+    @property
+    def max_processes(self) -> int:
+        """Gets the _max_processes attribute.
+
+        Returns
+        -------
+        max_processes : int
+            Maximum quantity of processes used to execute the nodes.
+        """
+
+        return self._max_processes
+
+    @max_processes.setter
+    def max_processes(self, max_processes: int) -> None:
+        """Sets the _max_processes attribute.
+
+        Parameters
+        ----------
+        max_processes : int
+            Maximum quantity of processes used to execute the nodes.
+        """
+
+        self._max_processes = max_processes
+
+    @property
+    def lane(self) -> str:
+        """Gets the _lane attribute.
+
+        Returns
+        -------
+        lane : str
+            Default lane of the nodes whose tags do not match a lane.
+        """
+
+        return self._lane
+
+    @lane.setter
+    def lane(self, lane: str) -> None:
+        """Sets the _lane attribute.
+
+        Parameters
+        ----------
+        lane : str
+            Default lane of the nodes whose tags do not match a lane.
+        """
+
+        self._lane = lane
+
+    def get_lane(self, pipeline: Pipeline, id: str) -> str:
+        """Gets the lane of a node.
+
+        Parameters
+        ----------
+        pipeline : Pipeline
+            Pipeline that stores a flow of tasks.
+        id : str
+            ID of the node.
+
+        Returns
+        -------
+        lane : str
+            Lane where the node is executed.
+        """
+
+        for tag in pipeline.get_node(id).tags:
+            if tag in _lanes:
+                return tag
+
+        return self._lane
+
+    def count_workers(self) -> int:
+        """Counts the workers of the pools of threads and processes.
+
+        Returns
+        -------
+        workers_qty : int
+            Quantity of workers that execute the nodes simultaneously.
+        """
+
+        workers_qty = check_none(
+            self._max_workers, min(32, (os.cpu_count() or 1) + 4)
+        ) + check_none(self._max_processes, os.cpu_count() or 1)
+
+        return workers_qty
+
+    def create_pool(self) -> Executor:
+        """Creates a pool of lanes.
+
+        The pools of threads and processes are created only when they are 
+        used by a node.
+
+        Returns
+        -------
+        pool : Executor
+            Pool that executes the nodes.
+        """
+
+        pool = _LanePool(self._max_workers, self._max_processes)
+
+        return pool
+
+    def submit_node(
+        self, pool: Executor, pipeline: Pipeline, catalog: Catalog, id: str
+    ) -> Future:
+        """Submits a node to the pool of its lane.
+
+        Parameters
+        ----------
+        pool : Executor
+            Pool that executes the nodes.
+        pipeline : Pipeline
+            Pipeline that stores a flow of tasks.
+        catalog : Catalog
+            Catalog that stores the items of an execution.
+        id : str
+            ID of the node.
+
+        Returns
+        -------
+        future : Future
+            Future that resolves to the items of an execution.
+        """
+
+        lane = self.get_lane(pipeline, id)
+
+        if lane == 'process':
+            future = self.submit_task(
+                pool.get_pool(lane), pipeline, catalog, id
+            )
+        elif lane == 'thread':
+            future = pool.get_pool(lane).submit(
+                self.execute_node, pipeline, catalog, id
+            )
+        else:
+            future = Future()
+
+            try:
+                future.set_result(self.execute_node(pipeline, catalog, id))
+            except Exception as error:
+                future.set_exception(error)
+
+        return future
+
+    def _check_lane(self, lane: str) -> str:
+        """Checks if the lane matches a lane.
+
+        Parameters
+        ----------
+        lane : str
+            Default lane of the nodes whose tags do not match a lane.
+
+        Returns
+        -------
+        lane : str
+            Default lane of the nodes whose tags do not match a lane.
+
+        Raises
+        ------
+        ExecutorError
+            Informs that the lane was not found in the lanes.
+        """
+
+        if lane in _lanes:
+            return lane
+        else:
+            raise ExecutorError(
+                'lane was not found in the lanes', [f'lane == {lane}']
+            )
+
+
+class DistributedExecutor(PoolExecutor):
+    """Executes a pipeline through processes that keep their items.
+
+    Each worker is a process with its own store of items. The items 
+    returned by a node stay in the worker that executed it and the 
+    catalog receives only placeholders, so the calling process tracks 
+    their locations instead of their values. A released node is sent to 
+    the idle worker that holds the most bytes of its inputs. The inputs 
+    held by other workers are fetched through the calling process and the 
+    inputs of the catalog are sent along with the node, both remaining in 
+    the worker for the next nodes. Thus a chain of nodes executed by the 
+    same worker never sends its items through the calling process. The 
+    remaining items are collected to the catalog at the end of the 
+    execution.
+
+    The tasks, arguments and returns must be picklable. The cache, record, 
+    checkpoint and transport are not supported, since the items do not 
+    pass through the calling process.
+
+    Attributes
+    ----------
+    _eviction : bool
+        Flag that indicates if the consumed items are deleted.
+    _kept_ids : List[str]
+        IDs of the items that are never deleted by the eviction.
+    _cache : BaseCache
+        Cache that stores the items of the executed nodes.
+    _record : Record
+        Record that stores the fingerprints of the executed nodes.
+    _checkpoint : Checkpoint
+        Checkpoint that stores the items of the executed nodes.
+    _include : List[str]
+        Tags of the nodes selected by the get_ordering method along with 
+        their upstream nodes. If None, all the nodes are selected.
+    _exclude : List[str]
+        Tags of the nodes never selected by the get_ordering method.
+    _max_workers : int
+        Maximum quantity of processes used to execute the nodes.
+    _scheduling : str
+        Scheduling mode used to release the nodes.
+    _priority : str
+        Priority mode used to submit the released nodes.
+    _costs : Dict[str, float]
+        Costs of the nodes used by the critical_path mode. The keys are 
+        the node IDs and the values are the costs.
+    _transport : SharedTransport
+        Transport that sends the large items to the pools of processes 
+        through shared memory.
+    """
+
+    def __init__(
+        self, 
+        max_workers: int = None, 
+        scheduling: str = 'level', 
+        priority: str = 'fifo', 
+        costs: Dict[str, float] = None, 
+        **key_args: dict
+    ) -> None:
+        """Initializes the attributes.
+
+        Parameters
+        ----------
+        max_workers : int, optional
+            Maximum quantity of processes used to execute the nodes. If 
+            None, the quantity of CPUs is used.
+        scheduling : str, optional
+            Scheduling mode used to release the nodes.
+        priority : str, optional
+            Priority mode used to submit the released nodes.
+        costs : Dict[str, float], optional
+            Costs of the nodes used by the critical_path mode. The keys are 
+            the node IDs and the values are the costs. The nodes without a 
+            cost are weighted as 1.
+        key_args : dict
+            Keyword arguments of the BaseExecutor class.
+
+        Raises
+        ------
+        ExecutorError
+            Informs that the param was not supported by the executor.
+        ExecutorError
+            Informs that the scheduling was not found in the modes.
+        ExecutorError
+            Informs that the priority was not found in the modes.
+        """
+
+        for param in ['cache', 'record', 'checkpoint', 'transport']:
+            if key_args.get(param) is not None:
+                raise ExecutorError(
+                    f'{param} was not supported by the executor', 
+                    [f'{param} == {key_args[param]}']
+                )
+
+        super().__init__(
+            max_workers=max_workers, 
+            scheduling=scheduling, 
+            priority=priority, 
+            costs=costs, 
+            **key_args
+        )
+
+    def count_workers(self) -> int:
+        """Counts the worker processes.
+
+        Returns
+        -------
+        workers_qty : int
+            Quantity of workers that execute the nodes simultaneously.
+        """
+
+        workers_qty = check_none(self._max_workers, os.cpu_count() or 1)
+
+        return workers_qty
+
+    def create_pool(self) -> Executor:
+        """Creates a pool of worker processes.
+
+        Returns
+        -------
+        pool : Executor
+            Pool that executes the nodes.
+        """
+
+        pool = _WorkerPool(self.count_workers())
+
+        return pool
+
+    def submit_node(
+        self, pool: Executor, pipeline: Pipeline, catalog: Catalog, id: str
+    ) -> Future:
+        """Submits a node to the worker that holds the most of its inputs.
+
+        Parameters
+        ----------
+        pool : Executor
+            Pool that executes the nodes.
+        pipeline : Pipeline
+            Pipeline that stores a flow of tasks.
+        catalog : Catalog
+            Catalog that stores the items of an execution.
+        id : str
+            ID of the node.
+
+        Returns
+        -------
+        future : Future
+            Future that resolves to the placeholders of the items of an 
+            execution.
+
+        Raises
+        ------
+        CatalogError
+            Informs that the id was not found in the _items.
+        """
+
+        node = pipeline.get_node(id)
+        logger.info(f'node.id: {node.id}, node.tags: {node.tags}')
+
+        future = pool.submit_node(node, catalog)
+
+        return future
+
+    def evict_items(self, pool: Executor, item_ids: List[str]) -> None:
+        """Deletes the items consumed for the last time from the workers.
+
+        Parameters
+        ----------
+        pool : Executor
+            Pool that executes the nodes.
+        item_ids : List[str]
+            IDs of the items.
+        """
+
+        pool.delete_items(item_ids)
+
+    def collect_items(self, pool: Executor, catalog: Catalog) -> None:
+        """Collects the items held by the workers to the catalog.
+
+        Parameters
+        ----------
+        pool : Executor
+            Pool that executes the nodes.
+        catalog : Catalog
+            Catalog that stores the items of an execution.
+
+        Raises
+        ------
+        ExecutorError
+            Informs that the items were not collected from the workers.
+        """
+
+        pool.collect_items(catalog)
+
+
+class ClusterExecutor(PoolExecutor):
+    """Executes a pipeline through workers connected over TCP.
+
+    The calling process acts as a coordinator that listens to an address 
+    until the quantity of workers is connected. The workers are started 
+    apart, on this or other machines, by the ipipeline worker command. 
+    Each worker pulls a node when it is idle along with the arguments it 
+    needs, executes it and pushes back its items. The tasks are sent as 
+    module:function references and imported by the workers, therefore 
+    they must be declared at the module level of a module found in the 
+    paths of the workers, while the arguments and returns must be 
+    picklable. The transport only applies when the workers share the 
+    machine of the coordinator.
+
+    Attributes
+    ----------
+    _eviction : bool
+        Flag that indicates if the consumed items are deleted.
+    _kept_ids : List[str]
+        IDs of the items that are never deleted by the eviction.
+    _cache : BaseCache
+        Cache that stores the items of the executed nodes.
+    _record : Record
+        Record that stores the fingerprints of the executed nodes.
+    _checkpoint : Checkpoint
+        Checkpoint that stores the items of the executed nodes.
+    _include : List[str]
+        Tags of the nodes selected by the get_ordering method along with 
+        their upstream nodes. If None, all the nodes are selected.
+    _exclude : List[str]
+        Tags of the nodes never selected by the get_ordering method.
+    _max_workers : int
+        Quantity of workers awaited by the coordinator.
+    _scheduling : str
+        Scheduling mode used to release the nodes.
+    _priority : str
+        Priority mode used to submit the released nodes.
+    _costs : Dict[str, float]
+        Costs of the nodes used by the critical_path mode. The keys are 
+        the node IDs and the values are the costs.
+    _transport : SharedTransport
+        Transport that sends the large items to the pools of processes 
+        through shared memory.
+    _host : str
+        Host listened by the coordinator.
+    _port : int
+        Port listened by the coordinator.
+    _authkey : bytes
+        Key that authenticates the connections of the workers.
+    _timeout : float
+        Seconds to wait for the workers to connect.
+    """
+
+    def __init__(
+        self, 
+        max_workers: int = None, 
+        scheduling: str = 'level', 
+        priority: str = 'fifo', 
+        costs: Dict[str, float] = None, 
+        host: str = 'localhost', 
+        port: int = 6400, 
+        authkey: bytes = None, 
+        timeout: float = 60.0, 
+        **key_args: dict
+    ) -> None:
+        """Initializes the attributes.
+
+        Parameters
+        ----------
+        max_workers : int, optional
+            Quantity of workers awaited by the coordinator. If None, a 
+            single worker is awaited.
+        scheduling : str, optional
+            Scheduling mode used to release the nodes.
+        priority : str, optional
+            Priority mode used to submit the released nodes.
+        costs : Dict[str, float], optional
+            Costs of the nodes used by the critical_path mode. The keys are 
+            the node IDs and the values are the costs. The nodes without a 
+            cost are weighted as 1.
+        host : str, optional
+            Host listened by the coordinator.
+        port : int, optional
+            Port listened by the coordinator.
+        authkey : bytes, optional
+            Key that authenticates the connections of the workers. If None, 
+            a random key is generated and read from the authkey attribute 
+            to start the workers, since the connections are always 
+            authenticated.
+        timeout : float, optional
+            Seconds to wait for the workers to connect.
+        key_args : dict
+            Keyword arguments of the BaseExecutor class.
+
+        Raises
+        ------
+        ExecutorError
+            Informs that the scheduling was not found in the modes.
+        ExecutorError
+            Informs that the priority was not found in the modes.
+        """
+
+        super().__init__(
+            max_workers=max_workers, 
+            scheduling=scheduling, 
+            priority=priority, 
+            costs=costs, 
+            **key_args
+        )
+
+        self._host = host
+        self._port = port
+        self._authkey = check_none(
+            authkey, secrets.token_hex(32).encode()
+        )
+        self._timeout = timeout
+
+    @property
+    def host(self) -> str:
+        """Gets the _host attribute.
+
+        Returns
+        -------
+        host : str
+            Host listened by the coordinator.
+        """
+
+        return self._host
+
+    @host.setter
+    def host(self, host: str) -> None:
+        """Sets the _host attribute.
+
+        Parameters
+        ----------
+        host : str
+            Host listened by the coordinator.
+        """
+
+        self._host = host
+
+    @property
+    def port(self) -> int:
+        """Gets the _port attribute.
+
+        Returns
+        -------
+        port : int
+            Port listened by the coordinator.
+        """
+
+        return self._port
+
+    @port.setter
+    def port(self, port: int) -> None:
+        """Sets the _port attribute.
+
+        Parameters
+        ----------
+        port : int
+            Port listened by the coordinator.
+        """
+
+        self._port = port
+
+    @property
+    def authkey(self) -> bytes:
+        """Gets the _authkey attribute.
+
+        Returns
+        -------
+        authkey : bytes
+            Key that authenticates the connections of the workers.
+        """
+
+        return self._authkey
+
+    @authkey.setter
+    def authkey(self, authkey: bytes) -> None:
+        """Sets the _authkey attribute.
+
+        Parameters
+        ----------
+        authkey : bytes
+            Key that authenticates the connections of the workers.
+        """
+
+        self._authkey = authkey
+
+    @property
+    def timeout(self) -> float:
+        """Gets the _timeout attribute.
+
+        Returns
+        -------
+        timeout : float
+            Seconds to wait for the workers to connect.
+        """
+
+        return self._timeout
+
+    @timeout.setter
+    def timeout(self, timeout: float) -> None:
+        """Sets the _timeout attribute.
+
+        Parameters
+        ----------
+        timeout : float
+            Seconds to wait for the workers to connect.
+        """
+
+        self._timeout = timeout
+
+    def count_workers(self) -> int:
+        """Counts the workers awaited by the coordinator.
+
+        Returns
+        -------
+        workers_qty : int
+            Quantity of workers that execute the nodes simultaneously.
+        """
+
+        workers_qty = check_none(self._max_workers, 1)
+
+        return workers_qty
+
+    def create_pool(self) -> Executor:
+        """Creates a pool of workers connected over TCP.
+
+        Returns
+        -------
+        pool : Executor
+            Pool that executes the nodes.
+
+        Raises
+        ------
+        ClusterError
+            Informs that the authkey was not found in the arguments.
+        ClusterError
+            Informs that the workers were not connected to the coordinator.
+        """
+
+        pool = ClusterPool(
+            (self._host, self._port), 
+            self.count_workers(), 
+            self._authkey, 
+            timeout=self._timeout
+        )
+
+        return pool
+
+    def submit_node(
+        self, pool: Executor, pipeline: Pipeline, catalog: Catalog, id: str
+    ) -> Future:
+        """Submits a node to the first worker that pulls it.
+
+        Parameters
+        ----------
+        pool : Executor
+            Pool that executes the nodes.
+        pipeline : Pipeline
+            Pipeline that stores a flow of tasks.
+        catalog : Catalog
+            Catalog that stores the items of an execution.
+        id : str
+            ID of the node.
+
+        Returns
+        -------
+        future : Future
+            Future that resolves to the items of an execution.
+        """
+
+        future = self.submit_task(pool, pipeline, catalog, id)
+
+        return future
+
+
+class AsyncExecutor(BaseExecutor):
+    """Executes a pipeline concurrently through an event loop.
+
+    Suits the tasks declared as coroutine functions. Each node is awaited 
+    as soon as its last source node was executed and the tasks that are 
+    not coroutine functions are executed in the default pool of threads 
+    of the event loop. The priority modes are the same of the 
+    PoolExecutor class and take effect when the max_tasks is reached.
+
+    Attributes
+    ----------
+    _eviction : bool
+        Flag that indicates if the consumed items are deleted.
+    _kept_ids : List[str]
+        IDs of the items that are never deleted by the eviction.
+    _cache : BaseCache
+        Cache that stores the items of the executed nodes.
+    _record : Record
+        Record that stores the fingerprints of the executed nodes.
+    _checkpoint : Checkpoint
+        Checkpoint that stores the items of the executed nodes.
+    _include : List[str]
+        Tags of the nodes selected by the get_ordering method along with 
+        their upstream nodes. If None, all the nodes are selected.
+    _exclude : List[str]
+        Tags of the nodes never selected by the get_ordering method.
+    _max_tasks : int
+        Maximum quantity of nodes executed simultaneously.
+    _priority : str
+        Priority mode used to submit the released nodes.
+    _costs : Dict[str, float]
+        Costs of the nodes used by the critical_path mode. The keys are 
+        the node IDs and the values are the costs.
+    """
+
+    def __init__(
+        self, 
+        max_tasks: int = None, 
+        priority: str = 'fifo', 
+        costs: Dict[str, float] = None, 
+        **key_args: dict
+    ) -> None:
+        """Initializes the attributes.
+
+        Parameters
+        ----------
+        max_tasks : int, optional
+            Maximum quantity of nodes executed simultaneously. If None, 
+            there is no limit.
+        priority : str, optional
+            Priority mode used to submit the released nodes.
+        costs : Dict[str, float], optional
+            Costs of the nodes used by the critical_path mode. The keys are 
+            the node IDs and the values are the costs. The nodes without a 
+            cost are weighted as 1.
+        key_args : dict
+            Keyword arguments of the BaseExecutor class.
+
+        Raises
+        ------
+        ExecutorError
+            Informs that the priority was not found in the modes.
+        """
+
+        super().__init__(**key_args)
+
+        self._max_tasks = max_tasks
+        self._priority = _check_mode('priority', priority, _priorities)
+        self._costs = check_none(costs, {})
+
+    @property
+    def max_tasks(self) -> int:
+        """Gets the _max_tasks attribute.
+
+        Returns
+        -------
+        max_tasks : int
+            Maximum quantity of nodes executed simultaneously.
+        """
+
+        return self._max_tasks
+
+    @max_tasks.setter
+    def max_tasks(self, max_tasks: int) -> None:
+        """Sets the _max_tasks attribute.
+
+        Parameters
+        ----------
+        max_tasks : int
+            Maximum quantity of nodes executed simultaneously.
+        """
+
+        self._max_tasks = max_tasks
+
+    @property
+    def priority(self) -> str:
+        """Gets the _priority attribute.
+
+        Returns
+        -------
+        priority : str
+            Priority mode used to submit the released nodes.
+        """
+
+        return self._priority
+
+    @priority.setter
+    def priority(self, priority: str) -> None:
+        """Sets the _priority attribute.
+
+        Parameters
+        ----------
+        priority : str
+            Priority mode used to submit the released nodes.
+        """
+
+        self._priority = priority
+
+    @property
+    def costs(self) -> Dict[str, float]:
+        """Gets the _costs attribute.
+
+        Returns
+        -------
+        costs : Dict[str, float]
+            Costs of the nodes used by the critical_path mode. The keys are 
+            the node IDs and the values are the costs.
+        """
+
+        return self._costs
+
+    @costs.setter
+    def costs(self, costs: Dict[str, float]) -> None:
+        """Sets the _costs attribute.
+
+        Parameters
+        ----------
+        costs : Dict[str, float]
+            Costs of the nodes used by the critical_path mode. The keys are 
+            the node IDs and the values are the costs.
+        """
+
+        self._costs = costs
+
+    async def execute_node_async(
+        self, pipeline: Pipeline, catalog: Catalog, id: str
+    ) -> Dict[str, Any]:
+        """Executes a node in the event loop.
+
+        Parameters
+        ----------
+        pipeline : Pipeline
+            Pipeline that stores a flow of tasks.
+        catalog : Catalog
+            Catalog that stores the items of an execution.
+        id : str
+            ID of the node.
+
+        Returns
+        -------
+        items : Dict[str, Any]
+            Items of an execution. The keys are the item IDs and the values 
+            are the arguments required by the tasks.
+
+        Raises
+        ------
+        ExecutorError
+            Informs that the node was not executed by the executor.
+        """
+
+        node = pipeline.get_node(id)
+        logger.info(f'node.id: {node.id}, node.tags: {node.tags}')
+
+        task = _get_task(node)
+        fingerprints, items = self._load_record(node, task, catalog)
+
+        if items is None:
+            pos_args = build_pos_args(node.pos_inputs, catalog)
+            key_args = build_key_args(node.key_inputs, catalog)
+            key, items = self._load_cache(
+                node.id, task, pos_args, key_args
+            )
+
+            if items is None:
+                items = await _execute_task_async(
+                    node.id, task, pos_args, key_args, node.outputs
+                )
+                self._dump_cache(key, items)
+
+            self._dump_record(node.id, task, fingerprints, items)
+
+        return items
+
+    async def execute_pipeline_async(
+        self, 
+        pipeline: Pipeline, 
+        catalog: Catalog, 
+        ordering: List[list], 
+        targets: List[str] = None
+    ) -> Catalog:
+        """Executes a pipeline in the event loop.
+
+        Parameters
+        ----------
+        pipeline : Pipeline
+            Pipeline that stores a flow of tasks.
+        catalog : Catalog
+            Catalog that stores the items of an execution.
+        ordering : List[list]
+            Ordering of the graph. The inner lists represent groups of nodes 
+            that must be executed sequentially and the nodes within these 
+            groups can be executed simultaneously.
+        targets : List[str], optional
+            IDs of the items to produce. Only the nodes required by them 
+            are executed. If None, all the nodes of the ordering are 
+            executed.
+
+        Returns
+        -------
+        catalog : Catalog
+            Catalog that stores the items of an execution.
+
+        Raises
+        ------
+        BuildingError
+            Informs that the target was not found in the node outputs.
+        ExecutorError
+            Informs that the node was not executed by the executor.
+        """
+
+        logger.info(
+            f'pipeline.id: {pipeline.id}, pipeline.tags: {pipeline.tags}'
+        )
+        logger.info(
+            f'catalog.id: {catalog.id}, catalog.tags: {catalog.tags}'
+        )
+
+        ordering = self._select_targets(pipeline, catalog, ordering, targets)
+        scheduler = _create_scheduler(
+            pipeline, ordering, 'ready', self._priority, self._costs
+        )
+        consumers_qty = self._count_consumers(pipeline, ordering, targets)
+        tasks_qty = check_none(self._max_tasks, float('inf'))
+        tasks = {}
+
+        try:
+            while scheduler.check_pending():
+                while scheduler.check_ready() and len(tasks) < tasks_qty:
+                    node_id = scheduler.pop_ready()
+                    task = asyncio.ensure_future(
+                        self.execute_node_async(pipeline, catalog, node_id)
+                    )
+                    tasks[task] = node_id
+
+                done, _ = await asyncio.wait(
+                    tasks, return_when=asyncio.FIRST_COMPLETED
+                )
+
+                for task in done:
+                    node_id = tasks.pop(task)
+                    items = task.result()
+                    self._store_items(
+                        pipeline, catalog, node_id, items, consumers_qty
+                    )
+                    scheduler.release(node_id)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+
+            if tasks:
+                await asyncio.wait(tasks)
+
+            raise
+
+        return catalog
+
+    def execute_pipeline(
+        self, 
+        pipeline: Pipeline, 
+        catalog: Catalog, 
+        ordering: List[list], 
+        targets: List[str] = None
+    ) -> Catalog:
+        """Executes a pipeline in a new event loop.
+
+        The execute_pipeline_async method must be awaited instead when an 
+        event loop is already running in the calling thread.
+
+        Parameters
+        ----------
+        pipeline : Pipeline
+            Pipeline that stores a flow of tasks.
+        catalog : Catalog
+            Catalog that stores the items of an execution.
+        ordering : List[list]
+            Ordering of the graph. The inner lists represent groups of nodes 
+            that must be executed sequentially and the nodes within these 
+            groups can be executed simultaneously.
+        targets : List[str], optional
+            IDs of the items to produce. Only the nodes required by them 
+            are executed. If None, all the nodes of the ordering are 
+            executed.
+
+        Returns
+        -------
+        catalog : Catalog
+            Catalog that stores the items of an execution.
+
+        Raises
+        ------
+        BuildingError
+            Informs that the target was not found in the node outputs.
+        ExecutorError
+            Informs that the node was not executed by the executor.
+        """
+
+        loop = asyncio.new_event_loop()
+
+        try:
+            catalog = loop.run_until_complete(
+                self.execute_pipeline_async(
+                    pipeline, catalog, ordering, targets=targets
+                )
+            )
+        finally:
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.close()
+
+        return catalog
+
+
+class CompiledExecutor(BaseExecutor):
+    """Executes a pipeline sequentially through a compiled plan.
+
+    The pipeline is compiled to a plan whose steps read and write the 
+    items by position in a flat list, which removes the lookups of the 
+    nodes and items from the execution of each node. The catalog is read 
+    before the first step and written after the last one. The plans are 
+    cached for each pipeline structure and ordering. The cache, record 
+    and checkpoint of the BaseExecutor class are not applied to the steps.
+
+    Attributes
+    ----------
+    _eviction : bool
+        Flag that indicates if the consumed items are deleted.
+    _kept_ids : List[str]
+        IDs of the items that are never deleted by the eviction.
+    _include : List[str]
+        Tags of the nodes selected by the get_ordering method along with 
+        their upstream nodes. If None, all the nodes are selected.
+    _exclude : List[str]
+        Tags of the nodes never selected by the get_ordering method.
+    _plans : WeakKeyDictionary
+        Plans compiled for the pipelines. The keys are the pipelines and 
+        the values are tuples of the revision of the pipeline and a 
+        dictionary whose keys are the orderings and whose values are the 
+        plans.
+    """
+
+    def __init__(
+        self, 
+        eviction: bool = False, 
+        kept_ids: List[str] = None, 
+        include: List[str] = None, 
+        exclude: List[str] = None
+    ) -> None:
+        """Initializes the attributes.
+
+        Parameters
+        ----------
+        eviction : bool, optional
+            Flag that indicates if the consumed items are deleted.
+        kept_ids : List[str], optional
+            IDs of the items that are never deleted by the eviction.
+        include : List[str], optional
+            Tags of the nodes selected by the get_ordering method along 
+            with their upstream nodes. If None, all the nodes are selected.
+        exclude : List[str], optional
+            Tags of the nodes never selected by the get_ordering method.
+        """
+
+        super().__init__(
+            eviction=eviction, 
+            kept_ids=kept_ids, 
+            include=include, 
+            exclude=exclude
+        )
+
+        self._plans = WeakKeyDictionary()
+
+    def get_plan(self, pipeline: Pipeline, ordering: List[list]) -> Plan:
+        """Gets the plan of a pipeline, compiling it in the first call.
+
+        Parameters
+        ----------
+        pipeline : Pipeline
+            Pipeline that stores a flow of tasks.
+        ordering : List[list]
+            Ordering of the graph. The inner lists represent groups of nodes 
+            that must be executed sequentially and the nodes within these 
+            groups can be executed simultaneously.
+
+        Returns
+        -------
+        plan : Plan
+            Plan that stores the slot-indexed steps of the pipeline.
+        """
+
+        revision, plans = self._plans.get(pipeline, (None, {}))
+        key = tuple(tuple(group) for group in ordering)
+
+        if revision != pipeline.revision:
+            plans = {}
+            self._plans[pipeline] = (pipeline.revision, plans)
+
+        if key not in plans:
+            plans[key] = compile_pipeline(pipeline, ordering)
+
+        return plans[key]
+
+    def execute_plan(
+        self, plan: Plan, catalog: Catalog, targets: List[str] = None
+    ) -> Catalog:
+        """Executes a plan.
+
+        Parameters
+        ----------
+        plan : Plan
+            Plan that stores the slot-indexed steps of a pipeline.
+        catalog : Catalog
+            Catalog that stores the items of an execution.
+        targets : List[str], optional
+            IDs of the items to produce, which are never deleted by the 
+            eviction.
+
+        Returns
+        -------
+        catalog : Catalog
+            Catalog that stores the items of an execution.
+
+        Raises
+        ------
+        CatalogError
+            Informs that the id was not found in the _items.
+        ExecutorError
+            Informs that the node was not executed by the executor.
+        BuildingError
+            Informs that an invalid type was found for the returns.
+        BuildingError
+            Informs that the outputs did not match the returns in terms of 
+            size.
+        """
+
+        ids = plan.ids
+        slots = [None] * len(ids)
+        kept_slots = set()
+        released_slots = set()
+
+        for slot in plan.inputs:
+            slots[slot] = catalog.get_item(ids[slot])
+
+        if self._eviction:
+            kept_ids = set(self._kept_ids + check_none(targets, []))
+            kept_slots = {
+                slot for slot, id in enumerate(ids) if id in kept_ids
+            }
+
+        for id, task, pos_slots, key_slots, out_slots, rel_slots in plan.steps:
+            try:
+                if key_slots:
+                    returns = task(
+                        *[slots[slot] for slot in pos_slots], 
+                        **{param: slots[slot] for param, slot in key_slots}
+                    )
+                else:
+                    returns = task(*[slots[slot] for slot in pos_slots])
+            except Exception as error:
+                raise ExecutorError(
+                    'node was not executed by the executor', [f'id == {id}']
+                ) from error
+
+            if len(out_slots) == 1:
+                slots[out_slots[0]] = returns
+            elif out_slots:
+                if not isinstance(returns, (list, tuple)) or \
+                        len(returns) != len(out_slots):
+                    _ = build_items([ids[slot] for slot in out_slots], returns)
+
+                for slot, item in zip(out_slots, returns):
+                    slots[slot] = item
+
+            if self._eviction:
+                for slot in rel_slots:
+                    if slot not in kept_slots:
+                        slots[slot] = None
+                        released_slots.add(slot)
+
+        for slot in plan.outputs:
+            if slot not in released_slots:
+                catalog.set_item(ids[slot], slots[slot])
+
+        for slot in plan.inputs:
+            if slot in released_slots and catalog.check_item(ids[slot]):
+                catalog.delete_item(ids[slot])
+                logger.debug(f'item_id: {ids[slot]}, evicted')
+
+        return catalog
+
+    def execute_pipeline(
+        self, 
+        pipeline: Pipeline, 
+        catalog: Catalog, 
+        ordering: List[list], 
+        targets: List[str] = None
+    ) -> Catalog:
+        """Executes a pipeline.
+
+        Parameters
+        ----------
+        pipeline : Pipeline
+            Pipeline that stores a flow of tasks.
+        catalog : Catalog
+            Catalog that stores the items of an execution.
+        ordering : List[list]
+            Ordering of the graph. The inner lists represent groups of nodes 
+            that must be executed sequentially and the nodes within these 
+            groups can be executed simultaneously.
+        targets : List[str], optional
+            IDs of the items to produce. Only the nodes required by them 
+            are executed. If None, all the nodes of the ordering are 
+            executed.
+
+        Returns
+        -------
+        catalog : Catalog
+            Catalog that stores the items of an execution.
+
+        Raises
+        ------
+        BuildingError
+            Informs that the target was not found in the node outputs.
+        ExecutorError
+            Informs that the node was not executed by the executor.
+        """
+
+        logger.info(
+            f'pipeline.id: {pipeline.id}, pipeline.tags: {pipeline.tags}'
+        )
+        logger.info(
+            f'catalog.id: {catalog.id}, catalog.tags: {catalog.tags}'
+        )
+
+        ordering = self._select_targets(pipeline, catalog, ordering, targets)
+        catalog = self.execute_plan(
+            self.get_plan(pipeline, ordering), catalog, targets=targets
+        )
+
+        return catalog
+
+
+class GeneratedExecutor(BaseExecutor):
+    """Executes a pipeline through a generated function.
+
+    The pipeline is compiled to a plan whose steps are generated as the 
+    source of a straight-line function, with one local variable per item 
+    and one direct call per node, which is executed once and cached for 
+    each pipeline structure and ordering. The cache, record and checkpoint 
+    of the BaseExecutor class are not applied to the nodes.
+
+    Attributes
+    ----------
+    _eviction : bool
+        Flag that indicates if the consumed items are deleted.
+    _kept_ids : List[str]
+        IDs of the items that are never deleted by the eviction.
+    _include : List[str]
+        Tags of the nodes selected by the get_ordering method along with 
+        their upstream nodes. If None, all the nodes are selected.
+    _exclude : List[str]
+        Tags of the nodes never selected by the get_ordering method.
+    _functions : WeakKeyDictionary
+        Functions generated for the pipelines. The keys are the pipelines 
+        and the values are tuples of the revision of the pipeline and a 
+        dictionary whose keys are the orderings and whose values are the 
+        functions.
+    """
+
+    def __init__(
+        self, 
+        eviction: bool = False, 
+        kept_ids: List[str] = None, 
+        include: List[str] = None, 
+        exclude: List[str] = None
+    ) -> None:
+        """Initializes the attributes.
+
+        Parameters
+        ----------
+        eviction : bool, optional
+            Flag that indicates if the consumed items are deleted.
+        kept_ids : List[str], optional
+            IDs of the items that are never deleted by the eviction.
+        include : List[str], optional
+            Tags of the nodes selected by the get_ordering method along 
+            with their upstream nodes. If None, all the nodes are selected.
+        exclude : List[str], optional
+            Tags of the nodes never selected by the get_ordering method.
+        """
+
+        super().__init__(
+            eviction=eviction, 
+            kept_ids=kept_ids, 
+            include=include, 
+            exclude=exclude
+        )
+
+        self._functions = WeakKeyDictionary()
+
+    def get_function(
+        self, 
+        pipeline: Pipeline, 
+        ordering: List[list], 
+        targets: List[str] = None
+    ) -> Callable:
+        """Gets the function of a pipeline, generating it in the first call.
+
+        Parameters
+        ----------
+        pipeline : Pipeline
+            Pipeline that stores a flow of tasks.
+        ordering : List[list]
+            Ordering of the graph. The inner lists represent groups of nodes 
+            that must be executed sequentially and the nodes within these 
+            groups can be executed simultaneously.
+        targets : List[str], optional
+            IDs of the items to produce, which are never deleted by the 
+            eviction.
+
+        Returns
+        -------
+        function : Callable
+            Function that receives a catalog and returns it after setting 
+            the produced items.
+        """
+
+        revision, functions = self._functions.get(pipeline, (None, {}))
+        targets = check_none(targets, [])
+        key = (
+            tuple(tuple(group) for group in ordering), 
+            tuple(targets), 
+            self._eviction, 
+            tuple(self._kept_ids)
+        )
+
+        if revision != pipeline.revision:
+            functions = {}
+            self._functions[pipeline] = (pipeline.revision, functions)
+
+        if key not in functions:
+            functions[key] = generate_function(
+                compile_pipeline(pipeline, ordering), 
+                eviction=self._eviction, 
+                kept_ids=self._kept_ids + targets
+            )
+
+        return functions[key]
+
+    def execute_pipeline(
+        self, 
+        pipeline: Pipeline, 
+        catalog: Catalog, 
+        ordering: List[list], 
+        targets: List[str] = None
+    ) -> Catalog:
+        """Executes a pipeline.
+
+        Parameters
+        ----------
+        pipeline : Pipeline
+            Pipeline that stores a flow of tasks.
+        catalog : Catalog
+            Catalog that stores the items of an execution.
+        ordering : List[list]
+            Ordering of the graph. The inner lists represent groups of nodes 
+            that must be executed sequentially and the nodes within these 
+            groups can be executed simultaneously.
+        targets : List[str], optional
+            IDs of the items to produce. Only the nodes required by them 
+            are executed. If None, all the nodes of the ordering are 
+            executed.
+
+        Returns
+        -------
+        catalog : Catalog
+            Catalog that stores the items of an execution.
+
+        Raises
+        ------
+        BuildingError
+            Informs that the target was not found in the node outputs.
+        CatalogError
+            Informs that the id was not found in the _items.
+        ExecutorError
+            Informs that the node was not executed by the executor.
+        """
+
+        logger.info(
+            f'pipeline.id: {pipeline.id}, pipeline.tags: {pipeline.tags}'
+        )
+        logger.info(
+            f'catalog.id: {catalog.id}, catalog.tags: {catalog.tags}'
+        )
+
+        ordering = self._select_targets(pipeline, catalog, ordering, targets)
+        catalog = self.get_function(pipeline, ordering, targets=targets)(
+            catalog
+        )
+
+        return catalog
+
+
+class _LanePool(Executor):
+    """Stores the pools of the lanes of the HybridExecutor class.
+
+    Attributes
+    ----------
+    _max_threads : int
+        Maximum quantity of threads used to execute the nodes.
+    _max_processes : int
+        Maximum quantity of processes used to execute the nodes.
+    _pools : Dict[str, Executor]
+        Pools of the lanes. The keys are the lanes and the values are the 
+        pools.
+    """
+
+    def __init__(self, max_threads: int, max_processes: int) -> None:
+        """Initializes the attributes.
+
+        Parameters
+        ----------
+        max_threads : int
+            Maximum quantity of threads used to execute the nodes.
+        max_processes : int
+            Maximum quantity of processes used to execute the nodes.
+        """
+
+        self._max_threads = max_threads
+        self._max_processes = max_processes
+        self._pools = {}
+
+    def get_pool(self, lane: str) -> Executor:
+        """Gets the pool of a lane, creating it in the first call.
+
+        Parameters
+        ----------
+        lane : str
+            Lane where the node is executed.
+
+        Returns
+        -------
+        pool : Executor
+            Pool that executes the nodes.
+        """
+
+        if lane not in self._pools:
+            if lane == 'process':
+                self._pools[lane] = ProcessPoolExecutor(
+                    max_workers=self._max_processes
+                )
+            else:
+                self._pools[lane] = ThreadPoolExecutor(
+                    max_workers=self._max_threads
+                )
+
+        return self._pools[lane]
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Shuts down the pools of the lanes.
+
+        Parameters
+        ----------
+        wait : bool, optional
+            Flag that indicates if the pending nodes must be waited.
+        """
+
+        for pool in self._pools.values():
+            pool.shutdown(wait=wait)
+
+
+class _RemoteItem:
+    """Stores the placeholder of an item held by a worker process.
+
+    Attributes
+    ----------
+    _size : int
+        Size of the item in bytes.
+    """
+
+    def __init__(self, size: int) -> None:
+        """Initializes the attributes.
+
+        Parameters
+        ----------
+        size : int
+            Size of the item in bytes.
+        """
+
+        self._size = size
+
+    @property
+    def size(self) -> int:
+        """Gets the _size attribute.
+
+        Returns
+        -------
+        size : int
+            Size of the item in bytes.
+        """
+
+        return self._size
+
+
+class _WorkerPool(Executor):
+    """Stores the worker processes of the DistributedExecutor class.
+
+    Each worker replies to the commands in the sent order, so the futures 
+    waiting for the replies of a worker are resolved from a queue by a 
+    thread that receives its replies.
+
+    Attributes
+    ----------
+    _connections : List[Connection]
+        Connections to the workers.
+    _processes : List[Process]
+        Processes of the workers.
+    _threads : List[Thread]
+        Threads that receive the replies of the workers.
+    _replies : List[deque]
+        Futures waiting for the replies of each worker in the sent order.
+    _send_locks : List[Lock]
+        Locks that serialize the commands sent to each worker.
+    _loads : List[int]
+        Quantity of nodes assigned to each worker.
+    _holders : Dict[str, set]
+        Workers that hold the items. The keys are the item IDs and the 
+        values are the sets of worker indexes.
+    _sizes : Dict[str, int]
+        Sizes of the items. The keys are the item IDs and the values are 
+        the sizes in bytes.
+    _remote_ids : Set[str]
+        IDs of the items returned by the workers, which are stored in the 
+        catalog as placeholders.
+    _lock : Lock
+        Lock that serializes the access to the loads, holders and sizes 
+        between threads.
+    """
+
+    def __init__(self, workers_qty: int) -> None:
+        """Initializes the attributes.
+
+        Parameters
+        ----------
+        workers_qty : int
+            Quantity of worker processes.
+        """
+
+        self._connections = []
+        self._processes = []
+        self._threads = []
+        self._replies = []
+        self._send_locks = []
+        self._loads = [0] * workers_qty
+        self._holders = {}
+        self._sizes = {}
+        self._remote_ids = set()
+        self._lock = Lock()
+
+        for index in range(workers_qty):
+            connection, worker_connection = Pipe()
+            process = Process(
+                target=_serve_worker, args=(worker_connection,), daemon=True
+            )
+            process.start()
+            worker_connection.close()
+
+            self._connections.append(connection)
+            self._processes.append(process)
+            self._replies.append(deque())
+            self._send_locks.append(Lock())
+
+        for index in range(workers_qty):
+            thread = Thread(
+                target=self._receive_replies, args=(index,), daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+
+    def submit_node(self, node: Node, catalog: Catalog) -> Future:
+        """Submits a node to the idle worker that holds most of its inputs.
+
+        Parameters
+        ----------
+        node : Node
+            Node that stores a task.
+        catalog : Catalog
+            Catalog that stores the items of an execution.
+
+        Returns
+        -------
+        future : Future
+            Future that resolves to the placeholders of the items of an 
+            execution.
+
+        Raises
+        ------
+        CatalogError
+            Informs that the id was not found in the _items.
+        """
+
+        input_ids = build_inputs(node.pos_inputs, node.key_inputs)
+        items = {}
+        fetched_ids = {}
+
+        with self._lock:
+            index = self._choose_worker(input_ids)
+
+            for item_id in input_ids:
+                holders = self._holders.get(item_id)
+
+                if holders is None:
+                    items[item_id] = catalog.get_item(item_id)
+                elif index not in holders:
+                    fetched_ids.setdefault(min(holders), []).append(item_id)
+
+            self._loads[index] += 1
+
+        future = Future()
+
+        if fetched_ids:
+            state = [len(fetched_ids), None]
+
+            for holder, item_ids in fetched_ids.items():
+                reply = self._send(holder, ('get', item_ids))
+                reply.add_done_callback(
+                    partial(
+                        self._receive_inputs, index, node, items, state, future
+                    )
+                )
+        else:
+            self._run_node(index, node, items, future)
+
+        return future
+
+    def delete_items(self, item_ids: List[str]) -> None:
+        """Deletes the items from the workers that hold them.
+
+        Parameters
+        ----------
+        item_ids : List[str]
+            IDs of the items.
+        """
+
+        deleted_ids = {}
+
+        with self._lock:
+            for item_id in item_ids:
+                self._sizes.pop(item_id, None)
+                self._remote_ids.discard(item_id)
+
+                for index in self._holders.pop(item_id, []):
+                    deleted_ids.setdefault(index, []).append(item_id)
+
+        for index, ids in deleted_ids.items():
+            self._send(index, ('delete', ids), reply=False)
+
+    def collect_items(self, catalog: Catalog) -> None:
+        """Collects the items held by the workers to the catalog.
+
+        Only the placeholders of the returned items are looked up, so the 
+        other items of the catalog are not loaded (e.g. from the spills of 
+        a budget catalog).
+
+        Parameters
+        ----------
+        catalog : Catalog
+            Catalog that stores the items of an execution.
+
+        Raises
+        ------
+        ExecutorError
+            Informs that the items were not collected from the workers.
+        """
+
+        collected_ids = {}
+
+        with self._lock:
+            for item_id in self._remote_ids:
+                if catalog.check_item(item_id):
+                    holder = min(self._holders[item_id])
+                    collected_ids.setdefault(holder, []).append(item_id)
+
+        replies = [
+            (self._send(holder, ('get', item_ids)), item_ids)
+            for holder, item_ids in collected_ids.items()
+        ]
+
+        for reply, item_ids in replies:
+            try:
+                items = reply.result()
+            except Exception as error:
+                raise ExecutorError(
+                    'items were not collected from the workers', 
+                    [f'item_ids == {item_ids}']
+                ) from error
+
+            for item_id, item in items.items():
+                catalog.set_item(item_id, item)
+
+            with self._lock:
+                self._remote_ids.difference_update(items)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Shuts down the worker processes.
+
+        Parameters
+        ----------
+        wait : bool, optional
+            Flag that indicates if the pending nodes must be waited.
+        """
+
+        for index in range(len(self._processes)):
+            try:
+                self._send(index, ('stop',), reply=False)
+            except (OSError, ValueError):
+                pass
+
+        for process in self._processes:
+            if not wait:
+                process.terminate()
+
+            process.join()
+
+        for thread in self._threads:
+            thread.join()
+
+        for connection in self._connections:
+            connection.close()
+
+    def _choose_worker(self, input_ids: List[str]) -> int:
+        """Chooses the idle worker that holds the most bytes of the inputs.
+
+        Parameters
+        ----------
+        input_ids : List[str]
+            IDs of the inputs of a node.
+
+        Returns
+        -------
+        index : int
+            Index of the worker. The first worker wins the ties and the 
+            least loaded worker is chosen when none of them is idle.
+        """
+
+        indexes = [
+            index for index, load in enumerate(self._loads) if load == 0
+        ]
+
+        if not indexes:
+            return self._loads.index(min(self._loads))
+
+        scores = []
+
+        for index in indexes:
+            score = 0
+
+            for item_id in input_ids:
+                if index in self._holders.get(item_id, ()):
+                    score += self._sizes.get(item_id, 0)
+
+            scores.append(score)
+
+        return indexes[scores.index(max(scores))]
+
+    def _send(self, index: int, command: tuple, reply: bool = True) -> Future:
+        """Sends a command to a worker.
+
+        Parameters
+        ----------
+        index : int
+            Index of the worker.
+        command : tuple
+            Command with its name followed by its arguments.
+        reply : bool, optional
+            Flag that indicates if the worker replies to the command.
+
+        Returns
+        -------
+        future : Future
+            Future that resolves to the reply of the worker. If the worker 
+            does not reply, None is returned.
+        """
+
+        future = Future() if reply else None
+
+        with self._send_locks[index]:
+            if reply:
+                self._replies[index].append(future)
+
+            try:
+                self._connections[index].send(command)
+            except Exception:
+                if reply:
+                    self._replies[index].pop()
+
+                raise
+
+        return future
+
+    def _receive_replies(self, index: int) -> None:
+        """Receives the replies of a worker until it is stopped.
+
+        Parameters
+        ----------
+        index : int
+            Index of the worker.
+        """
+
+        connection = self._connections[index]
+
+        while True:
+            try:
+                kind, value = connection.recv()
+            except (EOFError, OSError):
+                break
+
+            future = self._replies[index].popleft()
+
+            if kind == 'error':
+                _set_future(future, error=value)
+            else:
+                _set_future(future, result=value)
+
+        while self._replies[index]:
+            _set_future(
+                self._replies[index].popleft(), 
+                error=ExecutorError(
+                    'worker was stopped before the reply', 
+                    [f'index == {index}']
+                )
+            )
+
+    def _receive_inputs(
+        self, 
+        index: int, 
+        node: Node, 
+        items: Dict[str, Any], 
+        state: list, 
+        future: Future, 
+        reply: Future
+    ) -> None:
+        """Receives the inputs fetched from a worker for a node.
+
+        Parameters
+        ----------
+        index : int
+            Index of the worker chosen for the node.
+        node : Node
+            Node that stores a task.
+        items : Dict[str, Any]
+            Inputs sent along with the node. The keys are the item IDs and 
+            the values are the items.
+        state : list
+            Quantity of pending replies and the first error received.
+        future : Future
+            Future that resolves to the placeholders of the items of an 
+            execution.
+        reply : Future
+            Future that resolves to the fetched inputs.
+        """
+
+        with self._lock:
+            state[0] -= 1
+
+            if reply.exception() is None:
+                items.update(reply.result())
+            elif state[1] is None:
+                state[1] = reply.exception()
+
+            if state[0] > 0:
+                return
+
+            if state[1] is not None:
+                self._loads[index] -= 1
+
+        if state[1] is None:
+            self._run_node(index, node, items, future)
+        else:
+            _set_future(future, error=state[1])
+
+    def _run_node(
+        self, index: int, node: Node, items: Dict[str, Any], future: Future
+    ) -> None:
+        """Runs a node in a worker, sending the inputs it does not hold.
+
+        Parameters
+        ----------
+        index : int
+            Index of the worker chosen for the node.
+        node : Node
+            Node that stores a task.
+        items : Dict[str, Any]
+            Inputs sent along with the node. The keys are the item IDs and 
+            the values are the items.
+        future : Future
+            Future that resolves to the placeholders of the items of an 
+            execution.
+        """
+
+        sizes = {
+            item_id: measure_item(item) for item_id, item in items.items()
+        }
+
+        with self._lock:
+            for item_id, size in sizes.items():
+                self._holders.setdefault(item_id, set()).add(index)
+                self._sizes.setdefault(item_id, size)
+
+        try:
+            reply = self._send(
+                index, 
+                (
+                    'run', 
+                    node.id, 
+                    node.task, 
+                    node.pos_inputs, 
+                    node.key_inputs, 
+                    node.outputs, 
+                    items
+                )
+            )
+        except Exception as error:
+            with self._lock:
+                self._loads[index] -= 1
+
+            execution_error = ExecutorError(
+                'node was not executed by the executor', [f'id == {node.id}']
+            )
+            execution_error.__cause__ = error
+            _set_future(future, error=execution_error)
+        else:
+            reply.add_done_callback(
+                partial(self._receive_outputs, index, future)
+            )
+
+    def _receive_outputs(
+        self, index: int, future: Future, reply: Future
+    ) -> None:
+        """Receives the sizes of the items returned by a node.
+
+        Parameters
+        ----------
+        index : int
+            Index of the worker that executed the node.
+        future : Future
+            Future that resolves to the placeholders of the items of an 
+            execution.
+        reply : Future
+            Future that resolves to the sizes of the items of an execution.
+        """
+
+        with self._lock:
+            self._loads[index] -= 1
+
+            if reply.exception() is None:
+                for item_id, size in reply.result().items():
+                    self._holders[item_id] = {index}
+                    self._sizes[item_id] = size
+                    self._remote_ids.add(item_id)
+
+        if reply.exception() is None:
+            _set_future(
+                future, 
+                result={
+                    item_id: _RemoteItem(size) 
+                    for item_id, size in reply.result().items()
+                }
+            )
+        else:
+            _set_future(future, error=reply.exception())
+
+
+def _cancel_future(pool_future: Future, future: Future) -> None:
+    """Cancels a pool future when its future was cancelled.
+
+    Parameters
+    ----------
+    pool_future : Future
+        Future of the pool that resolves to the items of an execution 
+        with the large items replaced by their descriptions.
+    future : Future
+        Future that resolves to the items of an execution.
+    """
+
+    if future.cancelled():
+        pool_future.cancel()
+
+
+def _check_mode(name: str, mode: str, modes: List[str]) -> str:
+    """Checks if a mode matches the available modes.
+
+    Parameters
+    ----------
+    name : str
+        Name of the parameter that receives the mode.
+    mode : str
+        Mode of the parameter.
+    modes : List[str]
+        Available modes of the parameter.
+
+    Returns
+    -------
+    mode : str
+        Mode of the parameter.
+
+    Raises
+    ------
+    ExecutorError
+        Informs that the mode was not found in the modes.
+    """
+
+    if mode in modes:
+        return mode
+    else:
+        raise ExecutorError(
+            f'{name} was not found in the modes', [f'{name} == {mode}']
+        )
+
+
+def _create_scheduler(
+    pipeline: Pipeline, 
+    ordering: List[list], 
+    scheduling: str, 
+    priority: str, 
+    costs: Dict[str, float]
+) -> BaseScheduler:
+    """Creates a scheduler according to the scheduling and priority modes.
+
+    Parameters
+    ----------
+    pipeline : Pipeline
+        Pipeline that stores a flow of tasks.
+    ordering : List[list]
+        Ordering of the graph. The inner lists represent groups of nodes 
+        that must be executed sequentially and the nodes within these 
+        groups can be executed simultaneously.
+    scheduling : str
+        Scheduling mode used to release the nodes.
+    priority : str
+        Priority mode used to submit the released nodes.
+    costs : Dict[str, float]
+        Costs of the nodes used by the critical_path mode. The keys are 
+        the node IDs and the values are the costs.
+
+    Returns
+    -------
+    scheduler : BaseScheduler
+        Scheduler that releases the nodes ready to be executed.
+    """
+
+    graph = None
+    priorities = None
+
+    if scheduling == 'ready' or priority == 'critical_path':
+        graph = build_subgraph(build_graph(pipeline), ordering)
+
+    if priority == 'critical_path':
+        priorities = compute_critical_paths(graph, costs=costs)
+
+    if scheduling == 'ready':
+        scheduler = ReadyScheduler(graph, priorities=priorities)
+    else:
+        scheduler = LevelScheduler(ordering, priorities=priorities)
+
+    return scheduler
+
+
+def _execute_shared_task(
+    id: str, 
+    task: Callable, 
+    pos_args: List[Any], 
+    key_args: Dict[str, Any], 
+    outputs: List[str], 
+    min_size: int
+) -> Dict[str, Any]:
+    """Executes the task of a node with the arguments in shared memory.
+
+    The arguments placed in shared memory blocks are loaded as views of 
+    the blocks and the large returns are dumped to new blocks, which are 
+    mapped by the calling process and unlinked when the returns are 
+    released.
+
+    Parameters
+    ----------
+    id : str
+        ID of the node.
+    task : Callable
+        Task of the node.
+    pos_args : List[Any]
+        Positional arguments of the task. The large arguments are 
+        replaced by their descriptions.
+    key_args : Dict[str, Any]
+        Keyword arguments of the task. The large arguments are replaced 
+        by their descriptions.
+    outputs : List[str]
+        Outputs of the task. The outputs must match the returns in terms 
+        of size.
+    min_size : int
+        Minimum size in bytes of the returns placed in the blocks.
+
+    Returns
+    -------
+    items : Dict[str, Any]
+        Items of an execution. The large items are replaced by their 
+        descriptions.
+
+    Raises
+    ------
+    ExecutorError
+        Informs that the node was not executed by the executor.
+    TransportError
+        Informs that the name was not found in the shared memory.
+    """
+
+    blocks = []
+
+    try:
+        pos_args = [load_item(arg, blocks) for arg in pos_args]
+        key_args = {
+            param: load_item(arg, blocks) for param, arg in key_args.items()
+        }
+        items = _execute_task(id, task, pos_args, key_args, outputs)
+        del pos_args, key_args
+        dumped_blocks = []
+
+        try:
+            for item_id, item in items.items():
+                items[item_id], block = dump_item(item, min_size)
+
+                if block is not None:
+                    dumped_blocks.append(block)
+        except Exception:
+            for block in dumped_blocks:
+                block.unlink()
+
+            raise
+    finally:
+        close_blocks(blocks)
+
+    return items
+
+
+def _execute_task(
+    id: str, 
+    task: Callable, 
+    pos_args: List[Any], 
+    key_args: Dict[str, Any], 
+    outputs: List[str]
+) -> Dict[str, Any]:
+    """Executes the task of a node.
+
+    The function is declared at the module level to be picklable, which 
+    allows it to be sent to the workers of a pool of processes.
+
+    Parameters
+    ----------
+    id : str
+        ID of the node.
+    task : Callable
+        Task of the node.
+    pos_args : List[Any]
+        Positional arguments of the task.
+    key_args : Dict[str, Any]
+        Keyword arguments of the task.
+    outputs : List[str]
+        Outputs of the task. The outputs must match the returns in terms 
+        of size.
+
+    Returns
+    -------
+    items : Dict[str, Any]
+        Items of an execution. The keys are the item IDs and the values 
+        are the arguments required by the tasks.
+
+    Raises
+    ------
+    ExecutorError
+        Informs that the node was not executed by the executor.
+    """
+
+    try:
+        returns = task(*pos_args, **key_args)
+    except Exception as error:
+        raise ExecutorError(
+            'node was not executed by the executor', [f'id == {id}']
+        ) from error
+
+    items = build_items(outputs, returns)
+
+    return items
+
+
+async def _execute_task_async(
+    id: str, 
+    task: Callable, 
+    pos_args: List[Any], 
+    key_args: Dict[str, Any], 
+    outputs: List[str]
+) -> Dict[str, Any]:
+    """Executes the task of a node in the event loop.
+
+    The tasks that are not coroutine functions are executed in the default 
+    pool of threads of the event loop.
+
+    Parameters
+    ----------
+    id : str
+        ID of the node.
+    task : Callable
+        Task of the node.
+    pos_args : List[Any]
+        Positional arguments of the task.
+    key_args : Dict[str, Any]
+        Keyword arguments of the task.
+    outputs : List[str]
+        Outputs of the task. The outputs must match the returns in terms 
+        of size.
+
+    Returns
+    -------
+    items : Dict[str, Any]
+        Items of an execution. The keys are the item IDs and the values 
+        are the arguments required by the tasks.
+
+    Raises
+    ------
+    ExecutorError
+        Informs that the node was not executed by the executor.
+    """
+
+    try:
+        if iscoroutinefunction(task):
+            returns = await task(*pos_args, **key_args)
+        else:
+            returns = await asyncio.get_event_loop().run_in_executor(
+                None, partial(task, *pos_args, **key_args)
+            )
+
+            if isawaitable(returns):
+                returns = await returns
+    except Exception as error:
+        raise ExecutorError(
+            'node was not executed by the executor', [f'id == {id}']
+        ) from error
+
+    items = build_items(outputs, returns)
+
+    return items
+
+
+def _get_items(future: Future, id: str) -> Dict[str, Any]:
+    """Gets the items of an execution from a future.
+
+    Parameters
+    ----------
+    future : Future
+        Future that resolves to the items of an execution.
+    id : str
+        ID of the node.
+
+    Returns
+    -------
+    items : Dict[str, Any]
+        Items of an execution. The keys are the item IDs and the values 
+        are the arguments required by the tasks.
+
+    Raises
+    ------
+    ExecutorError
+        Informs that the node was not executed by the executor.
+    """
+
+    try:
+        items = future.result()
+
+        return items
+    except BaseError:
+        raise
+    except Exception as error:
+        raise ExecutorError(
+            'node was not executed by the executor', [f'id == {id}']
+        ) from error
+
+
+def _get_task(node: Node) -> Callable:
+    """Gets the task of a node, resolving it when it is a reference.
+
+    Parameters
+    ----------
+    node : Node
+        Node that stores a task.
+
+    Returns
+    -------
+    task : Callable
+        Task of the node.
+
+    Raises
+    ------
+    ExecutorError
+        Informs that the node was not executed by the executor.
+    """
+
+    try:
+        task = node.task
+
+        return task
+    except Exception as error:
+        raise ExecutorError(
+            'node was not executed by the executor', [f'id == {node.id}']
+        ) from error
+
+
+def _import_future(
+    transport: SharedTransport, future: Future, pool_future: Future
+) -> None:
+    """Resolves a future with the items imported from a pool future.
+
+    Parameters
+    ----------
+    transport : SharedTransport
+        Transport that sends the large items to the pools of processes 
+        through shared memory.
+    future : Future
+        Future that resolves to the items of an execution.
+    pool_future : Future
+        Future of the pool that resolves to the items of an execution 
+        with the large items replaced by their descriptions.
+    """
+
+    if pool_future.cancelled():
+        return
+
+    try:
+        items = transport.import_items(pool_future.result())
+    except Exception as error:
+        if future.set_running_or_notify_cancel():
+            future.set_exception(error)
+    else:
+        if future.set_running_or_notify_cancel():
+            future.set_result(items)
+
+
+def _send_error(
+    connection: Connection, error: Exception, default_error: BaseError
+) -> None:
+    """Sends an error to the calling process.
+
+    Parameters
+    ----------
+    connection : Connection
+        Connection to the calling process.
+    error : Exception
+        Error raised by the worker.
+    default_error : BaseError
+        Error sent when the raised error is not picklable.
+    """
+
+    try:
+        connection.send(('error', error))
+    except Exception:
+        connection.send(('error', default_error))
+
+
+def _serve_worker(connection: Connection) -> None:
+    """Serves the commands of the DistributedExecutor class in a worker.
+
+    The items received and returned by the nodes are kept in the worker 
+    until they are deleted or the worker is stopped. The commands are the 
+    following:
+
+        run: executes a node with the items held by the worker and replies 
+        with the sizes of the returned items. 
+        get: replies with the requested items. 
+        delete: deletes the requested items without a reply. 
+        stop: stops the worker.
+
+    Parameters
+    ----------
+    connection : Connection
+        Connection to the calling process.
+    """
+
+    items = {}
+
+    while True:
+        command, *args = connection.recv()
+
+        if command == 'run':
+            id, task, pos_inputs, key_inputs, outputs, inputs = args
+            items.update(inputs)
+
+            try:
+                returns = _execute_task(
+                    id, 
+                    task, 
+                    [items[item_id] for item_id in pos_inputs], 
+                    {
+                        param: items[item_id] 
+                        for param, item_id in key_inputs.items()
+                    }, 
+                    outputs
+                )
+            except Exception as error:
+                _send_error(connection, error, ExecutorError(
+                    'node was not executed by the executor', [f'id == {id}']
+                ))
+
+                continue
+
+            items.update(returns)
+            connection.send((
+                'done', 
+                {
+                    item_id: measure_item(item) 
+                    for item_id, item in returns.items()
+                }
+            ))
+        elif command == 'get':
+            try:
+                connection.send((
+                    'items', 
+                    {
+                        item_id: items[item_id] 
+                        for item_id in args[0] if item_id in items
+                    }
+                ))
+            except Exception as error:
+                _send_error(connection, error, ExecutorError(
+                    'items were not pickled by the worker', 
+                    [f'item_ids == {args[0]}']
+                ))
+        elif command == 'delete':
+            for item_id in args[0]:
+                items.pop(item_id, None)
+        else:
+            break
+
+
+def _set_future(
+    future: Future, result: Any = None, error: BaseException = None
+) -> None:
+    """Sets the result or error of a future unless it was cancelled.
+
+    Parameters
+    ----------
+    future : Future
+        Future that resolves to the reply.
+    result : Any, optional
+        Result of the future.
+    error : BaseException, optional
+        Error of the future. If None, the result is set.
+    """
+
+    if future.set_running_or_notify_cancel():
+        if error is None:
+            future.set_result(result)
+        else:
+            future.set_exception(error)
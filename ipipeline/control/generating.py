@@ -0,0 +1,147 @@
+"""Functions related to the generating procedures."""
+
+import linecache
+from itertools import count
+from keyword import iskeyword
+from typing import Callable, List
+
+from ipipeline.control.building import build_items
+from ipipeline.control.compiling import Plan
+from ipipeline.exceptions import ExecutorError
+from ipipeline.utils.checking import check_none
+
+
+_filenames = count()
+
+
+def generate_source(
+    plan: Plan, eviction: bool = False, kept_ids: List[str] = None
+) -> str:
+    """Generates the source of a function that executes a plan.
+
+    The function receives a catalog and returns it after setting the 
+    produced items. Each item is stored in a local variable named after 
+    its slot and each step is a direct call of the task named after its 
+    position, therefore the tasks must be informed in the namespace where 
+    the source is executed.
+
+    Parameters
+    ----------
+    plan : Plan
+        Plan that stores the slot-indexed steps of a pipeline.
+    eviction : bool, optional
+        Flag that indicates if the consumed items are deleted.
+    kept_ids : List[str], optional
+        IDs of the items that are never deleted by the eviction.
+
+    Returns
+    -------
+    source : str
+        Source of the function.
+    """
+
+    kept_ids = check_none(kept_ids, [])
+    ids = plan.ids
+    released_slots = set()
+    lines = ['def execute_plan(catalog):', '    get_item = catalog.get_item']
+
+    for slot in plan.inputs:
+        lines.append(f'    v{slot} = get_item({ids[slot]!r})')
+
+    for position, step in enumerate(plan.steps):
+        id, _, pos_slots, key_slots, out_slots, rel_slots = step
+        args = [f'v{slot}' for slot in pos_slots]
+
+        for param, slot in key_slots:
+            if param.isidentifier() and not iskeyword(param):
+                args.append(f'{param}=v{slot}')
+            else:
+                args.append(f'**{{{param!r}: v{slot}}}')
+
+        call = f't{position}({", ".join(args)})'
+
+        if len(out_slots) == 1:
+            call = f'v{out_slots[0]} = {call}'
+        elif out_slots:
+            call = f'returns = {call}'
+
+        lines += [
+            '    try:', 
+            f'        {call}', 
+            '    except Exception as error:', 
+            '        raise ExecutorError(', 
+            '            \'node was not executed by the executor\', '
+            f'[{f"id == {id}"!r}]', 
+            '        ) from error'
+        ]
+
+        if len(out_slots) > 1:
+            outputs = [ids[slot] for slot in out_slots]
+            lines += [
+                '    if not isinstance(returns, (list, tuple)) or '
+                f'len(returns) != {len(out_slots)}:', 
+                f'        build_items({outputs!r}, returns)', 
+                f'    {", ".join(f"v{slot}" for slot in out_slots)} = returns'
+            ]
+
+        if eviction:
+            for slot in rel_slots:
+                if ids[slot] not in kept_ids:
+                    released_slots.add(slot)
+                    lines.append(f'    del v{slot}')
+
+    for slot in plan.outputs:
+        if slot not in released_slots:
+            lines.append(f'    catalog.set_item({ids[slot]!r}, v{slot})')
+
+    for slot in plan.inputs:
+        if slot in released_slots:
+            lines += [
+                f'    if catalog.check_item({ids[slot]!r}):', 
+                f'        catalog.delete_item({ids[slot]!r})'
+            ]
+
+    lines.append('    return catalog')
+    source = '\n'.join(lines) + '\n'
+
+    return source
+
+
+def generate_function(
+    plan: Plan, eviction: bool = False, kept_ids: List[str] = None
+) -> Callable:
+    """Generates a function that executes a plan.
+
+    The source is registered in the linecache module, so the tracebacks 
+    raised by the function show the generated lines.
+
+    Parameters
+    ----------
+    plan : Plan
+        Plan that stores the slot-indexed steps of a pipeline.
+    eviction : bool, optional
+        Flag that indicates if the consumed items are deleted.
+    kept_ids : List[str], optional
+        IDs of the items that are never deleted by the eviction.
+
+    Returns
+    -------
+    function : Callable
+        Function that receives a catalog and returns it after setting the 
+        produced items.
+    """
+
+    source = generate_source(plan, eviction=eviction, kept_ids=kept_ids)
+    filename = f'<ipipeline-generated-{next(_filenames)}>'
+    namespace = {'ExecutorError': ExecutorError, 'build_items': build_items}
+
+    for position, step in enumerate(plan.steps):
+        namespace[f't{position}'] = step[1]
+
+    exec(compile(source, filename, 'exec'), namespace)
+    linecache.cache[filename] = (
+        len(source), None, source.splitlines(keepends=True), filename
+    )
+    function = namespace['execute_plan']
+
+    return function
@@ -0,0 +1,423 @@
+"""Functions related to the loading procedures."""
+
+import hashlib
+import json
+import logging
+import os
+import pickle
+import platform
+from pathlib import Path
+from typing import Any, Dict, List, Set, Tuple
+
+from ipipeline import __version__
+from ipipeline.control.building import build_compact_graph
+from ipipeline.control.sorting import sort_compact_topology
+from ipipeline.exceptions import LoadingError
+from ipipeline.structure.catalog import Catalog
+from ipipeline.structure.info import check_ids
+from ipipeline.structure.link import Link
+from ipipeline.structure.node import Node
+from ipipeline.structure.pipeline import Pipeline
+from ipipeline.utils.pickling import protocol
+
+try:
+    import tomllib
+except ImportError:
+    try:
+        import tomli as tomllib
+    except ImportError:
+        tomllib = None
+
+
+logger = logging.getLogger(name=__name__)
+_spec_keys = {'id', 'tags', 'ordered', 'nodes', 'links', 'catalog'}
+_node_keys = {'id', 'task', 'pos_inputs', 'key_inputs', 'outputs', 'tags'}
+_link_keys = {'id', 'src_id', 'dst_id', 'tags'}
+_catalog_keys = {'id', 'items', 'tags'}
+_entry_keys = {'key', 'digest', 'pipeline', 'catalog', 'ordering'}
+
+
+def load_spec(
+    path: str, cache: bool = True
+) -> Tuple[Pipeline, Catalog, List[list]]:
+    """Loads a pipeline, a catalog and an ordering from a spec file.
+
+    The spec is a JSON or TOML file selected by its suffix. The graph of 
+    the pipeline is sorted once while loading, so the duplicate links and 
+    the circular dependencies are found before any execution: an ordered 
+    pipeline validates its links while they are set and reuses its 
+    maintained order, otherwise the graph is built and sorted. When the 
+    cache is enabled, the validated pipeline, catalog and ordering are 
+    pickled next to the spec in a hidden file and reused while the spec 
+    keeps its modification time and size. If only the modification time 
+    changed, the hash of the spec decides if it must be built again.
+
+    Parameters
+    ----------
+    path : str
+        Path of the spec file.
+    cache : bool, optional
+        Flag that indicates if the compiled cache is used.
+
+    Returns
+    -------
+    pipeline : Pipeline
+        Pipeline that stores a flow of tasks.
+    catalog : Catalog
+        Catalog that stores the items of an execution.
+    ordering : List[list]
+        Ordering of the graph. The inner lists represent groups of nodes 
+        that must be executed sequentially and the nodes within these 
+        groups can be executed simultaneously.
+
+    Raises
+    ------
+    LoadingError
+        Informs that the spec was not found in the path.
+    LoadingError
+        Informs that the suffix was not found in the formats.
+    LoadingError
+        Informs that the spec was not parsed by the loader.
+    BuildingError
+        Informs that the dst_id was found in the graph[link.src_id].
+    SortingError
+        Informs that a circular dependency was found in the graph.
+    OrderError
+        Informs that the dst_id was found in the _successors[src_id].
+    OrderError
+        Informs that a circular dependency was found in the order.
+    """
+
+    path = Path(path)
+    cache_path = path.with_name(f'.{path.name}.cache')
+
+    try:
+        stat = path.stat()
+    except FileNotFoundError as error:
+        raise LoadingError(
+            'spec was not found in the path', [f'path == {path}']
+        ) from error
+
+    key = (__version__, stat.st_mtime_ns, stat.st_size)
+    entry = _read_cache(cache_path) if cache else None
+
+    if entry is not None and entry['key'] == key:
+        logger.info(f'path: {path}, cache hit')
+
+        return entry['pipeline'], entry['catalog'], entry['ordering']
+
+    data = path.read_bytes()
+    digest = hashlib.sha256(data).hexdigest()
+
+    if entry is not None and entry['key'][0] == __version__ and \
+            entry['digest'] == digest:
+        pipeline, catalog, ordering = (
+            entry['pipeline'], entry['catalog'], entry['ordering']
+        )
+    else:
+        pipeline, catalog = build_spec(parse_spec(data, path.suffix))
+
+        if pipeline.ordered:
+            ordering = pipeline.order.get_ordering()
+        else:
+            ordering = sort_compact_topology(*build_compact_graph(pipeline))
+
+    if cache:
+        _write_cache(
+            cache_path, 
+            {
+                'key': key, 
+                'digest': digest, 
+                'pipeline': pipeline, 
+                'catalog': catalog, 
+                'ordering': ordering
+            }
+        )
+
+    return pipeline, catalog, ordering
+
+
+def parse_spec(data: bytes, suffix: str) -> Dict[str, Any]:
+    """Parses the content of a spec file.
+
+    Parameters
+    ----------
+    data : bytes
+        Content of the spec file.
+    suffix : str
+        Suffix of the spec file (.json or .toml).
+
+    Returns
+    -------
+    spec : Dict[str, Any]
+        Spec of a pipeline.
+
+    Raises
+    ------
+    LoadingError
+        Informs that the suffix was not found in the formats.
+    LoadingError
+        Informs that the tomllib was not found in the packages.
+    LoadingError
+        Informs that the spec was not parsed by the loader.
+    """
+
+    if suffix not in ['.json', '.toml']:
+        raise LoadingError(
+            'suffix was not found in the formats', [f'suffix == {suffix}']
+        )
+
+    if suffix == '.toml' and tomllib is None:
+        raise LoadingError(
+            'tomllib was not found in the packages', 
+            [f'version == {platform.python_version()}']
+        )
+
+    try:
+        if suffix == '.json':
+            spec = json.loads(data)
+        else:
+            spec = tomllib.loads(data.decode())
+    except ValueError as error:
+        raise LoadingError(
+            'spec was not parsed by the loader', [f'error == {error}']
+        ) from error
+
+    return spec
+
+
+def build_spec(spec: Dict[str, Any]) -> Tuple[Pipeline, Catalog]:
+    """Builds a pipeline and a catalog from a spec.
+
+    The spec maps onto the Pipeline, Node, Link and Catalog classes and the 
+    tasks are informed as references in the module:function format, which 
+    are resolved when the nodes are executed. The IDs of the nodes and 
+    links are checked at once before the instances are created, so they 
+    are not matched again by each instance.
+
+    Parameters
+    ----------
+    spec : Dict[str, Any]
+        Spec of a pipeline. The nodes and links are lists of tables with 
+        the parameters of the Node and Link classes, while the optional 
+        catalog is a table with the id, items and tags keys.
+
+    Returns
+    -------
+    pipeline : Pipeline
+        Pipeline that stores a flow of tasks.
+    catalog : Catalog
+        Catalog that stores the items of an execution.
+
+    Raises
+    ------
+    LoadingError
+        Informs that the spec did not match the table.
+    LoadingError
+        Informs that the key was not found in the spec.
+    LoadingError
+        Informs that the colon was not found in the task.
+    LoadingError
+        Informs that the src_id was not found in the nodes.
+    LoadingError
+        Informs that the dst_id was not found in the nodes.
+    InfoError
+        Informs that the id did not match the pattern.
+    PipelineError
+        Informs that the id was found in the _nodes.
+    PipelineError
+        Informs that the id was found in the _links.
+    OrderError
+        Informs that the dst_id was found in the _successors[src_id].
+    OrderError
+        Informs that a circular dependency was found in the order.
+    """
+
+    _check_keys('spec', spec, {'id'}, _spec_keys)
+    node_specs = spec.get('nodes', [])
+    link_specs = spec.get('links', [])
+    catalog_spec = spec.get('catalog', {'id': spec['id']})
+
+    for node_spec in node_specs:
+        _check_keys('node', node_spec, {'id', 'task'}, _node_keys)
+        _check_task(node_spec['task'])
+
+    for link_spec in link_specs:
+        _check_keys('link', link_spec, {'id', 'src_id', 'dst_id'}, _link_keys)
+
+    _check_keys('catalog', catalog_spec, {'id'}, _catalog_keys)
+    check_ids(
+        [node_spec['id'] for node_spec in node_specs] + 
+        [link_spec['id'] for link_spec in link_specs]
+    )
+    pipeline = Pipeline(
+        spec['id'], 
+        tags=spec.get('tags'), 
+        ordered=spec.get('ordered', False)
+    )
+
+    for node_spec in node_specs:
+        pipeline.set_node(
+            Node(
+                node_spec['id'], 
+                node_spec['task'], 
+                pos_inputs=node_spec.get('pos_inputs'), 
+                key_inputs=node_spec.get('key_inputs'), 
+                outputs=node_spec.get('outputs'), 
+                tags=node_spec.get('tags'), 
+                checked=True
+            )
+        )
+
+    for link_spec in link_specs:
+        for param in ['src_id', 'dst_id']:
+            if not pipeline.check_node(link_spec[param]):
+                raise LoadingError(
+                    f'{param} was not found in the nodes', 
+                    [f'{param} == {link_spec[param]}']
+                )
+
+        pipeline.set_link(
+            Link(
+                link_spec['id'], 
+                link_spec['src_id'], 
+                link_spec['dst_id'], 
+                tags=link_spec.get('tags'), 
+                checked=True
+            )
+        )
+
+    catalog = Catalog(
+        catalog_spec['id'], 
+        items=dict(catalog_spec.get('items', {})), 
+        tags=catalog_spec.get('tags')
+    )
+
+    return pipeline, catalog
+
+
+def _check_keys(
+    name: str, spec: Any, required_keys: Set[str], keys: Set[str]
+) -> None:
+    """Checks the keys of a table of the spec.
+
+    Parameters
+    ----------
+    name : str
+        Name of the table.
+    spec : Any
+        Table of the spec.
+    required_keys : Set[str]
+        Keys that must be found in the table.
+    keys : Set[str]
+        Keys allowed in the table.
+
+    Raises
+    ------
+    LoadingError
+        Informs that the name did not match the table.
+    LoadingError
+        Informs that the key was not found in the name.
+    LoadingError
+        Informs that the key was not found in the keys.
+    """
+
+    if not isinstance(spec, dict):
+        raise LoadingError(
+            f'{name} did not match the table', [f'{name} == {spec!r}']
+        )
+
+    missing_keys = sorted(required_keys - spec.keys())
+    unknown_keys = sorted(spec.keys() - keys)
+
+    if missing_keys:
+        raise LoadingError(
+            f'{missing_keys[0]} was not found in the {name}', 
+            [f'{name} == {spec!r}']
+        )
+
+    if unknown_keys:
+        raise LoadingError(
+            'key was not found in the keys', 
+            [f'key == {unknown_keys[0]}', f'keys == {sorted(keys)}']
+        )
+
+
+def _check_task(task: Any) -> None:
+    """Checks if a task is a reference in the module:function format.
+
+    Parameters
+    ----------
+    task : Any
+        Task of the node.
+
+    Raises
+    ------
+    LoadingError
+        Informs that the colon was not found in the task.
+    """
+
+    if not isinstance(task, str) or not all(task.partition(':')):
+        raise LoadingError(
+            'colon was not found in the task', [f'task == {task!r}']
+        )
+
+
+def _read_cache(path: Path) -> Dict[str, Any]:
+    """Reads the compiled cache of a spec.
+
+    Parameters
+    ----------
+    path : Path
+        Path of the cache file.
+
+    Returns
+    -------
+    entry : Dict[str, Any]
+        Entry of the cache with the key, digest, pipeline, catalog and 
+        ordering. If the cache was not found, was not unpickled or misses 
+        a key, None is returned.
+    """
+
+    try:
+        entry = pickle.loads(path.read_bytes())
+    except FileNotFoundError:
+        return None
+    except Exception as error:
+        logger.warning(f'path: {path}, {error}')
+
+        return None
+
+    if not isinstance(entry, dict) or not _entry_keys <= entry.keys():
+        return None
+
+    return entry
+
+
+def _write_cache(path: Path, entry: Dict[str, Any]) -> None:
+    """Writes the compiled cache of a spec.
+
+    The cache is written to a temporary file and moved, so a concurrent 
+    reader never finds a partial file.
+
+    Parameters
+    ----------
+    path : Path
+        Path of the cache file.
+    entry : Dict[str, Any]
+        Entry of the cache with the key, digest, pipeline, catalog and 
+        ordering.
+    """
+
+    temp_path = path.with_name(f'{path.name}.{os.getpid()}')
+
+    try:
+        temp_path.write_bytes(pickle.dumps(entry, protocol=protocol))
+        os.replace(temp_path, path)
+    except Exception as error:
+        logger.warning(f'path: {path}, {error}')
+
+        try:
+            temp_path.unlink()
+        except OSError:
+            pass
@@ -0,0 +1,213 @@
+"""Functions related to the optimizing procedures."""
+
+from typing import Dict, List, Set
+
+from ipipeline.control.building import build_inputs
+from ipipeline.structure.link import Link
+from ipipeline.structure.node import Node
+from ipipeline.structure.pipeline import Pipeline
+
+
+def optimize_pipeline(
+    pipeline: Pipeline, 
+    ordering: List[list], 
+    outputs: List[str] = None, 
+    side_effect_tag: str = 'side_effect'
+) -> Pipeline:
+    """Optimizes a pipeline by eliminating the dead and duplicate nodes.
+
+    The dead nodes are the ones not required to produce the outputs and 
+    they are removed unless they have the side effect tag. The duplicate 
+    nodes are the ones with the same task, inputs and source nodes of an 
+    earlier node in the ordering, so they are removed and their consumers 
+    read the outputs of the earlier node instead. The nodes that produce 
+    the outputs and the nodes with the side effect tag are never removed 
+    as duplicates, therefore the outputs are the same with fewer task 
+    calls.
+
+    Parameters
+    ----------
+    pipeline : Pipeline
+        Pipeline that stores a flow of tasks.
+    ordering : List[list]
+        Ordering of the graph. The inner lists represent groups of nodes 
+        that must be executed sequentially and the nodes within these 
+        groups can be executed simultaneously.
+    outputs : List[str], optional
+        IDs of the items to produce. If None, no node is dead and the 
+        outputs are the items not consumed by any node.
+    side_effect_tag : str, optional
+        Tag of the nodes whose tasks have side effects.
+
+    Returns
+    -------
+    optimized_pipeline : Pipeline
+        Pipeline without the dead and duplicate nodes. The pipeline 
+        received is not modified.
+
+    Raises
+    ------
+    PipelineError
+        Informs that the id was not found in the _nodes.
+    PipelineError
+        Informs that the output was found in the _producers.
+    """
+
+    side_effect_ids = set(pipeline.tag_index.get(side_effect_tag, []))
+    src_ids = {}
+
+    for link in pipeline.links.values():
+        src_ids.setdefault(link.dst_id, []).append(link.src_id)
+
+    if outputs is None:
+        live_ids = set(pipeline.nodes.keys())
+        output_ids = {
+            item_id
+            for node in pipeline.nodes.values()
+            for item_id in node.outputs
+            if item_id not in pipeline.consumers
+        }
+    else:
+        live_ids = _find_live_ids(
+            pipeline, outputs, side_effect_ids, src_ids
+        )
+        output_ids = set(outputs)
+
+    optimized_pipeline = Pipeline(
+        pipeline.id, tags=pipeline.tags, ordered=pipeline.ordered
+    )
+    item_aliases = {}
+    node_aliases = {}
+    kept_nodes = {}
+
+    for group in ordering:
+        for node_id in group:
+            if node_id not in live_ids:
+                continue
+
+            node = pipeline.get_node(node_id)
+            pos_inputs = [
+                item_aliases.get(item_id, item_id)
+                for item_id in node.pos_inputs
+            ]
+            key_inputs = {
+                param: item_aliases.get(item_id, item_id)
+                for param, item_id in node.key_inputs.items()
+            }
+
+            if node_id not in side_effect_ids:
+                task_key = node.task_ref
+
+                if task_key is None:
+                    task_key = id(node.task)
+
+                key = (
+                    task_key, 
+                    tuple(pos_inputs), 
+                    tuple(sorted(key_inputs.items())), 
+                    len(node.outputs), 
+                    frozenset(
+                        node_aliases.get(src_id, src_id)
+                        for src_id in src_ids.get(node_id, [])
+                        if src_id in live_ids
+                    )
+                )
+                kept_node = kept_nodes.setdefault(key, node)
+
+                if kept_node is not node and \
+                        output_ids.isdisjoint(node.outputs):
+                    node_aliases[node_id] = kept_node.id
+                    item_aliases.update(zip(node.outputs, kept_node.outputs))
+
+                    continue
+
+            if pos_inputs != node.pos_inputs or \
+                    key_inputs != node.key_inputs:
+                node = Node(
+                    node_id, 
+                    node.task if node.task_ref is None else node.task_ref, 
+                    pos_inputs=pos_inputs, 
+                    key_inputs=key_inputs, 
+                    outputs=node.outputs, 
+                    tags=node.tags
+                )
+
+            optimized_pipeline.set_node(node)
+
+    pairs = set()
+
+    for link in pipeline.links.values():
+        if link.src_id not in live_ids or link.dst_id not in live_ids or \
+                link.dst_id in node_aliases:
+            continue
+
+        src_id = node_aliases.get(link.src_id, link.src_id)
+
+        if (src_id, link.dst_id) not in pairs:
+            pairs.add((src_id, link.dst_id))
+
+            if src_id != link.src_id:
+                link = Link(link.id, src_id, link.dst_id, tags=link.tags)
+
+            optimized_pipeline.set_link(link)
+
+    return optimized_pipeline
+
+
+def _find_live_ids(
+    pipeline: Pipeline, 
+    outputs: List[str], 
+    side_effect_ids: Set[str], 
+    src_ids: Dict[str, list]
+) -> Set[str]:
+    """Finds the nodes required to produce the outputs.
+
+    Parameters
+    ----------
+    pipeline : Pipeline
+        Pipeline that stores a flow of tasks.
+    outputs : List[str]
+        IDs of the items to produce.
+    side_effect_ids : Set[str]
+        IDs of the nodes whose tasks have side effects.
+    src_ids : Dict[str, list]
+        Source nodes of the nodes. The keys are the destination node IDs 
+        and the values are the lists of source node IDs.
+
+    Returns
+    -------
+    live_ids : Set[str]
+        IDs of the nodes required to produce the outputs along with the 
+        nodes with side effects and their upstream nodes.
+
+    Raises
+    ------
+    PipelineError
+        Informs that the id was not found in the _nodes.
+    PipelineError
+        Informs that the output was found in the _producers.
+    """
+
+    producers = pipeline.producers
+    live_ids = set()
+    pending_ids = list(side_effect_ids)
+    pending_ids.extend(
+        producers[item_id] for item_id in outputs if item_id in producers
+    )
+
+    while pending_ids:
+        id = pending_ids.pop()
+
+        if id in live_ids:
+            continue
+
+        live_ids.add(id)
+        node = pipeline.get_node(id)
+
+        for item_id in build_inputs(node.pos_inputs, node.key_inputs):
+            if item_id in producers:
+                pending_ids.append(producers[item_id])
+
+        pending_ids.extend(src_ids.get(id, []))
+
+    return live_ids
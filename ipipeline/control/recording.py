@@ -0,0 +1,314 @@
+"""Classes and functions related to the recording procedures."""
+
+import logging
+import pickle
+from pathlib import Path
+from threading import RLock
+from typing import Any, Callable, Dict, List
+from weakref import ref
+
+from ipipeline.control.caching import fingerprint_item, fingerprint_task
+from ipipeline.exceptions import RecordError
+from ipipeline.utils.checking import check_none
+from ipipeline.utils.pickling import protocol
+
+
+logger = logging.getLogger(name=__name__)
+
+
+class Record:
+    """Stores the fingerprints of the nodes executed in previous runs.
+
+    A node is skipped when its task and the fingerprints of its inputs 
+    match the recorded ones and its outputs are still available with the 
+    recorded fingerprints, so they are reused instead. When a node is 
+    executed again but its outputs match the recorded ones, the 
+    fingerprints seen by its destination nodes are unchanged, so the 
+    reexecution stops there (early cutoff).
+
+    The record holds only weak references to the fingerprinted items, so 
+    the items are still released by the eviction. An output is available 
+    while its weak reference is alive or while the catalog holds it.
+
+    Attributes
+    ----------
+    _nodes : Dict[str, dict]
+        Entries of the nodes. The keys are the node IDs and the values are 
+        dictionaries with the task fingerprint, the input fingerprints and 
+        the output fingerprints.
+    _refs : Dict[str, ref]
+        Weak references to the items fingerprinted by the record. The keys 
+        are the item IDs and the values are the references. The items that 
+        do not support weak references are not stored.
+    _fingerprints : Dict[str, str]
+        Fingerprints of the referenced items. The keys are the item IDs and 
+        the values are the fingerprints.
+    _lock : RLock
+        Lock that serializes the access to the entries between threads.
+    """
+
+    def __init__(self) -> None:
+        """Initializes the attributes."""
+
+        self._nodes = {}
+        self._refs = {}
+        self._fingerprints = {}
+        self._lock = RLock()
+
+    @property
+    def nodes(self) -> Dict[str, dict]:
+        """Gets the _nodes attribute.
+
+        Returns
+        -------
+        nodes : Dict[str, dict]
+            Entries of the nodes. The keys are the node IDs and the values 
+            are dictionaries with the task fingerprint, the input 
+            fingerprints and the output fingerprints.
+        """
+
+        return self._nodes
+
+    def fingerprint_item(self, item_id: str, item: Any) -> str:
+        """Fingerprints an item, reusing the fingerprint of the same object.
+
+        Parameters
+        ----------
+        item_id : str
+            ID of the item.
+        item : Any
+            Item of an execution.
+
+        Returns
+        -------
+        fingerprint : str
+            Fingerprint of the item.
+
+        Raises
+        ------
+        CacheError
+            Informs that the item was not pickled by the cache.
+        """
+
+        with self._lock:
+            if item_id in self._refs and self._refs[item_id]() is item:
+                return self._fingerprints[item_id]
+
+        fingerprint = fingerprint_item(item)
+
+        with self._lock:
+            try:
+                self._refs[item_id] = ref(item)
+                self._fingerprints[item_id] = fingerprint
+            except TypeError:
+                self._refs.pop(item_id, None)
+                self._fingerprints.pop(item_id, None)
+
+        return fingerprint
+
+    def get_items(
+        self, 
+        id: str, 
+        task: Callable, 
+        fingerprints: Dict[str, str], 
+        outputs: List[str], 
+        items: Dict[str, Any] = None
+    ) -> Dict[str, Any]:
+        """Gets the recorded items of a node when it was not changed.
+
+        The node is changed when its task, the fingerprints of its inputs 
+        or its output IDs differ from the recorded ones. The outputs are 
+        taken from the alive weak references or from the held items whose 
+        fingerprints match the recorded ones.
+
+        Parameters
+        ----------
+        id : str
+            ID of the node.
+        task : Callable
+            Task of the node.
+        fingerprints : Dict[str, str]
+            Fingerprints of the inputs of the node. The keys are the item 
+            IDs and the values are the fingerprints.
+        outputs : List[str]
+            Output IDs of the node.
+        items : Dict[str, Any], optional
+            Outputs held by the catalog. The keys are the item IDs and the 
+            values are the items.
+
+        Returns
+        -------
+        items : Dict[str, Any]
+            Items of an execution. The keys are the item IDs and the values 
+            are the arguments required by the tasks. If the node was not 
+            recorded, was changed or its outputs are not available, None is 
+            returned.
+
+        Raises
+        ------
+        CacheError
+            Informs that the item was not pickled by the cache.
+        """
+
+        items = check_none(items, {})
+
+        with self._lock:
+            entry = self._nodes.get(id)
+
+            if entry is None or entry['inputs'] != fingerprints or \
+                    list(entry['outputs']) != list(outputs):
+                return None
+
+            if entry['task'] != fingerprint_task(task):
+                return None
+
+            found_items = {}
+
+            for item_id, fingerprint in entry['outputs'].items():
+                reference = self._refs.get(item_id)
+                item = reference() if reference is not None else None
+
+                if item is None or self._fingerprints[item_id] != fingerprint:
+                    if item_id not in items or fingerprint != \
+                            self.fingerprint_item(item_id, items[item_id]):
+                        return None
+
+                    item = items[item_id]
+
+                found_items[item_id] = item
+
+            return found_items
+
+    def set_items(
+        self, 
+        id: str, 
+        task: Callable, 
+        fingerprints: Dict[str, str], 
+        items: Dict[str, Any]
+    ) -> bool:
+        """Sets the items of an executed node.
+
+        Parameters
+        ----------
+        id : str
+            ID of the node.
+        task : Callable
+            Task of the node.
+        fingerprints : Dict[str, str]
+            Fingerprints of the inputs of the node. The keys are the item 
+            IDs and the values are the fingerprints.
+        items : Dict[str, Any]
+            Items of an execution. The keys are the item IDs and the values 
+            are the arguments required by the tasks.
+
+        Returns
+        -------
+        changed : bool
+            Flag that indicates if the outputs differ from the recorded ones.
+
+        Raises
+        ------
+        CacheError
+            Informs that the item was not pickled by the cache.
+        """
+
+        with self._lock:
+            old_fingerprints = self._nodes.get(id, {}).get('outputs')
+            new_fingerprints = {
+                item_id: self.fingerprint_item(item_id, item)
+                for item_id, item in items.items()
+            }
+            self._nodes[id] = {
+                'task': fingerprint_task(task), 
+                'inputs': dict(fingerprints), 
+                'outputs': new_fingerprints
+            }
+            changed = old_fingerprints != new_fingerprints
+
+            return changed
+
+    def delete_node(self, id: str) -> None:
+        """Deletes the entry of a node.
+
+        Parameters
+        ----------
+        id : str
+            ID of the node.
+        """
+
+        with self._lock:
+            self._nodes.pop(id, None)
+
+    def dump(self, path: str) -> None:
+        """Dumps the record to a file.
+
+        Only the entries of the nodes are dumped, the items are not.
+
+        Parameters
+        ----------
+        path : str
+            Path of the file.
+
+        Raises
+        ------
+        RecordError
+            Informs that the record was not pickled.
+        """
+
+        with self._lock:
+            try:
+                data = pickle.dumps(self._nodes, protocol=protocol)
+            except Exception as error:
+                raise RecordError(
+                    'record was not pickled', [f'path == {path}']
+                ) from error
+
+        Path(path).write_bytes(data)
+
+
+def load_record(path: str) -> Record:
+    """Loads a record from a file.
+
+    A file that is not unpickled (e.g. truncated by an interrupted dump) 
+    is loaded as an empty record, so the nodes are executed again. The 
+    outputs of the loaded entries are reused only while the catalog holds 
+    them with the recorded fingerprints.
+
+    Parameters
+    ----------
+    path : str
+        Path of the file.
+
+    Returns
+    -------
+    record : Record
+        Record that stores the fingerprints of the executed nodes.
+
+    Raises
+    ------
+    RecordError
+        Informs that the record was not found in the path.
+    """
+
+    try:
+        data = Path(path).read_bytes()
+    except FileNotFoundError as error:
+        raise RecordError(
+            'record was not found in the path', [f'path == {path}']
+        ) from error
+
+    record = Record()
+
+    try:
+        nodes = pickle.loads(data)
+    except Exception as error:
+        logger.warning(f'path: {path}, {error}')
+
+        return record
+
+    if isinstance(nodes, dict):
+        record._nodes = nodes
+    else:
+        logger.warning(f'path: {path}, record format was not supported')
+
+    return record
@@ -0,0 +1,324 @@
+"""Classes and function related to the scheduling procedures."""
+
+from abc import ABC, abstractmethod
+from collections import deque
+from heapq import heappop, heappush
+from itertools import count
+from typing import Dict, List
+
+from ipipeline.control.sorting import _get_incomings_qty, sort_topology
+from ipipeline.utils.checking import check_none
+
+
+class BaseScheduler(ABC):
+    """Provides an interface to the scheduler classes.
+
+    A scheduler releases the node IDs that are ready to be executed as the 
+    executed ones are informed, which allows the executors to submit the 
+    nodes to a pool without knowing about their dependencies. When the 
+    priorities are informed, the ready node with the highest priority is 
+    popped first, otherwise the nodes are popped in the released order.
+
+    Attributes
+    ----------
+    _ready_ids : list
+        IDs of the nodes that are ready to be executed. The elements are 
+        stored as a heap of (priority, position, ID) tuples.
+    _pending_qty : int
+        Quantity of nodes that were not executed yet.
+    _priorities : Dict[str, float]
+        Priorities of the nodes. The keys are the node IDs and the values 
+        are the priorities.
+    _positions : count
+        Counter that breaks the ties between the priorities in the 
+        released order.
+    """
+
+    def __init__(
+        self, pending_qty: int, priorities: Dict[str, float] = None
+    ) -> None:
+        """Initializes the attributes.
+
+        Parameters
+        ----------
+        pending_qty : int
+            Quantity of nodes that were not executed yet.
+        priorities : Dict[str, float], optional
+            Priorities of the nodes. The keys are the node IDs and the 
+            values are the priorities.
+        """
+
+        self._ready_ids = []
+        self._pending_qty = pending_qty
+        self._priorities = check_none(priorities, {})
+        self._positions = count()
+
+    def check_pending(self) -> bool:
+        """Checks if there are nodes that were not executed yet.
+
+        Returns
+        -------
+        checked : bool
+            Flag that indicates if there are nodes that were not executed yet.
+        """
+
+        checked = self._pending_qty > 0
+
+        return checked
+
+    def check_ready(self) -> bool:
+        """Checks if there are nodes that are ready to be executed.
+
+        Returns
+        -------
+        checked : bool
+            Flag that indicates if there are nodes that are ready to be 
+            executed.
+        """
+
+        checked = len(self._ready_ids) > 0
+
+        return checked
+
+    def pop_ready(self) -> str:
+        """Pops the ID of a node that is ready to be executed.
+
+        Returns
+        -------
+        id : str
+            ID of the node.
+        """
+
+        _, _, id = heappop(self._ready_ids)
+
+        return id
+
+    def push_ready(self, id: str) -> None:
+        """Pushes the ID of a node that is ready to be executed.
+
+        Parameters
+        ----------
+        id : str
+            ID of the node.
+        """
+
+        heappush(
+            self._ready_ids, 
+            (-self._priorities.get(id, 0), next(self._positions), id)
+        )
+
+    def release(self, id: str) -> None:
+        """Releases the nodes that depend on an executed node.
+
+        Parameters
+        ----------
+        id : str
+            ID of the executed node.
+        """
+
+        self._pending_qty -= 1
+        self._release_ids(id)
+
+    @abstractmethod
+    def _release_ids(self, id: str) -> None:
+        """Provides an interface to release the nodes that became ready.
+
+        Parameters
+        ----------
+        id : str
+            ID of the executed node.
+        """
+
+        pass
+
+
+class LevelScheduler(BaseScheduler):
+    """Releases the nodes of an ordering group by group.
+
+    A group is released only after all the nodes of the previous group 
+    were executed, therefore each group acts as a barrier.
+
+    Attributes
+    ----------
+    _ready_ids : list
+        IDs of the nodes that are ready to be executed. The elements are 
+        stored as a heap of (priority, position, ID) tuples.
+    _pending_qty : int
+        Quantity of nodes that were not executed yet.
+    _priorities : Dict[str, float]
+        Priorities of the nodes. The keys are the node IDs and the values 
+        are the priorities.
+    _positions : count
+        Counter that breaks the ties between the priorities in the 
+        released order.
+    _groups : deque
+        Groups of the ordering that were not released yet.
+    _running_qty : int
+        Quantity of nodes of the released group that were not executed yet.
+    """
+
+    def __init__(
+        self, ordering: List[list], priorities: Dict[str, float] = None
+    ) -> None:
+        """Initializes the attributes.
+
+        Parameters
+        ----------
+        ordering : List[list]
+            Ordering of the graph. The inner lists represent groups of nodes 
+            that must be executed sequentially and the nodes within these 
+            groups can be executed simultaneously.
+        priorities : Dict[str, float], optional
+            Priorities of the nodes. The keys are the node IDs and the 
+            values are the priorities.
+        """
+
+        super().__init__(
+            sum(len(group) for group in ordering), priorities=priorities
+        )
+
+        self._groups = deque(group for group in ordering if group)
+        self._running_qty = 0
+        self._release_group()
+
+    def _release_ids(self, id: str) -> None:
+        """Releases the next group when the current one was executed.
+
+        Parameters
+        ----------
+        id : str
+            ID of the executed node.
+        """
+
+        self._running_qty -= 1
+
+        if self._running_qty == 0:
+            self._release_group()
+
+    def _release_group(self) -> None:
+        """Releases the next group of the ordering."""
+
+        if self._groups:
+            group = self._groups.popleft()
+            self._running_qty = len(group)
+
+            for id in group:
+                self.push_ready(id)
+
+
+class ReadyScheduler(BaseScheduler):
+    """Releases the nodes of a graph as soon as their dependencies are met.
+
+    The quantity of incoming links of each node is decremented every time 
+    one of its source nodes is executed, so a node is released when its 
+    last source node is executed regardless of the other nodes.
+
+    Attributes
+    ----------
+    _ready_ids : list
+        IDs of the nodes that are ready to be executed. The elements are 
+        stored as a heap of (priority, position, ID) tuples.
+    _pending_qty : int
+        Quantity of nodes that were not executed yet.
+    _priorities : Dict[str, float]
+        Priorities of the nodes. The keys are the node IDs and the values 
+        are the priorities.
+    _positions : count
+        Counter that breaks the ties between the priorities in the 
+        released order.
+    _graph : Dict[str, list]
+        Graph of the pipeline. The keys are the source node IDs and the 
+        values are the lists of destination node IDs.
+    _incomings_qty : Dict[str, int]
+        Quantity of incoming links for each node. The keys are the node IDs 
+        and the values are the quantity of incoming links.
+    """
+
+    def __init__(
+        self, graph: Dict[str, list], priorities: Dict[str, float] = None
+    ) -> None:
+        """Initializes the attributes.
+
+        Parameters
+        ----------
+        graph : Dict[str, list]
+            Graph of the pipeline. The keys are the source node IDs and the 
+            values are the lists of destination node IDs.
+        priorities : Dict[str, float], optional
+            Priorities of the nodes. The keys are the node IDs and the 
+            values are the priorities.
+
+        Raises
+        ------
+        SortingError
+            Informs that the dst_id was not set as a src_id.
+        """
+
+        super().__init__(len(graph), priorities=priorities)
+
+        self._graph = graph
+        self._incomings_qty = _get_incomings_qty(graph)
+
+        for id, in_qty in self._incomings_qty.items():
+            if in_qty == 0:
+                self.push_ready(id)
+
+    def _release_ids(self, id: str) -> None:
+        """Releases the destination nodes that have no incoming links left.
+
+        Parameters
+        ----------
+        id : str
+            ID of the executed node.
+        """
+
+        for dst_id in self._graph[id]:
+            self._incomings_qty[dst_id] -= 1
+
+            if self._incomings_qty[dst_id] == 0:
+                self.push_ready(dst_id)
+
+
+def compute_critical_paths(
+    graph: Dict[str, list], costs: Dict[str, float] = None
+) -> Dict[str, float]:
+    """Computes the critical path of each node of a graph.
+
+    The critical path of a node is the longest path from the node to the 
+    end of the graph, where the length is the sum of the costs of the 
+    nodes along the path. Dispatching first the ready nodes with the 
+    longest critical paths shortens the total time of an execution.
+
+    Parameters
+    ----------
+    graph : Dict[str, list]
+        Graph of the pipeline. The keys are the source node IDs and the 
+        values are the lists of destination node IDs.
+    costs : Dict[str, float], optional
+        Costs of the nodes. The keys are the node IDs and the values are 
+        the costs. The nodes without a cost are weighted as 1.
+
+    Returns
+    -------
+    paths : Dict[str, float]
+        Critical paths of the nodes. The keys are the node IDs and the 
+        values are the lengths of the critical paths.
+
+    Raises
+    ------
+    SortingError
+        Informs that the dst_id was not set as a src_id.
+    SortingError
+        Informs that a circular dependency was found in the graph.
+    """
+
+    costs = check_none(costs, {})
+    paths = {}
+
+    for group in reversed(sort_topology(graph)):
+        for id in group:
+            paths[id] = costs.get(id, 1) + max(
+                [paths[dst_id] for dst_id in graph[id]], default=0
+            )
+
+    return paths
@@ -1,5 +1,6 @@
 """Functions related to the sorting procedures."""
 
+from array import array
 from typing import Dict, List
 
 from ipipeline.exceptions import SortingError
@@ -64,6 +65,84 @@ def sort_topology(graph: Dict[str, list]) -> List[list]:
     return ordering
 
 
+def sort_compact_topology(
+    ids: List[str], offsets: array, targets: array
+) -> List[list]:
+    """Sorts the compact graph topology to find a linear ordering of the nodes.
+
+    The nodes are handled by their integer indexes and mapped back to 
+    their IDs only in the ordering, so the sorting runs in linear time 
+    and memory. The ordering is the same as the one of the sort_topology 
+    function for the graph built from the same pipeline.
+
+    Parameters
+    ----------
+    ids : List[str]
+        IDs of the nodes. The positions are the indexes of the nodes.
+    offsets : array
+        Offsets of the destination indexes of each source index in the 
+        targets. Its length is the quantity of nodes plus one.
+    targets : array
+        Destination indexes grouped by the source indexes.
+
+    Returns
+    -------
+    ordering : List[list]
+        Ordering of the graph. The inner lists represent groups of nodes 
+        that must be executed sequentially and the nodes within these 
+        groups can be executed simultaneously.
+
+    Raises
+    ------
+    SortingError
+        Informs that a circular dependency was found in the graph.
+
+    Notes
+    -----
+        Based on the Kahn's algorithm.
+    """
+
+    ordering = []
+    sorted_qty = 0
+    incomings_qty = array('l', [0]) * len(ids)
+
+    for dst_index in targets:
+        incomings_qty[dst_index] += 1
+
+    unbound_indexes = [
+        index for index, in_qty in enumerate(incomings_qty) if in_qty == 0
+    ]
+
+    while unbound_indexes:
+        tmp_indexes = []
+        ordering.append([ids[index] for index in unbound_indexes])
+        sorted_qty += len(unbound_indexes)
+
+        for src_index in unbound_indexes:
+            for dst_index in targets[
+                offsets[src_index]:offsets[src_index + 1]
+            ]:
+                incomings_qty[dst_index] -= 1
+
+                if incomings_qty[dst_index] == 0:
+                    tmp_indexes.append(dst_index)
+
+        unbound_indexes = tmp_indexes
+
+    if sorted_qty < len(ids):
+        incomings_qty = {
+            ids[index]: in_qty 
+            for index, in_qty in enumerate(incomings_qty) if in_qty > 0
+        }
+
+        raise SortingError(
+            'circular dependency was found in the graph', 
+            [f'incomings_qty == {incomings_qty}']
+        )
+
+    return ordering
+
+
 def _get_incomings_qty(graph: Dict[str, list]) -> Dict[str, int]:
     """Gets the quantity of incoming links for each node.
 
@@ -0,0 +1,529 @@
+"""Classes and functions related to the transporting procedures."""
+
+import os
+import platform
+from threading import Lock
+from typing import Any, Dict, List, NamedTuple, Tuple
+
+from ipipeline.exceptions import TransportError
+from ipipeline.utils.instance import build_repr
+
+try:
+    from multiprocessing import resource_tracker
+    from multiprocessing.shared_memory import SharedMemory
+except ImportError:
+    resource_tracker = None
+    SharedMemory = None
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class SharedItem(NamedTuple):
+    """Stores the description of an item placed in a shared memory block.
+
+    Only the description is pickled between the processes, so an item is 
+    read from the block instead of being copied through a pipe.
+
+    Attributes
+    ----------
+    name : str
+        Name of the shared memory block.
+    kind : str
+        Kind of the item (ndarray, bytes, bytearray or memoryview).
+    size : int
+        Size of the item in bytes.
+    shape : tuple
+        Shape of the item. Used by the ndarray and memoryview kinds.
+    format : str
+        Data type of the ndarray kind or format of the memoryview kind.
+    """
+
+    name: str
+    kind: str
+    size: int
+    shape: tuple
+    format: str
+
+
+class SharedTransport:
+    """Transports the large items to the workers through shared memory.
+
+    The numpy.ndarray, bytes, bytearray and memoryview items with at least 
+    the minimum size are placed in shared memory blocks by the calling 
+    process and only their descriptions are sent to the workers. An item 
+    consumed by several nodes is placed once. The ndarray and memoryview 
+    items are received as read-only views of the blocks, while the bytes 
+    and bytearray items are copied from the blocks since they do not wrap 
+    a foreign buffer. The returns of the workers follow the same path 
+    back and are kept in their blocks, which are reused when the returns 
+    are sent to the consumer nodes. A block is released when its item is 
+    evicted or when the execution ends.
+
+    Attributes
+    ----------
+    _min_size : int
+        Minimum size in bytes of the items placed in the blocks. The 
+        smaller items are pickled as usual.
+    _blocks : Dict[str, tuple]
+        Blocks of the items shared with the workers. The keys are the IDs 
+        of the items and the values are tuples of the item, the block and 
+        its description.
+    _lock : Lock
+        Lock that serializes the access to the blocks between threads.
+    """
+
+    def __init__(self, min_size: int = 1048576) -> None:
+        """Initializes the attributes.
+
+        Parameters
+        ----------
+        min_size : int, optional
+            Minimum size in bytes of the items placed in the blocks. The 
+            smaller items are pickled as usual.
+
+        Raises
+        ------
+        TransportError
+            Informs that the shared_memory was not found in the 
+            multiprocessing.
+        """
+
+        if SharedMemory is None:
+            raise TransportError(
+                'shared_memory was not found in the multiprocessing', 
+                [f'version == {platform.python_version()}']
+            )
+
+        if os.name == 'posix':
+            resource_tracker.ensure_running()
+
+        self._min_size = min_size
+        self._blocks = {}
+        self._lock = Lock()
+
+    @property
+    def min_size(self) -> int:
+        """Gets the _min_size attribute.
+
+        Returns
+        -------
+        min_size : int
+            Minimum size in bytes of the items placed in the blocks. The 
+            smaller items are pickled as usual.
+        """
+
+        return self._min_size
+
+    @min_size.setter
+    def min_size(self, min_size: int) -> None:
+        """Sets the _min_size attribute.
+
+        Parameters
+        ----------
+        min_size : int
+            Minimum size in bytes of the items placed in the blocks. The 
+            smaller items are pickled as usual.
+        """
+
+        self._min_size = min_size
+
+    def export_args(
+        self, 
+        pos_inputs: List[str], 
+        key_inputs: Dict[str, str], 
+        pos_args: List[Any], 
+        key_args: Dict[str, Any]
+    ) -> Tuple[List[Any], Dict[str, Any]]:
+        """Exports the arguments of a task to the blocks.
+
+        Parameters
+        ----------
+        pos_inputs : List[str]
+            Positional inputs of the task. The elements are the IDs of the 
+            catalog items.
+        key_inputs : Dict[str, str]
+            Keyword inputs of the task. The keys are the function 
+            parameters and the values are the IDs of the catalog items.
+        pos_args : List[Any]
+            Positional arguments of the task.
+        key_args : Dict[str, Any]
+            Keyword arguments of the task.
+
+        Returns
+        -------
+        pos_args : List[Any]
+            Positional arguments of the task with the large items replaced 
+            by their descriptions.
+        key_args : Dict[str, Any]
+            Keyword arguments of the task with the large items replaced by 
+            their descriptions.
+        """
+
+        pos_args = [
+            self._export_item(item_id, arg)
+            for item_id, arg in zip(pos_inputs, pos_args)
+        ]
+        key_args = {
+            param: self._export_item(key_inputs[param], arg)
+            for param, arg in key_args.items()
+        }
+
+        return pos_args, key_args
+
+    def import_items(self, items: Dict[str, Any]) -> Dict[str, Any]:
+        """Imports the items returned by a worker from the blocks.
+
+        The ndarray and memoryview items are mapped as read-only views of 
+        their blocks instead of being copied. The blocks are kept until 
+        the items are released, so they are reused when the items are sent 
+        to other workers.
+
+        Parameters
+        ----------
+        items : Dict[str, Any]
+            Items of an execution with the large items replaced by their 
+            descriptions.
+
+        Returns
+        -------
+        items : Dict[str, Any]
+            Items of an execution. The keys are the item IDs and the values 
+            are the arguments required by the tasks.
+
+        Raises
+        ------
+        TransportError
+            Informs that the name was not found in the shared memory.
+        """
+
+        imported_items = {}
+        blocks = {}
+
+        try:
+            for item_id, item in items.items():
+                item_blocks = []
+                imported_items[item_id] = load_item(item, item_blocks)
+
+                if item_blocks:
+                    blocks[item_id] = item_blocks[0]
+        except Exception:
+            close_blocks(list(blocks.values()))
+
+            for item in items.values():
+                if isinstance(item, SharedItem):
+                    _unlink_block(item.name)
+
+            raise
+
+        close_blocks(list(blocks.values()))
+
+        with self._lock:
+            for item_id, block in blocks.items():
+                if item_id in self._blocks:
+                    _unlink_blocks([self._blocks[item_id][1]])
+
+                self._blocks[item_id] = (
+                    imported_items[item_id], block, items[item_id]
+                )
+
+        return imported_items
+
+    def release_items(self, item_ids: List[str]) -> None:
+        """Releases the blocks of some items.
+
+        The views of the released items remain valid, since a block is 
+        only freed when it is no longer mapped by any process.
+
+        Parameters
+        ----------
+        item_ids : List[str]
+            IDs of the items.
+        """
+
+        with self._lock:
+            blocks = [
+                self._blocks.pop(item_id)[1]
+                for item_id in item_ids if item_id in self._blocks
+            ]
+
+        _unlink_blocks(blocks)
+
+    def release(self) -> None:
+        """Releases the blocks of all the items."""
+
+        with self._lock:
+            blocks = [block for _, block, _ in self._blocks.values()]
+            self._blocks.clear()
+
+        _unlink_blocks(blocks)
+
+    def __repr__(self) -> str:
+        """Builds the representation of an instance.
+
+        Returns
+        -------
+        repr : str
+            Representation of an instance.
+        """
+
+        repr = build_repr(self)
+
+        return repr
+
+    def _export_item(self, item_id: str, item: Any) -> Any:
+        """Exports an item to a block, reusing the block of a previous call.
+
+        Parameters
+        ----------
+        item_id : str
+            ID of the item.
+        item : Any
+            Item of the catalog.
+
+        Returns
+        -------
+        item : Any
+            Description of the item if it was placed in a block, otherwise 
+            the item itself.
+        """
+
+        with self._lock:
+            if item_id in self._blocks:
+                if self._blocks[item_id][0] is item:
+                    return self._blocks[item_id][2]
+
+                _unlink_blocks([self._blocks.pop(item_id)[1]])
+
+            shared_item, block = dump_item(item, self._min_size)
+
+            if block is not None:
+                self._blocks[item_id] = (item, block, shared_item)
+
+        return shared_item
+
+
+def dump_item(item: Any, min_size: int) -> Tuple[Any, Any]:
+    """Dumps an item to a new block.
+
+    The block is closed after the copy but not unlinked, so it remains 
+    available to the other processes until it is unlinked.
+
+    Parameters
+    ----------
+    item : Any
+        Item of the catalog.
+    min_size : int
+        Minimum size in bytes of the items placed in the blocks.
+
+    Returns
+    -------
+    item : Any
+        Description of the item if it was placed in a block, otherwise the 
+        item itself.
+    block : SharedMemory
+        Block that stores the item. If the item was not placed in a block, 
+        None is returned.
+    """
+
+    shared_item = _describe_item(item)
+
+    if shared_item is None or shared_item.size < max(min_size, 1):
+        return item, None
+
+    block = SharedMemory(create=True, size=shared_item.size)
+
+    try:
+        if shared_item.kind == 'ndarray':
+            view = numpy.ndarray(
+                item.shape, dtype=item.dtype, buffer=block.buf
+            )
+            view[...] = item
+            del view
+        elif shared_item.kind == 'memoryview':
+            block.buf[:shared_item.size] = item.cast('B')
+        else:
+            block.buf[:shared_item.size] = item
+    except BaseException:
+        block.close()
+        block.unlink()
+
+        raise
+
+    block.close()
+
+    return shared_item._replace(name=block.name), block
+
+
+def load_item(item: Any, blocks: List[Any], copy: bool = False) -> Any:
+    """Loads an item from its block.
+
+    Parameters
+    ----------
+    item : Any
+        Description of the item if it was placed in a block, otherwise the 
+        item itself.
+    blocks : List[Any]
+        Blocks opened by the calling process. The block of the item is 
+        appended to be closed by the close_blocks function.
+    copy : bool, optional
+        Flag that indicates if the ndarray and memoryview items are copied 
+        instead of being read-only views of the block.
+
+    Returns
+    -------
+    item : Any
+        Item of the catalog.
+
+    Raises
+    ------
+    TransportError
+        Informs that the name was not found in the shared memory.
+    """
+
+    if not isinstance(item, SharedItem):
+        return item
+
+    try:
+        block = SharedMemory(name=item.name)
+    except FileNotFoundError as error:
+        raise TransportError(
+            'name was not found in the shared memory', 
+            [f'name == {item.name}']
+        ) from error
+
+    blocks.append(block)
+
+    if item.kind == 'ndarray':
+        view = numpy.ndarray(
+            item.shape, dtype=numpy.dtype(item.format), buffer=block.buf
+        )
+
+        if copy:
+            return numpy.array(view)
+
+        view.flags.writeable = False
+
+        return view
+
+    with block.buf[:item.size] as view:
+        if item.kind == 'bytes':
+            return bytes(view)
+        elif item.kind == 'bytearray':
+            return bytearray(view)
+        elif copy:
+            return memoryview(bytes(view)).cast(item.format, item.shape)
+
+    return block.buf[:item.size].toreadonly().cast(item.format, item.shape)
+
+
+def close_blocks(blocks: List[Any]) -> None:
+    """Closes the blocks opened by the calling process.
+
+    A block still referenced by a view is detached from its mapping, which 
+    is unmapped when the last view is released.
+
+    Parameters
+    ----------
+    blocks : List[Any]
+        Blocks opened by the calling process.
+    """
+
+    for block in blocks:
+        try:
+            block.close()
+        except BufferError:
+            _detach_block(block)
+
+
+def _detach_block(block: Any) -> None:
+    """Detaches a block from the mapping still referenced by its views.
+
+    The views keep the mapping alive by themselves, so only the file 
+    descriptor is closed and the block no longer tries to close the 
+    mapping when it is collected.
+
+    Parameters
+    ----------
+    block : SharedMemory
+        Block opened by the calling process.
+    """
+
+    block._buf = None
+    block._mmap = None
+
+    if getattr(block, '_fd', -1) >= 0:
+        os.close(block._fd)
+        block._fd = -1
+
+
+def _describe_item(item: Any) -> SharedItem:
+    """Describes an item that can be placed in a block.
+
+    Parameters
+    ----------
+    item : Any
+        Item of the catalog.
+
+    Returns
+    -------
+    shared_item : SharedItem
+        Description of the item without the name of the block. If the item 
+        can not be placed in a block, None is returned.
+    """
+
+    if numpy is not None and isinstance(item, numpy.ndarray):
+        if item.dtype.hasobject or item.dtype.fields is not None:
+            return None
+
+        return SharedItem(
+            '', 'ndarray', item.nbytes, item.shape, item.dtype.str
+        )
+    elif isinstance(item, (bytes, bytearray)):
+        return SharedItem('', type(item).__name__, len(item), (), '')
+    elif isinstance(item, memoryview):
+        if not item.c_contiguous or not item.ndim or \
+                len(item.format) != 1:
+            return None
+
+        return SharedItem(
+            '', 'memoryview', item.nbytes, item.shape, item.format
+        )
+
+    return None
+
+
+def _unlink_block(name: str) -> None:
+    """Unlinks a block by its name.
+
+    Parameters
+    ----------
+    name : str
+        Name of the shared memory block.
+    """
+
+    try:
+        block = SharedMemory(name=name)
+    except FileNotFoundError:
+        return
+
+    block.close()
+    block.unlink()
+
+
+def _unlink_blocks(blocks: List[Any]) -> None:
+    """Unlinks the blocks created or opened by the calling process.
+
+    Parameters
+    ----------
+    blocks : List[Any]
+        Blocks created or opened by the calling process.
+    """
+
+    for block in blocks:
+        try:
+            block.unlink()
+        except FileNotFoundError:
+            pass
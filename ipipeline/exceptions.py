@@ -10,6 +10,9 @@ from typing import List
 class BaseError(Exception):
     """Informs the occurrence of an error related to the ipipeline package.
 
+    The parameters are passed to the Exception class in order to keep the 
+    state of the error when it is pickled (e.g. between processes).
+
     Attributes
     ----------
     _text : str
@@ -29,6 +32,8 @@ class BaseError(Exception):
             Causes of the error.
         """
 
+        super().__init__(text, causes)
+
         self._text = text
         self._causes = causes
 
@@ -58,6 +63,20 @@ class BuildingError(BaseError):
     pass
 
 
+class CacheError(BaseError):
+    """Informs the occurrence of an error related to the caching module.
+
+    Attributes
+    ----------
+    _text : str
+        Text of the error.
+    _causes : List[str]
+        Causes of the error.
+    """
+
+    pass
+
+
 class CatalogError(BaseError):
     """Informs the occurrence of an error related to the catalog module.
 
@@ -72,6 +91,34 @@ class CatalogError(BaseError):
     pass
 
 
+class CheckpointError(BaseError):
+    """Informs the occurrence of an error related to the checkpointing module.
+
+    Attributes
+    ----------
+    _text : str
+        Text of the error.
+    _causes : List[str]
+        Causes of the error.
+    """
+
+    pass
+
+
+class ClusterError(BaseError):
+    """Informs the occurrence of an error related to the clustering module.
+
+    Attributes
+    ----------
+    _text : str
+        Text of the error.
+    _causes : List[str]
+        Causes of the error.
+    """
+
+    pass
+
+
 class ExecutorError(BaseError):
     """Informs the occurrence of an error related to the executors module.
 
@@ -114,6 +161,34 @@ class InstanceError(BaseError):
     pass
 
 
+class LoadingError(BaseError):
+    """Informs the occurrence of an error related to the loading module.
+
+    Attributes
+    ----------
+    _text : str
+        Text of the error.
+    _causes : List[str]
+        Causes of the error.
+    """
+
+    pass
+
+
+class OrderError(BaseError):
+    """Informs the occurrence of an error related to the order module.
+
+    Attributes
+    ----------
+    _text : str
+        Text of the error.
+    _causes : List[str]
+        Causes of the error.
+    """
+
+    pass
+
+
 class PipelineError(BaseError):
     """Informs the occurrence of an error related to the pipeline module.
 
@@ -128,6 +203,20 @@ class PipelineError(BaseError):
     pass
 
 
+class RecordError(BaseError):
+    """Informs the occurrence of an error related to the recording module.
+
+    Attributes
+    ----------
+    _text : str
+        Text of the error.
+    _causes : List[str]
+        Causes of the error.
+    """
+
+    pass
+
+
 class SortingError(BaseError):
     """Informs the occurrence of an error related to the sorting module.
 
@@ -154,3 +243,17 @@ class SystemError(BaseError):
     """
 
     pass
+
+
+class TransportError(BaseError):
+    """Informs the occurrence of an error related to the transporting module.
+
+    Attributes
+    ----------
+    _text : str
+        Text of the error.
+    _causes : List[str]
+        Causes of the error.
+    """
+
+    pass
@@ -3,5 +3,5 @@
 The structure package provides components to store the data.
 """
 
-from ipipeline.structure.catalog import Catalog
+from ipipeline.structure.catalog import BudgetCatalog, Catalog
 from ipipeline.structure.pipeline import Pipeline
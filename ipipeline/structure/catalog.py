@@ -1,10 +1,24 @@
-"""Class related to the catalog procedures."""
-
+"""Classes and functions related to the catalog procedures."""
+
+import logging
+import pickle
+import sys
+from collections import OrderedDict, deque
+from pathlib import Path
+from shutil import rmtree
+from tempfile import mkdtemp
+from threading import RLock
 from typing import Any, Dict, List
+from uuid import uuid4
+from weakref import finalize
 
 from ipipeline.exceptions import CatalogError
 from ipipeline.structure.info import Info
 from ipipeline.utils.checking import check_none
+from ipipeline.utils.pickling import protocol
+
+
+logger = logging.getLogger(name=__name__)
 
 
 class Catalog(Info):
@@ -146,3 +160,445 @@ class Catalog(Info):
             raise CatalogError(
                 'id was not found in the _items', [f'id == {id}']
             ) from error
+
+
+class BudgetCatalog(Catalog):
+    """Stores the items of an execution within a memory budget.
+
+    The size of an item is measured by its nbytes attribute (e.g. arrays 
+    and buffers) or by a deep estimate of its objects otherwise. When the 
+    size of the items in memory exceeds the budget, the least recently 
+    used items are spilled to files in a directory and they are loaded 
+    back when required. The most recently set item is never spilled and 
+    the items that are not picklable are kept in memory until they are 
+    set again.
+
+    Attributes
+    ----------
+    _id : str
+        ID of the catalog.
+    _budget : int
+        Budget of the items in memory in bytes.
+    _path : str
+        Path of the directory where the items are spilled.
+    _items : Dict[str, Any]
+        Items of an execution kept in memory. The keys are the item IDs 
+        and the values are the arguments required by the tasks.
+    _tags : List[str]
+        Tags of the catalog to provide more context.
+    _sizes : OrderedDict
+        Sizes of the items in memory that can be spilled, ordered from the 
+        least to the most recently used. The keys are the item IDs and the 
+        values are the sizes in bytes.
+    _pinned_sizes : Dict[str, int]
+        Sizes of the items in memory that were not pickled by a spill, 
+        which are not spilled again. The keys are the item IDs and the 
+        values are the sizes in bytes.
+    _size : int
+        Size of the items in memory in bytes.
+    _spills : Dict[str, str]
+        Spilled items. The keys are the item IDs and the values are the 
+        paths of the files.
+    _lock : RLock
+        Lock that serializes the access to the items between threads.
+    _finalizer : finalize
+        Finalizer that deletes the spills when the catalog is collected.
+    """
+
+    def __init__(
+        self, 
+        id: str, 
+        budget: int, 
+        path: str = None, 
+        items: Dict[str, Any] = None, 
+        tags: List[str] = None
+    ) -> None:
+        """Initializes the attributes.
+
+        Parameters
+        ----------
+        id : str
+            ID of the catalog.
+        budget : int
+            Budget of the items in memory in bytes.
+        path : str, optional
+            Path of the directory where the items are spilled. If None, a 
+            temporary directory is created on the first spill and removed 
+            with the catalog.
+        items : Dict[str, Any], optional
+            Items of an execution. The keys are the item IDs and the values 
+            are the arguments required by the tasks.
+        tags : List[str], optional
+            Tags of the catalog to provide more context.
+        """
+
+        super().__init__(id, tags=tags)
+
+        self._budget = budget
+        self._path = path
+        self._sizes = OrderedDict()
+        self._pinned_sizes = {}
+        self._size = 0
+        self._spills = {}
+        self._lock = RLock()
+        self._finalizer = None
+
+        for item_id, item in check_none(items, {}).items():
+            self.set_item(item_id, item)
+
+    @property
+    def budget(self) -> int:
+        """Gets the _budget attribute.
+
+        Returns
+        -------
+        budget : int
+            Budget of the items in memory in bytes.
+        """
+
+        return self._budget
+
+    @budget.setter
+    def budget(self, budget: int) -> None:
+        """Sets the _budget attribute.
+
+        Parameters
+        ----------
+        budget : int
+            Budget of the items in memory in bytes.
+        """
+
+        with self._lock:
+            self._budget = budget
+            self._spill_items()
+
+    @property
+    def path(self) -> str:
+        """Gets the _path attribute.
+
+        Returns
+        -------
+        path : str
+            Path of the directory where the items are spilled.
+        """
+
+        return self._path
+
+    @property
+    def items(self) -> Dict[str, Any]:
+        """Gets the items in memory and the spilled items.
+
+        The spilled items are loaded without being kept in memory, but the 
+        returned dictionary holds all of them at once, so the check_item 
+        and get_item methods are preferred to access the items one by one.
+
+        Returns
+        -------
+        items : Dict[str, Any]
+            Items of an execution. The keys are the item IDs and the values 
+            are the arguments required by the tasks.
+        """
+
+        with self._lock:
+            items = dict(self._items)
+
+            for item_id, path in self._spills.items():
+                items[item_id] = _load_item(path)
+
+            return items
+
+    @items.setter
+    def items(self, items: Dict[str, Any]) -> None:
+        """Sets the items.
+
+        Parameters
+        ----------
+        items : Dict[str, Any]
+            Items of an execution. The keys are the item IDs and the values 
+            are the arguments required by the tasks.
+        """
+
+        with self._lock:
+            for item_id in list(self._items) + list(self._spills):
+                self.delete_item(item_id)
+
+            for item_id, item in items.items():
+                self.set_item(item_id, item)
+
+    @property
+    def size(self) -> int:
+        """Gets the _size attribute.
+
+        Returns
+        -------
+        size : int
+            Size of the items in memory in bytes.
+        """
+
+        return self._size
+
+    def check_item(self, id: str) -> bool:
+        """Checks if an item exists in memory or in a spill.
+
+        Parameters
+        ----------
+        id : str
+            ID of the item.
+
+        Returns
+        -------
+        checked : bool
+            Flag that indicates if an item exists.
+        """
+
+        checked = id in self._items or id in self._spills
+
+        return checked
+
+    def check_spill(self, id: str) -> bool:
+        """Checks if an item was spilled.
+
+        Parameters
+        ----------
+        id : str
+            ID of the item.
+
+        Returns
+        -------
+        checked : bool
+            Flag that indicates if an item was spilled.
+        """
+
+        checked = id in self._spills
+
+        return checked
+
+    def get_item(self, id: str) -> Any:
+        """Gets an item, loading it back to memory if it was spilled.
+
+        Parameters
+        ----------
+        id : str
+            ID of the item.
+
+        Returns
+        -------
+        item : Any
+            Item that represents an argument required by a task.
+
+        Raises
+        ------
+        CatalogError
+            Informs that the id was not found in the _items.
+        """
+
+        with self._lock:
+            if id in self._sizes:
+                self._sizes.move_to_end(id)
+            elif id in self._spills:
+                path = self._spills.pop(id)
+                self._keep_item(id, _load_item(path))
+                Path(path).unlink()
+                logger.debug(f'item_id: {id}, loaded')
+
+            return super().get_item(id)
+
+    def set_item(self, id: str, item: Any) -> None:
+        """Sets an item, spilling the least recently used ones if needed.
+
+        Parameters
+        ----------
+        id : str
+            ID of the item.
+        item : Any
+            Item that represents an argument required by a task.
+        """
+
+        with self._lock:
+            if self.check_item(id):
+                self.delete_item(id)
+
+            self._keep_item(id, item)
+
+    def delete_item(self, id: str) -> None:
+        """Deletes an item from memory or from a spill.
+
+        Parameters
+        ----------
+        id : str
+            ID of the item.
+
+        Raises
+        ------
+        CatalogError
+            Informs that the id was not found in the _items.
+        """
+
+        with self._lock:
+            if id in self._spills:
+                Path(self._spills.pop(id)).unlink()
+            else:
+                super().delete_item(id)
+
+                if id in self._pinned_sizes:
+                    self._size -= self._pinned_sizes.pop(id)
+                else:
+                    self._size -= self._sizes.pop(id)
+
+    def _keep_item(self, id: str, item: Any) -> None:
+        """Keeps an item in memory and spills the others beyond the budget.
+
+        Parameters
+        ----------
+        id : str
+            ID of the item.
+        item : Any
+            Item that represents an argument required by a task.
+        """
+
+        self._items[id] = item
+        self._sizes[id] = measure_item(item)
+        self._size += self._sizes[id]
+        self._spill_items()
+
+    def _spill_items(self) -> None:
+        """Spills the least recently used items beyond the budget.
+
+        The items are pickled straight into their files and an item is 
+        only removed from memory after its file is written. The items that 
+        are not picklable are pinned in memory, so they are not pickled 
+        again by the next spills.
+        """
+
+        if not self._sizes:
+            return
+
+        last_id = next(reversed(self._sizes))
+
+        while self._size > self._budget:
+            id = next(iter(self._sizes))
+
+            if id == last_id:
+                break
+
+            path = Path(self._build_path()) / f'{uuid4().hex}.pkl'
+
+            try:
+                with open(path, 'wb') as file:
+                    pickle.dump(self._items[id], file, protocol=protocol)
+            except Exception as error:
+                _delete_files({id: str(path)})
+                self._pinned_sizes[id] = self._sizes.pop(id)
+                logger.warning(f'item_id: {id}, {error}')
+
+                continue
+
+            del self._items[id]
+            self._spills[id] = str(path)
+            self._size -= self._sizes.pop(id)
+            logger.debug(f'item_id: {id}, spilled')
+
+    def _build_path(self) -> str:
+        """Builds the directory of the spills on the first call.
+
+        Returns
+        -------
+        path : str
+            Path of the directory where the items are spilled.
+        """
+
+        if self._path is None:
+            self._path = mkdtemp(prefix='ipipeline-')
+            self._finalizer = finalize(
+                self, rmtree, self._path, ignore_errors=True
+            )
+        elif self._finalizer is None:
+            Path(self._path).mkdir(parents=True, exist_ok=True)
+            self._finalizer = finalize(self, _delete_files, self._spills)
+
+        return self._path
+
+
+def measure_item(item: Any) -> int:
+    """Measures the size of an item.
+
+    Parameters
+    ----------
+    item : Any
+        Item that represents an argument required by a task.
+
+    Returns
+    -------
+    size : int
+        Size of the item in bytes. The nbytes attribute is used when it is 
+        available, otherwise the size is estimated by traversing the 
+        containers and the attributes of the objects.
+    """
+
+    size = 0
+    seen_ids = set()
+    objs = [item]
+
+    while objs:
+        obj = objs.pop()
+
+        if id(obj) in seen_ids:
+            continue
+
+        seen_ids.add(id(obj))
+        nbytes = getattr(obj, 'nbytes', None)
+
+        if isinstance(nbytes, int):
+            size += nbytes
+            continue
+
+        size += sys.getsizeof(obj)
+
+        if isinstance(obj, (str, bytes, bytearray, int, float, complex)):
+            continue
+        elif isinstance(obj, dict):
+            objs.extend(obj.keys())
+            objs.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset, deque)):
+            objs.extend(obj)
+        elif hasattr(obj, '__dict__') and not isinstance(obj, type):
+            objs.append(vars(obj))
+
+    return size
+
+
+def _load_item(path: str) -> Any:
+    """Loads a spilled item.
+
+    Parameters
+    ----------
+    path : str
+        Path of the file.
+
+    Returns
+    -------
+    item : Any
+        Item that represents an argument required by a task.
+    """
+
+    with open(path, 'rb') as file:
+        item = pickle.load(file)
+
+    return item
+
+
+def _delete_files(spills: Dict[str, str]) -> None:
+    """Deletes the files of the spilled items.
+
+    Parameters
+    ----------
+    spills : Dict[str, str]
+        Spilled items. The keys are the item IDs and the values are the 
+        paths of the files.
+    """
+
+    for path in spills.values():
+        try:
+            Path(path).unlink()
+        except FileNotFoundError:
+            pass
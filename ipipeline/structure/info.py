@@ -8,6 +8,10 @@ from ipipeline.utils.checking import check_none
 from ipipeline.utils.instance import build_repr
 
 
+_id_pattern = re.compile(r'[\w.-]+')
+_ids_pattern = re.compile(r'[\w.-]+(?:\n[\w.-]+)*')
+
+
 class Info:
     """Stores the information of an instance.
 
@@ -22,7 +26,9 @@ class Info:
         Tags of the instance to provide more context.
     """
 
-    def __init__(self, id: str, tags: List[str] = None) -> None:
+    def __init__(
+        self, id: str, tags: List[str] = None, *, checked: bool = False
+    ) -> None:
         """Initializes the attributes.
 
         Parameters
@@ -31,6 +37,9 @@ class Info:
             ID of the instance.
         tags : List[str], optional
             Tags of the instance to provide more context.
+        checked : bool, optional
+            Flag that indicates if the ID was already checked by the 
+            check_ids function, so it is not matched again.
 
         Raises
         ------
@@ -38,7 +47,7 @@ class Info:
             Informs that the id did not match the pattern.
         """
 
-        self._id = self._check_id(id)
+        self._id = id if checked else self._check_id(id)
         self._tags = check_none(tags, [])
 
     @property
@@ -111,7 +120,7 @@ class Info:
             Informs that the id did not match the pattern.
         """
 
-        if id is not None and re.fullmatch(r'[\w.-]+', id) is not None:
+        if isinstance(id, str) and _id_pattern.fullmatch(id) is not None:
             return id
         else:
             raise InfoError('id did not match the pattern', [f'id == {id}'])
@@ -128,3 +137,34 @@ class Info:
         repr = build_repr(self)
 
         return repr
+
+
+def check_ids(ids: List[str]) -> None:
+    """Checks if the IDs match the pattern of the Info class.
+
+    The IDs are joined by line breaks and matched by a single call, so a 
+    large quantity of IDs is checked without a call per ID. The count of 
+    line breaks rejects the IDs that contain one.
+
+    Parameters
+    ----------
+    ids : List[str]
+        IDs of the instances.
+
+    Raises
+    ------
+    InfoError
+        Informs that the id did not match the pattern.
+    """
+
+    text = '\n'.join(id if isinstance(id, str) else '' for id in ids)
+
+    if ids and (
+        _ids_pattern.fullmatch(text) is None or 
+        text.count('\n') != len(ids) - 1
+    ):
+        for id in ids:
+            if not isinstance(id, str) or _id_pattern.fullmatch(id) is None:
+                raise InfoError(
+                    'id did not match the pattern', [f'id == {id}']
+                )
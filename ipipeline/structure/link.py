@@ -25,7 +25,9 @@ class Link(Info):
         id: str, 
         src_id: str, 
         dst_id: str, 
-        tags: List[str] = None
+        tags: List[str] = None, 
+        *, 
+        checked: bool = False
     ) -> None:
         """Initializes the attributes.
 
@@ -39,9 +41,12 @@ class Link(Info):
             ID of the destination node.
         tags : List[str], optional
             Tags of the link to provide more context.
+        checked : bool, optional
+            Flag that indicates if the ID was already checked by the 
+            check_ids function, so it is not matched again.
         """
 
-        super().__init__(id, tags=tags)
+        super().__init__(id, tags=tags, checked=checked)
 
         self._src_id = src_id
         self._dst_id = dst_id
@@ -1,9 +1,10 @@
 """Class related to the node procedures."""
 
-from typing import Callable, Dict, List
+from typing import Callable, Dict, List, Union
 
 from ipipeline.structure.info import Info
 from ipipeline.utils.checking import check_none
+from ipipeline.utils.instance import resolve_ref
 
 
 class Node(Info):
@@ -13,8 +14,9 @@ class Node(Info):
     ----------
     _id : str
         ID of the node.
-    _task : Callable
-        Task of the node.
+    _task : Union[Callable, str]
+        Task of the node or its reference in the module:function format, 
+        which is resolved when the task is first got.
     _pos_inputs : List[str]
         Positional inputs of the task. The elements are the IDs of the 
         catalog items.
@@ -31,11 +33,13 @@ class Node(Info):
     def __init__(
         self, 
         id: str, 
-        task: Callable, 
+        task: Union[Callable, str], 
         pos_inputs: List[str] = None, 
         key_inputs: Dict[str, str] = None, 
         outputs: List[str] = None, 
-        tags: List[str] = None
+        tags: List[str] = None, 
+        *, 
+        checked: bool = False
     ) -> None:
         """Initializes the attributes.
 
@@ -43,8 +47,10 @@ class Node(Info):
         ----------
         id : str
             ID of the node.
-        task : Callable
-            Task of the node.
+        task : Union[Callable, str]
+            Task of the node or its reference in the module:function 
+            format (e.g. package.module:function). The reference delays 
+            the import of the module until the task is first got.
         pos_inputs : List[str], optional
             Positional inputs of the task. The elements are the IDs of the 
             catalog items.
@@ -56,9 +62,12 @@ class Node(Info):
             of size.
         tags : List[str], optional
             Tags of the node to provide more context.
+        checked : bool, optional
+            Flag that indicates if the ID was already checked by the 
+            check_ids function, so it is not matched again.
         """
 
-        super().__init__(id, tags=tags)
+        super().__init__(id, tags=tags, checked=checked)
 
         self._task = task
         self._pos_inputs = check_none(pos_inputs, [])
@@ -67,28 +76,57 @@ class Node(Info):
 
     @property
     def task(self) -> Callable:
-        """Gets the _task attribute.
+        """Gets the _task attribute, resolving it when it is a reference.
 
         Returns
         -------
         task : Callable
             Task of the node.
+
+        Raises
+        ------
+        InstanceError
+            Informs that the colon was not found in the ref.
+        InstanceError
+            Informs that the mod_name was not found in the package.
+        InstanceError
+            Informs that the inst_name was not found in the module.
         """
 
+        if isinstance(self._task, str):
+            return resolve_ref(self._task)
+
         return self._task
 
     @task.setter
-    def task(self, task: Callable) -> None:
+    def task(self, task: Union[Callable, str]) -> None:
         """Sets the _task attribute.
 
         Parameters
         ----------
-        task : Callable
-            Task of the node.
+        task : Union[Callable, str]
+            Task of the node or its reference in the module:function 
+            format.
         """
 
         self._task = task
 
+    @property
+    def task_ref(self) -> str:
+        """Gets the _task attribute when it is a reference.
+
+        Returns
+        -------
+        task_ref : str
+            Reference of the task in the module:function format. If the 
+            task was informed as a callable, None is returned.
+        """
+
+        if isinstance(self._task, str):
+            return self._task
+
+        return None
+
     @property
     def pos_inputs(self) -> List[str]:
         """Gets the _pos_inputs attribute.
@@ -0,0 +1,354 @@
+"""Class related to the order procedures."""
+
+from typing import Dict, List
+
+from ipipeline.exceptions import OrderError
+from ipipeline.utils.instance import build_repr
+
+
+class Order:
+    """Stores an incremental topological order of a graph.
+
+    Each node holds an integer position and every link goes from a lower 
+    to a higher position. When a link contradicts the positions, only the 
+    nodes whose positions lie between its source and destination nodes 
+    are searched and reassigned, so a link that closes a cycle is rejected 
+    without sorting the whole graph again.
+
+    Attributes
+    ----------
+    _positions : Dict[str, int]
+        Positions of the nodes. The keys are the node IDs and the values 
+        are the positions.
+    _successors : Dict[str, list]
+        Successors of the nodes. The keys are the node IDs and the values 
+        are the lists of destination node IDs.
+    _predecessors : Dict[str, list]
+        Predecessors of the nodes. The keys are the node IDs and the values 
+        are the lists of source node IDs.
+    _next_position : int
+        Position assigned to the next node.
+
+    Notes
+    -----
+        Based on the Pearce-Kelly's algorithm.
+    """
+
+    def __init__(self) -> None:
+        """Initializes the attributes."""
+
+        self._positions = {}
+        self._successors = {}
+        self._predecessors = {}
+        self._next_position = 0
+
+    @property
+    def positions(self) -> Dict[str, int]:
+        """Gets the _positions attribute.
+
+        Returns
+        -------
+        positions : Dict[str, int]
+            Positions of the nodes. The keys are the node IDs and the values 
+            are the positions.
+        """
+
+        return self._positions
+
+    def set_node(self, id: str) -> None:
+        """Sets a node in the last position.
+
+        Parameters
+        ----------
+        id : str
+            ID of the node.
+
+        Raises
+        ------
+        OrderError
+            Informs that the id was found in the _positions.
+        """
+
+        if id in self._positions:
+            raise OrderError(
+                'id was found in the _positions', [f'id == {id}']
+            )
+
+        self._positions[id] = self._next_position
+        self._successors[id] = []
+        self._predecessors[id] = []
+        self._next_position += 1
+
+    def delete_node(self, id: str) -> None:
+        """Deletes a node.
+
+        Parameters
+        ----------
+        id : str
+            ID of the node.
+
+        Raises
+        ------
+        OrderError
+            Informs that the id was not found in the _positions.
+        OrderError
+            Informs that the id was found in a link of the order.
+        """
+
+        if id not in self._positions:
+            raise OrderError(
+                'id was not found in the _positions', [f'id == {id}']
+            )
+
+        if self._successors[id] or self._predecessors[id]:
+            raise OrderError(
+                'id was found in a link of the order', [f'id == {id}']
+            )
+
+        del self._positions[id]
+        del self._successors[id]
+        del self._predecessors[id]
+
+    def set_link(self, src_id: str, dst_id: str) -> None:
+        """Sets a link, reordering the affected nodes if necessary.
+
+        Parameters
+        ----------
+        src_id : str
+            ID of the source node.
+        dst_id : str
+            ID of the destination node.
+
+        Raises
+        ------
+        OrderError
+            Informs that the src_id was not found in the _positions.
+        OrderError
+            Informs that the dst_id was not found in the _positions.
+        OrderError
+            Informs that the dst_id was found in the _successors[src_id].
+        OrderError
+            Informs that a circular dependency was found in the order.
+        """
+
+        if src_id not in self._positions:
+            raise OrderError(
+                'src_id was not found in the _positions', 
+                [f'src_id == {src_id}']
+            )
+
+        if dst_id not in self._positions:
+            raise OrderError(
+                'dst_id was not found in the _positions', 
+                [f'dst_id == {dst_id}']
+            )
+
+        if dst_id in self._successors[src_id]:
+            raise OrderError(
+                'dst_id was found in the _successors[src_id]', 
+                [f'src_id == {src_id}', f'dst_id == {dst_id}']
+            )
+
+        lower = self._positions[dst_id]
+        upper = self._positions[src_id]
+
+        if lower <= upper:
+            forward_ids = self._search_forward(src_id, dst_id, upper)
+            backward_ids = self._search_backward(src_id, lower)
+            self._reorder(backward_ids, forward_ids)
+
+        self._successors[src_id].append(dst_id)
+        self._predecessors[dst_id].append(src_id)
+
+    def delete_link(self, src_id: str, dst_id: str) -> None:
+        """Deletes a link.
+
+        The positions remain valid, since removing a link never breaks a 
+        topological order.
+
+        Parameters
+        ----------
+        src_id : str
+            ID of the source node.
+        dst_id : str
+            ID of the destination node.
+
+        Raises
+        ------
+        OrderError
+            Informs that the dst_id was not found in the 
+            _successors[src_id].
+        """
+
+        try:
+            self._successors[src_id].remove(dst_id)
+            self._predecessors[dst_id].remove(src_id)
+        except (KeyError, ValueError) as error:
+            raise OrderError(
+                'dst_id was not found in the _successors[src_id]', 
+                [f'src_id == {src_id}', f'dst_id == {dst_id}']
+            ) from error
+
+    def get_ids(self) -> List[str]:
+        """Gets the node IDs in the topological order.
+
+        Returns
+        -------
+        ids : List[str]
+            IDs of the nodes sorted by their positions.
+        """
+
+        ids = sorted(self._positions, key=self._positions.__getitem__)
+
+        return ids
+
+    def get_ordering(self) -> List[list]:
+        """Gets the ordering of the graph from the maintained positions.
+
+        Each node is placed in the group after the last group of its 
+        source nodes, so the groups are the same as the ones found by the 
+        Kahn's algorithm and the nodes within them follow the positions.
+
+        Returns
+        -------
+        ordering : List[list]
+            Ordering of the graph. The inner lists represent groups of nodes 
+            that must be executed sequentially and the nodes within these 
+            groups can be executed simultaneously.
+        """
+
+        ordering = []
+        levels = dict.fromkeys(self._positions, 0)
+
+        for id in self.get_ids():
+            level = levels[id]
+
+            if level == len(ordering):
+                ordering.append([])
+
+            ordering[level].append(id)
+
+            for dst_id in self._successors[id]:
+                if levels[dst_id] <= level:
+                    levels[dst_id] = level + 1
+
+        return ordering
+
+    def __repr__(self) -> str:
+        """Builds the representation of an instance.
+
+        Returns
+        -------
+        repr : str
+            Representation of an instance.
+        """
+
+        repr = build_repr(self)
+
+        return repr
+
+    def _search_forward(
+        self, src_id: str, dst_id: str, upper: int
+    ) -> List[str]:
+        """Searches the nodes reachable from the destination node.
+
+        Only the nodes positioned up to the source node are visited.
+
+        Parameters
+        ----------
+        src_id : str
+            ID of the source node.
+        dst_id : str
+            ID of the destination node.
+        upper : int
+            Position of the source node.
+
+        Returns
+        -------
+        forward_ids : List[str]
+            IDs of the nodes reachable from the destination node.
+
+        Raises
+        ------
+        OrderError
+            Informs that a circular dependency was found in the order.
+        """
+
+        forward_ids = [dst_id]
+        visited_ids = {dst_id}
+        stack = [dst_id]
+
+        while stack:
+            id = stack.pop()
+
+            if id == src_id:
+                raise OrderError(
+                    'circular dependency was found in the order', 
+                    [f'src_id == {src_id}', f'dst_id == {dst_id}']
+                )
+
+            for next_id in self._successors[id]:
+                if next_id not in visited_ids and \
+                        self._positions[next_id] <= upper:
+                    visited_ids.add(next_id)
+                    forward_ids.append(next_id)
+                    stack.append(next_id)
+
+        return forward_ids
+
+    def _search_backward(self, src_id: str, lower: int) -> List[str]:
+        """Searches the nodes that reach the source node.
+
+        Only the nodes positioned after the destination node are visited.
+
+        Parameters
+        ----------
+        src_id : str
+            ID of the source node.
+        lower : int
+            Position of the destination node.
+
+        Returns
+        -------
+        backward_ids : List[str]
+            IDs of the nodes that reach the source node.
+        """
+
+        backward_ids = [src_id]
+        visited_ids = {src_id}
+        stack = [src_id]
+
+        while stack:
+            for next_id in self._predecessors[stack.pop()]:
+                if next_id not in visited_ids and \
+                        self._positions[next_id] > lower:
+                    visited_ids.add(next_id)
+                    backward_ids.append(next_id)
+                    stack.append(next_id)
+
+        return backward_ids
+
+    def _reorder(
+        self, backward_ids: List[str], forward_ids: List[str]
+    ) -> None:
+        """Reassigns the positions of the searched nodes.
+
+        The nodes that reach the source node take the lowest positions of 
+        the pool and the nodes reachable from the destination node take 
+        the highest ones, keeping the relative order within each set.
+
+        Parameters
+        ----------
+        backward_ids : List[str]
+            IDs of the nodes that reach the source node.
+        forward_ids : List[str]
+            IDs of the nodes reachable from the destination node.
+        """
+
+        backward_ids.sort(key=self._positions.__getitem__)
+        forward_ids.sort(key=self._positions.__getitem__)
+        ids = backward_ids + forward_ids
+        positions = sorted(self._positions[id] for id in ids)
+
+        for id, position in zip(ids, positions):
+            self._positions[id] = position
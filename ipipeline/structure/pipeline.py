@@ -1,11 +1,13 @@
 """Class related to the pipeline procedures."""
 
-from typing import Callable, Dict, List
+import hashlib
+from typing import Callable, Dict, List, Union
 
 from ipipeline.exceptions import PipelineError
 from ipipeline.structure.info import Info
 from ipipeline.structure.link import Link
 from ipipeline.structure.node import Node
+from ipipeline.structure.order import Order
 from ipipeline.utils.checking import check_none
 
 
@@ -14,6 +16,23 @@ class Pipeline(Info):
 
     The links between the nodes must compose a directed acyclic graph.
 
+    The structural fingerprint is computed in the first access and reset, 
+    along with an increment of the revision, every time a node or link is 
+    set or deleted through the pipeline (the fingerprint is also reset 
+    when the ordered flag is set), therefore the nodes and links must not 
+    be mutated in place after the fingerprint or revision is used.
+
+    The tag and item indexes are built in the first access and reset 
+    every time a node is set or deleted through the pipeline, therefore 
+    the node tags, inputs and outputs must not be mutated in place after 
+    the indexes are used either.
+
+    When the pipeline is ordered, a topological order is maintained as the 
+    nodes and links are set or deleted through the pipeline, so a link 
+    that closes a cycle is rejected when it is set instead of when the 
+    graph is sorted. The order is rebuilt in the next access after the 
+    nodes or links are replaced.
+
     Attributes
     ----------
     _id : str
@@ -26,6 +45,30 @@ class Pipeline(Info):
         the links.
     _tags : List[str]
         Tags of the pipeline to provide more context.
+    _fingerprint : str
+        Structural fingerprint of the pipeline. If None, it is computed in 
+        the next access.
+    _revision : int
+        Revision of the structure, incremented by each change of the nodes 
+        or links. Along with the pipeline identity, it keys the objects 
+        that depend on the tasks (e.g. the compiled plans) without hashing 
+        the structure.
+    _tag_index : Dict[str, list]
+        Index of the node IDs by tag. The keys are the tags and the values 
+        are the lists of node IDs. If None, it is built in the next access.
+    _producers : Dict[str, str]
+        Producer nodes of the items. The keys are the item IDs and the 
+        values are the IDs of the nodes that output the items. If None, it 
+        is built in the next access.
+    _consumers : Dict[str, list]
+        Consumer nodes of the items. The keys are the item IDs and the 
+        values are the lists of IDs of the nodes that input the items. If 
+        None, it is built in the next access.
+    _ordered : bool
+        Flag that indicates if a topological order is maintained.
+    _order : Order
+        Topological order of the graph. If None, it is built in the next 
+        access when the pipeline is ordered.
     """
 
     def __init__(
@@ -33,7 +76,8 @@ class Pipeline(Info):
         id: str, 
         nodes: Dict[str, Node] = None, 
         links: Dict[str, Link] = None, 
-        tags: List[str] = None
+        tags: List[str] = None, 
+        ordered: bool = False
     ) -> None:
         """Initializes the attributes.
 
@@ -49,12 +93,21 @@ class Pipeline(Info):
             the links.
         tags : List[str], optional
             Tags of the pipeline to provide more context.
+        ordered : bool, optional
+            Flag that indicates if a topological order is maintained.
         """
 
         super().__init__(id, tags=tags)
 
         self._nodes = check_none(nodes, {})
         self._links = check_none(links, {})
+        self._fingerprint = None
+        self._revision = 0
+        self._tag_index = None
+        self._producers = None
+        self._consumers = None
+        self._ordered = ordered
+        self._order = None
 
     @property
     def nodes(self) -> Dict[str, Node]:
@@ -81,6 +134,12 @@ class Pipeline(Info):
         """
 
         self._nodes = nodes
+        self._fingerprint = None
+        self._revision += 1
+        self._tag_index = None
+        self._producers = None
+        self._consumers = None
+        self._order = None
 
     @property
     def links(self) -> Dict[str, Link]:
@@ -107,6 +166,197 @@ class Pipeline(Info):
         """
 
         self._links = links
+        self._fingerprint = None
+        self._revision += 1
+        self._order = None
+
+    @property
+    def ordered(self) -> bool:
+        """Gets the _ordered attribute.
+
+        Returns
+        -------
+        ordered : bool
+            Flag that indicates if a topological order is maintained.
+        """
+
+        return self._ordered
+
+    @ordered.setter
+    def ordered(self, ordered: bool) -> None:
+        """Sets the _ordered attribute.
+
+        Parameters
+        ----------
+        ordered : bool
+            Flag that indicates if a topological order is maintained.
+        """
+
+        self._ordered = ordered
+        self._order = None
+        self._fingerprint = None
+
+    @property
+    def order(self) -> Order:
+        """Gets the _order attribute, building it when it was reset.
+
+        Returns
+        -------
+        order : Order
+            Topological order of the graph. If the pipeline is not ordered, 
+            None is returned.
+
+        Raises
+        ------
+        OrderError
+            Informs that the src_id was not found in the _positions.
+        OrderError
+            Informs that the dst_id was not found in the _positions.
+        OrderError
+            Informs that the dst_id was found in the _successors[src_id].
+        OrderError
+            Informs that a circular dependency was found in the order.
+        """
+
+        if self._ordered and self._order is None:
+            order = Order()
+
+            for id in self._nodes.keys():
+                order.set_node(id)
+
+            for link in self._links.values():
+                order.set_link(link.src_id, link.dst_id)
+
+            self._order = order
+
+        return self._order
+
+    @property
+    def tag_index(self) -> Dict[str, list]:
+        """Gets the _tag_index attribute, building it when it was reset.
+
+        Returns
+        -------
+        tag_index : Dict[str, list]
+            Index of the node IDs by tag. The keys are the tags and the 
+            values are the lists of node IDs in the insertion order.
+        """
+
+        if self._tag_index is None:
+            tag_index = {}
+
+            for node in self._nodes.values():
+                for tag in node.tags:
+                    tag_index.setdefault(tag, []).append(node.id)
+
+            self._tag_index = tag_index
+
+        return self._tag_index
+
+    @property
+    def producers(self) -> Dict[str, str]:
+        """Gets the _producers attribute, building it when it was reset.
+
+        Returns
+        -------
+        producers : Dict[str, str]
+            Producer nodes of the items. The keys are the item IDs and the 
+            values are the IDs of the nodes that output the items.
+
+        Raises
+        ------
+        PipelineError
+            Informs that the output was found in the _producers.
+        """
+
+        if self._producers is None:
+            self._index_items()
+
+        return self._producers
+
+    @property
+    def consumers(self) -> Dict[str, list]:
+        """Gets the _consumers attribute, building it when it was reset.
+
+        Returns
+        -------
+        consumers : Dict[str, list]
+            Consumer nodes of the items. The keys are the item IDs and the 
+            values are the lists of IDs of the nodes that input the items.
+
+        Raises
+        ------
+        PipelineError
+            Informs that the output was found in the _producers.
+        """
+
+        if self._consumers is None:
+            self._index_items()
+
+        return self._consumers
+
+    @property
+    def revision(self) -> int:
+        """Gets the _revision attribute.
+
+        Returns
+        -------
+        revision : int
+            Revision of the structure, incremented by each change of the 
+            nodes or links.
+        """
+
+        return self._revision
+
+    @property
+    def fingerprint(self) -> str:
+        """Gets the _fingerprint attribute, computing it when it was reset.
+
+        The fingerprint covers what the orderings depend on: the ordered 
+        flag, the node IDs, inputs, outputs and tags in the order of the 
+        nodes (or in the maintained topological order when the pipeline is 
+        ordered) and the source and destination node IDs of the links. The 
+        tasks and the object IDs are not covered, so the pipelines built 
+        with the same structure share the fingerprint, even across the 
+        processes.
+
+        Returns
+        -------
+        fingerprint : str
+            Structural fingerprint of the pipeline.
+
+        Raises
+        ------
+        OrderError
+            Informs that the dst_id was found in the _successors[src_id].
+        OrderError
+            Informs that a circular dependency was found in the order.
+        """
+
+        if self._fingerprint is None:
+            digest = hashlib.sha256(repr(self._ordered).encode())
+            ids = self.order.get_ids() if self._ordered else self._nodes
+
+            for id in ids:
+                node = self._nodes[id]
+                digest.update(
+                    repr((
+                        node.id, 
+                        node.pos_inputs, 
+                        sorted(node.key_inputs.items()), 
+                        node.outputs, 
+                        node.tags
+                    )).encode()
+                )
+
+            digest.update(b'|')
+
+            for link in self._links.values():
+                digest.update(repr((link.src_id, link.dst_id)).encode())
+
+            self._fingerprint = digest.hexdigest()
+
+        return self._fingerprint
 
     def check_node(self, id: str) -> bool:
         """Checks if a node exists.
@@ -173,7 +423,15 @@ class Pipeline(Info):
                 'id was found in the _nodes', [f'id == {node.id}']
             )
 
+        if self._ordered:
+            self.order.set_node(node.id)
+
         self._nodes[node.id] = node
+        self._fingerprint = None
+        self._revision += 1
+        self._tag_index = None
+        self._producers = None
+        self._consumers = None
 
     def delete_node(self, id: str) -> None:
         """Deletes a node.
@@ -187,10 +445,20 @@ class Pipeline(Info):
         ------
         PipelineError
             Informs that the id was not found in the _nodes.
+        OrderError
+            Informs that the id was found in a link of the order.
         """
 
+        if self._ordered and self.check_node(id):
+            self.order.delete_node(id)
+
         try:
             del self._nodes[id]
+            self._fingerprint = None
+            self._revision += 1
+            self._tag_index = None
+            self._producers = None
+            self._consumers = None
         except KeyError as error:
             raise PipelineError(
                 'id was not found in the _nodes', [f'id == {id}']
@@ -199,7 +467,7 @@ class Pipeline(Info):
     def add_node(
         self, 
         id: str, 
-        task: Callable, 
+        task: Union[Callable, str], 
         pos_inputs: List[str] = None, 
         key_inputs: Dict[str, str] = None, 
         outputs: List[str] = None, 
@@ -211,8 +479,9 @@ class Pipeline(Info):
         ----------
         id : str
             ID of the node.
-        task : Callable
-            Task of the node.
+        task : Union[Callable, str]
+            Task of the node or its reference in the module:function 
+            format (e.g. package.module:function).
         pos_inputs : List[str], optional
             Positional inputs of the task. The elements are the IDs of the 
             catalog items.
@@ -299,6 +568,14 @@ class Pipeline(Info):
         ------
         PipelineError
             Informs that the id was found in the _links.
+        OrderError
+            Informs that the src_id was not found in the _positions.
+        OrderError
+            Informs that the dst_id was not found in the _positions.
+        OrderError
+            Informs that the dst_id was found in the _successors[src_id].
+        OrderError
+            Informs that a circular dependency was found in the order.
         """
 
         if self.check_link(link.id):
@@ -306,7 +583,12 @@ class Pipeline(Info):
                 'id was found in the _links', [f'id == {link.id}']
             )
 
+        if self._ordered:
+            self.order.set_link(link.src_id, link.dst_id)
+
         self._links[link.id] = link
+        self._fingerprint = None
+        self._revision += 1
 
     def delete_link(self, id: str) -> None:
         """Deletes a link.
@@ -322,8 +604,14 @@ class Pipeline(Info):
             Informs that the id was not found in the _links.
         """
 
+        if self._ordered and self.check_link(id):
+            link = self._links[id]
+            self.order.delete_link(link.src_id, link.dst_id)
+
         try:
             del self._links[id]
+            self._fingerprint = None
+            self._revision += 1
         except KeyError as error:
             raise PipelineError(
                 'id was not found in the _links', [f'id == {id}']
@@ -353,7 +641,126 @@ class Pipeline(Info):
         ------
         PipelineError
             Informs that the id was found in the _links.
+        OrderError
+            Informs that the src_id was not found in the _positions.
+        OrderError
+            Informs that the dst_id was not found in the _positions.
+        OrderError
+            Informs that the dst_id was found in the _successors[src_id].
+        OrderError
+            Informs that a circular dependency was found in the order.
         """
 
         link = Link(id, src_id, dst_id, tags=tags)
         self.set_link(link)
+
+    def infer_links(self, external_ids: List[str] = None) -> List[str]:
+        """Infers the links from the inputs and outputs of the nodes.
+
+        A link is added from the producer node of each item to each of its 
+        consumer nodes, unless a link between both nodes already exists. 
+        The ID of an added link is formed by the source and destination 
+        node IDs separated by a dash, followed by a numeric suffix when the 
+        ID was already taken (e.g. by the a-b to c and a to b-c links). The 
+        IDs are formed before the links are added, and the added links are 
+        deleted when a link is rejected, so either all links or none of 
+        them are added.
+
+        Parameters
+        ----------
+        external_ids : List[str], optional
+            IDs of the items provided by the catalog instead of a node. If 
+            None, the inputs without a producer node are not checked.
+
+        Returns
+        -------
+        link_ids : List[str]
+            IDs of the added links.
+
+        Raises
+        ------
+        PipelineError
+            Informs that the output was found in the _producers.
+        PipelineError
+            Informs that the input was not found in the _producers.
+        OrderError
+            Informs that a circular dependency was found in the order.
+        """
+
+        producers = self.producers
+        consumers = self.consumers
+
+        if external_ids is not None:
+            external_ids = set(external_ids)
+
+            for item_id in consumers.keys():
+                if item_id not in producers and item_id not in external_ids:
+                    raise PipelineError(
+                        'input was not found in the _producers', 
+                        [f'input == {item_id}']
+                    )
+
+        pairs = {(link.src_id, link.dst_id) for link in self._links.values()}
+        taken_ids = set(self._links)
+        links = []
+
+        for item_id, dst_ids in consumers.items():
+            src_id = producers.get(item_id)
+
+            if src_id is not None:
+                for dst_id in dst_ids:
+                    if (src_id, dst_id) not in pairs:
+                        pairs.add((src_id, dst_id))
+                        link_id = f'{src_id}-{dst_id}'
+                        suffix = 1
+
+                        while link_id in taken_ids:
+                            suffix += 1
+                            link_id = f'{src_id}-{dst_id}-{suffix}'
+
+                        taken_ids.add(link_id)
+                        links.append(Link(link_id, src_id, dst_id))
+
+        link_ids = []
+
+        try:
+            for link in links:
+                self.set_link(link)
+                link_ids.append(link.id)
+        except Exception:
+            for link_id in reversed(link_ids):
+                self.delete_link(link_id)
+
+            raise
+
+        return link_ids
+
+    def _index_items(self) -> None:
+        """Indexes the producer and consumer nodes of the items.
+
+        Raises
+        ------
+        PipelineError
+            Informs that the output was found in the _producers.
+        """
+
+        producers = {}
+        consumers = {}
+
+        for node in self._nodes.values():
+            for item_id in node.outputs:
+                if item_id in producers:
+                    raise PipelineError(
+                        'output was found in the _producers', 
+                        [f'output == {item_id}', f'id == {node.id}']
+                    )
+
+                producers[item_id] = node.id
+
+            for item_id in dict.fromkeys(
+                [*node.pos_inputs, *node.key_inputs.values()]
+            ):
+                consumers.setdefault(item_id, []).append(node.id)
+
+        self._producers = producers
+        self._consumers = consumers
@@ -8,11 +8,15 @@ from pathlib import Path
 from ipipeline.exceptions import InstanceError
 
 
+_refs = {}
+
+
 def build_repr(inst: object) -> str:
     """Builds the representation of an instance.
 
     The class name and the initializer parameters are used to create the 
-    representation.
+    representation. The keyword-only parameters only change the 
+    initialization, so they are ignored.
 
     Parameters
     ----------
@@ -28,6 +32,9 @@ def build_repr(inst: object) -> str:
     repr = f'{inst.__class__.__name__}('
 
     for param in signature(inst.__init__).parameters.values():
+        if param.kind == param.KEYWORD_ONLY:
+            continue
+
         value = None
 
         for attr in [f'_{param.name}', param.name]:
@@ -85,3 +92,45 @@ def get_inst(mod_name: str, inst_name: str) -> object:
             'inst_name was not found in the module', 
             [f'inst_name == {inst_name}']
         ) from error
+
+
+def resolve_ref(ref: str) -> object:
+    """Resolves a reference to an instance from a module.
+
+    The reference follows the module:instance format and the instances 
+    are cached by their references, so each module is imported once.
+
+    Parameters
+    ----------
+    ref : str
+        Reference of the instance in the module:instance format (e.g. 
+        package.module:function).
+
+    Returns
+    -------
+    inst : object
+        Instance of a class.
+
+    Raises
+    ------
+    InstanceError
+        Informs that the colon was not found in the ref.
+    InstanceError
+        Informs that the mod_name was not found in the package.
+    InstanceError
+        Informs that the inst_name was not found in the module.
+    """
+
+    if ref not in _refs:
+        mod_name, colon, inst_name = ref.partition(':')
+
+        if not colon or not mod_name or not inst_name:
+            raise InstanceError(
+                'colon was not found in the ref', [f'ref == {ref}']
+            )
+
+        _refs[ref] = get_inst(mod_name, inst_name)
+
+    inst = _refs[ref]
+
+    return inst
@@ -0,0 +1,6 @@
+"""Constants related to the pickling procedures."""
+
+import pickle
+
+
+protocol = min(5, pickle.HIGHEST_PROTOCOL)
@@ -1,9 +1,20 @@
+import json
+import os
+import socket
+from multiprocessing import Process
 from pathlib import Path
 from shutil import rmtree
+from tempfile import TemporaryDirectory
 from unittest import TestCase
-
-from ipipeline.cli.actions import build_project, execute_pipeline
-from ipipeline.exceptions import InstanceError, SystemError
+from unittest.mock import patch
+
+from ipipeline.cli.actions import (
+    build_project, execute_pipeline, execute_spec, start_worker
+)
+from ipipeline.control.clustering import ClusterPool
+from ipipeline.exceptions import (
+    ClusterError, InstanceError, LoadingError, SystemError
+)
 from ipipeline.structure.catalog import Catalog
 from ipipeline.structure.pipeline import Pipeline
 
@@ -96,6 +107,64 @@ class TestExecutePipeline(TestCase):
             )
 
 
+class TestExecuteSpec(TestCase):
+    def test_execute_spec__path_eq_spec(self) -> None:
+        with TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / 'p1.json'
+            path.write_text(json.dumps({
+                'id': 'p1', 
+                'nodes': [
+                    {
+                        'id': 'n1', 
+                        'task': 'builtins:print', 
+                        'pos_inputs': ['i1']
+                    }
+                ], 
+                'catalog': {'id': 'c1', 'items': {'i1': 2}}
+            }))
+            execute_spec('SequentialExecutor', str(path))
+
+            self.assertTrue((Path(temp_dir) / '.p1.json.cache').exists())
+
+    def test_execute_spec__path_ne_spec(self) -> None:
+        with self.assertRaisesRegex(
+            LoadingError, r'spec was not found in the path: path == *'
+        ):
+            execute_spec('SequentialExecutor', 'p1.json')
+
+
+class TestStartWorker(TestCase):
+    def test_start_worker__authkey_eq_key(self) -> None:
+        with socket.socket() as sock:
+            sock.bind(('localhost', 0))
+            port = sock.getsockname()[1]
+
+        worker = Process(
+            target=start_worker, args=('localhost', port), daemon=True
+        )
+
+        with patch.dict(os.environ, {'IPIPELINE_AUTHKEY': 'k1'}):
+            worker.start()
+
+        with ClusterPool(
+            ('localhost', port), 1, authkey=b'k1', timeout=10.0
+        ) as pool:
+            self.assertEqual(pool.submit(abs, -2).result(10.0), 2)
+
+        worker.join(10.0)
+
+        self.assertEqual(worker.exitcode, 0)
+
+    def test_start_worker__authkey_wo_env(self) -> None:
+        with patch.dict(os.environ, {'IPIPELINE_AUTHKEY': ''}):
+            with self.assertRaisesRegex(
+                ClusterError, 
+                r'authkey was not found in the environment: '
+                r'name == IPIPELINE_AUTHKEY'
+            ):
+                start_worker('localhost', 0)
+
+
 def build_pipeline() -> Pipeline:
     pipeline = Pipeline('p1')
     pipeline.add_node('n1', lambda p1: print(f'p1: {p1}'), pos_inputs=['i1'])
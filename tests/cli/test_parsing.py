@@ -9,7 +9,8 @@ from ipipeline.cli.parsing import create_parser, _add_pos_args, _add_opt_args
 class TestCreateParser(TestCase):
     def test_valid_cmds(self) -> None:
         parser = create_parser(
-            cmds['root'], [cmds['project'], cmds['execution']]
+            cmds['root'], 
+            [cmds['project'], cmds['execution'], cmds['spec'], cmds['worker']]
         )
 
         with self.assertRaisesRegex(SystemExit, r'0'):
@@ -21,9 +22,16 @@ class TestCreateParser(TestCase):
         with self.assertRaisesRegex(SystemExit, r'0'):
             _ = parser.parse_args(['execution', '-h'])
 
+        with self.assertRaisesRegex(SystemExit, r'0'):
+            _ = parser.parse_args(['spec', '-h'])
+
+        with self.assertRaisesRegex(SystemExit, r'0'):
+            _ = parser.parse_args(['worker', '-h'])
+
     def test_invalid_cmds(self) -> None:
         parser = create_parser(
-            cmds['root'], [cmds['project'], cmds['execution']]
+            cmds['root'], 
+            [cmds['project'], cmds['execution'], cmds['spec'], cmds['worker']]
         )
 
         with self.assertRaisesRegex(SystemExit, r'2'):
@@ -35,6 +43,9 @@ class TestCreateParser(TestCase):
         with self.assertRaisesRegex(SystemExit, r'2'):
             _ = parser.parse_args(['execution', '-i'])
 
+        with self.assertRaisesRegex(SystemExit, r'2'):
+            _ = parser.parse_args(['worker', 'localhost', 'port'])
+
 
 class TestAddPosArgs(TestCase):
     def test_valid_args(self) -> None:
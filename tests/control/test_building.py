@@ -1,9 +1,19 @@
+from array import array
 from unittest import TestCase
 
 from ipipeline.control.building import (
-    build_graph, build_items, build_key_args, build_pos_args
+    build_compact_graph, 
+    build_consumers_qty, 
+    build_graph, 
+    build_inputs, 
+    build_items, 
+    build_key_args, 
+    build_pos_args, 
+    build_subgraph, 
+    build_tag_ordering, 
+    build_target_ordering
 )
-from ipipeline.exceptions import BuildingError
+from ipipeline.exceptions import BuildingError, PipelineError
 from ipipeline.structure.catalog import Catalog
 from ipipeline.structure.link import Link
 from ipipeline.structure.node import Node
@@ -84,6 +94,294 @@ class TestBuildGraph(TestCase):
         self.assertDictEqual(graph, {'n1': ['n2'], 'n2': []})
 
 
+class TestBuildCompactGraph(TestCase):
+    def test_build_compact_graph__pipeline_wi_src_ids_wi_dst_ids(self) -> None:
+        pipeline = Pipeline(
+            'p1', 
+            {
+                'n1': Node('n1', None), 
+                'n2': Node('n2', None), 
+                'n3': Node('n3', None), 
+                'n4': Node('n4', None)
+            }, 
+            {
+                'l1': Link('l1', 'n2', 'n4'), 
+                'l2': Link('l2', 'n1', 'n3'), 
+                'l3': Link('l3', 'n1', 'n2')
+            }
+        )
+        ids, offsets, targets = build_compact_graph(pipeline)
+
+        self.assertListEqual(ids, ['n1', 'n2', 'n3', 'n4'])
+        self.assertEqual(offsets, array('l', [0, 2, 3, 3, 3]))
+        self.assertEqual(targets, array('l', [2, 1, 3]))
+
+    def test_build_compact_graph__pipeline_wi_src_ids_wo_dst_ids(self) -> None:
+        pipeline = Pipeline(
+            'p1', {'n1': Node('n1', None)}, {'l1': Link('l1', 'n1', 'n2')}
+        )
+
+        with self.assertRaisesRegex(
+            BuildingError, 
+            r'dst_id was not found in the pipeline._nodes: dst_id == n2'
+        ):
+            _ = build_compact_graph(pipeline)
+
+    def test_build_compact_graph__pipeline_wo_src_ids_wi_dst_ids(self) -> None:
+        pipeline = Pipeline(
+            'p1', {'n2': Node('n2', None)}, {'l1': Link('l1', 'n1', 'n2')}
+        )
+
+        with self.assertRaisesRegex(
+            BuildingError, 
+            r'src_id was not found in the pipeline._nodes: src_id == n1'
+        ):
+            _ = build_compact_graph(pipeline)
+
+    def test_build_compact_graph__pipeline_wo_src_ids_wo_dst_ids(self) -> None:
+        pipeline = Pipeline('p1')
+        ids, offsets, targets = build_compact_graph(pipeline)
+
+        self.assertListEqual(ids, [])
+        self.assertEqual(offsets, array('l', [0]))
+        self.assertEqual(targets, array('l'))
+
+    def test_build_compact_graph__pipeline_wi_duplicate_dst_id(self) -> None:
+        pipeline = Pipeline(
+            'p1', 
+            {
+                'n1': Node('n1', None), 
+                'n2': Node('n2', None), 
+                'n3': Node('n3', None)
+            }, 
+            {
+                'l1': Link('l1', 'n1', 'n2'), 
+                'l2': Link('l2', 'n1', 'n3'), 
+                'l3': Link('l3', 'n1', 'n2')
+            }
+        )
+
+        with self.assertRaisesRegex(
+            BuildingError, 
+            r'dst_id was found in the graph\[link.src_id\]: dst_id == n2'
+        ):
+            _ = build_compact_graph(pipeline)
+
+    def test_build_compact_graph__pipeline_wo_duplicate_dst_id(self) -> None:
+        pipeline = Pipeline(
+            'p1', 
+            {'n1': Node('n1', None), 'n2': Node('n2', None)}, 
+            {'l1': Link('l1', 'n1', 'n2'), 'l2': Link('l2', 'n2', 'n1')}
+        )
+        ids, offsets, targets = build_compact_graph(pipeline)
+
+        self.assertListEqual(ids, ['n1', 'n2'])
+        self.assertEqual(offsets, array('l', [0, 1, 2]))
+        self.assertEqual(targets, array('l', [1, 0]))
+
+
+class TestBuildSubgraph(TestCase):
+    def test_build_subgraph__ordering_wi_all_ids(self) -> None:
+        subgraph = build_subgraph(
+            {'n1': ['n2', 'n3'], 'n2': ['n4'], 'n3': [], 'n4': []}, 
+            [['n1'], ['n2', 'n3'], ['n4']]
+        )
+
+        self.assertDictEqual(
+            subgraph, {'n1': ['n2', 'n3'], 'n2': ['n4'], 'n3': [], 'n4': []}
+        )
+
+    def test_build_subgraph__ordering_wi_some_ids(self) -> None:
+        subgraph = build_subgraph(
+            {'n1': ['n2', 'n3'], 'n2': ['n4'], 'n3': [], 'n4': []}, 
+            [['n1'], ['n3']]
+        )
+
+        self.assertDictEqual(subgraph, {'n1': ['n3'], 'n3': []})
+
+    def test_build_subgraph__ordering_wo_ids(self) -> None:
+        subgraph = build_subgraph({'n1': ['n2'], 'n2': []}, [])
+
+        self.assertDictEqual(subgraph, {})
+
+
+class TestBuildTargetOrdering(TestCase):
+    def setUp(self) -> None:
+        self._pipeline = Pipeline('p1')
+        self._pipeline.add_node(
+            'n1', None, pos_inputs=['i1', 'i2'], outputs=['i3']
+        )
+        self._pipeline.add_node('n2', None, pos_inputs=['i3'], outputs=['i4'])
+        self._pipeline.add_node('n3', None, pos_inputs=['i1'], outputs=['i5'])
+        self._pipeline.add_node('n4', None)
+        self._pipeline.add_link('l1', 'n1', 'n2')
+        self._pipeline.add_link('l2', 'n4', 'n3')
+
+        self._ordering = [['n1', 'n4'], ['n2', 'n3']]
+
+    def test_build_target_ordering__targets_wi_producers(self) -> None:
+        target_ordering = build_target_ordering(
+            self._pipeline, 
+            Catalog('c1', items={'i1': 2, 'i2': 4}), 
+            self._ordering, 
+            ['i4']
+        )
+
+        self.assertListEqual(target_ordering, [['n1'], ['n2']])
+
+    def test_build_target_ordering__targets_wi_link_sources(self) -> None:
+        target_ordering = build_target_ordering(
+            self._pipeline, 
+            Catalog('c1', items={'i1': 2, 'i2': 4}), 
+            self._ordering, 
+            ['i5']
+        )
+
+        self.assertListEqual(target_ordering, [['n4'], ['n3']])
+
+    def test_build_target_ordering__inputs_wi_catalog_items(self) -> None:
+        target_ordering = build_target_ordering(
+            self._pipeline, 
+            Catalog('c1', items={'i3': 6}), 
+            self._ordering, 
+            ['i4']
+        )
+
+        self.assertListEqual(target_ordering, [['n2']])
+
+    def test_build_target_ordering__targets_wi_catalog_items(self) -> None:
+        target_ordering = build_target_ordering(
+            self._pipeline, 
+            Catalog('c1', items={'i4': 8}), 
+            self._ordering, 
+            ['i4']
+        )
+
+        self.assertListEqual(target_ordering, [])
+
+    def test_build_target_ordering__targets_wo_producers(self) -> None:
+        with self.assertRaisesRegex(
+            BuildingError, 
+            r'target was not found in the node outputs: target == i6'
+        ):
+            _ = build_target_ordering(
+                self._pipeline, Catalog('c1'), self._ordering, ['i6']
+            )
+
+    def test_build_target_ordering__outputs_wi_two_producers(self) -> None:
+        self._pipeline.add_node('n5', None, outputs=['i4'])
+
+        with self.assertRaisesRegex(
+            PipelineError, 
+            r'output was found in the _producers: output == i4, id == n5'
+        ):
+            _ = build_target_ordering(
+                self._pipeline, Catalog('c1'), self._ordering, ['i4']
+            )
+
+
+class TestBuildTagOrdering(TestCase):
+    def setUp(self) -> None:
+        self._pipeline = Pipeline('p1')
+        self._pipeline.add_node(
+            'n1', None, outputs=['i1'], tags=['extract', 'slow']
+        )
+        self._pipeline.add_node('n2', None, outputs=['i2'], tags=['extract'])
+        self._pipeline.add_node(
+            'n3', None, pos_inputs=['i1'], outputs=['i3'], tags=['transform']
+        )
+        self._pipeline.add_node('n4', None, tags=['load'])
+        self._pipeline.add_link('l1', 'n2', 'n3')
+        self._pipeline.add_link('l2', 'n3', 'n4')
+
+        self._ordering = [['n1', 'n2'], ['n3'], ['n4']]
+
+    def test_build_tag_ordering__include_wi_tags(self) -> None:
+        tag_ordering = build_tag_ordering(
+            self._pipeline, self._ordering, include=['transform']
+        )
+
+        self.assertListEqual(tag_ordering, [['n1', 'n2'], ['n3']])
+
+    def test_build_tag_ordering__outputs_wi_two_producers(self) -> None:
+        self._pipeline.add_node('n5', None, outputs=['i1'])
+
+        with self.assertRaisesRegex(
+            PipelineError, 
+            r'output was found in the _producers: output == i1, id == n5'
+        ):
+            _ = build_tag_ordering(
+                self._pipeline, self._ordering, include=['transform']
+            )
+
+    def test_build_tag_ordering__include_wi_tags__exclude_wi_tags(
+        self
+    ) -> None:
+        tag_ordering = build_tag_ordering(
+            self._pipeline, 
+            self._ordering, 
+            include=['transform'], 
+            exclude=['slow']
+        )
+
+        self.assertListEqual(tag_ordering, [['n2'], ['n3']])
+
+    def test_build_tag_ordering__include_wo_tags__exclude_wi_tags(
+        self
+    ) -> None:
+        tag_ordering = build_tag_ordering(
+            self._pipeline, self._ordering, exclude=['extract']
+        )
+
+        self.assertListEqual(tag_ordering, [['n3'], ['n4']])
+
+    def test_build_tag_ordering__include_wi_unknown_tags(self) -> None:
+        tag_ordering = build_tag_ordering(
+            self._pipeline, self._ordering, include=['t1']
+        )
+
+        self.assertListEqual(tag_ordering, [])
+
+
+class TestBuildConsumersQty(TestCase):
+    def setUp(self) -> None:
+        self._pipeline = Pipeline('p1')
+        self._pipeline.add_node('n1', None, pos_inputs=['i1', 'i1'])
+        self._pipeline.add_node(
+            'n2', None, pos_inputs=['i1'], key_inputs={'p1': 'i2'}
+        )
+        self._pipeline.add_node('n3', None, key_inputs={'p1': 'i2'})
+
+    def test_build_consumers_qty__ordering_wi_ids(self) -> None:
+        consumers_qty = build_consumers_qty(
+            self._pipeline, [['n1', 'n2'], ['n3']]
+        )
+
+        self.assertDictEqual(consumers_qty, {'i1': 2, 'i2': 2})
+
+    def test_build_consumers_qty__ordering_wi_some_ids(self) -> None:
+        consumers_qty = build_consumers_qty(self._pipeline, [['n3']])
+
+        self.assertDictEqual(consumers_qty, {'i2': 1})
+
+    def test_build_consumers_qty__ordering_wo_ids(self) -> None:
+        consumers_qty = build_consumers_qty(self._pipeline, [])
+
+        self.assertDictEqual(consumers_qty, {})
+
+
+class TestBuildInputs(TestCase):
+    def test_build_inputs__inputs_wi_duplicates(self) -> None:
+        inputs = build_inputs(['i1', 'i2', 'i1'], {'p1': 'i3', 'p2': 'i2'})
+
+        self.assertListEqual(inputs, ['i1', 'i2', 'i3'])
+
+    def test_build_inputs__inputs_wo_ids(self) -> None:
+        inputs = build_inputs([], {})
+
+        self.assertListEqual(inputs, [])
+
+
 class TestBuildPosArgs(TestCase):
     def setUp(self) -> None:
         self._catalog = Catalog('c1', items={'i1': 2, 'i2': 4})
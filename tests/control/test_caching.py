@@ -0,0 +1,245 @@
+from functools import partial
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from threading import Lock
+from typing import Callable
+from unittest import TestCase
+
+from ipipeline.control.caching import (
+    BaseCache, 
+    DiskCache, 
+    MemoryCache, 
+    build_key, 
+    fingerprint_args, 
+    fingerprint_task
+)
+from ipipeline.exceptions import CacheError
+
+
+def add_args(p1: int, p2: int) -> int:
+    return p1 + p2
+
+
+def sub_args(p1: int, p2: int) -> int:
+    return p1 - p2
+
+
+def build_default_task(p2: int) -> Callable:
+    def task(p1: int, p2: int = p2) -> int:
+        return p1 + p2
+
+    return task
+
+
+def build_closure_task(p2: int) -> Callable:
+    def task(p1: int) -> int:
+        return p1 + p2
+
+    return task
+
+
+class Scaler:
+    def __init__(self, factor: int) -> None:
+        self.factor = factor
+
+    def __call__(self, p1: int) -> int:
+        return p1 * self.factor
+
+    def scale(self, p1: int) -> int:
+        return p1 * self.factor
+
+
+class TestBaseCache(TestCase):
+    def setUp(self) -> None:
+        BaseCache.__abstractmethods__ = frozenset()
+
+    def test_init__args_eq_types(self) -> None:
+        cache = BaseCache()
+
+        self.assertEqual(cache._hits, 0)
+        self.assertEqual(cache._misses, 0)
+
+
+class TestMemoryCache(TestCase):
+    def test_init__args_eq_types(self) -> None:
+        cache = MemoryCache(max_entries=2)
+
+        self.assertEqual(cache._max_entries, 2)
+        self.assertDictEqual(cache._entries, {})
+
+    def test_get_items__key_wi_items(self) -> None:
+        cache = MemoryCache()
+        cache.set_items('k1', {'i1': 2})
+        items = cache.get_items('k1')
+
+        self.assertDictEqual(items, {'i1': 2})
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(cache.misses, 0)
+
+    def test_get_items__key_wo_items(self) -> None:
+        cache = MemoryCache()
+        items = cache.get_items('k1')
+
+        self.assertIsNone(items)
+        self.assertEqual(cache.hits, 0)
+        self.assertEqual(cache.misses, 1)
+
+    def test_set_items__entries_gt_max_entries(self) -> None:
+        cache = MemoryCache(max_entries=2)
+        cache.set_items('k1', {'i1': 2})
+        cache.set_items('k2', {'i2': 4})
+        _ = cache.get_items('k1')
+        cache.set_items('k3', {'i3': 6})
+
+        self.assertListEqual(list(cache._entries), ['k1', 'k3'])
+
+
+class TestDiskCache(TestCase):
+    def setUp(self) -> None:
+        self._temp_dir = TemporaryDirectory()
+        self._path = self._temp_dir.name
+
+    def tearDown(self) -> None:
+        self._temp_dir.cleanup()
+
+    def test_init__path_wi_entries(self) -> None:
+        cache1 = DiskCache(self._path)
+        cache1.set_items('k1', {'i1': 2})
+        cache2 = DiskCache(self._path)
+        items = cache2.get_items('k1')
+
+        self.assertDictEqual(items, {'i1': 2})
+        self.assertEqual(cache2.hits, 1)
+
+    def test_get_items__key_set_by_other_cache(self) -> None:
+        cache1 = DiskCache(self._path)
+        cache2 = DiskCache(self._path)
+        cache2.set_items('k1', {'i1': 2})
+        items = cache1.get_items('k1')
+
+        self.assertDictEqual(items, {'i1': 2})
+        self.assertEqual(cache1.hits, 1)
+        self.assertEqual(cache1._size, cache2._size)
+
+    def test_get_items__key_wo_items(self) -> None:
+        cache = DiskCache(self._path)
+        items = cache.get_items('k1')
+
+        self.assertIsNone(items)
+        self.assertEqual(cache.misses, 1)
+
+    def test_get_items__key_wi_corrupt_items(self) -> None:
+        cache = DiskCache(self._path)
+        cache.set_items('k1', {'i1': 2})
+        (Path(self._path) / 'k1.pkl').write_bytes(b'\x80')
+        items = cache.get_items('k1')
+
+        self.assertIsNone(items)
+        self.assertEqual(cache.misses, 1)
+        self.assertEqual(cache._size, 0)
+        self.assertListEqual(list(Path(self._path).iterdir()), [])
+
+    def test_set_items__size_gt_max_size(self) -> None:
+        cache = DiskCache(self._path, max_size=1)
+        cache.set_items('k1', {'i1': 2})
+        cache.set_items('k2', {'i2': 4})
+
+        self.assertListEqual(list(cache._sizes), ['k2'])
+        self.assertEqual(cache._size, cache._sizes['k2'])
+        self.assertListEqual(
+            [file.name for file in Path(self._path).iterdir()], ['k2.pkl']
+        )
+
+    def test_set_items__items_wi_unpicklable_items(self) -> None:
+        cache = DiskCache(self._path)
+
+        with self.assertRaisesRegex(
+            CacheError, r'items were not pickled by the cache: key == k1'
+        ):
+            cache.set_items('k1', {'i1': lambda: None})
+
+
+class TestBuildKey(TestCase):
+    def test_build_key__args_eq_args(self) -> None:
+        key1 = build_key(add_args, [2], {'p2': 4})
+        key2 = build_key(add_args, [2], {'p2': 4})
+
+        self.assertEqual(key1, key2)
+
+    def test_build_key__args_ne_args(self) -> None:
+        key1 = build_key(add_args, [2], {'p2': 4})
+        key2 = build_key(add_args, [2], {'p2': 5})
+
+        self.assertNotEqual(key1, key2)
+
+
+class TestFingerprintTask(TestCase):
+    def test_fingerprint_task__tasks_wi_diff_code(self) -> None:
+        task1 = lambda p1: p1 + 1
+        task2 = lambda p1: p1 + 2
+
+        self.assertNotEqual(fingerprint_task(task1), fingerprint_task(task2))
+
+    def test_fingerprint_task__tasks_wi_diff_names(self) -> None:
+        self.assertNotEqual(
+            fingerprint_task(add_args), fingerprint_task(sub_args)
+        )
+
+    def test_fingerprint_task__task_eq_partial(self) -> None:
+        fingerprint1 = fingerprint_task(partial(add_args, 2))
+        fingerprint2 = fingerprint_task(partial(add_args, 3))
+
+        self.assertNotEqual(fingerprint1, fingerprint2)
+        self.assertEqual(fingerprint1, fingerprint_task(partial(add_args, 2)))
+
+    def test_fingerprint_task__tasks_wi_diff_defaults(self) -> None:
+        fingerprint1 = fingerprint_task(build_default_task(2))
+        fingerprint2 = fingerprint_task(build_default_task(3))
+
+        self.assertNotEqual(fingerprint1, fingerprint2)
+        self.assertEqual(fingerprint1, fingerprint_task(build_default_task(2)))
+
+    def test_fingerprint_task__tasks_wi_diff_closures(self) -> None:
+        fingerprint1 = fingerprint_task(build_closure_task(2))
+        fingerprint2 = fingerprint_task(build_closure_task(3))
+
+        self.assertNotEqual(fingerprint1, fingerprint2)
+        self.assertEqual(fingerprint1, fingerprint_task(build_closure_task(2)))
+
+    def test_fingerprint_task__partial_wi_unpicklable_args(self) -> None:
+        with self.assertRaisesRegex(
+            CacheError, r'task was not pickled by the cache: error == '
+        ):
+            fingerprint_task(partial(add_args, Lock()))
+
+    def test_fingerprint_task__methods_wi_diff_instances(self) -> None:
+        fingerprint1 = fingerprint_task(Scaler(2).scale)
+        fingerprint2 = fingerprint_task(Scaler(10).scale)
+
+        self.assertNotEqual(fingerprint1, fingerprint2)
+        self.assertEqual(fingerprint1, fingerprint_task(Scaler(2).scale))
+
+    def test_fingerprint_task__callables_wi_diff_states(self) -> None:
+        fingerprint1 = fingerprint_task(Scaler(2))
+        fingerprint2 = fingerprint_task(Scaler(10))
+
+        self.assertNotEqual(fingerprint1, fingerprint2)
+        self.assertEqual(fingerprint1, fingerprint_task(Scaler(2)))
+
+    def test_fingerprint_task__task_wo_code(self) -> None:
+        self.assertNotEqual(fingerprint_task(len), fingerprint_task(sum))
+
+
+class TestFingerprintArgs(TestCase):
+    def test_fingerprint_args__key_args_wi_diff_orders(self) -> None:
+        fingerprint1 = fingerprint_args([], {'p1': 2, 'p2': 4})
+        fingerprint2 = fingerprint_args([], {'p2': 4, 'p1': 2})
+
+        self.assertEqual(fingerprint1, fingerprint2)
+
+    def test_fingerprint_args__args_wi_unpicklable_args(self) -> None:
+        with self.assertRaisesRegex(
+            CacheError, 
+            r'arguments were not pickled by the cache: error == '
+        ):
+            _ = fingerprint_args([lambda: None], {})
@@ -0,0 +1,62 @@
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from ipipeline.control.checkpointing import Checkpoint
+from ipipeline.exceptions import CheckpointError
+
+
+class TestCheckpoint(TestCase):
+    def setUp(self) -> None:
+        self._temp_dir = TemporaryDirectory()
+        self._path = str(Path(self._temp_dir.name) / 'c1')
+
+    def tearDown(self) -> None:
+        self._temp_dir.cleanup()
+
+    def test_init__path_wo_dir(self) -> None:
+        checkpoint = Checkpoint(self._path)
+
+        self.assertEqual(checkpoint._path, self._path)
+        self.assertTrue(Path(self._path).is_dir())
+
+    def test_dump_items__items_wi_picklable_items(self) -> None:
+        checkpoint = Checkpoint(self._path)
+        checkpoint.dump_items('n1', {'i1': 2, 'i2': 4})
+        checkpoint.dump_items('n2', {'i3': 6})
+
+        self.assertListEqual(
+            sorted(file.name for file in Path(self._path).iterdir()), 
+            ['n1.pkl', 'n2.pkl']
+        )
+
+    def test_dump_items__items_wi_unpicklable_items(self) -> None:
+        checkpoint = Checkpoint(self._path)
+
+        with self.assertRaisesRegex(
+            CheckpointError, 
+            r'items were not pickled by the checkpoint: id == n1'
+        ):
+            checkpoint.dump_items('n1', {'i1': lambda: None})
+
+    def test_load_items__dir_wi_files(self) -> None:
+        Checkpoint(self._path).dump_items('n1', {'i1': 2, 'i2': 4})
+        Checkpoint(self._path).dump_items('n2', {'i3': 6})
+        items = Checkpoint(self._path).load_items()
+
+        self.assertDictEqual(items, {'i1': 2, 'i2': 4, 'i3': 6})
+
+    def test_load_ids__dir_wi_files(self) -> None:
+        checkpoint = Checkpoint(self._path)
+        checkpoint.dump_items('n2', {'i3': 6})
+        checkpoint.dump_items('n1', {'i1': 2})
+        (Path(self._path) / 'n3.tmp').write_bytes(b'')
+
+        self.assertListEqual(checkpoint.load_ids(), ['n1', 'n2'])
+
+    def test_clear__dir_wi_files(self) -> None:
+        checkpoint = Checkpoint(self._path)
+        checkpoint.dump_items('n1', {'i1': 2})
+        checkpoint.clear()
+
+        self.assertListEqual(checkpoint.load_ids(), [])
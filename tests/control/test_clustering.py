@@ -0,0 +1,213 @@
+import socket
+import time
+from multiprocessing import Process
+from unittest import TestCase
+
+from ipipeline.control.clustering import (
+    ClusterPool, Reference, build_reference, load_reference, serve_worker
+)
+from ipipeline.exceptions import ClusterError, ExecutorError, InstanceError
+
+
+class TestClusterPool(TestCase):
+    def setUp(self) -> None:
+        self._address = ('localhost', find_port())
+        self._workers = [
+            Process(
+                target=serve_worker, 
+                args=(self._address,), 
+                kwargs={'authkey': b'k1', 'timeout': 10.0}, 
+                daemon=True
+            )
+            for _ in range(2)
+        ]
+
+        for worker in self._workers:
+            worker.start()
+
+    def tearDown(self) -> None:
+        for worker in self._workers:
+            worker.join(10.0)
+            worker.kill()
+
+    def test_submit__fn_wi_reference(self) -> None:
+        with ClusterPool(
+            self._address, 2, authkey=b'k1', timeout=10.0
+        ) as pool:
+            futures = [pool.submit(apply_fn, add, i, p2=1) for i in range(6)]
+
+            self.assertListEqual(
+                [future.result(10.0) for future in futures], 
+                [1, 2, 3, 4, 5, 6]
+            )
+
+        for worker in self._workers:
+            worker.join(10.0)
+
+            self.assertEqual(worker.exitcode, 0)
+
+    def test_submit__fn_wi_exception(self) -> None:
+        with ClusterPool(
+            self._address, 2, authkey=b'k1', timeout=10.0
+        ) as pool:
+            future = pool.submit(add, 1, None)
+
+            with self.assertRaises(TypeError):
+                _ = future.result(10.0)
+
+    def test_submit__fn_wo_reference(self) -> None:
+        with ClusterPool(
+            self._address, 2, authkey=b'k1', timeout=10.0
+        ) as pool:
+            future = pool.submit(lambda: None)
+
+            with self.assertRaisesRegex(
+                ClusterError, r'fn was not declared at the module level'
+            ):
+                _ = future.result(10.0)
+
+    def test_init__workers_wo_connections(self) -> None:
+        with self.assertRaisesRegex(
+            ClusterError, 
+            r'workers were not connected to the coordinator: '
+            r'workers_qty == 3, connected_qty == 2'
+        ):
+            _ = ClusterPool(self._address, 3, authkey=b'k1', timeout=2.0)
+
+
+    def test_init__authkey_eq_empty(self) -> None:
+        for worker in self._workers:
+            worker.kill()
+
+        with self.assertRaisesRegex(
+            ClusterError, 
+            r'authkey was not found in the arguments: type == bytes'
+        ):
+            _ = ClusterPool(self._address, 2, b'', timeout=2.0)
+
+    def test_submit__workers_wi_disconnections(self) -> None:
+        with ClusterPool(
+            self._address, 2, authkey=b'k1', timeout=10.0
+        ) as pool:
+            futures = [pool.submit(time.sleep, 5.0) for _ in range(4)]
+            time.sleep(0.5)
+
+            for worker in self._workers:
+                worker.kill()
+
+            for future in futures[:2]:
+                with self.assertRaisesRegex(
+                    ClusterError, 
+                    r'worker was disconnected from the coordinator'
+                ):
+                    _ = future.result(10.0)
+
+            for future in futures[2:] + [pool.submit(abs, -2)]:
+                with self.assertRaisesRegex(
+                    ExecutorError, 
+                    r'workers were not connected to the coordinator'
+                ):
+                    _ = future.result(10.0)
+
+    def test_submit__workers_wi_broken_connections(self) -> None:
+        with ClusterPool(
+            self._address, 2, authkey=b'k1', timeout=10.0
+        ) as pool:
+            while len(pool._idle_ids) < 2:
+                time.sleep(0.05)
+
+            with pool._lock:
+                connections = pool._connections[:]
+                pool._connections[:] = [BrokenConnection()] * 2
+
+            futures = [pool.submit(abs, -i) for i in range(3)]
+
+            for future in futures[:2]:
+                with self.assertRaisesRegex(
+                    ClusterError, r'job was not sent to the worker'
+                ):
+                    _ = future.result(10.0)
+
+            with self.assertRaisesRegex(
+                ExecutorError, r'workers were not connected to the coordinator'
+            ):
+                _ = futures[2].result(10.0)
+
+            self.assertSetEqual(pool._active_ids, set())
+
+            with pool._lock:
+                pool._connections[:] = connections
+
+
+class TestBuildReference(TestCase):
+    def test_build_reference__fn_wi_module_level(self) -> None:
+        self.assertTupleEqual(
+            build_reference(add), 
+            Reference('tests.control.test_clustering', 'add')
+        )
+
+    def test_build_reference__fn_wo_module_level(self) -> None:
+        def sub(p1: int, p2: int) -> int:
+            return p1 - p2
+
+        for fn in [sub, lambda: None, TestBuildReference.setUp]:
+            with self.assertRaisesRegex(
+                ClusterError, r'fn was not declared at the module level'
+            ):
+                _ = build_reference(fn)
+
+
+class TestLoadReference(TestCase):
+    def test_load_reference__reference_eq_fn(self) -> None:
+        self.assertIs(
+            load_reference(Reference('tests.control.test_clustering', 'add')), 
+            add
+        )
+
+    def test_load_reference__reference_ne_fn(self) -> None:
+        with self.assertRaisesRegex(
+            InstanceError, 
+            r'inst_name was not found in the module: inst_name == sub'
+        ):
+            _ = load_reference(
+                Reference('tests.control.test_clustering', 'sub')
+            )
+
+
+class TestServeWorker(TestCase):
+    def test_serve_worker__address_wo_coordinator(self) -> None:
+        address = ('localhost', find_port())
+
+        with self.assertRaisesRegex(
+            ClusterError, 
+            r'coordinator was not found in the address: '
+            rf'address == \(.localhost., {address[1]}\)'
+        ):
+            serve_worker(address, b'k1', timeout=0.2)
+
+    def test_serve_worker__authkey_eq_none(self) -> None:
+        with self.assertRaisesRegex(
+            ClusterError, 
+            r'authkey was not found in the arguments: type == NoneType'
+        ):
+            serve_worker(('localhost', find_port()), None, timeout=0.2)
+
+
+class BrokenConnection:
+    def send(self, obj: object) -> None:
+        raise OSError('handle is closed')
+
+
+def add(p1: int, p2: int) -> int:
+    return p1 + p2
+
+
+def apply_fn(fn: callable, *args: int, **kwargs: int) -> int:
+    return fn(*args, **kwargs)
+
+
+def find_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('localhost', 0))
+
+        return sock.getsockname()[1]
@@ -0,0 +1,72 @@
+from unittest import TestCase
+
+from ipipeline.control.compiling import Plan, compile_pipeline
+from ipipeline.exceptions import PipelineError
+from ipipeline.structure.pipeline import Pipeline
+
+
+class TestPlan(TestCase):
+    def test_init__args_eq_types(self) -> None:
+        plan = Plan(['i1', 'i2'], [], [0], [1])
+
+        self.assertListEqual(plan._ids, ['i1', 'i2'])
+        self.assertListEqual(plan._steps, [])
+        self.assertListEqual(plan._inputs, [0])
+        self.assertListEqual(plan._outputs, [1])
+
+    def test_repr__args_eq_types(self) -> None:
+        plan = Plan(['i1', 'i2'], [], [0], [1])
+
+        self.assertEqual(
+            repr(plan), 
+            'Plan(ids=[\'i1\', \'i2\'], steps=[], inputs=[0], outputs=[1])'
+        )
+
+
+class TestCompilePipeline(TestCase):
+    def setUp(self) -> None:
+        self._task = lambda p1, p2: p1 + p2
+
+        self._pipeline = Pipeline('p1', tags=['t1'])
+        self._pipeline.add_node(
+            'n1', 
+            self._task, 
+            pos_inputs=['i1', 'i2'], 
+            outputs=['i3'], 
+            tags=['t1']
+        )
+        self._pipeline.add_node(
+            'n2', 
+            self._task, 
+            pos_inputs=['i3'], 
+            key_inputs={'p2': 'i1'}, 
+            outputs=['i4', 'i5'], 
+            tags=['t2']
+        )
+        self._pipeline.add_link('l1', 'n1', 'n2')
+
+    def test_compile_pipeline__pipeline_wi_nodes_wi_links(self) -> None:
+        plan = compile_pipeline(self._pipeline, [['n1'], ['n2']])
+
+        self.assertListEqual(plan.ids, ['i1', 'i2', 'i3', 'i4', 'i5'])
+        self.assertListEqual(
+            plan.steps, 
+            [
+                ('n1', self._task, (0, 1), (), (2,), (1,)), 
+                ('n2', self._task, (2,), (('p2', 0),), (3, 4), (0, 2))
+            ]
+        )
+        self.assertListEqual(plan.inputs, [0, 1])
+        self.assertListEqual(plan.outputs, [2, 3, 4])
+
+    def test_compile_pipeline__pipeline_wo_nodes_wo_links(self) -> None:
+        plan = compile_pipeline(Pipeline('p1', tags=['t1']), [])
+
+        self.assertListEqual(plan.ids, [])
+        self.assertListEqual(plan.steps, [])
+
+    def test_compile_pipeline__ordering_wi_unknown_id(self) -> None:
+        with self.assertRaisesRegex(
+            PipelineError, r'id was not found in the _nodes: id == n3'
+        ):
+            _ = compile_pipeline(self._pipeline, [['n3']])
@@ -1,8 +1,36 @@
+import asyncio
+import os
+import socket
+from copy import deepcopy
+from multiprocessing import Process
+from threading import Barrier, Event, Timer, get_ident
+from time import perf_counter, sleep
+from tempfile import TemporaryDirectory
 from unittest import TestCase
 
-from ipipeline.control.executors import BaseExecutor, SequentialExecutor
-from ipipeline.exceptions import ExecutorError
-from ipipeline.structure.catalog import Catalog
+from ipipeline.control.caching import DiskCache, MemoryCache
+from ipipeline.control.checkpointing import Checkpoint
+from ipipeline.control.clustering import serve_worker
+from ipipeline.control.compiling import compile_pipeline
+from ipipeline.control.recording import Record
+from ipipeline.control.transporting import SharedTransport
+from ipipeline.control.executors import (
+    AsyncExecutor, 
+    BaseExecutor, 
+    ClusterExecutor, 
+    CompiledExecutor, 
+    DistributedExecutor, 
+    GeneratedExecutor, 
+    HybridExecutor, 
+    ProcessExecutor, 
+    SequentialExecutor, 
+    ThreadExecutor, 
+    _orderings
+)
+from ipipeline.exceptions import (
+    BuildingError, CatalogError, ClusterError, ExecutorError
+)
+from ipipeline.structure.catalog import BudgetCatalog, Catalog
 from ipipeline.structure.pipeline import Pipeline
 
 
@@ -36,18 +64,83 @@ class TestBaseExecutor(TestCase):
         self._catalog.set_item('i1', 2)
         self._catalog.set_item('i2', 4)
 
+    def test_init__args_eq_types(self) -> None:
+        cache = MemoryCache()
+        executor = BaseExecutor(eviction=True, kept_ids=['i1'], cache=cache)
+
+        self.assertTrue(executor._eviction)
+        self.assertListEqual(executor._kept_ids, ['i1'])
+        self.assertIs(executor._cache, cache)
+        self.assertIsNone(executor._include)
+        self.assertListEqual(executor._exclude, [])
+
     def test_get_ordering__pipeline_wi_nodes_wi_links(self) -> None:
         executor = BaseExecutor()
         ordering = executor.get_ordering(self._pipeline)
 
         self.assertListEqual(ordering, [['n1'], ['n2', 'n3']])
 
+    def test_get_ordering__pipeline_wi_cached_ordering(self) -> None:
+        executor = BaseExecutor()
+        ordering1 = executor.get_ordering(self._pipeline)
+        ordering1[0].append('n4')
+        ordering2 = executor.get_ordering(self._pipeline)
+        self._pipeline.delete_link('l2')
+        self._pipeline.add_link('l2', 'n2', 'n3')
+        ordering3 = executor.get_ordering(self._pipeline)
+
+        self.assertListEqual(ordering2, [['n1'], ['n2', 'n3']])
+        self.assertListEqual(ordering3, [['n1'], ['n2'], ['n3']])
+
+    def test_get_ordering__pipelines_eq_structures(self) -> None:
+        executor = BaseExecutor()
+        _ = executor.get_ordering(self._pipeline)
+        orderings_qty = len(_orderings)
+        ordering = executor.get_ordering(deepcopy(self._pipeline))
+
+        self.assertListEqual(ordering, [['n1'], ['n2', 'n3']])
+        self.assertEqual(len(_orderings), orderings_qty)
+
+    def test_get_ordering__pipelines_eq_revisions(self) -> None:
+        executor = BaseExecutor()
+        pipeline = deepcopy(self._pipeline)
+        ordering1 = executor.get_ordering(self._pipeline)
+        pipeline.delete_link('l2')
+        pipeline.add_link('l2', 'n2', 'n3')
+        self._pipeline.delete_link('l1')
+        self._pipeline.add_link('l1', 'n1', 'n2')
+        ordering2 = executor.get_ordering(pipeline)
+
+        self.assertListEqual(ordering1, [['n1'], ['n2', 'n3']])
+        self.assertListEqual(ordering2, [['n1'], ['n2'], ['n3']])
+
     def test_get_ordering__pipeline_wo_nodes_wo_links(self) -> None:
         executor = BaseExecutor()
         ordering = executor.get_ordering(Pipeline('p1', tags=['t1']))
 
         self.assertListEqual(ordering, [])
 
+    def test_get_ordering__include_wi_tags__exclude_wi_tags(self) -> None:
+        executor = BaseExecutor(include=['t3'])
+        ordering1 = executor.get_ordering(self._pipeline)
+        executor.exclude = ['t1']
+        ordering2 = executor.get_ordering(self._pipeline)
+        executor.include = None
+        ordering3 = executor.get_ordering(self._pipeline)
+
+        self.assertListEqual(ordering1, [['n1'], ['n3']])
+        self.assertListEqual(ordering2, [['n3']])
+        self.assertListEqual(ordering3, [['n2', 'n3']])
+
+    def test_get_ordering__pipeline_wi_ordered(self) -> None:
+        executor = BaseExecutor()
+        self._pipeline.ordered = True
+        self._pipeline.add_node('n4', None)
+        self._pipeline.add_link('l3', 'n4', 'n1')
+        ordering = executor.get_ordering(self._pipeline)
+
+        self.assertListEqual(ordering, [['n4'], ['n1'], ['n2', 'n3']])
+
     def test_execute_node__node_wi_exception(self) -> None:
         executor = BaseExecutor()
 
@@ -56,12 +149,54 @@ class TestBaseExecutor(TestCase):
         ):
             _ = executor.execute_node(self._pipeline, self._catalog, 'n3')
 
+    def test_execute_node__node_wi_missing_task_ref(self) -> None:
+        self._pipeline.get_node('n1').task = 'nosuchmod:add_args'
+        executor = BaseExecutor()
+
+        with self.assertRaisesRegex(
+            ExecutorError, r'node was not executed by the executor: id == n1'
+        ):
+            _ = executor.execute_node(self._pipeline, self._catalog, 'n1')
+
     def test_execute_node__node_wo_exception(self) -> None:
         executor = BaseExecutor()
         items = executor.execute_node(self._pipeline, self._catalog, 'n1')
 
         self.assertDictEqual(items, {'i3': 6})
 
+    def test_execute_node__cache_wi_items(self) -> None:
+        global_calls.clear()
+        self._pipeline.get_node('n1').task = (
+            lambda p1, p2: global_calls.append(p1)
+        )
+        executor = BaseExecutor(cache=MemoryCache())
+        items1 = executor.execute_node(self._pipeline, self._catalog, 'n1')
+        items2 = executor.execute_node(self._pipeline, self._catalog, 'n1')
+
+        self.assertDictEqual(items1, items2)
+        self.assertListEqual(global_calls, [2])
+        self.assertEqual(executor.cache.hits, 1)
+        self.assertEqual(executor.cache.misses, 1)
+
+    def test_execute_node__cache_wi_changed_args(self) -> None:
+        executor = BaseExecutor(cache=MemoryCache())
+        items1 = executor.execute_node(self._pipeline, self._catalog, 'n1')
+        self._catalog.set_item('i2', 5)
+        items2 = executor.execute_node(self._pipeline, self._catalog, 'n1')
+
+        self.assertDictEqual(items1, {'i3': 6})
+        self.assertDictEqual(items2, {'i3': 7})
+        self.assertEqual(executor.cache.hits, 0)
+
+    def test_execute_node__cache_wi_unpicklable_args(self) -> None:
+        self._catalog.set_item('i2', lambda: None)
+        self._pipeline.get_node('n1').task = lambda p1, p2: p1
+        executor = BaseExecutor(cache=MemoryCache())
+        items = executor.execute_node(self._pipeline, self._catalog, 'n1')
+
+        self.assertDictEqual(items, {'i3': 2})
+        self.assertEqual(executor.cache.misses, 0)
+
 
 class TestSequentialExecutor(TestCase):
     def setUp(self) -> None:
@@ -119,3 +254,1332 @@ class TestSequentialExecutor(TestCase):
         )
 
         self.assertDictEqual(catalog.items, {})
+
+    def test_execute_pipeline__eviction_eq_true(self) -> None:
+        executor = SequentialExecutor(eviction=True)
+        catalog = executor.execute_pipeline(
+            self._pipeline, self._catalog, self._ordering
+        )
+
+        self.assertDictEqual(catalog.items, {'i5': 0})
+
+    def test_execute_pipeline__eviction_eq_true__kept_ids_wi_ids(self) -> None:
+        executor = SequentialExecutor(eviction=True, kept_ids=['i2', 'i3'])
+        catalog = executor.execute_pipeline(
+            self._pipeline, self._catalog, self._ordering
+        )
+
+        self.assertDictEqual(catalog.items, {'i2': 4, 'i3': 6, 'i5': 0})
+
+    def test_execute_pipeline__targets_wi_producers(self) -> None:
+        executor = SequentialExecutor()
+        catalog = executor.execute_pipeline(
+            self._pipeline, self._catalog, self._ordering, targets=['i3']
+        )
+
+        self.assertDictEqual(catalog.items, {'i1': 2, 'i2': 4, 'i3': 6})
+
+    def test_execute_pipeline__targets_wi_catalog_items(self) -> None:
+        executor = SequentialExecutor()
+        self._catalog.set_item('i3', 8)
+        catalog = executor.execute_pipeline(
+            self._pipeline, self._catalog, self._ordering, targets=['i3']
+        )
+
+        self.assertDictEqual(catalog.items, {'i1': 2, 'i2': 4, 'i3': 8})
+
+    def test_execute_pipeline__targets_wo_producers(self) -> None:
+        executor = SequentialExecutor()
+
+        with self.assertRaisesRegex(
+            BuildingError, 
+            r'target was not found in the node outputs: target == i6'
+        ):
+            _ = executor.execute_pipeline(
+                self._pipeline, self._catalog, self._ordering, targets=['i6']
+            )
+
+    def test_execute_pipeline__cache_wi_items(self) -> None:
+        executor = SequentialExecutor(cache=MemoryCache())
+        _ = executor.execute_pipeline(
+            self._pipeline, Catalog('c1', items={'i1': 2, 'i2': 4}), 
+            self._ordering
+        )
+        catalog = executor.execute_pipeline(
+            self._pipeline, self._catalog, self._ordering
+        )
+
+        self.assertDictEqual(
+            catalog.items, {'i1': 2, 'i2': 4, 'i3': 6, 'i4': -2, 'i5': 0}
+        )
+        self.assertEqual(executor.cache.hits, 4)
+        self.assertEqual(executor.cache.misses, 4)
+
+    def test_execute_pipeline__record_wi_unchanged_items(self) -> None:
+        calls = []
+        self._pipeline.get_node('n3').task = lambda p3: calls.append(p3)
+        executor = SequentialExecutor(record=Record())
+        _ = executor.execute_pipeline(
+            self._pipeline, Catalog('c1', items={'i1': 2, 'i2': 4}), 
+            self._ordering
+        )
+        catalog = executor.execute_pipeline(
+            self._pipeline, self._catalog, self._ordering
+        )
+
+        self.assertDictEqual(
+            catalog.items, {'i1': 2, 'i2': 4, 'i3': 6, 'i4': -2, 'i5': 0}
+        )
+        self.assertListEqual(calls, [6])
+
+    def test_execute_pipeline__record_wi_unchanged_outputs(self) -> None:
+        global_calls.clear()
+        self._pipeline.get_node('n3').task = lambda p3: global_calls.append(p3)
+        self._pipeline.get_node('n4').task = lambda p4: global_calls.append(p4)
+        executor = SequentialExecutor(record=Record())
+        _ = executor.execute_pipeline(
+            self._pipeline, self._catalog, self._ordering
+        )
+        catalog = executor.execute_pipeline(
+            self._pipeline, Catalog('c1', items={'i1': 3, 'i2': 3}), 
+            self._ordering
+        )
+
+        self.assertDictEqual(
+            catalog.items, {'i1': 3, 'i2': 3, 'i3': 6, 'i4': 0, 'i5': 0}
+        )
+        self.assertListEqual(global_calls, [6, -2, 0])
+
+    def test_execute_pipeline__record_wi_changed_instances(self) -> None:
+        executor = SequentialExecutor(record=Record())
+        self._pipeline.get_node('n1').task = Scaler(2).scale
+        self._pipeline.get_node('n1').pos_inputs = ['i1']
+        catalog = executor.execute_pipeline(
+            self._pipeline, self._catalog, [['n1']]
+        )
+        self._pipeline.get_node('n1').task = Scaler(10).scale
+        catalog = executor.execute_pipeline(self._pipeline, catalog, [['n1']])
+
+        self.assertEqual(catalog.get_item('i3'), 20)
+
+    def test_execute_pipeline__record_wi_changed_outputs(self) -> None:
+        executor = SequentialExecutor(record=Record())
+        _ = executor.execute_pipeline(
+            self._pipeline, Catalog('c1', items={'i1': 2, 'i2': 4}), 
+            self._ordering
+        )
+        self._pipeline.get_node('n1').outputs = ['i6']
+        self._pipeline.get_node('n3').key_inputs = {'p3': 'i6'}
+        catalog = executor.execute_pipeline(
+            self._pipeline, self._catalog, self._ordering
+        )
+
+        self.assertDictEqual(
+            catalog.items, {'i1': 2, 'i2': 4, 'i4': -2, 'i5': 0, 'i6': 6}
+        )
+
+    def test_resume__checkpoint_wi_nodes(self) -> None:
+        calls = []
+        self._pipeline.get_node('n3').task = lambda p3: calls.append(p3)
+        self._pipeline.get_node('n4').task = lambda p4: [][0]
+
+        with TemporaryDirectory() as path:
+            executor = SequentialExecutor(checkpoint=Checkpoint(path))
+
+            with self.assertRaisesRegex(
+                ExecutorError, 
+                r'node was not executed by the executor: id == n4'
+            ):
+                _ = executor.execute_pipeline(
+                    self._pipeline, self._catalog, self._ordering
+                )
+
+            self._pipeline.get_node('n4').task = lambda p4: calls.append(p4)
+            catalog = executor.resume(
+                self._pipeline, 
+                Catalog('c1', items={'i1': 2, 'i2': 4}), 
+                self._ordering
+            )
+
+        self.assertDictEqual(
+            catalog.items, {'i1': 2, 'i2': 4, 'i3': 6, 'i4': -2, 'i5': 0}
+        )
+        self.assertListEqual(calls, [6, -2])
+
+    def test_resume__checkpoint_eq_none(self) -> None:
+        executor = SequentialExecutor()
+
+        with self.assertRaisesRegex(
+            ExecutorError, 
+            r'checkpoint was not set in the executor: checkpoint == None'
+        ):
+            _ = executor.resume(self._pipeline, self._catalog, self._ordering)
+
+
+class TestThreadExecutor(TestCase):
+    def setUp(self) -> None:
+        barrier = Barrier(2, timeout=5)
+
+        self._pipeline = Pipeline('p1', tags=['t1'])
+        self._pipeline.add_node(
+            'n1', 
+            lambda p1, p2: [barrier.wait(), p1 + p2][1], 
+            pos_inputs=['i1', 'i2'], 
+            outputs=['i3'], 
+            tags=['t1']
+        )
+        self._pipeline.add_node(
+            'n2', 
+            lambda p1, p2: [barrier.wait(), p1 - p2, 0][1:], 
+            pos_inputs=['i1', 'i2'], 
+            outputs=['i4', 'i5'], 
+            tags=['t2']
+        )
+        self._pipeline.add_node(
+            'n3', 
+            lambda p3=0: print(f'p3: {p3}'), 
+            key_inputs={'p3': 'i3'}, 
+            tags=['t3']
+        )
+        self._pipeline.add_node(
+            'n4', 
+            lambda p4=0: print(f'p4: {p4}'), 
+            key_inputs={'p4': 'i4'}, 
+            tags=['t4']
+        )
+        self._pipeline.add_node(
+            'n5', 
+            lambda: [][0], 
+            tags=['t5']
+        )
+
+        self._pipeline.add_link('l1', 'n1', 'n3')
+        self._pipeline.add_link('l2', 'n2', 'n4')
+
+        self._catalog = Catalog('c1', tags=['t1'])
+        self._catalog.set_item('i1', 2)
+        self._catalog.set_item('i2', 4)
+
+        self._ordering = [['n1', 'n2'], ['n3', 'n4']]
+
+    def test_init__args_eq_types(self) -> None:
+        executor = ThreadExecutor(max_workers=2, scheduling='ready')
+
+        self.assertEqual(executor._max_workers, 2)
+        self.assertEqual(executor._scheduling, 'ready')
+
+    def test_execute_pipeline__pipeline_wi_nodes_wi_links(self) -> None:
+        executor = ThreadExecutor(max_workers=2)
+        catalog = executor.execute_pipeline(
+            self._pipeline, self._catalog, self._ordering
+        )
+
+        self.assertDictEqual(
+            catalog.items, {'i1': 2, 'i2': 4, 'i3': 6, 'i4': -2, 'i5': 0}
+        )
+
+    def test_execute_pipeline__pipeline_wo_nodes_wo_links(self) -> None:
+        executor = ThreadExecutor()
+        catalog = executor.execute_pipeline(
+            Pipeline('p1', tags=['t1']), Catalog('c1', tags=['t1']), []
+        )
+
+        self.assertDictEqual(catalog.items, {})
+
+    def test_execute_pipeline__node_wi_exception(self) -> None:
+        executor = ThreadExecutor(max_workers=2)
+
+        with self.assertRaisesRegex(
+            ExecutorError, r'node was not executed by the executor: id == n5'
+        ):
+            _ = executor.execute_pipeline(
+                self._pipeline, self._catalog, [['n5'], ['n3']]
+            )
+
+        self.assertFalse(self._catalog.check_item('i3'))
+
+    def test_execute_pipeline__scheduling_eq_ready(self) -> None:
+        event = Event()
+        pipeline = Pipeline('p1', tags=['t1'])
+        pipeline.add_node('n1', lambda: event.wait(5), outputs=['i1'])
+        pipeline.add_node('n2', lambda: 2, outputs=['i2'])
+        pipeline.add_node('n3', lambda: event.set(), outputs=['i3'])
+        pipeline.add_link('l1', 'n2', 'n3')
+
+        executor = ThreadExecutor(max_workers=2, scheduling='ready')
+        catalog = executor.execute_pipeline(
+            pipeline, Catalog('c1'), [['n1', 'n2'], ['n3']]
+        )
+
+        self.assertDictEqual(catalog.items, {'i1': True, 'i2': 2, 'i3': None})
+
+    def test_execute_pipeline__eviction_eq_true(self) -> None:
+        executor = ThreadExecutor(
+            max_workers=2, eviction=True, kept_ids=['i1']
+        )
+        catalog = executor.execute_pipeline(
+            self._pipeline, self._catalog, self._ordering
+        )
+
+        self.assertDictEqual(catalog.items, {'i1': 2, 'i5': 0})
+
+    def test_execute_pipeline__targets_wi_producers(self) -> None:
+        executor = ThreadExecutor(max_workers=2)
+        catalog = executor.execute_pipeline(
+            self._pipeline, 
+            self._catalog, 
+            [['n1', 'n2', 'n5'], ['n3', 'n4']], 
+            targets=['i3', 'i4']
+        )
+
+        self.assertDictEqual(
+            catalog.items, {'i1': 2, 'i2': 4, 'i3': 6, 'i4': -2, 'i5': 0}
+        )
+
+    def test_execute_pipeline__priority_eq_critical_path(self) -> None:
+        ids = []
+        pipeline = Pipeline('p1')
+        pipeline.add_node('n1', lambda: ids.append('n1'))
+        pipeline.add_node('n2', lambda: ids.append('n2'))
+        pipeline.add_node('n3', lambda: ids.append('n3'))
+        pipeline.add_node('n4', lambda: ids.append('n4'))
+        pipeline.add_link('l1', 'n2', 'n3')
+        pipeline.add_link('l2', 'n3', 'n4')
+        ordering = [['n1', 'n2'], ['n3'], ['n4']]
+
+        executor = ThreadExecutor(max_workers=1, scheduling='ready')
+        _ = executor.execute_pipeline(pipeline, Catalog('c1'), ordering)
+
+        self.assertListEqual(ids, ['n1', 'n2', 'n3', 'n4'])
+
+        ids.clear()
+        executor = ThreadExecutor(
+            max_workers=1, 
+            scheduling='ready', 
+            priority='critical_path', 
+            costs={'n1': 0.5}
+        )
+        _ = executor.execute_pipeline(pipeline, Catalog('c1'), ordering)
+
+        self.assertListEqual(ids, ['n2', 'n3', 'n4', 'n1'])
+
+        ids.clear()
+        executor.costs = {'n1': 5}
+        _ = executor.execute_pipeline(pipeline, Catalog('c1'), ordering)
+
+        self.assertListEqual(ids, ['n1', 'n2', 'n3', 'n4'])
+
+    def test_init__priority_ne_mode(self) -> None:
+        with self.assertRaisesRegex(
+            ExecutorError, 
+            r'priority was not found in the modes: priority == lifo'
+        ):
+            _ = ThreadExecutor(priority='lifo')
+
+    def test_init__scheduling_ne_mode(self) -> None:
+        with self.assertRaisesRegex(
+            ExecutorError, 
+            r'scheduling was not found in the modes: scheduling == queue'
+        ):
+            _ = ThreadExecutor(scheduling='queue')
+
+
+class TestProcessExecutor(TestCase):
+    def setUp(self) -> None:
+        self._pipeline = Pipeline('p1', tags=['t1'])
+        self._pipeline.add_node(
+            'n1', 
+            add_args, 
+            pos_inputs=['i1', 'i2'], 
+            outputs=['i3'], 
+            tags=['t1']
+        )
+        self._pipeline.add_node(
+            'n2', 
+            sub_args, 
+            pos_inputs=['i1'], 
+            key_inputs={'p2': 'i2'}, 
+            outputs=['i4', 'i5'], 
+            tags=['t2']
+        )
+        self._pipeline.add_node(
+            'n3', 
+            add_args, 
+            pos_inputs=['i3', 'i4'], 
+            outputs=['i6'], 
+            tags=['t3']
+        )
+        self._pipeline.add_node(
+            'n4', 
+            raise_error, 
+            tags=['t4']
+        )
+        self._pipeline.add_node(
+            'n5', 
+            lambda: None, 
+            tags=['t5']
+        )
+
+        self._pipeline.add_link('l1', 'n1', 'n3')
+        self._pipeline.add_link('l2', 'n2', 'n3')
+
+        self._catalog = Catalog('c1', tags=['t1'])
+        self._catalog.set_item('i1', 2)
+        self._catalog.set_item('i2', 4)
+
+        self._ordering = [['n1', 'n2'], ['n3']]
+
+    def test_execute_pipeline__pipeline_wi_nodes_wi_links(self) -> None:
+        executor = ProcessExecutor(max_workers=2)
+        catalog = executor.execute_pipeline(
+            self._pipeline, self._catalog, self._ordering
+        )
+
+        self.assertDictEqual(
+            catalog.items, 
+            {'i1': 2, 'i2': 4, 'i3': 6, 'i4': -2, 'i5': 0, 'i6': 4}
+        )
+
+    def test_execute_pipeline__scheduling_eq_ready(self) -> None:
+        executor = ProcessExecutor(max_workers=2, scheduling='ready')
+        catalog = executor.execute_pipeline(
+            self._pipeline, self._catalog, self._ordering
+        )
+
+        self.assertEqual(catalog.get_item('i6'), 4)
+
+    def test_execute_pipeline__nodes_wi_task_refs(self) -> None:
+        self._pipeline.get_node('n1').task = (
+            'tests.control.test_executors:add_args'
+        )
+        self._pipeline.get_node('n2').task = (
+            'tests.control.test_executors:sub_args'
+        )
+        self._pipeline.get_node('n4').task = 'tests.control.test_:raise_error'
+        executor = ProcessExecutor(max_workers=2)
+        catalog = executor.execute_pipeline(
+            self._pipeline, self._catalog, [['n1', 'n2']]
+        )
+
+        self.assertEqual(catalog.get_item('i3'), 6)
+        self.assertEqual(catalog.get_item('i4'), -2)
+
+    def test_execute_pipeline__node_wi_missing_task_ref(self) -> None:
+        self._pipeline.get_node('n1').task = 'nosuchmod:add_args'
+        executor = ProcessExecutor(max_workers=2)
+
+        with self.assertRaisesRegex(
+            ExecutorError, r'node was not executed by the executor: id == n1'
+        ):
+            _ = executor.execute_pipeline(
+                self._pipeline, self._catalog, [['n1']]
+            )
+
+    def test_execute_pipeline__pipeline_wo_nodes_wo_links(self) -> None:
+        executor = ProcessExecutor()
+        catalog = executor.execute_pipeline(
+            Pipeline('p1', tags=['t1']), Catalog('c1', tags=['t1']), []
+        )
+
+        self.assertDictEqual(catalog.items, {})
+
+    def test_execute_pipeline__node_wi_exception(self) -> None:
+        executor = ProcessExecutor(max_workers=2)
+
+        with self.assertRaisesRegex(
+            ExecutorError, r'node was not executed by the executor: id == n4'
+        ):
+            _ = executor.execute_pipeline(
+                self._pipeline, self._catalog, [['n4']]
+            )
+
+    def test_execute_pipeline__cache_wi_items(self) -> None:
+        with TemporaryDirectory() as path:
+            executor = ProcessExecutor(max_workers=2, cache=DiskCache(path))
+            _ = executor.execute_pipeline(
+                self._pipeline, Catalog('c1', items={'i1': 2, 'i2': 4}), 
+                self._ordering
+            )
+            executor.cache = DiskCache(path)
+            catalog = executor.execute_pipeline(
+                self._pipeline, self._catalog, self._ordering
+            )
+
+        self.assertEqual(catalog.get_item('i6'), 4)
+        self.assertEqual(executor.cache.hits, 3)
+        self.assertEqual(executor.cache.misses, 0)
+
+    def test_execute_pipeline__record_wi_unchanged_items(self) -> None:
+        executor = ProcessExecutor(max_workers=2, record=Record())
+        catalog = executor.execute_pipeline(
+            self._pipeline, Catalog('c1', items={'i1': 2, 'i2': 4}), 
+            self._ordering
+        )
+        future = executor.submit_task(None, self._pipeline, catalog, 'n1')
+
+        self.assertDictEqual(future.result(), {'i3': 6})
+
+    def test_execute_pipeline__node_wi_unpicklable_task(self) -> None:
+        executor = ProcessExecutor(max_workers=2)
+
+        with self.assertRaisesRegex(
+            ExecutorError, r'node was not executed by the executor: id == n5'
+        ):
+            _ = executor.execute_pipeline(
+                self._pipeline, self._catalog, [['n5']]
+            )
+
+    def test_execute_pipeline__transport_wi_large_items(self) -> None:
+        transport = SharedTransport(min_size=8)
+        executor = ProcessExecutor(max_workers=2, transport=transport)
+        catalog = executor.execute_pipeline(
+            self._pipeline, 
+            Catalog('c1', items={'i1': b'ab' * 8, 'i2': bytearray(b'c')}), 
+            [['n1']]
+        )
+
+        self.assertEqual(catalog.get_item('i3'), b'ab' * 8 + b'c')
+        self.assertDictEqual(transport._blocks, {})
+
+    def test_execute_pipeline__transport_wi_exception(self) -> None:
+        transport = SharedTransport(min_size=8)
+        executor = ProcessExecutor(max_workers=2, transport=transport)
+        self._catalog.set_item('i1', b'ab' * 8)
+
+        with self.assertRaisesRegex(
+            ExecutorError, r'node was not executed by the executor: id == n1'
+        ):
+            _ = executor.execute_pipeline(
+                self._pipeline, self._catalog, [['n1']]
+            )
+
+        self.assertDictEqual(transport._blocks, {})
+
+    def test_evict_items__transport_wi_blocks(self) -> None:
+        transport = SharedTransport(min_size=8)
+        executor = ProcessExecutor(max_workers=2, transport=transport)
+        _ = transport.export_args(
+            ['i1', 'i2'], {}, [b'ab' * 8, b'cd' * 8], {}
+        )
+        executor.evict_items(None, ['i1'])
+
+        self.assertListEqual(list(transport._blocks), ['i2'])
+        transport.release()
+
+
+class TestHybridExecutor(TestCase):
+    def setUp(self) -> None:
+        self._pipeline = Pipeline('p1', tags=['t1'])
+        self._pipeline.add_node(
+            'n1', get_ident, outputs=['i1'], tags=['inline']
+        )
+        self._pipeline.add_node(
+            'n2', get_ident, outputs=['i2'], tags=['t2', 'thread']
+        )
+        self._pipeline.add_node(
+            'n3', os.getpid, outputs=['i3'], tags=['process']
+        )
+        self._pipeline.add_node(
+            'n4', 
+            add_args, 
+            pos_inputs=['i1', 'i2'], 
+            outputs=['i4'], 
+            tags=['process']
+        )
+        self._pipeline.add_node(
+            'n5', raise_error, tags=['process']
+        )
+        self._pipeline.add_link('l1', 'n1', 'n4')
+        self._pipeline.add_link('l2', 'n2', 'n4')
+
+        self._ordering = [['n1', 'n2', 'n3'], ['n4']]
+
+    def test_init__args_eq_types(self) -> None:
+        executor = HybridExecutor(
+            max_workers=2, scheduling='ready', max_processes=3, lane='inline'
+        )
+
+        self.assertEqual(executor._max_workers, 2)
+        self.assertEqual(executor._scheduling, 'ready')
+        self.assertEqual(executor._max_processes, 3)
+        self.assertEqual(executor._lane, 'inline')
+
+    def test_init__lane_ne_lane(self) -> None:
+        with self.assertRaisesRegex(
+            ExecutorError, r'lane was not found in the lanes: lane == gpu'
+        ):
+            _ = HybridExecutor(lane='gpu')
+
+    def test_get_lane__tags_wi_lane(self) -> None:
+        executor = HybridExecutor(lane='inline')
+
+        self.assertEqual(executor.get_lane(self._pipeline, 'n2'), 'thread')
+        self.assertEqual(executor.get_lane(self._pipeline, 'n3'), 'process')
+
+    def test_get_lane__tags_wo_lane(self) -> None:
+        executor = HybridExecutor(lane='inline')
+        self._pipeline.get_node('n2').tags = ['t2']
+
+        self.assertEqual(executor.get_lane(self._pipeline, 'n2'), 'inline')
+
+    def test_execute_pipeline__pipeline_wi_nodes_wi_links(self) -> None:
+        executor = HybridExecutor(scheduling='ready')
+        catalog = executor.execute_pipeline(
+            self._pipeline, Catalog('c1'), self._ordering
+        )
+
+        self.assertEqual(catalog.get_item('i1'), get_ident())
+        self.assertNotEqual(catalog.get_item('i2'), get_ident())
+        self.assertNotEqual(catalog.get_item('i3'), os.getpid())
+        self.assertEqual(
+            catalog.get_item('i4'), 
+            catalog.get_item('i1') + catalog.get_item('i2')
+        )
+
+    def test_execute_pipeline__node_wi_exception(self) -> None:
+        executor = HybridExecutor()
+
+        with self.assertRaisesRegex(
+            ExecutorError, r'node was not executed by the executor: id == n5'
+        ):
+            _ = executor.execute_pipeline(
+                self._pipeline, Catalog('c1'), [['n1', 'n5']]
+            )
+
+
+class TestDistributedExecutor(TestCase):
+    def setUp(self) -> None:
+        self._pipeline = Pipeline('p1', tags=['t1'])
+        self._pipeline.add_node(
+            'n1', add_args, pos_inputs=['i1', 'i2'], outputs=['i3']
+        )
+        self._pipeline.add_node(
+            'n2', get_pid_args, pos_inputs=['i3'], outputs=['i4', 'i5']
+        )
+        self._pipeline.add_node(
+            'n3', get_pid_args, pos_inputs=['i4'], outputs=['i6', 'i7']
+        )
+        self._pipeline.add_node(
+            'n4', sub_args, pos_inputs=['i1'], outputs=['i8', 'i9']
+        )
+        self._pipeline.add_node(
+            'n5', 
+            add_args, 
+            pos_inputs=['i6'], 
+            key_inputs={'p2': 'i8'}, 
+            outputs=['i10']
+        )
+        self._pipeline.add_node('n6', raise_error)
+        self._pipeline.add_node('n7', lambda: None)
+        self._pipeline.infer_links(external_ids=['i1', 'i2'])
+
+        self._ordering = [['n1', 'n4'], ['n2'], ['n3'], ['n5']]
+
+    def test_init__cache_ne_none(self) -> None:
+        with self.assertRaisesRegex(
+            ExecutorError, 
+            r'cache was not supported by the executor: cache == '
+        ):
+            _ = DistributedExecutor(cache=MemoryCache())
+
+    def test_init__transport_ne_none(self) -> None:
+        with self.assertRaisesRegex(
+            ExecutorError, 
+            r'transport was not supported by the executor: transport == '
+        ):
+            _ = DistributedExecutor(transport=SharedTransport())
+
+    def test_execute_pipeline__pipeline_wi_nodes_wi_links(self) -> None:
+        executor = DistributedExecutor(max_workers=2)
+        catalog = executor.execute_pipeline(
+            self._pipeline, 
+            Catalog('c1', items={'i1': 2, 'i2': 4}), 
+            self._ordering
+        )
+
+        self.assertEqual(catalog.get_item('i6'), 6)
+        self.assertEqual(catalog.get_item('i10'), 8)
+        self.assertEqual(catalog.get_item('i5'), catalog.get_item('i7'))
+        self.assertNotEqual(catalog.get_item('i5'), os.getpid())
+
+    def test_execute_pipeline__eviction_eq_true(self) -> None:
+        executor = DistributedExecutor(
+            max_workers=2, eviction=True, scheduling='ready'
+        )
+        catalog = executor.execute_pipeline(
+            self._pipeline, 
+            Catalog('c1', items={'i1': 2, 'i2': 4}), 
+            self._ordering
+        )
+
+        self.assertListEqual(
+            sorted(catalog.items.keys()), ['i10', 'i5', 'i7', 'i9']
+        )
+
+    def test_execute_pipeline__catalog_wi_budget(self) -> None:
+        executor = DistributedExecutor(max_workers=2)
+        catalog = executor.execute_pipeline(
+            self._pipeline, 
+            BudgetCatalog('c1', 0, items={'i1': 2, 'i2': 4}), 
+            self._ordering
+        )
+
+        self.assertEqual(catalog.get_item('i6'), 6)
+        self.assertEqual(catalog.get_item('i10'), 8)
+
+    def test_execute_pipeline__pipeline_wo_nodes_wo_links(self) -> None:
+        executor = DistributedExecutor()
+        catalog = executor.execute_pipeline(
+            Pipeline('p1', tags=['t1']), Catalog('c1', tags=['t1']), []
+        )
+
+        self.assertDictEqual(catalog.items, {})
+
+    def test_execute_pipeline__node_wi_exception(self) -> None:
+        executor = DistributedExecutor(max_workers=2)
+
+        with self.assertRaisesRegex(
+            ExecutorError, r'node was not executed by the executor: id == n6'
+        ):
+            _ = executor.execute_pipeline(
+                self._pipeline, Catalog('c1'), [['n6']]
+            )
+
+    def test_execute_pipeline__node_wi_unpicklable_task(self) -> None:
+        executor = DistributedExecutor(max_workers=2)
+
+        with self.assertRaisesRegex(
+            ExecutorError, r'node was not executed by the executor: id == n7'
+        ):
+            _ = executor.execute_pipeline(
+                self._pipeline, Catalog('c1'), [['n7']]
+            )
+
+    def test_execute_pipeline__catalog_wo_items(self) -> None:
+        executor = DistributedExecutor(max_workers=2)
+
+        with self.assertRaisesRegex(
+            CatalogError, r'id was not found in the _items: id == i1'
+        ):
+            _ = executor.execute_pipeline(
+                self._pipeline, Catalog('c1'), [['n1']]
+            )
+
+
+class TestClusterExecutor(TestCase):
+    def setUp(self) -> None:
+        self._pipeline = Pipeline('p1', tags=['t1'])
+        self._pipeline.add_node(
+            'n1', add_args, pos_inputs=['i1', 'i2'], outputs=['i3']
+        )
+        self._pipeline.add_node(
+            'n2', get_pid_args, pos_inputs=['i3'], outputs=['i4', 'i5']
+        )
+        self._pipeline.add_node(
+            'n3', get_pid_args, pos_inputs=['i1'], outputs=['i6', 'i7']
+        )
+        self._pipeline.add_node(
+            'n4', 
+            add_args, 
+            pos_inputs=['i4'], 
+            key_inputs={'p2': 'i6'}, 
+            outputs=['i8']
+        )
+        self._pipeline.add_node('n5', raise_error)
+        self._pipeline.add_node('n6', lambda: None)
+        self._pipeline.add_link('l1', 'n1', 'n2')
+        self._pipeline.add_link('l2', 'n2', 'n4')
+        self._pipeline.add_link('l3', 'n3', 'n4')
+
+        self._ordering = [['n1', 'n3'], ['n2'], ['n4']]
+        self._port = find_port()
+        self._workers = [
+            Process(
+                target=serve_worker, 
+                args=(('localhost', self._port),), 
+                kwargs={'authkey': b'k1', 'timeout': 10.0}, 
+                daemon=True
+            )
+            for _ in range(2)
+        ]
+
+        for worker in self._workers:
+            worker.start()
+
+    def tearDown(self) -> None:
+        for worker in self._workers:
+            worker.join(10.0)
+            worker.kill()
+
+    def test_execute_pipeline__pipeline_wi_nodes_wi_links(self) -> None:
+        executor = ClusterExecutor(
+            max_workers=2, port=self._port, authkey=b'k1', timeout=10.0
+        )
+        catalog = executor.execute_pipeline(
+            self._pipeline, 
+            Catalog('c1', items={'i1': 2, 'i2': 4}), 
+            self._ordering
+        )
+        pids = {worker.pid for worker in self._workers}
+
+        self.assertEqual(catalog.get_item('i8'), 8)
+        self.assertIn(catalog.get_item('i5'), pids)
+        self.assertIn(catalog.get_item('i7'), pids)
+
+        for worker in self._workers:
+            worker.join(10.0)
+
+            self.assertEqual(worker.exitcode, 0)
+
+    def test_execute_pipeline__node_wi_exception(self) -> None:
+        executor = ClusterExecutor(
+            max_workers=2, port=self._port, authkey=b'k1', timeout=10.0
+        )
+
+        with self.assertRaisesRegex(
+            ExecutorError, r'node was not executed by the executor: id == n5'
+        ):
+            _ = executor.execute_pipeline(
+                self._pipeline, Catalog('c1'), [['n5']]
+            )
+
+    def test_execute_pipeline__node_wo_reference(self) -> None:
+        executor = ClusterExecutor(
+            max_workers=2, port=self._port, authkey=b'k1', timeout=10.0
+        )
+
+        with self.assertRaisesRegex(
+            ClusterError, r'fn was not declared at the module level'
+        ):
+            _ = executor.execute_pipeline(
+                self._pipeline, Catalog('c1'), [['n6']]
+            )
+
+    def test_init__authkey_eq_none(self) -> None:
+        for worker in self._workers:
+            worker.kill()
+
+        executor1 = ClusterExecutor()
+        executor2 = ClusterExecutor()
+
+        self.assertEqual(executor1.host, 'localhost')
+        self.assertEqual(len(executor1.authkey), 64)
+        self.assertNotEqual(executor1.authkey, executor2.authkey)
+
+    def test_execute_pipeline__worker_wi_disconnection(self) -> None:
+        self._workers[1].kill()
+        pipeline = Pipeline('p2')
+
+        for node_id in ['n1', 'n2', 'n3']:
+            pipeline.add_node(node_id, sleep, pos_inputs=['i1'])
+
+        executor = ClusterExecutor(
+            max_workers=1, port=self._port, authkey=b'k1', timeout=10.0
+        )
+        killer = Timer(0.5, self._workers[0].kill)
+        killer.start()
+        start = perf_counter()
+
+        with self.assertRaisesRegex(
+            ClusterError, r'worker was disconnected from the coordinator'
+        ):
+            _ = executor.execute_pipeline(
+                pipeline, 
+                Catalog('c1', items={'i1': 5.0}), 
+                [['n1', 'n2', 'n3']]
+            )
+
+        killer.join()
+
+        self.assertLess(perf_counter() - start, 5.0)
+
+    def test_execute_pipeline__workers_wo_authkey(self) -> None:
+        executor = ClusterExecutor(
+            max_workers=2, port=self._port, authkey=b'k2', timeout=2.0
+        )
+
+        with self.assertRaisesRegex(
+            ClusterError, 
+            r'workers were not connected to the coordinator: '
+            r'workers_qty == 2, connected_qty == 0'
+        ):
+            _ = executor.execute_pipeline(
+                self._pipeline, Catalog('c1'), [['n5']]
+            )
+
+
+class TestCompiledExecutor(TestCase):
+    def setUp(self) -> None:
+        self._pipeline = Pipeline('p1', tags=['t1'])
+        self._pipeline.add_node(
+            'n1', 
+            add_args, 
+            pos_inputs=['i1', 'i2'], 
+            outputs=['i3'], 
+            tags=['t1']
+        )
+        self._pipeline.add_node(
+            'n2', 
+            sub_args, 
+            pos_inputs=['i1'], 
+            key_inputs={'p2': 'i2'}, 
+            outputs=['i4', 'i5'], 
+            tags=['t2']
+        )
+        self._pipeline.add_node(
+            'n3', 
+            add_args, 
+            pos_inputs=['i3', 'i4'], 
+            outputs=['i6'], 
+            tags=['t3']
+        )
+        self._pipeline.add_node(
+            'n4', 
+            raise_error, 
+            tags=['t4']
+        )
+        self._pipeline.add_node(
+            'n5', 
+            lambda: 2, 
+            outputs=['i7', 'i8'], 
+            tags=['t5']
+        )
+
+        self._pipeline.add_link('l1', 'n1', 'n3')
+        self._pipeline.add_link('l2', 'n2', 'n3')
+
+        self._catalog = Catalog('c1', tags=['t1'])
+        self._catalog.set_item('i1', 2)
+        self._catalog.set_item('i2', 4)
+
+        self._ordering = [['n1', 'n2'], ['n3']]
+
+    def test_execute_pipeline__pipeline_wi_nodes_wi_links(self) -> None:
+        executor = CompiledExecutor()
+        catalog = executor.execute_pipeline(
+            self._pipeline, self._catalog, self._ordering
+        )
+
+        self.assertDictEqual(
+            catalog.items, 
+            {'i1': 2, 'i2': 4, 'i3': 6, 'i4': -2, 'i5': 0, 'i6': 4}
+        )
+
+    def test_execute_pipeline__pipeline_wo_nodes_wo_links(self) -> None:
+        executor = CompiledExecutor()
+        catalog = executor.execute_pipeline(
+            Pipeline('p1', tags=['t1']), Catalog('c1', tags=['t1']), []
+        )
+
+        self.assertDictEqual(catalog.items, {})
+
+    def test_execute_pipeline__node_wi_exception(self) -> None:
+        executor = CompiledExecutor()
+
+        with self.assertRaisesRegex(
+            ExecutorError, r'node was not executed by the executor: id == n4'
+        ):
+            _ = executor.execute_pipeline(
+                self._pipeline, self._catalog, [['n4']]
+            )
+
+    def test_execute_pipeline__node_wi_invalid_returns(self) -> None:
+        executor = CompiledExecutor()
+
+        with self.assertRaisesRegex(
+            BuildingError, r'invalid type was found for the returns'
+        ):
+            _ = executor.execute_pipeline(
+                self._pipeline, self._catalog, [['n5']]
+            )
+
+    def test_execute_pipeline__catalog_wo_items(self) -> None:
+        executor = CompiledExecutor()
+
+        with self.assertRaisesRegex(
+            CatalogError, r'id was not found in the _items: id == i1'
+        ):
+            _ = executor.execute_pipeline(
+                self._pipeline, Catalog('c1', tags=['t1']), self._ordering
+            )
+
+    def test_execute_pipeline__eviction_eq_true(self) -> None:
+        executor = CompiledExecutor(eviction=True, kept_ids=['i3'])
+        catalog = executor.execute_pipeline(
+            self._pipeline, self._catalog, self._ordering
+        )
+
+        self.assertDictEqual(catalog.items, {'i3': 6, 'i5': 0, 'i6': 4})
+
+    def test_execute_pipeline__eviction_eq_true__targets_wi_ids(self) -> None:
+        executor = CompiledExecutor(eviction=True)
+        catalog = executor.execute_pipeline(
+            self._pipeline, self._catalog, self._ordering, 
+            targets=['i3', 'i6']
+        )
+
+        self.assertDictEqual(catalog.items, {'i3': 6, 'i5': 0, 'i6': 4})
+
+    def test_execute_pipeline__targets_wi_producers(self) -> None:
+        executor = CompiledExecutor()
+        catalog = executor.execute_pipeline(
+            self._pipeline, self._catalog, self._ordering, targets=['i4']
+        )
+
+        self.assertDictEqual(
+            catalog.items, {'i1': 2, 'i2': 4, 'i4': -2, 'i5': 0}
+        )
+
+    def test_execute_plan__plan_wi_steps(self) -> None:
+        executor = CompiledExecutor()
+        plan = compile_pipeline(self._pipeline, self._ordering)
+        catalog1 = executor.execute_plan(
+            plan, Catalog('c1', items={'i1': 2, 'i2': 4})
+        )
+        catalog2 = executor.execute_plan(
+            plan, Catalog('c2', items={'i1': 4, 'i2': 2})
+        )
+
+        self.assertEqual(catalog1.get_item('i6'), 4)
+        self.assertEqual(catalog2.get_item('i6'), 8)
+
+    def test_get_plan__pipeline_wi_plan(self) -> None:
+        executor = CompiledExecutor()
+        plan1 = executor.get_plan(self._pipeline, self._ordering)
+        plan2 = executor.get_plan(self._pipeline, self._ordering)
+        self._pipeline.delete_link('l1')
+        plan3 = executor.get_plan(self._pipeline, self._ordering)
+
+        self.assertIs(plan1, plan2)
+        self.assertIsNot(plan1, plan3)
+
+
+class TestGeneratedExecutor(TestCase):
+    def setUp(self) -> None:
+        self._pipeline = Pipeline('p1', tags=['t1'])
+        self._pipeline.add_node(
+            'n1', 
+            add_args, 
+            pos_inputs=['i1', 'i2'], 
+            outputs=['i3'], 
+            tags=['t1']
+        )
+        self._pipeline.add_node(
+            'n2', 
+            sub_args, 
+            pos_inputs=['i1'], 
+            key_inputs={'p2': 'i2'}, 
+            outputs=['i4', 'i5'], 
+            tags=['t2']
+        )
+        self._pipeline.add_node(
+            'n3', 
+            add_args, 
+            pos_inputs=['i3', 'i4'], 
+            outputs=['i6'], 
+            tags=['t3']
+        )
+        self._pipeline.add_node(
+            'n4', 
+            raise_error, 
+            tags=['t4']
+        )
+        self._pipeline.add_node(
+            'n5', 
+            lambda: 2, 
+            outputs=['i7', 'i8'], 
+            tags=['t5']
+        )
+
+        self._pipeline.add_link('l1', 'n1', 'n3')
+        self._pipeline.add_link('l2', 'n2', 'n3')
+
+        self._catalog = Catalog('c1', tags=['t1'])
+        self._catalog.set_item('i1', 2)
+        self._catalog.set_item('i2', 4)
+
+        self._ordering = [['n1', 'n2'], ['n3']]
+
+    def test_execute_pipeline__pipeline_wi_nodes_wi_links(self) -> None:
+        executor = GeneratedExecutor()
+        catalog = executor.execute_pipeline(
+            self._pipeline, self._catalog, self._ordering
+        )
+
+        self.assertDictEqual(
+            catalog.items, 
+            {'i1': 2, 'i2': 4, 'i3': 6, 'i4': -2, 'i5': 0, 'i6': 4}
+        )
+
+    def test_execute_pipeline__pipeline_wo_nodes_wo_links(self) -> None:
+        executor = GeneratedExecutor()
+        catalog = executor.execute_pipeline(
+            Pipeline('p1', tags=['t1']), Catalog('c1', tags=['t1']), []
+        )
+
+        self.assertDictEqual(catalog.items, {})
+
+    def test_execute_pipeline__node_wi_exception(self) -> None:
+        executor = GeneratedExecutor()
+
+        with self.assertRaisesRegex(
+            ExecutorError, r'node was not executed by the executor: id == n4'
+        ):
+            _ = executor.execute_pipeline(
+                self._pipeline, self._catalog, [['n4']]
+            )
+
+    def test_execute_pipeline__catalog_wo_items(self) -> None:
+        executor = GeneratedExecutor()
+
+        with self.assertRaisesRegex(
+            CatalogError, r'id was not found in the _items: id == i1'
+        ):
+            _ = executor.execute_pipeline(
+                self._pipeline, Catalog('c1', tags=['t1']), self._ordering
+            )
+
+    def test_execute_pipeline__eviction_eq_true(self) -> None:
+        executor = GeneratedExecutor(eviction=True, kept_ids=['i3'])
+        catalog = executor.execute_pipeline(
+            self._pipeline, self._catalog, self._ordering
+        )
+
+        self.assertDictEqual(catalog.items, {'i3': 6, 'i5': 0, 'i6': 4})
+
+    def test_execute_pipeline__eviction_eq_true__targets_wi_ids(self) -> None:
+        executor = GeneratedExecutor(eviction=True)
+        catalog = executor.execute_pipeline(
+            self._pipeline, self._catalog, self._ordering, 
+            targets=['i3', 'i6']
+        )
+
+        self.assertDictEqual(catalog.items, {'i3': 6, 'i5': 0, 'i6': 4})
+
+    def test_execute_pipeline__targets_wi_producers(self) -> None:
+        executor = GeneratedExecutor()
+        catalog = executor.execute_pipeline(
+            self._pipeline, self._catalog, self._ordering, targets=['i4']
+        )
+
+        self.assertDictEqual(
+            catalog.items, {'i1': 2, 'i2': 4, 'i4': -2, 'i5': 0}
+        )
+
+    def test_get_function__pipeline_wi_function(self) -> None:
+        executor = GeneratedExecutor()
+        function1 = executor.get_function(self._pipeline, self._ordering)
+        function2 = executor.get_function(self._pipeline, self._ordering)
+        function3 = executor.get_function(self._pipeline, [['n1']])
+
+        self.assertIs(function1, function2)
+        self.assertIsNot(function1, function3)
+
+    def test_get_function__pipeline_wi_added_node(self) -> None:
+        executor = GeneratedExecutor()
+        function1 = executor.get_function(self._pipeline, [['n1']])
+        self._pipeline.delete_node('n1')
+        self._pipeline.add_node(
+            'n1', sub_args, pos_inputs=['i1', 'i2'], outputs=['i3']
+        )
+        function2 = executor.get_function(self._pipeline, [['n1']])
+        catalog = function2(Catalog('c1', items={'i1': 2, 'i2': 4}))
+
+        self.assertIsNot(function1, function2)
+        self.assertEqual(catalog.get_item('i3'), [-2, 0])
+
+    def test_get_function__eviction_wi_changes(self) -> None:
+        executor = GeneratedExecutor()
+        _ = executor.execute_pipeline(
+            self._pipeline, Catalog('c1', items={'i1': 2, 'i2': 4}), 
+            self._ordering
+        )
+        executor.eviction = True
+        executor.kept_ids = ['i3']
+        catalog = executor.execute_pipeline(
+            self._pipeline, self._catalog, self._ordering
+        )
+
+        self.assertDictEqual(catalog.items, {'i3': 6, 'i5': 0, 'i6': 4})
+
+
+class TestAsyncExecutor(TestCase):
+    def setUp(self) -> None:
+        self._pipeline = Pipeline('p1', tags=['t1'])
+        self._pipeline.add_node(
+            'n1', 
+            add_args_async, 
+            pos_inputs=['i1', 'i2'], 
+            outputs=['i3'], 
+            tags=['t1']
+        )
+        self._pipeline.add_node(
+            'n2', 
+            sub_args, 
+            pos_inputs=['i1'], 
+            key_inputs={'p2': 'i2'}, 
+            outputs=['i4', 'i5'], 
+            tags=['t2']
+        )
+        self._pipeline.add_node(
+            'n3', 
+            add_args_async, 
+            pos_inputs=['i3', 'i4'], 
+            outputs=['i6'], 
+            tags=['t3']
+        )
+        self._pipeline.add_node(
+            'n4', 
+            raise_error_async, 
+            tags=['t4']
+        )
+
+        self._pipeline.add_link('l1', 'n1', 'n3')
+        self._pipeline.add_link('l2', 'n2', 'n3')
+
+        self._catalog = Catalog('c1', tags=['t1'])
+        self._catalog.set_item('i1', 2)
+        self._catalog.set_item('i2', 4)
+
+        self._ordering = [['n1', 'n2'], ['n3']]
+
+    def test_init__args_eq_types(self) -> None:
+        executor = AsyncExecutor(
+            max_tasks=2, priority='critical_path', costs={'n1': 2}
+        )
+
+        self.assertEqual(executor._max_tasks, 2)
+        self.assertEqual(executor._priority, 'critical_path')
+        self.assertDictEqual(executor._costs, {'n1': 2})
+
+    def test_execute_pipeline__pipeline_wi_nodes_wi_links(self) -> None:
+        executor = AsyncExecutor()
+        catalog = executor.execute_pipeline(
+            self._pipeline, self._catalog, self._ordering
+        )
+
+        self.assertDictEqual(
+            catalog.items, 
+            {'i1': 2, 'i2': 4, 'i3': 6, 'i4': -2, 'i5': 0, 'i6': 4}
+        )
+
+    def test_execute_pipeline__pipeline_wo_nodes_wo_links(self) -> None:
+        executor = AsyncExecutor()
+        catalog = executor.execute_pipeline(
+            Pipeline('p1', tags=['t1']), Catalog('c1', tags=['t1']), []
+        )
+
+        self.assertDictEqual(catalog.items, {})
+
+    def test_execute_pipeline__node_wi_exception(self) -> None:
+        executor = AsyncExecutor()
+
+        with self.assertRaisesRegex(
+            ExecutorError, r'node was not executed by the executor: id == n4'
+        ):
+            _ = executor.execute_pipeline(
+                self._pipeline, self._catalog, [['n4', 'n1']]
+            )
+
+    def test_execute_pipeline__nodes_wi_concurrent_tasks(self) -> None:
+        pipeline = Pipeline('p1')
+
+        for i in range(50):
+            pipeline.add_node(
+                f'n{i}', sleep_async, pos_inputs=['i1'], outputs=[f'o{i}']
+            )
+
+        start = perf_counter()
+        catalog = AsyncExecutor(max_tasks=25).execute_pipeline(
+            pipeline, Catalog('c1', items={'i1': 0.2}), [list(pipeline.nodes)]
+        )
+
+        self.assertLess(perf_counter() - start, 2)
+        self.assertEqual(len(catalog.items), 51)
+
+    def test_execute_pipeline__eviction_eq_true(self) -> None:
+        executor = AsyncExecutor(eviction=True, kept_ids=['i6'])
+        catalog = executor.execute_pipeline(
+            self._pipeline, self._catalog, self._ordering
+        )
+
+        self.assertDictEqual(catalog.items, {'i5': 0, 'i6': 4})
+
+    def test_execute_pipeline__targets_wi_producers(self) -> None:
+        executor = AsyncExecutor()
+        catalog = executor.execute_pipeline(
+            self._pipeline, 
+            self._catalog, 
+            [['n1', 'n2', 'n4'], ['n3']], 
+            targets=['i3']
+        )
+
+        self.assertDictEqual(catalog.items, {'i1': 2, 'i2': 4, 'i3': 6})
+
+    def test_execute_pipeline_async__loop_wi_running_state(self) -> None:
+        async def execute_pipeline() -> Catalog:
+            executor = AsyncExecutor()
+            catalog = await executor.execute_pipeline_async(
+                self._pipeline, self._catalog, self._ordering
+            )
+
+            return catalog
+
+        loop = asyncio.new_event_loop()
+
+        try:
+            catalog = loop.run_until_complete(execute_pipeline())
+        finally:
+            loop.close()
+
+        self.assertEqual(catalog.get_item('i6'), 4)
+
+
+global_calls = []
+
+
+def add_args(p1: int, p2: int) -> int:
+    return p1 + p2
+
+
+def sub_args(p1: int, p2: int = 0) -> list:
+    return [p1 - p2, 0]
+
+
+def get_pid_args(p1: int) -> list:
+    return [p1, os.getpid()]
+
+
+def raise_error() -> None:
+    raise ValueError('error text')
+
+
+class Scaler:
+    def __init__(self, factor: int) -> None:
+        self.factor = factor
+
+    def scale(self, p1: int) -> int:
+        return p1 * self.factor
+
+
+def find_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('localhost', 0))
+
+        return sock.getsockname()[1]
+
+
+async def add_args_async(p1: int, p2: int) -> int:
+    await asyncio.sleep(0)
+
+    return p1 + p2
+
+
+async def sleep_async(p1: float) -> float:
+    await asyncio.sleep(p1)
+
+    return p1
+
+
+async def raise_error_async() -> None:
+    raise ValueError('error text')
@@ -0,0 +1,117 @@
+import traceback
+from unittest import TestCase
+
+from ipipeline.control.compiling import compile_pipeline
+from ipipeline.control.generating import generate_function, generate_source
+from ipipeline.exceptions import BuildingError, ExecutorError
+from ipipeline.structure.catalog import Catalog
+from ipipeline.structure.pipeline import Pipeline
+
+
+class TestGenerateSource(TestCase):
+    def setUp(self) -> None:
+        self._pipeline = Pipeline('p1', tags=['t1'])
+        self._pipeline.add_node(
+            'n1', 
+            lambda p1, p2: p1 + p2, 
+            pos_inputs=['i1', 'i2'], 
+            outputs=['i3'], 
+            tags=['t1']
+        )
+        self._pipeline.add_node(
+            'n2', 
+            lambda p1, **p2: [p1, p2], 
+            pos_inputs=['i3'], 
+            key_inputs={'p2': 'i1', 'class': 'i2'}, 
+            outputs=['i4', 'i5'], 
+            tags=['t2']
+        )
+        self._pipeline.add_link('l1', 'n1', 'n2')
+
+        self._plan = compile_pipeline(self._pipeline, [['n1'], ['n2']])
+
+    def test_generate_source__eviction_eq_false(self) -> None:
+        source = generate_source(self._plan)
+
+        self.assertIn('    v2 = t0(v0, v1)\n', source)
+        self.assertIn(
+            '        returns = t1(v2, p2=v0, **{\'class\': v1})\n', source
+        )
+        self.assertIn('    v3, v4 = returns\n', source)
+        self.assertIn('    catalog.set_item(\'i3\', v2)\n', source)
+        self.assertNotIn('del', source)
+
+    def test_generate_source__eviction_eq_true(self) -> None:
+        source = generate_source(self._plan, eviction=True, kept_ids=['i1'])
+
+        self.assertIn('    del v1\n', source)
+        self.assertIn('    del v2\n', source)
+        self.assertNotIn('    del v0\n', source)
+        self.assertNotIn('    catalog.set_item(\'i3\', v2)\n', source)
+        self.assertIn('        catalog.delete_item(\'i2\')\n', source)
+
+
+class TestGenerateFunction(TestCase):
+    def setUp(self) -> None:
+        self._pipeline = Pipeline('p1', tags=['t1'])
+        self._pipeline.add_node(
+            'n1', 
+            lambda p1, p2: p1 + p2, 
+            pos_inputs=['i1', 'i2'], 
+            outputs=['i3'], 
+            tags=['t1']
+        )
+        self._pipeline.add_node(
+            'n2', 
+            lambda p1, p2: [p1 - p2, 0], 
+            pos_inputs=['i3'], 
+            key_inputs={'p2': 'i1'}, 
+            outputs=['i4', 'i5'], 
+            tags=['t2']
+        )
+        self._pipeline.add_node(
+            'n3', 
+            lambda: [][0], 
+            tags=['t3']
+        )
+        self._pipeline.add_node(
+            'n4', 
+            lambda: 2, 
+            outputs=['i6', 'i7'], 
+            tags=['t4']
+        )
+        self._pipeline.add_link('l1', 'n1', 'n2')
+
+    def test_generate_function__plan_wi_steps(self) -> None:
+        function = generate_function(
+            compile_pipeline(self._pipeline, [['n1'], ['n2']])
+        )
+        catalog = function(Catalog('c1', items={'i1': 2, 'i2': 4}))
+
+        self.assertDictEqual(
+            catalog.items, {'i1': 2, 'i2': 4, 'i3': 6, 'i4': 4, 'i5': 0}
+        )
+
+    def test_generate_function__node_wi_exception(self) -> None:
+        function = generate_function(
+            compile_pipeline(self._pipeline, [['n3']])
+        )
+
+        with self.assertRaisesRegex(
+            ExecutorError, r'node was not executed by the executor: id == n3'
+        ) as context:
+            _ = function(Catalog('c1'))
+
+        lines = traceback.format_tb(context.exception.__cause__.__traceback__)
+
+        self.assertIn('t0()', ''.join(lines))
+
+    def test_generate_function__node_wi_invalid_returns(self) -> None:
+        function = generate_function(
+            compile_pipeline(self._pipeline, [['n4']])
+        )
+
+        with self.assertRaisesRegex(
+            BuildingError, r'invalid type was found for the returns'
+        ):
+            _ = function(Catalog('c1'))
@@ -0,0 +1,265 @@
+import json
+import os
+import pickle
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase, skipIf
+
+from ipipeline.control.executors import SequentialExecutor
+from ipipeline.control.loading import (
+    build_spec, load_spec, parse_spec, tomllib
+)
+from ipipeline.exceptions import (
+    BuildingError, InfoError, LoadingError, PipelineError, SortingError
+)
+from ipipeline.structure.link import Link
+from ipipeline.structure.node import Node
+
+
+class TestLoadSpec(TestCase):
+    def setUp(self) -> None:
+        self._temp_dir = TemporaryDirectory()
+        self._path = Path(self._temp_dir.name) / 'p1.json'
+        self._cache_path = Path(self._temp_dir.name) / '.p1.json.cache'
+        self._spec = {
+            'id': 'p1', 
+            'nodes': [
+                {
+                    'id': 'n1', 
+                    'task': 'tests.control.test_loading:add', 
+                    'pos_inputs': ['i1', 'i2'], 
+                    'outputs': ['i3']
+                }, 
+                {
+                    'id': 'n2', 
+                    'task': 'tests.control.test_loading:add', 
+                    'pos_inputs': ['i3'], 
+                    'key_inputs': {'p2': 'i1'}, 
+                    'outputs': ['i4']
+                }
+            ], 
+            'links': [{'id': 'l1', 'src_id': 'n1', 'dst_id': 'n2'}], 
+            'catalog': {'id': 'c1', 'items': {'i1': 2, 'i2': 4}}
+        }
+        self._path.write_text(json.dumps(self._spec))
+
+    def tearDown(self) -> None:
+        self._temp_dir.cleanup()
+
+    def test_load_spec__path_wi_spec(self) -> None:
+        pipeline, catalog, ordering = load_spec(str(self._path))
+        catalog = SequentialExecutor().execute_pipeline(
+            pipeline, catalog, ordering
+        )
+
+        self.assertListEqual(list(pipeline.nodes.keys()), ['n1', 'n2'])
+        self.assertEqual(pipeline.get_link('l1').src_id, 'n1')
+        self.assertEqual(catalog.id, 'c1')
+        self.assertEqual(catalog.get_item('i4'), 8)
+        self.assertListEqual(ordering, [['n1'], ['n2']])
+        self.assertTrue(self._cache_path.exists())
+
+    def test_load_spec__spec_wi_same_mtime(self) -> None:
+        _ = load_spec(str(self._path))
+        stat = self._path.stat()
+        self._path.write_text(' ' * stat.st_size)
+        os.utime(self._path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        pipeline, _, _ = load_spec(str(self._path))
+
+        self.assertListEqual(list(pipeline.nodes.keys()), ['n1', 'n2'])
+
+    def test_load_spec__spec_wi_same_digest(self) -> None:
+        _ = load_spec(str(self._path))
+        stat = self._path.stat()
+        os.utime(self._path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+        cache_data = self._cache_path.read_bytes()
+        pipeline, _, _ = load_spec(str(self._path))
+
+        self.assertListEqual(list(pipeline.nodes.keys()), ['n1', 'n2'])
+        self.assertNotEqual(self._cache_path.read_bytes(), cache_data)
+
+    def test_load_spec__spec_wi_changes(self) -> None:
+        _ = load_spec(str(self._path))
+        self._spec['nodes'].pop()
+        self._spec['links'].clear()
+        self._path.write_text(json.dumps(self._spec, indent=4))
+        pipeline, _, _ = load_spec(str(self._path))
+
+        self.assertListEqual(list(pipeline.nodes.keys()), ['n1'])
+
+    def test_load_spec__spec_wi_circular_links(self) -> None:
+        self._spec['links'].append(
+            {'id': 'l2', 'src_id': 'n2', 'dst_id': 'n1'}
+        )
+        self._path.write_text(json.dumps(self._spec))
+
+        with self.assertRaisesRegex(
+            SortingError, r'circular dependency was found in the graph'
+        ):
+            _ = load_spec(str(self._path))
+
+        self.assertFalse(self._cache_path.exists())
+
+    def test_load_spec__spec_wi_duplicate_links(self) -> None:
+        self._spec['links'].append(
+            {'id': 'l2', 'src_id': 'n1', 'dst_id': 'n2'}
+        )
+        self._path.write_text(json.dumps(self._spec))
+
+        with self.assertRaisesRegex(
+            BuildingError, 
+            r'dst_id was found in the graph\[link.src_id\]: dst_id == n2'
+        ):
+            _ = load_spec(str(self._path))
+
+    def test_load_spec__spec_wi_ordered_pipeline(self) -> None:
+        self._spec['ordered'] = True
+        self._path.write_text(json.dumps(self._spec))
+        pipeline, _, ordering = load_spec(str(self._path))
+
+        self.assertTrue(pipeline.ordered)
+        self.assertListEqual(ordering, [['n1'], ['n2']])
+
+    def test_load_spec__cache_wo_ordering(self) -> None:
+        _ = load_spec(str(self._path))
+        entry = pickle.loads(self._cache_path.read_bytes())
+        del entry['ordering']
+        self._cache_path.write_bytes(pickle.dumps(entry))
+        _, _, ordering = load_spec(str(self._path))
+
+        self.assertListEqual(ordering, [['n1'], ['n2']])
+
+    def test_load_spec__cache_eq_false(self) -> None:
+        _ = load_spec(str(self._path), cache=False)
+
+        self.assertFalse(self._cache_path.exists())
+
+    def test_load_spec__path_wo_spec(self) -> None:
+        with self.assertRaisesRegex(
+            LoadingError, r'spec was not found in the path: path == *'
+        ):
+            _ = load_spec(str(self._path.with_name('p2.json')))
+
+
+class TestParseSpec(TestCase):
+    def test_parse_spec__suffix_eq_json(self) -> None:
+        spec = parse_spec(b'{"id": "p1", "nodes": []}', '.json')
+
+        self.assertDictEqual(spec, {'id': 'p1', 'nodes': []})
+
+    @skipIf(tomllib is None, 'tomllib was not found')
+    def test_parse_spec__suffix_eq_toml(self) -> None:
+        spec = parse_spec(
+            b'id = "p1"\n\n[[nodes]]\nid = "n1"\ntask = "m1:f1"\n', '.toml'
+        )
+
+        self.assertDictEqual(
+            spec, {'id': 'p1', 'nodes': [{'id': 'n1', 'task': 'm1:f1'}]}
+        )
+
+    def test_parse_spec__suffix_ne_formats(self) -> None:
+        with self.assertRaisesRegex(
+            LoadingError, 
+            r'suffix was not found in the formats: suffix == .yaml'
+        ):
+            _ = parse_spec(b'', '.yaml')
+
+    def test_parse_spec__data_wi_syntax_error(self) -> None:
+        with self.assertRaisesRegex(
+            LoadingError, r'spec was not parsed by the loader: error == *'
+        ):
+            _ = parse_spec(b'{"id": ', '.json')
+
+
+class TestBuildSpec(TestCase):
+    def test_build_spec__spec_wi_nodes_wi_links(self) -> None:
+        pipeline, catalog = build_spec({
+            'id': 'p1', 
+            'tags': ['t1'], 
+            'ordered': True, 
+            'nodes': [
+                {'id': 'n1', 'task': 'm1:f1', 'outputs': ['i1']}, 
+                {'id': 'n2', 'task': 'm1:f2', 'tags': ['t2']}
+            ], 
+            'links': [{'id': 'l1', 'src_id': 'n1', 'dst_id': 'n2'}]
+        })
+
+        self.assertDictEqual(
+            vars(pipeline.get_node('n1')), 
+            vars(Node('n1', 'm1:f1', outputs=['i1']))
+        )
+        self.assertDictEqual(
+            vars(pipeline.get_node('n2')), 
+            vars(Node('n2', 'm1:f2', tags=['t2']))
+        )
+        self.assertDictEqual(
+            vars(pipeline.get_link('l1')), vars(Link('l1', 'n1', 'n2'))
+        )
+        self.assertListEqual(pipeline.tags, ['t1'])
+        self.assertListEqual(pipeline.order.get_ids(), ['n1', 'n2'])
+        self.assertEqual(catalog.id, 'p1')
+        self.assertDictEqual(catalog.items, {})
+
+    def test_build_spec__spec_wi_invalid_id(self) -> None:
+        with self.assertRaisesRegex(
+            InfoError, r'id did not match the pattern: id == n 1'
+        ):
+            _ = build_spec(
+                {'id': 'p1', 'nodes': [{'id': 'n 1', 'task': 'm1:f1'}]}
+            )
+
+    def test_build_spec__spec_wi_invalid_type(self) -> None:
+        with self.assertRaisesRegex(
+            InfoError, r'id did not match the pattern: id == 1'
+        ):
+            _ = build_spec({'id': 'p1', 'nodes': [{'id': 1, 'task': 'm1:f1'}]})
+
+    def test_build_spec__spec_wi_duplicate_ids(self) -> None:
+        with self.assertRaisesRegex(
+            PipelineError, r'id was found in the _nodes: id == n1'
+        ):
+            _ = build_spec({
+                'id': 'p1', 
+                'nodes': [
+                    {'id': 'n1', 'task': 'm1:f1'}, 
+                    {'id': 'n1', 'task': 'm1:f2'}
+                ]
+            })
+
+    def test_build_spec__spec_wi_invalid_task(self) -> None:
+        with self.assertRaisesRegex(
+            LoadingError, 
+            r'colon was not found in the task: task == \'m1.f1\''
+        ):
+            _ = build_spec(
+                {'id': 'p1', 'nodes': [{'id': 'n1', 'task': 'm1.f1'}]}
+            )
+
+    def test_build_spec__spec_wi_unknown_key(self) -> None:
+        with self.assertRaisesRegex(
+            LoadingError, r'key was not found in the keys: key == inputs'
+        ):
+            _ = build_spec({
+                'id': 'p1', 
+                'nodes': [{'id': 'n1', 'task': 'm1:f1', 'inputs': ['i1']}]
+            })
+
+    def test_build_spec__spec_wo_key(self) -> None:
+        with self.assertRaisesRegex(
+            LoadingError, r'task was not found in the node: node == *'
+        ):
+            _ = build_spec({'id': 'p1', 'nodes': [{'id': 'n1'}]})
+
+    def test_build_spec__link_wo_node(self) -> None:
+        with self.assertRaisesRegex(
+            LoadingError, r'dst_id was not found in the nodes: dst_id == n2'
+        ):
+            _ = build_spec({
+                'id': 'p1', 
+                'nodes': [{'id': 'n1', 'task': 'm1:f1'}], 
+                'links': [{'id': 'l1', 'src_id': 'n1', 'dst_id': 'n2'}]
+            })
+
+
+def add(p1: int, p2: int) -> int:
+    return p1 + p2
@@ -0,0 +1,138 @@
+from unittest import TestCase
+
+from ipipeline.control.building import build_graph
+from ipipeline.control.executors import SequentialExecutor
+from ipipeline.control.optimizing import optimize_pipeline
+from ipipeline.control.sorting import sort_topology
+from ipipeline.structure.catalog import Catalog
+from ipipeline.structure.pipeline import Pipeline
+
+
+class TestOptimizePipeline(TestCase):
+    def setUp(self) -> None:
+        self._calls = []
+
+        def add(p1: int, p2: int) -> int:
+            self._calls.append('add')
+
+            return p1 + p2
+
+        def mul(p1: int, p2: int) -> int:
+            self._calls.append('mul')
+
+            return p1 * p2
+
+        self._add = add
+        self._mul = mul
+        self._pipeline = Pipeline('p1', tags=['t1'])
+        self._pipeline.add_node(
+            'n1', add, pos_inputs=['i1', 'i2'], outputs=['i3']
+        )
+        self._pipeline.add_node(
+            'n2', add, pos_inputs=['i1', 'i2'], outputs=['i4']
+        )
+        self._pipeline.add_node(
+            'n3', mul, pos_inputs=['i3', 'i1'], outputs=['i5']
+        )
+        self._pipeline.add_node(
+            'n4', mul, pos_inputs=['i4', 'i1'], outputs=['i6']
+        )
+        self._pipeline.add_node(
+            'n5', add, pos_inputs=['i5', 'i6'], outputs=['i7']
+        )
+        self._pipeline.add_node(
+            'n6', mul, pos_inputs=['i2', 'i2'], outputs=['i8']
+        )
+        self._pipeline.add_link('l1', 'n1', 'n3')
+        self._pipeline.add_link('l2', 'n2', 'n4')
+        self._pipeline.add_link('l3', 'n3', 'n5')
+        self._pipeline.add_link('l4', 'n4', 'n5')
+
+    def _get_ordering(self, pipeline: Pipeline) -> list:
+        return sort_topology(build_graph(pipeline))
+
+    def test_optimize_pipeline__pipeline_wi_duplicate_nodes(self) -> None:
+        pipeline = optimize_pipeline(
+            self._pipeline, self._get_ordering(self._pipeline)
+        )
+
+        self.assertListEqual(
+            list(pipeline.nodes.keys()), ['n1', 'n6', 'n3', 'n5']
+        )
+        self.assertListEqual(pipeline.nodes['n5'].pos_inputs, ['i5', 'i5'])
+        self.assertDictEqual(
+            {id: (link.src_id, link.dst_id)
+             for id, link in pipeline.links.items()}, 
+            {'l1': ('n1', 'n3'), 'l3': ('n3', 'n5')}
+        )
+        self.assertEqual(len(self._pipeline.nodes), 6)
+        self.assertEqual(len(self._pipeline.links), 4)
+
+    def test_optimize_pipeline__pipeline_wi_dead_nodes(self) -> None:
+        pipeline = optimize_pipeline(
+            self._pipeline, self._get_ordering(self._pipeline), outputs=['i3']
+        )
+
+        self.assertListEqual(list(pipeline.nodes.keys()), ['n1'])
+        self.assertDictEqual(pipeline.links, {})
+
+    def test_optimize_pipeline__pipeline_wi_output_duplicates(self) -> None:
+        pipeline = optimize_pipeline(
+            self._pipeline, 
+            self._get_ordering(self._pipeline), 
+            outputs=['i3', 'i4']
+        )
+
+        self.assertListEqual(list(pipeline.nodes.keys()), ['n1', 'n2'])
+
+    def test_optimize_pipeline__pipeline_wi_side_effect_nodes(self) -> None:
+        self._pipeline.add_node(
+            'n7', self._add, pos_inputs=['i1', 'i2'], tags=['side_effect']
+        )
+        self._pipeline.add_node(
+            'n8', self._add, pos_inputs=['i1', 'i2'], tags=['side_effect']
+        )
+        pipeline = optimize_pipeline(
+            self._pipeline, self._get_ordering(self._pipeline), outputs=['i3']
+        )
+
+        self.assertListEqual(list(pipeline.nodes.keys()), ['n1', 'n7', 'n8'])
+
+    def test_optimize_pipeline__pipeline_wi_different_links(self) -> None:
+        self._pipeline.add_link('l5', 'n6', 'n2')
+        pipeline = optimize_pipeline(
+            self._pipeline, self._get_ordering(self._pipeline)
+        )
+
+        self.assertListEqual(
+            list(pipeline.nodes.keys()), ['n1', 'n6', 'n3', 'n2', 'n4', 'n5']
+        )
+
+    def test_optimize_pipeline__pipeline_wi_execution(self) -> None:
+        catalog = Catalog('c1', items={'i1': 2, 'i2': 3})
+        executor = SequentialExecutor()
+        executor.execute_pipeline(
+            self._pipeline, catalog, self._get_ordering(self._pipeline)
+        )
+        items = dict(catalog.items)
+        calls_qty = len(self._calls)
+
+        self._calls.clear()
+        catalog = Catalog('c2', items={'i1': 2, 'i2': 3})
+        pipeline = optimize_pipeline(
+            self._pipeline, self._get_ordering(self._pipeline)
+        )
+        executor.execute_pipeline(
+            pipeline, catalog, self._get_ordering(pipeline)
+        )
+
+        self.assertEqual(catalog.items['i7'], items['i7'])
+        self.assertEqual(catalog.items['i8'], items['i8'])
+        self.assertEqual(calls_qty, 6)
+        self.assertEqual(len(self._calls), 4)
+
+    def test_optimize_pipeline__pipeline_wo_nodes(self) -> None:
+        pipeline = optimize_pipeline(Pipeline('p1', ordered=True), [])
+
+        self.assertDictEqual(pipeline.nodes, {})
+        self.assertTrue(pipeline.ordered)
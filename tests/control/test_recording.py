@@ -0,0 +1,193 @@
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from ipipeline.control.recording import Record, load_record
+from ipipeline.exceptions import CacheError, RecordError
+
+
+def add_args(p1: int, p2: int) -> int:
+    return p1 + p2
+
+
+def sub_args(p1: int, p2: int) -> int:
+    return p1 - p2
+
+
+class Items(list):
+    pass
+
+
+class TestRecord(TestCase):
+    def setUp(self) -> None:
+        self._record = Record()
+        self._fingerprints = {
+            'i1': self._record.fingerprint_item('i1', 2), 
+            'i2': self._record.fingerprint_item('i2', 4)
+        }
+
+    def test_init__args_eq_types(self) -> None:
+        record = Record()
+
+        self.assertDictEqual(record._nodes, {})
+        self.assertDictEqual(record._refs, {})
+        self.assertDictEqual(record._fingerprints, {})
+
+    def test_fingerprint_item__item_eq_item(self) -> None:
+        item = Items([2, 4])
+        fingerprint1 = self._record.fingerprint_item('i3', item)
+        item.append(6)
+        fingerprint2 = self._record.fingerprint_item('i3', item)
+
+        self.assertEqual(fingerprint1, fingerprint2)
+
+    def test_fingerprint_item__item_wo_weak_refs(self) -> None:
+        item = [2, 4]
+        fingerprint1 = self._record.fingerprint_item('i3', item)
+        item.append(6)
+        fingerprint2 = self._record.fingerprint_item('i3', item)
+
+        self.assertNotEqual(fingerprint1, fingerprint2)
+        self.assertNotIn('i3', self._record._refs)
+
+    def test_fingerprint_item__item_ne_item(self) -> None:
+        fingerprint1 = self._record.fingerprint_item('i3', [2, 4])
+        fingerprint2 = self._record.fingerprint_item('i3', [2, 4, 6])
+
+        self.assertNotEqual(fingerprint1, fingerprint2)
+
+    def test_fingerprint_item__item_wi_unpicklable_item(self) -> None:
+        with self.assertRaisesRegex(
+            CacheError, r'item was not pickled by the cache: error == '
+        ):
+            _ = self._record.fingerprint_item('i3', lambda: None)
+
+    def test_get_items__node_wi_entry(self) -> None:
+        _ = self._record.set_items(
+            'n1', add_args, self._fingerprints, {'i3': 6}
+        )
+        items = self._record.get_items(
+            'n1', add_args, self._fingerprints, ['i3'], {'i3': 6}
+        )
+
+        self.assertDictEqual(items, {'i3': 6})
+
+    def test_get_items__node_wi_alive_outputs(self) -> None:
+        item = Items([6])
+        _ = self._record.set_items(
+            'n1', add_args, self._fingerprints, {'i3': item}
+        )
+        items = self._record.get_items(
+            'n1', add_args, self._fingerprints, ['i3']
+        )
+
+        self.assertIs(items['i3'], item)
+
+    def test_get_items__node_wo_outputs(self) -> None:
+        _ = self._record.set_items(
+            'n1', add_args, self._fingerprints, {'i3': Items([6])}
+        )
+        items = self._record.get_items(
+            'n1', add_args, self._fingerprints, ['i3']
+        )
+
+        self.assertIsNone(items)
+
+    def test_get_items__node_wi_changed_held_outputs(self) -> None:
+        _ = self._record.set_items(
+            'n1', add_args, self._fingerprints, {'i3': 6}
+        )
+        items = self._record.get_items(
+            'n1', add_args, self._fingerprints, ['i3'], {'i3': 7}
+        )
+
+        self.assertIsNone(items)
+
+    def test_get_items__node_wo_entry(self) -> None:
+        items = self._record.get_items(
+            'n1', add_args, self._fingerprints, ['i3']
+        )
+
+        self.assertIsNone(items)
+
+    def test_get_items__node_wi_changed_task(self) -> None:
+        _ = self._record.set_items(
+            'n1', add_args, self._fingerprints, {'i3': 6}
+        )
+        items = self._record.get_items(
+            'n1', sub_args, self._fingerprints, ['i3']
+        )
+
+        self.assertIsNone(items)
+
+    def test_get_items__node_wi_changed_inputs(self) -> None:
+        _ = self._record.set_items(
+            'n1', add_args, self._fingerprints, {'i3': 6}
+        )
+        self._fingerprints['i2'] = self._record.fingerprint_item('i2', 5)
+        items = self._record.get_items(
+            'n1', add_args, self._fingerprints, ['i3']
+        )
+
+        self.assertIsNone(items)
+
+    def test_get_items__node_wi_changed_outputs(self) -> None:
+        _ = self._record.set_items(
+            'n1', add_args, self._fingerprints, {'i3': 6}
+        )
+        items = self._record.get_items(
+            'n1', add_args, self._fingerprints, ['i4']
+        )
+
+        self.assertIsNone(items)
+
+    def test_set_items__items_eq_items(self) -> None:
+        changed1 = self._record.set_items(
+            'n1', add_args, self._fingerprints, {'i3': 6}
+        )
+        changed2 = self._record.set_items(
+            'n1', add_args, self._fingerprints, {'i3': 6}
+        )
+
+        self.assertTrue(changed1)
+        self.assertFalse(changed2)
+
+    def test_delete_node__node_wi_entry(self) -> None:
+        _ = self._record.set_items(
+            'n1', add_args, self._fingerprints, {'i3': 6}
+        )
+        self._record.delete_node('n1')
+
+        self.assertDictEqual(self._record.nodes, {})
+
+    def test_dump__path_wi_file(self) -> None:
+        _ = self._record.set_items(
+            'n1', add_args, self._fingerprints, {'i3': 6}
+        )
+
+        with TemporaryDirectory() as path:
+            self._record.dump(str(Path(path) / 'record.pkl'))
+            record = load_record(str(Path(path) / 'record.pkl'))
+
+        items = record.get_items(
+            'n1', add_args, self._fingerprints, ['i3'], {'i3': 6}
+        )
+
+        self.assertDictEqual(items, {'i3': 6})
+        self.assertDictEqual(record._refs, {})
+
+
+class TestLoadRecord(TestCase):
+    def test_load_record__path_wo_file(self) -> None:
+        with TemporaryDirectory() as path:
+            with self.assertRaisesRegex(
+                RecordError, r'record was not found in the path: path == '
+            ):
+                _ = load_record(str(Path(path) / 'record.pkl'))
+
+    def test_load_record__path_wi_corrupt_file(self) -> None:
+        with TemporaryDirectory() as path:
+            (Path(path) / 'record.pkl').write_bytes(b'\x80')
+            record = load_record(str(Path(path) / 'record.pkl'))
+
+        self.assertDictEqual(record.nodes, {})
@@ -0,0 +1,141 @@
+from unittest import TestCase
+
+from ipipeline.control.scheduling import (
+    LevelScheduler, ReadyScheduler, compute_critical_paths
+)
+from ipipeline.exceptions import SortingError
+
+
+class TestLevelScheduler(TestCase):
+    def test_init__ordering_wi_groups(self) -> None:
+        scheduler = LevelScheduler([['n1', 'n2'], ['n3']])
+
+        self.assertListEqual(
+            scheduler._ready_ids, [(0, 0, 'n1'), (0, 1, 'n2')]
+        )
+        self.assertEqual(scheduler._pending_qty, 3)
+        self.assertEqual(scheduler._running_qty, 2)
+
+    def test_init__ordering_wo_groups(self) -> None:
+        scheduler = LevelScheduler([])
+
+        self.assertFalse(scheduler.check_pending())
+        self.assertFalse(scheduler.check_ready())
+
+    def test_pop_ready__scheduler_wi_priorities(self) -> None:
+        scheduler = LevelScheduler(
+            [['n1', 'n2', 'n3'], ['n4']], priorities={'n2': 3, 'n3': 2}
+        )
+
+        self.assertEqual(scheduler.pop_ready(), 'n2')
+        self.assertEqual(scheduler.pop_ready(), 'n3')
+        self.assertEqual(scheduler.pop_ready(), 'n1')
+
+    def test_release__group_wi_pending_nodes(self) -> None:
+        scheduler = LevelScheduler([['n1', 'n2'], ['n3']])
+        _ = scheduler.pop_ready()
+        _ = scheduler.pop_ready()
+        scheduler.release('n1')
+
+        self.assertFalse(scheduler.check_ready())
+        self.assertTrue(scheduler.check_pending())
+
+    def test_release__group_wo_pending_nodes(self) -> None:
+        scheduler = LevelScheduler([['n1', 'n2'], ['n3']])
+        _ = scheduler.pop_ready()
+        _ = scheduler.pop_ready()
+        scheduler.release('n2')
+        scheduler.release('n1')
+
+        self.assertEqual(scheduler.pop_ready(), 'n3')
+
+        scheduler.release('n3')
+
+        self.assertFalse(scheduler.check_pending())
+
+
+class TestReadyScheduler(TestCase):
+    def setUp(self) -> None:
+        self._graph = {
+            'n1': ['n3'], 'n2': ['n4'], 'n3': ['n5'], 'n4': ['n5'], 'n5': []
+        }
+
+    def test_init__graph_wi_src_ids_wi_dst_ids(self) -> None:
+        scheduler = ReadyScheduler(self._graph)
+
+        self.assertListEqual(
+            scheduler._ready_ids, [(0, 0, 'n1'), (0, 1, 'n2')]
+        )
+        self.assertEqual(scheduler._pending_qty, 5)
+
+    def test_init__graph_wo_src_ids_wi_dst_ids(self) -> None:
+        with self.assertRaisesRegex(
+            SortingError, r'dst_id was not set as a src_id: dst_id == n2'
+        ):
+            _ = ReadyScheduler({'n1': ['n2']})
+
+    def test_pop_ready__scheduler_wi_priorities(self) -> None:
+        scheduler = ReadyScheduler(self._graph, priorities={'n1': 1, 'n2': 2})
+
+        self.assertEqual(scheduler.pop_ready(), 'n2')
+
+        scheduler.release('n2')
+        scheduler.push_ready('n6')
+
+        self.assertEqual(scheduler.pop_ready(), 'n1')
+        self.assertEqual(scheduler.pop_ready(), 'n4')
+        self.assertEqual(scheduler.pop_ready(), 'n6')
+
+    def test_release__node_wi_pending_groupmates(self) -> None:
+        scheduler = ReadyScheduler(self._graph)
+        _ = scheduler.pop_ready()
+        _ = scheduler.pop_ready()
+        scheduler.release('n2')
+
+        self.assertEqual(scheduler.pop_ready(), 'n4')
+        self.assertFalse(scheduler.check_ready())
+
+    def test_release__node_wi_pending_sources(self) -> None:
+        scheduler = ReadyScheduler(self._graph)
+
+        for id in ['n1', 'n2', 'n3']:
+            _ = scheduler.pop_ready()
+            scheduler.release(id)
+
+        self.assertEqual(scheduler.pop_ready(), 'n4')
+        self.assertFalse(scheduler.check_ready())
+
+        scheduler.release('n4')
+
+        self.assertEqual(scheduler.pop_ready(), 'n5')
+
+        scheduler.release('n5')
+
+        self.assertFalse(scheduler.check_pending())
+
+
+class TestComputeCriticalPaths(TestCase):
+    def test_compute_critical_paths__graph_wi_costs(self) -> None:
+        paths = compute_critical_paths(
+            {
+                'n1': ['n3'], 'n2': ['n4'], 'n3': ['n5'], 'n4': ['n5'], 
+                'n5': []
+            }, 
+            costs={'n1': 2, 'n4': 10, 'n5': 0.5}
+        )
+
+        self.assertDictEqual(
+            paths, {'n1': 3.5, 'n2': 11.5, 'n3': 1.5, 'n4': 10.5, 'n5': 0.5}
+        )
+
+    def test_compute_critical_paths__graph_wo_costs(self) -> None:
+        paths = compute_critical_paths(
+            {'n1': ['n2', 'n3'], 'n2': ['n4'], 'n3': [], 'n4': []}
+        )
+
+        self.assertDictEqual(paths, {'n1': 3, 'n2': 2, 'n3': 1, 'n4': 1})
+
+    def test_compute_critical_paths__graph_wo_nodes(self) -> None:
+        paths = compute_critical_paths({})
+
+        self.assertDictEqual(paths, {})
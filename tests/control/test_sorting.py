@@ -1,7 +1,11 @@
+from array import array
 from unittest import TestCase
 
 from ipipeline.control.sorting import (
-    sort_topology, _get_incomings_qty, _get_unbound_ids
+    sort_compact_topology, 
+    sort_topology, 
+    _get_incomings_qty, 
+    _get_unbound_ids
 )
 from ipipeline.exceptions import SortingError
 
@@ -50,6 +54,68 @@ class TestSortTopology(TestCase):
         )
 
 
+class TestSortCompactTopology(TestCase):
+    def setUp(self) -> None:
+        self._ids = ['n1', 'n2', 'n3', 'n4', 'n5', 'n6', 'n7', 'n8', 'n9']
+
+    def test_sort_compact_topology__graph_wi_linear_topology_wi_cycle(
+        self
+    ) -> None:
+        with self.assertRaisesRegex(
+            SortingError, 
+            r'circular dependency was found in the graph: '
+            r'incomings_qty == {\'n2\': 1, \'n3\': 1, \'n4\': 1}'
+        ):
+            _ = sort_compact_topology(
+                self._ids[:4], 
+                array('l', [0, 1, 2, 3, 4]), 
+                array('l', [1, 2, 3, 1])
+            )
+
+    def test_sort_compact_topology__graph_wi_linear_topology_wo_cycle(
+        self
+    ) -> None:
+        ordering = sort_compact_topology(
+            self._ids[:4], array('l', [0, 1, 2, 3, 3]), array('l', [1, 2, 3])
+        )
+
+        self.assertListEqual(ordering, [['n1'], ['n2'], ['n3'], ['n4']])
+
+    def test_sort_compact_topology__graph_wo_linear_topology_wi_cycle(
+        self
+    ) -> None:
+        with self.assertRaisesRegex(
+            SortingError, 
+            r'circular dependency was found in the graph: '
+            r'incomings_qty == {\'n3\': 1, \'n4\': 1, \'n6\': 2, \'n7\': 1, '
+            r'\'n8\': 1, \'n9\': 1}'
+        ):
+            _ = sort_compact_topology(
+                self._ids, 
+                array('l', [0, 3, 4, 5, 9, 10, 11, 12, 12, 12]), 
+                array('l', [2, 3, 5, 4, 5, 2, 5, 6, 7, 7, 3, 8])
+            )
+
+    def test_sort_compact_topology__graph_wo_linear_topology_wo_cycle(
+        self
+    ) -> None:
+        ordering = sort_compact_topology(
+            self._ids, 
+            array('l', [0, 3, 4, 5, 9, 10, 10, 11, 11, 11]), 
+            array('l', [2, 3, 5, 4, 5, 2, 5, 6, 7, 7, 8])
+        )
+
+        self.assertListEqual(
+            ordering, 
+            [['n1', 'n2'], ['n4', 'n5'], ['n3', 'n7', 'n8'], ['n6', 'n9']]
+        )
+
+    def test_sort_compact_topology__graph_wo_nodes(self) -> None:
+        ordering = sort_compact_topology([], array('l', [0]), array('l'))
+
+        self.assertListEqual(ordering, [])
+
+
 class TestGetIncomingsQty(TestCase):
     def test_get_incomings_qty__graph_wi_src_ids_wi_dst_ids(self) -> None:
         incomings_qty = _get_incomings_qty(
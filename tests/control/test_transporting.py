@@ -0,0 +1,173 @@
+from unittest import TestCase, skipIf
+
+from ipipeline.control.transporting import (
+    SharedItem, SharedTransport, close_blocks, dump_item, load_item, numpy
+)
+from ipipeline.exceptions import TransportError
+
+
+class TestSharedTransport(TestCase):
+    def setUp(self) -> None:
+        self._transport = SharedTransport(min_size=8)
+
+    def tearDown(self) -> None:
+        self._transport.release()
+
+    def test_init__args_eq_types(self) -> None:
+        transport = SharedTransport(min_size=8)
+
+        self.assertEqual(transport._min_size, 8)
+        self.assertDictEqual(transport._blocks, {})
+
+    def test_export_args__args_wi_large_items(self) -> None:
+        item = b'ab' * 8
+        pos_args, key_args = self._transport.export_args(
+            ['i1', 'i2'], {'p1': 'i1'}, [item, b'a'], {'p1': item}
+        )
+
+        self.assertIsInstance(pos_args[0], SharedItem)
+        self.assertEqual(pos_args[1], b'a')
+        self.assertIs(key_args['p1'], pos_args[0])
+        self.assertListEqual(list(self._transport._blocks), ['i1'])
+
+    def test_export_args__items_wi_changes(self) -> None:
+        pos_args, _ = self._transport.export_args(
+            ['i1'], {}, [b'ab' * 8], {}
+        )
+        new_pos_args, _ = self._transport.export_args(
+            ['i1'], {}, [b'cd' * 8], {}
+        )
+
+        self.assertNotEqual(new_pos_args[0].name, pos_args[0].name)
+        self.assertEqual(load_item(new_pos_args[0], []), b'cd' * 8)
+
+        with self.assertRaisesRegex(
+            TransportError, r'name was not found in the shared memory'
+        ):
+            _ = load_item(pos_args[0], [])
+
+    def test_export_args__args_wo_large_items(self) -> None:
+        pos_args, key_args = self._transport.export_args(
+            ['i1', 'i2'], {'p1': 'i3'}, [1, 'a' * 16], {'p1': b'a'}
+        )
+
+        self.assertListEqual(pos_args, [1, 'a' * 16])
+        self.assertDictEqual(key_args, {'p1': b'a'})
+        self.assertDictEqual(self._transport._blocks, {})
+
+    def test_import_items__items_wi_shared_items(self) -> None:
+        shared_item, _ = dump_item(bytearray(b'ab' * 8), 8)
+        items = self._transport.import_items({'i1': shared_item, 'i2': 2})
+        pos_args, _ = self._transport.export_args(
+            ['i1'], {}, [items['i1']], {}
+        )
+
+        self.assertDictEqual(items, {'i1': bytearray(b'ab' * 8), 'i2': 2})
+        self.assertIs(pos_args[0], shared_item)
+
+    def test_import_items__items_wi_memoryview(self) -> None:
+        item = memoryview(bytearray(range(16))).cast('H', [2, 4])
+        shared_item, _ = dump_item(item, 8)
+        items = self._transport.import_items({'i1': shared_item})
+        self._transport.release_items(['i1'])
+
+        self.assertListEqual(items['i1'].tolist(), item.tolist())
+        self.assertTrue(items['i1'].readonly)
+        self.assertDictEqual(self._transport._blocks, {})
+
+    def test_import_items__items_wo_blocks(self) -> None:
+        shared_item, block = dump_item(b'ab' * 8, 8)
+        block.unlink()
+
+        with self.assertRaisesRegex(
+            TransportError, 
+            r'name was not found in the shared memory: '
+            rf'name == {shared_item.name}'
+        ):
+            _ = self._transport.import_items({'i1': shared_item})
+
+    def test_release_items__items_wi_blocks(self) -> None:
+        pos_args, _ = self._transport.export_args(
+            ['i1', 'i2'], {}, [b'ab' * 8, b'cd' * 8], {}
+        )
+        self._transport.release_items(['i1', 'i3'])
+
+        self.assertListEqual(list(self._transport._blocks), ['i2'])
+        self.assertEqual(load_item(pos_args[1], []), b'cd' * 8)
+
+        with self.assertRaisesRegex(
+            TransportError, r'name was not found in the shared memory'
+        ):
+            _ = load_item(pos_args[0], [])
+
+    def test_release__transport_wi_blocks(self) -> None:
+        pos_args, _ = self._transport.export_args(
+            ['i1'], {}, [b'ab' * 8], {}
+        )
+        self._transport.release()
+
+        self.assertDictEqual(self._transport._blocks, {})
+
+        with self.assertRaisesRegex(
+            TransportError, r'name was not found in the shared memory'
+        ):
+            _ = load_item(pos_args[0], [])
+
+    def test_repr__transport_wo_blocks(self) -> None:
+        self.assertEqual(
+            repr(self._transport), 'SharedTransport(min_size=8)'
+        )
+
+
+class TestDumpItem(TestCase):
+    def test_dump_item__item_wi_large_size(self) -> None:
+        shared_item, block = dump_item(b'ab' * 8, 8)
+        block.unlink()
+
+        self.assertEqual(shared_item.name, block.name)
+        self.assertEqual(shared_item.kind, 'bytes')
+        self.assertEqual(shared_item.size, 16)
+
+    def test_dump_item__item_wi_small_size(self) -> None:
+        self.assertTupleEqual(dump_item(b'ab', 8), (b'ab', None))
+
+    def test_dump_item__item_wi_unsupported_type(self) -> None:
+        self.assertTupleEqual(dump_item('ab' * 8, 8), ('ab' * 8, None))
+
+
+class TestLoadItem(TestCase):
+    def test_load_item__item_wi_memoryview(self) -> None:
+        item = memoryview(bytearray(range(16))).cast('H', [2, 4])
+        shared_item, block = dump_item(item, 8)
+        blocks = []
+        loaded_item = load_item(shared_item, blocks)
+
+        self.assertListEqual(loaded_item.tolist(), item.tolist())
+        self.assertTrue(loaded_item.readonly)
+
+        loaded_item.release()
+        close_blocks(blocks)
+        block.unlink()
+
+    def test_load_item__item_wo_shared_item(self) -> None:
+        blocks = []
+
+        self.assertEqual(load_item(b'ab', blocks), b'ab')
+        self.assertListEqual(blocks, [])
+
+    @skipIf(numpy is None, 'numpy was not found')
+    def test_load_item__item_wi_ndarray(self) -> None:
+        item = numpy.arange(12, dtype='<f8').reshape(3, 4).T
+        shared_item, block = dump_item(item, 8)
+        blocks = []
+        loaded_item = load_item(shared_item, blocks)
+        copied_item = load_item(shared_item, blocks, copy=True)
+
+        self.assertTrue(numpy.array_equal(loaded_item, item))
+        self.assertFalse(loaded_item.flags.writeable)
+        self.assertTrue(numpy.array_equal(copied_item, item))
+        self.assertTrue(copied_item.flags.writeable)
+
+        del loaded_item
+        close_blocks(blocks)
+        block.unlink()
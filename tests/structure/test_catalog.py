@@ -1,7 +1,11 @@
+from pathlib import Path
+from shutil import rmtree
+from tempfile import mkdtemp
+from threading import Lock
 from unittest import TestCase
 
 from ipipeline.exceptions import CatalogError
-from ipipeline.structure.catalog import Catalog
+from ipipeline.structure.catalog import BudgetCatalog, Catalog, measure_item
 
 
 class TestCatalog(TestCase):
@@ -83,3 +87,182 @@ class TestCatalog(TestCase):
             CatalogError, r'id was not found in the _items: id == i1'
         ):
             catalog.delete_item('i1')
+
+
+class Buffer:
+    def __init__(self, nbytes: int) -> None:
+        self.nbytes = nbytes
+
+
+class UnpicklableBuffer(Buffer):
+    reduces_qty = 0
+
+    def __reduce__(self) -> tuple:
+        UnpicklableBuffer.reduces_qty += 1
+
+        raise TypeError('buffer was not pickled')
+
+
+class TestBudgetCatalog(TestCase):
+    def setUp(self) -> None:
+        self._path = mkdtemp()
+        self._items = {'i1': Buffer(600), 'i2': b'2' * 600}
+
+    def tearDown(self) -> None:
+        rmtree(self._path, ignore_errors=True)
+
+    def test_init__args_eq_types(self) -> None:
+        catalog = BudgetCatalog(
+            'c1', 1000, path=self._path, items=self._items, tags=['t1']
+        )
+
+        self.assertEqual(catalog._id, 'c1')
+        self.assertEqual(catalog._budget, 1000)
+        self.assertEqual(catalog._path, self._path)
+        self.assertListEqual(list(catalog._items), ['i2'])
+        self.assertListEqual(list(catalog._spills), ['i1'])
+        self.assertListEqual(catalog._tags, ['t1'])
+
+    def test_get_item__id_eq_spilled_id(self) -> None:
+        catalog = BudgetCatalog(
+            'c1', 1000, path=self._path, items=self._items
+        )
+        item = catalog.get_item('i1')
+
+        self.assertEqual(item.nbytes, 600)
+        self.assertFalse(catalog.check_spill('i1'))
+        self.assertTrue(catalog.check_spill('i2'))
+        self.assertEqual(len(list(Path(self._path).iterdir())), 1)
+
+    def test_get_item__id_ne_id(self) -> None:
+        catalog = BudgetCatalog('c1', 1000, path=self._path)
+
+        with self.assertRaisesRegex(
+            CatalogError, r'id was not found in the _items: id == i1'
+        ):
+            _ = catalog.get_item('i1')
+
+    def test_set_item__size_le_budget(self) -> None:
+        catalog = BudgetCatalog('c1', 2000, path=self._path)
+        catalog.set_item('i1', Buffer(600))
+        catalog.set_item('i2', Buffer(600))
+
+        self.assertEqual(catalog.size, 1200)
+        self.assertDictEqual(catalog._spills, {})
+
+    def test_set_item__size_gt_budget(self) -> None:
+        catalog = BudgetCatalog('c1', 1000, path=self._path)
+        catalog.set_item('i1', Buffer(600))
+        catalog.set_item('i2', Buffer(600))
+        catalog.set_item('i3', Buffer(300))
+
+        self.assertEqual(catalog.size, 900)
+        self.assertTrue(catalog.check_item('i1'))
+        self.assertTrue(catalog.check_spill('i1'))
+        self.assertFalse(catalog.check_spill('i2'))
+
+    def test_set_item__items_wi_unpicklable_items(self) -> None:
+        lock = Lock()
+        catalog = BudgetCatalog('c1', 1000, path=self._path)
+        catalog.set_item('i1', lock)
+        catalog.set_item('i2', Buffer(600))
+        catalog.set_item('i3', Buffer(600))
+
+        self.assertIs(catalog.get_item('i1'), lock)
+        self.assertFalse(catalog.check_spill('i1'))
+        self.assertTrue(catalog.check_spill('i2'))
+        self.assertEqual(
+            catalog.size, 
+            sum(catalog._sizes.values()) + sum(catalog._pinned_sizes.values())
+        )
+        self.assertEqual(len(list(Path(self._path).iterdir())), 1)
+
+    def test_set_item__items_wi_pinned_items(self) -> None:
+        UnpicklableBuffer.reduces_qty = 0
+        catalog = BudgetCatalog('c1', 1000, path=self._path)
+        catalog.set_item('i1', UnpicklableBuffer(600))
+        catalog.set_item('i2', Buffer(300))
+        catalog.set_item('i3', Buffer(300))
+        catalog.set_item('i4', Buffer(300))
+
+        self.assertEqual(UnpicklableBuffer.reduces_qty, 1)
+        self.assertListEqual(list(catalog._pinned_sizes), ['i1'])
+        self.assertTrue(catalog.check_spill('i2'))
+        self.assertEqual(catalog.size, 900)
+
+        catalog.delete_item('i1')
+
+        self.assertDictEqual(catalog._pinned_sizes, {})
+        self.assertEqual(catalog.size, 300)
+
+    def test_set_item__id_eq_spilled_id(self) -> None:
+        catalog = BudgetCatalog(
+            'c1', 1000, path=self._path, items=self._items
+        )
+        catalog.set_item('i1', 8)
+
+        self.assertFalse(catalog.check_spill('i1'))
+        self.assertEqual(catalog.get_item('i1'), 8)
+        self.assertEqual(len(list(Path(self._path).iterdir())), 0)
+
+    def test_delete_item__id_eq_spilled_id(self) -> None:
+        catalog = BudgetCatalog(
+            'c1', 1000, path=self._path, items=self._items
+        )
+        catalog.delete_item('i1')
+        catalog.delete_item('i2')
+
+        self.assertEqual(catalog.size, 0)
+        self.assertDictEqual(catalog.items, {})
+        self.assertEqual(len(list(Path(self._path).iterdir())), 0)
+
+    def test_delete_item__id_ne_id(self) -> None:
+        catalog = BudgetCatalog('c1', 1000, path=self._path)
+
+        with self.assertRaisesRegex(
+            CatalogError, r'id was not found in the _items: id == i1'
+        ):
+            catalog.delete_item('i1')
+
+    def test_items__items_wi_spills(self) -> None:
+        catalog = BudgetCatalog(
+            'c1', 1000, path=self._path, items=self._items
+        )
+
+        self.assertListEqual(sorted(catalog.items), ['i1', 'i2'])
+        self.assertTrue(catalog.check_spill('i1'))
+
+    def test_budget__budget_lt_size(self) -> None:
+        catalog = BudgetCatalog('c1', 2000, path=self._path, items=self._items)
+        catalog.budget = 100
+
+        self.assertTrue(catalog.check_spill('i1'))
+        self.assertFalse(catalog.check_spill('i2'))
+
+    def test_finalize__path_eq_none(self) -> None:
+        catalog = BudgetCatalog('c1', 100, items=self._items)
+        path = Path(catalog.path)
+
+        self.assertTrue(path.exists())
+
+        catalog._finalizer()
+
+        self.assertFalse(path.exists())
+
+
+class TestMeasureItem(TestCase):
+    def testmeasure_item__item_wi_nbytes(self) -> None:
+        size = measure_item(Buffer(600))
+
+        self.assertEqual(size, 600)
+
+    def testmeasure_item__item_wo_nbytes(self) -> None:
+        size = measure_item({'k1': [b'1' * 600, b'2' * 600]})
+
+        self.assertGreater(size, 1200)
+
+    def testmeasure_item__item_wi_shared_objects(self) -> None:
+        data = b'1' * 600
+        size = measure_item([data, data])
+
+        self.assertLess(size, 1200)
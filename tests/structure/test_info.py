@@ -1,7 +1,7 @@
 from unittest import TestCase
 
 from ipipeline.exceptions import InfoError
-from ipipeline.structure.info import Info
+from ipipeline.structure.info import Info, check_ids
 
 
 class TestInfo(TestCase):
@@ -11,6 +11,11 @@ class TestInfo(TestCase):
         self.assertEqual(info._id, 'i1')
         self.assertListEqual(info._tags, ['t1', 't2'])
 
+    def test_init__checked_eq_true(self) -> None:
+        info = Info('i1!', checked=True)
+
+        self.assertEqual(info._id, 'i1!')
+
     def test_get__args_eq_types(self) -> None:
         info = Info('i1', tags=['t1', 't2'])
 
@@ -55,8 +60,42 @@ class TestInfo(TestCase):
         ):
             _ = info._check_id(None)
 
+    def test_check_id__id_ne_str(self) -> None:
+        info = Info('i1')
+
+        with self.assertRaisesRegex(
+            InfoError, r'id did not match the pattern: id == 1'
+        ):
+            _ = info._check_id(1)
+
     def test_repr(self) -> None:
         info = Info('i1', tags=['t1', 't2'])
         repr = info.__repr__()
 
         self.assertEqual(repr, 'Info(id=\'i1\', tags=[\'t1\', \'t2\'])')
+
+
+class TestCheckIds(TestCase):
+    def test_check_ids__ids_eq_pattern(self) -> None:
+        check_ids(['i1', 'i2_-.', 'i3'])
+
+    def test_check_ids__ids_eq_empty(self) -> None:
+        check_ids([])
+
+    def test_check_ids__ids_ne_pattern(self) -> None:
+        with self.assertRaisesRegex(
+            InfoError, r'id did not match the pattern: id == i2!'
+        ):
+            check_ids(['i1', 'i2!', 'i3'])
+
+    def test_check_ids__ids_wi_line_break(self) -> None:
+        with self.assertRaisesRegex(
+            InfoError, r'id did not match the pattern: id == i1\ni2'
+        ):
+            check_ids(['i1\ni2', 'i3'])
+
+    def test_check_ids__ids_ne_str(self) -> None:
+        with self.assertRaisesRegex(
+            InfoError, r'id did not match the pattern: id == 1'
+        ):
+            check_ids(['i1', 1])
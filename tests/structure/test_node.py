@@ -1,5 +1,6 @@
 from unittest import TestCase
 
+from ipipeline.exceptions import InstanceError
 from ipipeline.structure.node import Node
 
 
@@ -63,3 +64,29 @@ class TestNode(TestCase):
         self.assertDictEqual(node.key_inputs, {'i2': 4})
         self.assertListEqual(node.outputs, ['o2'])
         self.assertListEqual(node.tags, ['t2'])
+
+    def test_get__task_eq_ref(self) -> None:
+        node = Node('n1', 'tests.structure.test_node:add')
+
+        self.assertEqual(node._task, 'tests.structure.test_node:add')
+        self.assertEqual(node.task_ref, 'tests.structure.test_node:add')
+        self.assertIs(node.task, add)
+
+    def test_get__task_ne_ref(self) -> None:
+        node = Node('n1', self._tasks[0])
+
+        self.assertIsNone(node.task_ref)
+
+    def test_get__task_wi_invalid_ref(self) -> None:
+        node = Node('n1', 'tests.structure.test_node.add')
+
+        with self.assertRaisesRegex(
+            InstanceError, 
+            r'colon was not found in the ref: '
+            r'ref == tests.structure.test_node.add'
+        ):
+            _ = node.task
+
+
+def add(p1: int, p2: int) -> int:
+    return p1 + p2
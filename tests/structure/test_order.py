@@ -0,0 +1,150 @@
+from unittest import TestCase
+
+from ipipeline.exceptions import OrderError
+from ipipeline.structure.order import Order
+
+
+class TestOrder(TestCase):
+    def setUp(self) -> None:
+        self._order = Order()
+
+        for id in ['n1', 'n2', 'n3', 'n4']:
+            self._order.set_node(id)
+
+    def test_init__args_eq_types(self) -> None:
+        order = Order()
+
+        self.assertDictEqual(order._positions, {})
+        self.assertDictEqual(order._successors, {})
+        self.assertDictEqual(order._predecessors, {})
+        self.assertEqual(order._next_position, 0)
+
+    def test_get__positions(self) -> None:
+        self.assertDictEqual(
+            self._order.positions, {'n1': 0, 'n2': 1, 'n3': 2, 'n4': 3}
+        )
+
+    def test_set_node__id_wi_positions(self) -> None:
+        with self.assertRaisesRegex(
+            OrderError, r'id was found in the _positions: id == n1'
+        ):
+            self._order.set_node('n1')
+
+    def test_set_node__id_wo_positions(self) -> None:
+        self._order.set_node('n5')
+
+        self.assertEqual(self._order.positions['n5'], 4)
+        self.assertListEqual(self._order._successors['n5'], [])
+        self.assertListEqual(self._order._predecessors['n5'], [])
+
+    def test_delete_node__id_wi_links(self) -> None:
+        self._order.set_link('n1', 'n2')
+
+        with self.assertRaisesRegex(
+            OrderError, r'id was found in a link of the order: id == n2'
+        ):
+            self._order.delete_node('n2')
+
+    def test_delete_node__id_wo_links(self) -> None:
+        self._order.delete_node('n2')
+
+        self.assertListEqual(self._order.get_ids(), ['n1', 'n3', 'n4'])
+
+    def test_delete_node__id_wo_positions(self) -> None:
+        with self.assertRaisesRegex(
+            OrderError, r'id was not found in the _positions: id == n5'
+        ):
+            self._order.delete_node('n5')
+
+    def test_set_link__ids_wo_positions(self) -> None:
+        with self.assertRaisesRegex(
+            OrderError, r'src_id was not found in the _positions: src_id == n5'
+        ):
+            self._order.set_link('n5', 'n1')
+
+        with self.assertRaisesRegex(
+            OrderError, r'dst_id was not found in the _positions: dst_id == n5'
+        ):
+            self._order.set_link('n1', 'n5')
+
+    def test_set_link__ids_wi_forward_positions(self) -> None:
+        self._order.set_link('n1', 'n3')
+
+        self.assertListEqual(self._order.get_ids(), ['n1', 'n2', 'n3', 'n4'])
+
+    def test_set_link__ids_wi_backward_positions(self) -> None:
+        self._order.set_link('n2', 'n3')
+        self._order.set_link('n4', 'n2')
+
+        self.assertListEqual(self._order.get_ids(), ['n1', 'n4', 'n2', 'n3'])
+        self.assertListEqual(self._order._successors['n4'], ['n2'])
+        self.assertListEqual(self._order._predecessors['n2'], ['n4'])
+
+    def test_set_link__ids_wi_cycle(self) -> None:
+        self._order.set_link('n1', 'n2')
+        self._order.set_link('n2', 'n3')
+
+        with self.assertRaisesRegex(
+            OrderError, 
+            r'circular dependency was found in the order: '
+            r'src_id == n3, dst_id == n1'
+        ):
+            self._order.set_link('n3', 'n1')
+
+        self.assertListEqual(self._order.get_ids(), ['n1', 'n2', 'n3', 'n4'])
+        self.assertListEqual(self._order._successors['n3'], [])
+
+    def test_set_link__ids_wi_duplicate(self) -> None:
+        self._order.set_link('n1', 'n2')
+
+        with self.assertRaisesRegex(
+            OrderError, 
+            r'dst_id was found in the _successors\[src_id\]: '
+            r'src_id == n1, dst_id == n2'
+        ):
+            self._order.set_link('n1', 'n2')
+
+        self.assertListEqual(self._order._successors['n1'], ['n2'])
+
+    def test_set_link__ids_wi_self_cycle(self) -> None:
+        with self.assertRaisesRegex(
+            OrderError, 
+            r'circular dependency was found in the order: '
+            r'src_id == n1, dst_id == n1'
+        ):
+            self._order.set_link('n1', 'n1')
+
+    def test_delete_link__ids_wi_links(self) -> None:
+        self._order.set_link('n1', 'n2')
+        self._order.delete_link('n1', 'n2')
+        self._order.set_link('n2', 'n1')
+
+        self.assertListEqual(self._order.get_ids(), ['n2', 'n1', 'n3', 'n4'])
+
+    def test_delete_link__ids_wo_links(self) -> None:
+        with self.assertRaisesRegex(
+            OrderError, 
+            r'dst_id was not found in the _successors\[src_id\]: '
+            r'src_id == n1, dst_id == n2'
+        ):
+            self._order.delete_link('n1', 'n2')
+
+    def test_get_ordering__order_wi_links(self) -> None:
+        self._order.set_link('n4', 'n3')
+        self._order.set_link('n3', 'n1')
+        self._order.set_link('n4', 'n2')
+
+        self.assertListEqual(
+            self._order.get_ordering(), [['n4'], ['n2', 'n3'], ['n1']]
+        )
+
+    def test_get_ordering__order_wo_links(self) -> None:
+        self.assertListEqual(
+            self._order.get_ordering(), [['n1', 'n2', 'n3', 'n4']]
+        )
+
+    def test_get_ordering__order_wo_nodes(self) -> None:
+        self.assertListEqual(Order().get_ordering(), [])
+
+    def test_repr__order_wo_nodes(self) -> None:
+        self.assertEqual(repr(Order()), 'Order()')
@@ -1,6 +1,6 @@
 from unittest import TestCase
 
-from ipipeline.exceptions import PipelineError
+from ipipeline.exceptions import OrderError, PipelineError
 from ipipeline.structure.link import Link
 from ipipeline.structure.node import Node
 from ipipeline.structure.pipeline import Pipeline
@@ -21,6 +21,8 @@ class TestPipeline(TestCase):
         self.assertDictEqual(pipeline._nodes, self._nodes)
         self.assertDictEqual(pipeline._links, self._links)
         self.assertListEqual(pipeline._tags, ['t1'])
+        self.assertFalse(pipeline._ordered)
+        self.assertIsNone(pipeline._order)
 
     def test_get__args_eq_types(self) -> None:
         pipeline = Pipeline(
@@ -197,3 +199,270 @@ class TestPipeline(TestCase):
         self.assertListEqual(
             [link.id for link in pipeline.links.values()], ['l1']
         )
+
+    def test_fingerprint__pipelines_eq_structures(self) -> None:
+        pipeline1 = Pipeline('p1', nodes=self._nodes, links=self._links)
+        pipeline2 = Pipeline('p2', nodes=self._nodes, links=self._links)
+
+        self.assertEqual(pipeline1.fingerprint, pipeline2.fingerprint)
+
+    def test_fingerprint__pipeline_wi_added_node(self) -> None:
+        pipeline = Pipeline('p1', nodes=dict(self._nodes))
+        fingerprint = pipeline.fingerprint
+        pipeline.add_node('n3', self._task[0], outputs=['i1'])
+
+        self.assertNotEqual(pipeline.fingerprint, fingerprint)
+
+    def test_fingerprint__pipeline_wi_deleted_node(self) -> None:
+        pipeline = Pipeline('p1', nodes=dict(self._nodes))
+        fingerprint = pipeline.fingerprint
+        pipeline.delete_node('n2')
+
+        self.assertNotEqual(pipeline.fingerprint, fingerprint)
+
+    def test_fingerprint__pipeline_wi_added_link(self) -> None:
+        pipeline = Pipeline('p1', nodes=self._nodes)
+        fingerprint = pipeline.fingerprint
+        pipeline.add_link('l1', 'n1', 'n2')
+
+        self.assertNotEqual(pipeline.fingerprint, fingerprint)
+
+    def test_fingerprint__pipeline_wi_deleted_link(self) -> None:
+        pipeline = Pipeline('p1', nodes=self._nodes, links=dict(self._links))
+        fingerprint = pipeline.fingerprint
+        pipeline.delete_link('l1')
+
+        self.assertNotEqual(pipeline.fingerprint, fingerprint)
+
+    def test_fingerprint__pipeline_wi_task_refs(self) -> None:
+        pipeline1 = Pipeline('p1')
+        pipeline1.add_node('n1', 'tests.structure.test_:add')
+        pipeline2 = Pipeline('p2')
+        pipeline2.add_node('n1', 'tests.structure.test_:add')
+
+        self.assertEqual(pipeline1.fingerprint, pipeline2.fingerprint)
+
+    def test_fingerprint__pipelines_wi_diff_tasks(self) -> None:
+        pipeline1 = Pipeline('p1')
+        pipeline1.add_node('n1', lambda: 2)
+        pipeline2 = Pipeline('p2')
+        pipeline2.add_node('n1', lambda: 4)
+
+        self.assertEqual(pipeline1.fingerprint, pipeline2.fingerprint)
+
+    def test_fingerprint__pipeline_wi_ordered(self) -> None:
+        pipeline = Pipeline('p1', nodes=dict(self._nodes))
+        fingerprint = pipeline.fingerprint
+        pipeline.ordered = True
+
+        self.assertNotEqual(pipeline.fingerprint, fingerprint)
+
+    def test_order__pipeline_wi_ordered(self) -> None:
+        pipeline = Pipeline(
+            'p1', nodes=dict(self._nodes), links=dict(self._links), 
+            ordered=True
+        )
+
+        self.assertListEqual(pipeline.order.get_ids(), ['n1', 'n2'])
+
+    def test_order__pipeline_wo_ordered(self) -> None:
+        pipeline = Pipeline('p1', nodes=self._nodes, links=self._links)
+
+        self.assertIsNone(pipeline.order)
+
+    def test_order__pipeline_wi_replaced_links(self) -> None:
+        pipeline = Pipeline(
+            'p1', nodes=dict(self._nodes), links=dict(self._links), 
+            ordered=True
+        )
+        order = pipeline.order
+        pipeline.links = {'l2': Link('l2', 'n2', 'n1')}
+
+        self.assertIsNot(pipeline.order, order)
+        self.assertListEqual(pipeline.order.get_ids(), ['n2', 'n1'])
+
+    def test_set_node__pipeline_wi_ordered(self) -> None:
+        pipeline = Pipeline('p1', nodes=dict(self._nodes), ordered=True)
+        pipeline.add_node('n3', None)
+        pipeline.add_link('l1', 'n3', 'n1')
+
+        self.assertListEqual(pipeline.order.get_ids(), ['n3', 'n2', 'n1'])
+
+    def test_delete_node__pipeline_wi_ordered(self) -> None:
+        pipeline = Pipeline(
+            'p1', nodes=dict(self._nodes), links=dict(self._links), 
+            ordered=True
+        )
+
+        with self.assertRaisesRegex(
+            OrderError, r'id was found in a link of the order: id == n2'
+        ):
+            pipeline.delete_node('n2')
+
+        pipeline.delete_link('l1')
+        pipeline.delete_node('n2')
+
+        self.assertListEqual(list(pipeline.nodes.keys()), ['n1'])
+        self.assertListEqual(pipeline.order.get_ids(), ['n1'])
+
+    def test_set_link__pipeline_wi_ordered_wi_cycle(self) -> None:
+        pipeline = Pipeline(
+            'p1', nodes=dict(self._nodes), links=dict(self._links), 
+            ordered=True
+        )
+
+        with self.assertRaisesRegex(
+            OrderError, 
+            r'circular dependency was found in the order: '
+            r'src_id == n2, dst_id == n1'
+        ):
+            pipeline.add_link('l2', 'n2', 'n1')
+
+        self.assertListEqual(list(pipeline.links.keys()), ['l1'])
+
+    def test_set_link__pipeline_wi_ordered_wi_duplicate(self) -> None:
+        pipeline = Pipeline(
+            'p1', nodes=dict(self._nodes), links=dict(self._links), 
+            ordered=True
+        )
+
+        with self.assertRaisesRegex(
+            OrderError, 
+            r'dst_id was found in the _successors\[src_id\]: '
+            r'src_id == n1, dst_id == n2'
+        ):
+            pipeline.add_link('l2', 'n1', 'n2')
+
+        self.assertListEqual(list(pipeline.links.keys()), ['l1'])
+
+    def test_set_link__pipeline_wi_ordered_wo_node(self) -> None:
+        pipeline = Pipeline('p1', nodes=dict(self._nodes), ordered=True)
+
+        with self.assertRaisesRegex(
+            OrderError, r'dst_id was not found in the _positions: dst_id == n3'
+        ):
+            pipeline.add_link('l1', 'n1', 'n3')
+
+        self.assertDictEqual(pipeline.links, {})
+
+    def test_tag_index__pipeline_wi_tags(self) -> None:
+        pipeline = Pipeline('p1')
+        pipeline.add_node('n1', None, tags=['t1', 't2'])
+        pipeline.add_node('n2', None, tags=['t2'])
+        pipeline.add_node('n3', None)
+
+        self.assertDictEqual(
+            pipeline.tag_index, {'t1': ['n1'], 't2': ['n1', 'n2']}
+        )
+
+    def test_tag_index__pipeline_wi_deleted_node(self) -> None:
+        pipeline = Pipeline('p1')
+        pipeline.add_node('n1', None, tags=['t1'])
+        pipeline.add_node('n2', None, tags=['t1'])
+        tag_index = pipeline.tag_index
+        pipeline.delete_node('n1')
+
+        self.assertDictEqual(tag_index, {'t1': ['n1', 'n2']})
+        self.assertDictEqual(pipeline.tag_index, {'t1': ['n2']})
+
+    def test_revision__pipeline_wi_changes(self) -> None:
+        pipeline = Pipeline('p1', nodes=dict(self._nodes))
+        pipeline.add_link('l1', 'n1', 'n2')
+        pipeline.delete_link('l1')
+        pipeline.delete_node('n2')
+
+        self.assertEqual(pipeline.revision, 3)
+
+    def test_fingerprint__pipelines_ne_tags(self) -> None:
+        pipeline1 = Pipeline('p1', nodes={'n1': Node('n1', None)})
+        pipeline2 = Pipeline('p1', nodes={'n1': Node('n1', None, tags=['t1'])})
+
+        self.assertNotEqual(pipeline1.fingerprint, pipeline2.fingerprint)
+
+    def test_producers__nodes_wi_distinct_outputs(self) -> None:
+        pipeline = Pipeline('p1')
+        pipeline.add_node('n1', None, outputs=['i1', 'i2'])
+        pipeline.add_node('n2', None, pos_inputs=['i1'], outputs=['i3'])
+
+        self.assertDictEqual(
+            pipeline.producers, {'i1': 'n1', 'i2': 'n1', 'i3': 'n2'}
+        )
+
+    def test_producers__nodes_wi_duplicate_outputs(self) -> None:
+        pipeline = Pipeline('p1')
+        pipeline.add_node('n1', None, outputs=['i1'])
+        pipeline.add_node('n2', None, outputs=['i1'])
+
+        with self.assertRaisesRegex(
+            PipelineError, 
+            r'output was found in the _producers: output == i1, id == n2'
+        ):
+            _ = pipeline.producers
+
+    def test_consumers__nodes_wi_inputs(self) -> None:
+        pipeline = Pipeline('p1')
+        pipeline.add_node('n1', None, pos_inputs=['i1', 'i1'])
+        pipeline.add_node(
+            'n2', None, pos_inputs=['i1'], key_inputs={'p1': 'i2'}
+        )
+        consumers = pipeline.consumers
+        pipeline.add_node('n3', None, pos_inputs=['i2'])
+
+        self.assertDictEqual(consumers, {'i1': ['n1', 'n2'], 'i2': ['n2']})
+        self.assertDictEqual(
+            pipeline.consumers, {'i1': ['n1', 'n2'], 'i2': ['n2', 'n3']}
+        )
+
+    def test_infer_links__nodes_wi_producers(self) -> None:
+        pipeline = Pipeline('p1')
+        pipeline.add_node('n1', None, pos_inputs=['i1'], outputs=['i2'])
+        pipeline.add_node('n2', None, pos_inputs=['i2'], outputs=['i3'])
+        pipeline.add_node(
+            'n3', None, pos_inputs=['i2'], key_inputs={'p1': 'i3'}
+        )
+        pipeline.add_link('l1', 'n1', 'n2')
+        link_ids = pipeline.infer_links(external_ids=['i1'])
+
+        self.assertListEqual(link_ids, ['n1-n3', 'n2-n3'])
+        self.assertListEqual(
+            [(link.src_id, link.dst_id) for link in pipeline.links.values()], 
+            [('n1', 'n2'), ('n1', 'n3'), ('n2', 'n3')]
+        )
+
+    def test_infer_links__nodes_wo_producers(self) -> None:
+        pipeline = Pipeline('p1')
+        pipeline.add_node('n1', None, pos_inputs=['i1'], outputs=['i2'])
+        pipeline.add_node('n2', None, pos_inputs=['i2', 'i3'])
+
+        with self.assertRaisesRegex(
+            PipelineError, 
+            r'input was not found in the _producers: input == i3'
+        ):
+            _ = pipeline.infer_links(external_ids=['i1'])
+
+        self.assertDictEqual(pipeline.links, {})
+        self.assertListEqual(pipeline.infer_links(), ['n1-n2'])
+
+    def test_infer_links__nodes_wi_clashing_ids(self) -> None:
+        pipeline = Pipeline('p1')
+        pipeline.add_node('a-b', None, outputs=['i1'])
+        pipeline.add_node('c', None, pos_inputs=['i1'])
+        pipeline.add_node('a', None, outputs=['i2'])
+        pipeline.add_node('b-c', None, pos_inputs=['i2'])
+        link_ids = pipeline.infer_links()
+
+        self.assertListEqual(link_ids, ['a-b-c', 'a-b-c-2'])
+        self.assertEqual(pipeline.get_link('a-b-c-2').src_id, 'a')
+
+    def test_infer_links__pipeline_wi_circular_links(self) -> None:
+        pipeline = Pipeline('p1', ordered=True)
+        pipeline.add_node('n1', None, pos_inputs=['i2'], outputs=['i1'])
+        pipeline.add_node('n2', None, pos_inputs=['i1'], outputs=['i2'])
+
+        with self.assertRaisesRegex(
+            OrderError, r'circular dependency was found in the order'
+        ):
+            _ = pipeline.infer_links()
+
+        self.assertDictEqual(pipeline.links, {})
+        self.assertEqual(len(pipeline.order.get_ordering()), 1)
@@ -1,6 +1,7 @@
+import pickle
 from unittest import TestCase
 
-from ipipeline.exceptions import BaseError
+from ipipeline.exceptions import BaseError, ExecutorError
 
 
 class TestBaseError(TestCase):
@@ -9,6 +10,7 @@ class TestBaseError(TestCase):
 
         self.assertEqual(error._text, 'error text')
         self.assertListEqual(error._causes, ['cause == item'])
+        self.assertTupleEqual(error.args, ('error text', ['cause == item']))
 
     def test_str__text_eq_str__causes_eq_empty_cause(self) -> None:
         error = BaseError('error text', [])
@@ -27,3 +29,13 @@ class TestBaseError(TestCase):
         msg = error.__str__()
 
         self.assertEqual(msg, 'error text: cause1 == item1, cause2 == item2')
+
+    def test_pickle__error_eq_subclass(self) -> None:
+        error = pickle.loads(
+            pickle.dumps(ExecutorError('error text', ['cause == item']))
+        )
+
+        self.assertIsInstance(error, ExecutorError)
+        self.assertEqual(error._text, 'error text')
+        self.assertListEqual(error._causes, ['cause == item'])
+        self.assertEqual(str(error), 'error text: cause == item')
@@ -2,7 +2,7 @@ from unittest import TestCase
 from typing import List
 
 from ipipeline.exceptions import InstanceError
-from ipipeline.utils.instance import build_repr, get_inst
+from ipipeline.utils.instance import build_repr, get_inst, resolve_ref
 
 
 class Class1:
@@ -43,6 +43,12 @@ class Class4:
         pass
 
 
+class Class5:
+    def __init__(self, arg1: int, *, arg2: bool = False) -> None:
+        self._arg1 = arg1
+        self._arg2 = arg2
+
+
 class TestBuildRepr(TestCase):
     def test_build_repr__inst_wi_args_wi_attrs(self) -> None:
         repr = build_repr(Class1(1, '2'))
@@ -70,6 +76,11 @@ class TestBuildRepr(TestCase):
 
         self.assertEqual(repr, 'Class4()')
 
+    def test_build_repr__inst_wi_key_only_args(self) -> None:
+        repr = build_repr(Class5(1, arg2=True))
+
+        self.assertEqual(repr, 'Class5(arg1=1)')
+
 
 class TestGetInst(TestCase):
     def test_get_inst__mod_name_eq_mod__inst_name_eq_inst(self) -> None:
@@ -91,3 +102,25 @@ class TestGetInst(TestCase):
             r'inst_name was not found in the module: inst_name == Class0'
         ):
             _ = get_inst('tests.utils.test_instance', 'Class0')
+
+
+class TestResolveRef(TestCase):
+    def test_resolve_ref__ref_eq_inst(self) -> None:
+        inst = resolve_ref('tests.utils.test_instance:Class1')
+
+        self.assertIs(inst, Class1)
+        self.assertIs(resolve_ref('tests.utils.test_instance:Class1'), inst)
+
+    def test_resolve_ref__ref_wo_colon(self) -> None:
+        for ref in ['tests.utils.test_instance', 'tests.utils:', ':Class1']:
+            with self.assertRaisesRegex(
+                InstanceError, r'colon was not found in the ref: ref == *'
+            ):
+                _ = resolve_ref(ref)
+
+    def test_resolve_ref__ref_ne_inst(self) -> None:
+        with self.assertRaisesRegex(
+            InstanceError, 
+            r'inst_name was not found in the module: inst_name == Class0'
+        ):
+            _ = resolve_ref('tests.utils.test_instance:Class0')
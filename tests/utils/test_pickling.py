@@ -0,0 +1,13 @@
+import pickle
+from unittest import TestCase
+
+from ipipeline.utils.pickling import protocol
+
+
+class TestProtocol(TestCase):
+    def test_protocol__version_le_highest(self) -> None:
+        self.assertLessEqual(protocol, min(5, pickle.HIGHEST_PROTOCOL))
+        self.assertEqual(
+            pickle.loads(pickle.dumps({'i1': 2}, protocol=protocol)), 
+            {'i1': 2}
+        )